@@ -0,0 +1,26 @@
+"""
+App Pages
+Registry of the Streamlit app's pages, one module per page
+
+A page module is imported the first time its page is selected and only
+its render() runs on a rerun, so a rerun costs the active page alone.
+"""
+import importlib
+from typing import Dict
+
+# Navigation key (translation key of the menu label) -> page module, in menu order
+PAGES: Dict[str, str] = {
+    'nav_dashboard': 'dashboard',
+    'nav_devices': 'devices',
+    'nav_system': 'system_config',
+    'nav_products': 'products',
+    'nav_simulation': 'simulation',
+    'nav_reports': 'reports',
+    'nav_technician': 'technician',
+}
+
+
+def render_page(nav_key: str):
+    """Import the page module for nav_key (cached after first use) and render it"""
+    module = importlib.import_module(f"{__name__}.{PAGES[nav_key]}")
+    module.render()
@@ -0,0 +1,1112 @@
+"""
+Dashboard Page
+Customer details, quick system sizing and the instant quote
+"""
+import re
+from datetime import datetime
+
+import streamlit as st
+
+from models import SolarPanel, Battery, Inverter, Device
+from translations import t
+from vip_auth import check_vip_status
+
+
+def render():
+    """Render the dashboard page"""
+    # Compact header with minimal spacing
+    st.markdown("<div style='margin-bottom: 0.5rem;'></div>", unsafe_allow_html=True)
+    
+    # Enhanced Customer Information Section
+    if st.session_state.customer_info['name'] or st.session_state.customer_info['company']:
+        # Display existing customer info in enhanced card
+        customer_display = st.session_state.customer_info['name'] or t('not_set')
+        company_display = st.session_state.customer_info['company'] or t('na')
+        phone_display = st.session_state.customer_info['phone'] or t('na')
+        email_display = st.session_state.customer_info['email'] or t('na')
+        telegram_display = st.session_state.customer_info.get('telegram', '') or t('na')
+        address_display = st.session_state.customer_info.get('address', '') or t('na')
+        
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #10b981 0%, #059669 100%); 
+            padding: 0.8rem 1rem; 
+            border-radius: 10px; 
+            margin-bottom: 0.5rem;
+            box-shadow: 0 4px 16px rgba(16, 185, 129, 0.2);
+            border: 1px solid rgba(255, 255, 255, 0.18);
+        ">
+            <div style="display: flex; align-items: center; gap: 1.5rem;">
+                <div style="flex: 0 0 auto;">
+                    <div style="
+                        background: rgba(255,255,255,0.25); 
+                        backdrop-filter: blur(10px);
+                        width: 55px; 
+                        height: 55px; 
+                        border-radius: 50%; 
+                        display: flex; 
+                        align-items: center; 
+                        justify-content: center;
+                        border: 2px solid rgba(255,255,255,0.4);
+                    ">
+                        <span style="font-size: 1.6rem;">👤</span>
+                    </div>
+                </div>
+                <div style="flex: 1;">
+                    <div style="display: flex; align-items: baseline; gap: 0.75rem; margin-bottom: 0.3rem;">
+                        <h3 style="color: white; margin: 0; font-size: 1.3rem; font-weight: 700;">{customer_display}</h3>
+                        <span style="
+                            background: rgba(255,255,255,0.25); 
+                            padding: 0.2rem 0.6rem; 
+                            border-radius: 15px; 
+                            font-size: 0.65rem; 
+                            color: white;
+                            font-weight: 600;
+                        ">✅ ACTIVE</span>
+                    </div>
+                    <p style="color: rgba(255,255,255,0.95); margin: 0; font-size: 0.85rem; font-weight: 500;">🏢 {company_display}</p>
+                    <p style="color: rgba(255,255,255,0.85); margin: 0.25rem 0 0 0; font-size: 0.8rem;">📍 {address_display}</p>
+                </div>
+                <div style="flex: 0 0 auto; display: flex; flex-direction: column; gap: 0.5rem; text-align: right;">
+                    <div style="
+                        background: rgba(255,255,255,0.2); 
+                        backdrop-filter: blur(10px);
+                        padding: 0.5rem 1rem; 
+                        border-radius: 8px;
+                        border: 1px solid rgba(255,255,255,0.3);
+                    ">
+                        <p style="color: white; margin: 0 0 0.2rem 0; font-size: 0.7rem; opacity: 0.9;">📞 Contact</p>
+                        <p style="color: white; margin: 0; font-size: 0.85rem; font-weight: 600;">{phone_display}</p>
+                        <p style="color: rgba(255,255,255,0.9); margin: 0.2rem 0 0 0; font-size: 0.7rem;">✉️ {email_display}</p>
+                    </div>
+                    <div style="
+                        background: rgba(255,255,255,0.2); 
+                        backdrop-filter: blur(10px);
+                        padding: 0.5rem 1rem; 
+                        border-radius: 8px;
+                        border: 1px solid rgba(255,255,255,0.3);
+                    ">
+                        <p style="color: white; margin: 0 0 0.2rem 0; font-size: 0.7rem; opacity: 0.9;">💬 Telegram</p>
+                        <p style="color: white; margin: 0; font-size: 0.85rem; font-weight: 600;">@{telegram_display}</p>
+                    </div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Functional Edit Button - Compact
+        edit_col1, edit_col2, edit_col3 = st.columns([1, 2, 1])
+        with edit_col2:
+            if st.button("✏️ Edit Info", key="edit_customer_btn", use_container_width=True, type="secondary"):
+                st.session_state.show_customer_form = True
+                st.rerun()
+    else:
+        # Show form to add customer info
+        st.markdown(f"""
+        <div class="warning-box">
+            <h3>{t('customer_required')}</h3>
+            <p>{t('customer_required_msg')}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        st.session_state.show_customer_form = True
+    
+    # Customer info input form
+    if st.session_state.get('show_customer_form', False) or not st.session_state.customer_info['name']:
+        st.markdown(f"### {t('enter_customer_info')}")
+        
+        with st.form("customer_info_form"):
+            form_col1, form_col2 = st.columns(2)
+            
+            with form_col1:
+                name = st.text_input(
+                    f"{t('customer_name')} *",
+                    value=st.session_state.customer_info['name'],
+                    placeholder="e.g., Sok Pisey"
+                )
+                company = st.text_input(
+                    t('company_name'),
+                    value=st.session_state.customer_info['company'],
+                    placeholder="e.g., Pisey Electronics Shop"
+                )
+                phone = st.text_input(
+                    f"{t('phone_number')} *",
+                    value=st.session_state.customer_info['phone'],
+                    placeholder="e.g., +855 12 345 678"
+                )
+            
+            with form_col2:
+                telegram = st.text_input(
+                    t('telegram_username'),
+                    value=st.session_state.customer_info['telegram'],
+                    placeholder="@username or +855123456789",
+                    help="Enter Telegram username or phone number"
+                )
+                email = st.text_input(
+                    t('email_address'),
+                    value=st.session_state.customer_info['email'],
+                    placeholder="e.g., pisey@example.com"
+                )
+                address = st.text_input(
+                    t('address'),
+                    value=st.session_state.customer_info['address'],
+                    placeholder="e.g., Phnom Penh, Cambodia"
+                )
+            
+            submit_col1, submit_col2, submit_col3 = st.columns([1, 2, 1])
+            with submit_col2:
+                submitted = st.form_submit_button(t('save_customer_info'), type="primary", use_container_width=True)
+            
+            if submitted:
+                if name and phone:
+                    # Validate Telegram username/phone format if provided
+                    telegram_valid = True
+                    telegram_clean = telegram
+                    
+                    if telegram:
+                        telegram_clean = telegram.strip().lstrip('@').lstrip('+')
+                        
+                        # Check if it's a phone number (digits only, possibly with +)
+                        if telegram_clean.replace('+', '').isdigit():
+                            # Valid phone number format
+                            if len(telegram_clean) < 8 or len(telegram_clean) > 15:
+                                st.error("⚠️ Phone number must be 8-15 digits")
+                                telegram_valid = False
+                        else:
+                            # Check if username is valid (alphanumeric, underscore, 5-32 chars)
+                            if not re.match(r'^[a-zA-Z0-9_]{5,32}$', telegram_clean):
+                                st.error("⚠️ Telegram username must be 5-32 characters (letters, numbers, underscore only) or a valid phone number")
+                                telegram_valid = False
+                    
+                    if telegram_valid:
+                        # Check VIP status
+                        is_vip = check_vip_status(phone=phone, telegram=telegram_clean)
+                        st.session_state.is_vip = is_vip
+                        
+                        st.session_state.customer_info = {
+                            'name': name,
+                            'company': company,
+                            'phone': phone,
+                            'telegram': telegram_clean,
+                            'email': email,
+                            'address': address
+                        }
+                        st.session_state.show_customer_form = False
+                        
+                        success_msg = f"✅ Customer information saved for {name}"
+                        if telegram_clean:
+                            if telegram_clean.isdigit():
+                                success_msg += f" | Telegram: +{telegram_clean}"
+                            else:
+                                success_msg += f" | Telegram: @{telegram_clean}"
+                        
+                        if is_vip:
+                            success_msg += " | 👑 VIP ACCESS GRANTED"
+                        
+                        st.success(success_msg)
+                        st.rerun()
+                else:
+                    st.error("⚠️ Please enter at least Customer Name and Phone Number")
+    
+    # =============== SYSTEM SIZING ===============
+    if st.session_state.customer_info['name']:
+        with st.container():
+            with st.form("quick_sizing_form"):
+                st.markdown("### 📊 System Configuration")
+                
+                # Row 1: kWh Usage, Status, and System Type
+                input_row1_col1, input_row1_col2, input_row1_col3 = st.columns(3)
+                with input_row1_col1:
+                    monthly_kwh = st.number_input(
+                        "⚡ Monthly kWh Usage *",
+                        min_value=50,
+                        max_value=10000,
+                        value=300,
+                        step=50,
+                        help="Enter your average monthly electricity consumption in kWh (Required)"
+                    )
+                
+                with input_row1_col2:
+                    usage_status = st.selectbox(
+                        "📊 Usage Status",
+                        ["Average", "Low Usage", "High Usage", "Peak Season"],
+                        help="Select your typical usage pattern"
+                    )
+                
+                with input_row1_col3:
+                    system_type = st.selectbox(
+                        "🔧 System Type *",
+                        ["Hybrid (Grid + Battery)", "On-Grid (No Battery)", "Off-Grid (Full Battery)"],
+                        help="Choose your preferred system configuration"
+                    )
+                
+                # Row 3: Brand Selection (Optional - Auto-recommend if empty)
+                st.markdown("---")
+                st.markdown("##### 🏷️ Component Selection (Optional - Leave empty for auto-recommend)")
+                
+                # Get available brands from product manager
+                pm = st.session_state.product_manager
+                
+                # Get PV panel brands
+                pv_products = pm.get_products_by_category('pv_panel')
+                pv_brands = sorted(list(set([p.name for p in pv_products])))
+                pv_brands.insert(0, "Auto-Recommend (Best Value)")
+                
+                # Get battery brands
+                battery_products = pm.get_products_by_category('battery')
+                battery_brands = sorted(list(set([p.name for p in battery_products])))
+                battery_brands.insert(0, "Auto-Recommend (Best Value)")
+                
+                # Get inverter brands
+                inverter_products = pm.get_products_by_category('inverter')
+                inverter_brands = sorted(list(set([p.name for p in inverter_products])))
+                inverter_brands.insert(0, "Auto-Recommend (Best Value)")
+                
+                brand_col1, brand_col2, brand_col3 = st.columns(3)
+                
+                with brand_col1:
+                    selected_pv = st.selectbox(
+                        "☀️ Solar Panel Brand",
+                        pv_brands,
+                        help="Select specific panel or leave as auto-recommend"
+                    )
+                
+                with brand_col2:
+                    selected_battery = st.selectbox(
+                        "🔋 Battery Brand",
+                        battery_brands,
+                        help="Select specific battery or leave as auto-recommend"
+                    )
+                
+                with brand_col3:
+                    selected_inverter = st.selectbox(
+                        "⚡ Inverter Brand",
+                        inverter_brands,
+                        help="Select specific inverter or leave as auto-recommend"
+                    )
+                
+                st.markdown("<br>", unsafe_allow_html=True)
+                submit_col1, submit_col2, submit_col3 = st.columns([1, 2, 1])
+                with submit_col2:
+                    calculate_system = st.form_submit_button("⚡ Calculate System", type="primary", use_container_width=True)
+                
+                if calculate_system:
+                    # Calculate system requirements
+                    daily_kwh = monthly_kwh / 30
+                    sunlight_hours = st.session_state.system_config.sunlight_hours
+                    
+                    # Calculate PV requirement (with 15% safety margin and system losses)
+                    pv_kw_needed = (daily_kwh / sunlight_hours) * 1.25
+                    
+                    # Calculate battery based on system type
+                    if "Off-Grid" in system_type:
+                        battery_kwh_needed = daily_kwh * 2  # 2 days autonomy
+                    elif "Hybrid" in system_type:
+                        battery_kwh_needed = daily_kwh * 0.7  # Night coverage
+                    else:
+                        battery_kwh_needed = 0  # No battery for on-grid
+                    
+                    # Improved inverter calculation based on actual load patterns
+                    # Peak load = sum of all simultaneous loads (typically 60-70% of total daily load compressed into peak hours)
+                    # For residential: peak typically occurs 6-8 hours with 3-4x average load
+                    average_hourly_load = daily_kwh / 24
+                    peak_load_kw = average_hourly_load * 3.5  # Peak is 3.5x average (more accurate)
+                    inverter_kw_needed = peak_load_kw * 1.3  # 30% safety margin for surge protection
+                    
+                    # Get recommended products
+                    pm = st.session_state.product_manager
+                    
+                    # ===== SOLAR PANEL SELECTION =====
+                    if selected_pv == "Auto-Recommend (Best Value)":
+                        # Auto-recommend mode: find best value panel
+                        rec_panel = pm.get_recommended_panel(min_wattage=500)
+                        if not rec_panel:
+                            rec_panel = pm.get_recommended_panel(min_wattage=300)
+                        
+                        panel_wattage = rec_panel.specifications.get('power', 550) if rec_panel else 550
+                        panel_cost = rec_panel.cost if rec_panel else 66.0
+                        panel_name = rec_panel.name if rec_panel else "Lvtopsun 550W"
+                    else:
+                        # User selected specific panel
+                        selected_panel_product = pm.products.get(selected_pv)
+                        if selected_panel_product:
+                            panel_wattage = selected_panel_product.specifications.get('power', 550)
+                            panel_cost = selected_panel_product.cost
+                            panel_name = selected_panel_product.name
+                        else:
+                            # Fallback if product not found
+                            panel_wattage = 550
+                            panel_cost = 66.0
+                            panel_name = selected_pv
+                    
+                    num_panels = max(1, int((pv_kw_needed * 1000) / panel_wattage))
+                    
+                    # ===== BATTERY SELECTION =====
+                    if battery_kwh_needed > 0:
+                        if selected_battery == "Auto-Recommend (Best Value)":
+                            # Auto-recommend mode
+                            rec_battery = pm.get_recommended_battery(min_capacity_kwh=5.0)
+                            if rec_battery:
+                                battery_unit_capacity = rec_battery.specifications.get('capacity', 5.12)
+                                battery_cost_per_unit = rec_battery.cost
+                                battery_name = rec_battery.name
+                                battery_voltage = rec_battery.specifications.get('voltage', 51.2)
+                            else:
+                                battery_unit_capacity = 5.12
+                                battery_cost_per_unit = 1440.0
+                                battery_name = "DEYE 100AH 51.2v (5.12KWH)"
+                                battery_voltage = 51.2
+                        else:
+                            # User selected specific battery
+                            selected_battery_product = pm.products.get(selected_battery)
+                            if selected_battery_product:
+                                battery_unit_capacity = selected_battery_product.specifications.get('capacity', 5.12)
+                                battery_cost_per_unit = selected_battery_product.cost
+                                battery_name = selected_battery_product.name
+                                battery_voltage = selected_battery_product.specifications.get('voltage', 51.2)
+                            else:
+                                # Fallback
+                                battery_unit_capacity = 5.12
+                                battery_cost_per_unit = 1440.0
+                                battery_name = selected_battery
+                                battery_voltage = 51.2
+                        
+                        num_batteries = max(1, int(battery_kwh_needed / battery_unit_capacity))
+                    else:
+                        num_batteries = 0
+                        battery_name = "Not Required (On-Grid System)"
+                        battery_cost_per_unit = 0
+                        battery_unit_capacity = 0
+                        battery_voltage = 0
+                    
+                    # ===== INVERTER SELECTION =====
+                    inv_type = "Hybrid" if "Hybrid" in system_type else "On-Grid" if "On-Grid" in system_type else "Off-Grid"
+                    
+                    if selected_inverter == "Auto-Recommend (Best Value)":
+                        # Auto-recommend mode
+                        rec_inverter = pm.get_recommended_inverter(min_power_kw=inverter_kw_needed, inverter_type=inv_type)
+                        if rec_inverter:
+                            inverter_power = rec_inverter.specifications.get('power', 5.0)
+                            inverter_cost = rec_inverter.cost
+                            inverter_name = rec_inverter.name
+                        else:
+                            inverter_power = max(5.0, inverter_kw_needed)
+                            inverter_cost = inverter_power * 180
+                            inverter_name = f"Deye {inv_type} {inverter_power:.0f}kw"
+                    else:
+                        # User selected specific inverter
+                        selected_inverter_product = pm.products.get(selected_inverter)
+                        if selected_inverter_product:
+                            inverter_power = selected_inverter_product.specifications.get('power', 5.0)
+                            inverter_cost = selected_inverter_product.cost
+                            inverter_name = selected_inverter_product.name
+                        else:
+                            # Fallback
+                            inverter_power = max(5.0, inverter_kw_needed)
+                            inverter_cost = inverter_power * 180
+                            inverter_name = selected_inverter
+                    
+                    # Calculate installation area (approx 2 m² per 550W panel)
+                    area_per_panel = 2.0 if panel_wattage >= 500 else 1.7
+                    total_area = num_panels * area_per_panel
+                    
+                    # Calculate costs
+                    pv_cost = num_panels * panel_cost
+                    battery_cost = num_batteries * battery_cost_per_unit
+                    inverter_total_cost = inverter_cost
+                    labor_cost = 250.0 if inverter_power <= 5 else 500.0
+                    
+                    # Support materials based on inverter size
+                    if inverter_power <= 5.0:
+                        support_cost = 450.0
+                    elif inverter_power >= 10.0:
+                        support_cost = 600.0
+                    else:
+                        support_cost = 450.0 + ((inverter_power - 5.0) / 5.0) * (600.0 - 450.0)
+                    
+                    equipment_cost = pv_cost + battery_cost + inverter_total_cost
+                    total_wholesale = equipment_cost + labor_cost + support_cost
+                    total_customer = total_wholesale * 1.3  # 30% markup
+                    
+                    # Store results in session state
+                    st.session_state.quick_sizing_results = {
+                        'monthly_kwh': monthly_kwh,
+                        'daily_kwh': daily_kwh,
+                        'usage_status': usage_status,
+                        'system_type': system_type,
+                        'selected_pv': selected_pv,
+                        'selected_battery': selected_battery,
+                        'selected_inverter': selected_inverter,
+                        'pv_kw': pv_kw_needed,
+                        'num_panels': num_panels,
+                        'panel_name': panel_name,
+                        'panel_wattage': panel_wattage,
+                        'panel_cost': panel_cost,
+                        'battery_kwh': battery_kwh_needed,
+                        'num_batteries': num_batteries,
+                        'battery_name': battery_name,
+                        'battery_unit_capacity': battery_unit_capacity,
+                        'battery_voltage': battery_voltage,
+                        'battery_cost_per_unit': battery_cost_per_unit,
+                        'inverter_kw': inverter_power,
+                        'inverter_name': inverter_name,
+                        'inverter_cost': inverter_total_cost,
+                        'area_needed': total_area,
+                        'equipment_cost': equipment_cost,
+                        'labor_cost': labor_cost,
+                        'support_cost': support_cost,
+                        'total_wholesale': total_wholesale,
+                        'total_customer': total_customer
+                    }
+                    
+                    # AUTO-APPLY: Automatically configure the system
+                    
+                    # Apply Solar Panels
+                    st.session_state.system_config.solar_panels = SolarPanel(
+                        name=panel_name,
+                        power_watts=panel_wattage,
+                        efficiency=0.21,
+                        cost_per_panel=panel_cost,
+                        quantity=num_panels
+                    )
+                    
+                    # Apply Battery (if needed)
+                    if num_batteries > 0:
+                        st.session_state.system_config.battery = Battery(
+                            name=battery_name,
+                            capacity_kwh=battery_unit_capacity,
+                            voltage=battery_voltage,
+                            depth_of_discharge=0.8,
+                            efficiency=0.95,
+                            cost=battery_cost_per_unit,
+                            quantity=num_batteries
+                        )
+                    else:
+                        st.session_state.system_config.battery = None
+                    
+                    # Apply Inverter
+                    st.session_state.system_config.inverter = Inverter(
+                        name=inverter_name,
+                        power_kw=inverter_power,
+                        efficiency=0.97,
+                        cost=inverter_total_cost
+                    )
+                    
+                    # AUTO-CREATE DEVICES: Generate sample devices based on daily consumption
+                    # Clear existing devices and create new ones based on usage pattern
+                    st.session_state.devices = []
+                    
+                    # Generate devices based on daily kWh (distribute across common appliances)
+                    if daily_kwh > 0:
+                        # Common device distribution ratios for typical usage
+                        if usage_status == "Low Usage":
+                            device_templates = [
+                                ("Lights (LED)", 0.05, 6, 0.25),  # 50W, 6 hours
+                                ("Refrigerator", 0.15, 24, 0.15),  # 150W, 24 hours
+                                ("TV", 0.10, 4, 0.20),  # 100W, 4 hours
+                                ("Fan", 0.075, 8, 0.20)  # 75W, 8 hours
+                            ]
+                        elif usage_status == "High Usage" or usage_status == "Peak Season":
+                            device_templates = [
+                                ("Air Conditioner", 1.5, 8, 0.35),  # 1500W, 8 hours
+                                ("Refrigerator", 0.20, 24, 0.15),  # 200W, 24 hours
+                                ("Water Pump", 0.75, 2, 0.10),  # 750W, 2 hours
+                                ("Lights (LED)", 0.10, 8, 0.15),  # 100W, 8 hours
+                                ("TV", 0.15, 5, 0.10),  # 150W, 5 hours
+                                ("Washing Machine", 0.50, 2, 0.08),  # 500W, 2 hours
+                                ("Microwave", 1.0, 0.5, 0.05)  # 1000W, 30 min
+                            ]
+                        else:  # Average
+                            device_templates = [
+                                ("Lights (LED)", 0.08, 7, 0.20),  # 80W, 7 hours
+                                ("Refrigerator", 0.18, 24, 0.20),  # 180W, 24 hours
+                                ("TV", 0.12, 5, 0.15),  # 120W, 5 hours
+                                ("Fan", 0.10, 10, 0.15),  # 100W, 10 hours
+                                ("Computer", 0.15, 6, 0.12),  # 150W, 6 hours
+                                ("Washing Machine", 0.45, 1.5, 0.10),  # 450W, 1.5 hours
+                                ("Rice Cooker", 0.70, 1, 0.08)  # 700W, 1 hour
+                            ]
+                        
+                        # Calculate total energy from templates and scale to match input
+                        total_template_ratio = sum(ratio for _, _, _, ratio in device_templates)
+                        
+                        # Calculate total energy from template devices
+                        template_total_kwh = sum(power * hours for _, power, hours, _ in device_templates)
+                        
+                        # Scale factor to match actual daily_kwh input
+                        scale_factor = daily_kwh / template_total_kwh if template_total_kwh > 0 else 1
+                        
+                        # Create devices with scaled hours to match input daily_kwh exactly
+                        for device_name, power_kw, hours, ratio in device_templates:
+                            # Scale hours to match total daily consumption
+                            scaled_hours = hours * scale_factor
+                            device = Device(
+                                device_name,
+                                power_kw,
+                                scaled_hours,
+                                1  # quantity
+                            )
+                            st.session_state.devices.append(device)
+                    
+                    st.rerun()
+        
+        # Display results if available
+        if 'quick_sizing_results' in st.session_state and st.session_state.quick_sizing_results:
+            results = st.session_state.quick_sizing_results
+            
+            st.markdown("---")
+            
+            # Configuration Summary
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, #e0e7ff 0%, #c7d2fe 100%);
+                padding: 1.5rem;
+                border-radius: 15px;
+                margin-bottom: 2rem;
+                border: 2px solid #6366f1;
+            ">
+                <h3 style="margin: 0 0 1rem 0; color: #4338ca; display: flex; align-items: center; gap: 0.5rem;">
+                    <span style="font-size: 1.8rem;">📋</span> Configuration Summary
+                </h3>
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
+                    <div style="background: rgba(255,255,255,0.6); padding: 1rem; border-radius: 10px;">
+                        <p style="margin: 0; color: #6b7280; font-size: 0.85rem; font-weight: 600;">MONTHLY USAGE</p>
+                        <p style="margin: 0.3rem 0 0 0; color: #1f2937; font-size: 1.3rem; font-weight: 700;">{results['monthly_kwh']} kWh</p>
+                        <p style="margin: 0.3rem 0 0 0; color: #6b7280; font-size: 0.8rem;">{results['usage_status']}</p>
+                    </div>
+                    <div style="background: rgba(255,255,255,0.6); padding: 1rem; border-radius: 10px;">
+                        <p style="margin: 0; color: #6b7280; font-size: 0.85rem; font-weight: 600;">SYSTEM TYPE</p>
+                        <p style="margin: 0.3rem 0 0 0; color: #1f2937; font-size: 1rem; font-weight: 700;">{results['system_type']}</p>
+                    </div>
+                    <div style="background: rgba(255,255,255,0.6); padding: 1rem; border-radius: 10px;">
+                        <p style="margin: 0; color: #6b7280; font-size: 0.85rem; font-weight: 600;">SELECTION MODE</p>
+                        <p style="margin: 0.3rem 0 0 0; color: #1f2937; font-size: 0.85rem; font-weight: 600;">
+                            {'🤖 Auto-Recommended' if results['selected_pv'] == "Auto-Recommend (Best Value)" and results['selected_battery'] == "Auto-Recommend (Best Value)" and results['selected_inverter'] == "Auto-Recommend (Best Value)" else '👤 User-Selected Components'}
+                        </p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown("### 🎯 Recommended System Configuration")
+            
+            result_col1, result_col2, result_col3 = st.columns(3)
+            
+            with result_col1:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 1.5rem;">
+                    <h4>☀️ Solar Panels</h4>
+                    <p><b>Model:</b> {results['panel_name']}</p>
+                    <p><b>Quantity:</b> {results['num_panels']} panels × {results['panel_wattage']}W</p>
+                    <p><b>Total Capacity:</b> {(results['num_panels'] * results['panel_wattage'] / 1000):.2f} kW</p>
+                    <p><b>Installation Area:</b> ~{results['area_needed']:.1f} m²</p>
+                    <hr>
+                    <p><b>Cost:</b> ${results['num_panels'] * results['panel_cost']:,.2f}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with result_col2:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 1.5rem;">
+                    <h4>🔋 Battery Storage</h4>
+                    <p><b>Model:</b> {results['battery_name']}</p>
+                    {'<p><b>Quantity:</b> ' + str(results['num_batteries']) + ' units</p>' if results['num_batteries'] > 0 else '<p><b>Quantity:</b> Not Required</p>'}
+                    {'<p><b>Unit Capacity:</b> ' + f"{results['battery_unit_capacity']:.2f}" + ' kWh</p>' if results['num_batteries'] > 0 else ''}
+                    {'<p><b>Total Capacity:</b> ' + f"{results['battery_kwh']:.2f}" + ' kWh</p>' if results['num_batteries'] > 0 else '<p><b>Type:</b> On-Grid (No Battery)</p>'}
+                    {'<p><b>Backup Time:</b> ~' + f"{(results['battery_kwh'] / results['daily_kwh'] * 24):.1f}" + ' hours</p>' if results['num_batteries'] > 0 else ''}
+                    <hr>
+                    <p><b>Cost:</b> ${results['num_batteries'] * results['battery_cost_per_unit']:,.2f}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with result_col3:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 1.5rem;">
+                    <h4>⚡ Inverter</h4>
+                    <p><b>Model:</b> {results['inverter_name']}</p>
+                    <p><b>Power Rating:</b> {results['inverter_kw']:.1f} kW</p>
+                    <p><b>Type:</b> {results['system_type']}</p>
+                    <p><b>Max Output:</b> {results['inverter_kw'] * 0.9:.1f} kW</p>
+                    <hr>
+                    <p><b>Cost:</b> ${results['inverter_cost']:,.2f}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Modern Section Header
+            st.markdown("""<div style='text-align: center; padding: 2rem 0 1rem 0;'>
+                <h2 style='font-size: 2.2rem; font-weight: 800; background: linear-gradient(135deg, #0f766e 0%, #0d9488 100%); 
+                           -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin: 0;'>
+                    💰 Investment & Savings
+                </h2>
+                <p style='color: #6b7280; font-size: 1rem; margin: 0.5rem 0 0 0;'>Complete system breakdown & financial analysis</p>
+            </div>""", unsafe_allow_html=True)
+            
+            cost_col1, cost_col2 = st.columns([1.2, 1])
+            
+            with cost_col1:
+                # Component Pricing Cards
+                st.markdown("""<div style='background: white; padding: 1.5rem; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
+                    <h3 style='margin: 0 0 1rem 0; color: #111827; font-size: 1.2rem; font-weight: 700;'>📋 System Components</h3>
+                </div>""", unsafe_allow_html=True)
+                
+                st.markdown("<div style='height: 0.5rem;'></div>", unsafe_allow_html=True)
+                
+                # Individual component cards
+                components = [
+                    {"icon": "☀️", "name": f"Solar Panels ({results['num_panels']}x {results['panel_wattage']}W)", 
+                     "price": results['num_panels'] * results['panel_cost'] * 1.3, "color": "#f59e0b"},
+                    {"icon": "🔋", "name": f"Battery Storage ({results['num_batteries']} units)" if results['num_batteries'] > 0 else "Battery (Not Required)",
+                     "price": results['num_batteries'] * results['battery_cost_per_unit'] * 1.3 if results['num_batteries'] > 0 else 0, "color": "#10b981"},
+                    {"icon": "⚡", "name": f"Inverter ({results['inverter_kw']:.1f}kW)",
+                     "price": results['inverter_cost'] * 1.3, "color": "#3b82f6"},
+                    {"icon": "🔧", "name": "Installation & Labor",
+                     "price": results['labor_cost'] * 1.3, "color": "#8b5cf6"},
+                    {"icon": "📦", "name": "Mounting & Cables",
+                     "price": results['support_cost'] * 1.3, "color": "#6b7280"}
+                ]
+                
+                for comp in components:
+                    st.markdown(f"""
+                    <div style='background: white; padding: 1rem; margin-bottom: 0.5rem; border-radius: 10px; 
+                                border-left: 4px solid {comp['color']}; box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+                                display: flex; justify-content: space-between; align-items: center;'>
+                        <div style='display: flex; align-items: center; gap: 0.75rem;'>
+                            <span style='font-size: 1.5rem;'>{comp['icon']}</span>
+                            <span style='color: #374151; font-weight: 500;'>{comp['name']}</span>
+                        </div>
+                        <div style='color: {comp['color']}; font-weight: 700; font-size: 1.1rem;'>${comp['price']:,.2f}</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Telegram Send Button - Send from YOUR personal account
+                if st.session_state.customer_info.get('telegram'):
+                    st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
+                    telegram_contact = st.session_state.customer_info['telegram']
+                    
+                    try:
+                        
+                        # Language selector - compact
+                        st.markdown("""
+                        <div style='background: linear-gradient(135deg, #6366f1 0%, #4f46e5 100%); padding: 1rem; 
+                                    border-radius: 10px; text-align: center; margin-bottom: 0.75rem;'>
+                            <span style='font-size: 1.3rem; margin-right: 0.5rem;'>🌐</span>
+                            <span style='color: white; font-weight: 600; font-size: 0.9rem;'>Report Language</span>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        report_lang = st.radio(
+                            "Choose:",
+                            options=["🇺🇸🇰🇭 Bilingual", "🇺🇸 English", "🇰🇭 Khmer"],
+                            index=0,
+                            horizontal=True,
+                            label_visibility="collapsed"
+                        )
+                        
+                        # Map selection
+                        lang_map = {
+                            "🇺🇸🇰🇭 Bilingual": "bilingual",
+                            "🇺🇸 English": "english",
+                            "🇰🇭 Khmer": "khmer"
+                        }
+                        selected_language = lang_map[report_lang]
+                        
+                        st.markdown("<div style='height: 0.5rem;'></div>", unsafe_allow_html=True)
+                        
+                        # Send button
+                        if st.button("📤 Send Report to My Telegram", type="primary", use_container_width=True):
+                            # Prepare report data
+                            report_data = {
+                                'customer_name': st.session_state.customer_info['name'],
+                                'phone': st.session_state.customer_info['phone'],
+                                'address': st.session_state.customer_info.get('address', 'Cambodia'),
+                                'monthly_kwh': results['monthly_kwh'],
+                                'daily_kwh': results['daily_kwh'],
+                                'system_type': results['system_type'],
+                                'num_panels': results['num_panels'],
+                                'panel_wattage': results['panel_wattage'],
+                                'pv_kw': results['pv_kw'],
+                                'pv_generation': results['monthly_kwh'],
+                                'battery_kwh': results['battery_kwh'],
+                                'num_batteries': results['num_batteries'],
+                                'inverter_kw': results['inverter_kw'],
+                                'total_price': results['total_customer'],
+                                'monthly_savings': results['monthly_kwh'] * 0.20,
+                                'annual_savings': results['monthly_kwh'] * 0.20 * 12,
+                                'payback_years': results['total_customer'] / (results['monthly_kwh'] * 0.20 * 12) if results['monthly_kwh'] > 0 else 0,
+                                'date': datetime.now().strftime('%Y-%m-%d %H:%M')
+                            }
+                            
+                            # Charts for the message, rendered once per design and cached on disk
+                            from chart_renderer import report_charts
+                            with st.spinner('📊 Preparing charts...'):
+                                charts = report_charts(st.session_state.get('simulation_results'),
+                                                       report_data['annual_savings'], report_data['total_price'])
+                            
+                            # Try personal sender first (better experience)
+                            try:
+                                from telegram_personal_sender import send_report_from_personal
+                                
+                                with st.spinner(f'📤 Sending from your Telegram to {telegram_contact}...'):
+                                    success, message = send_report_from_personal(telegram_contact, report_data, selected_language, charts)
+                                
+                                if success:
+                                    st.success(f"✅ Sent from YOUR account to {telegram_contact}!")
+                                    st.balloons()
+                                    st.info("📞 Contact: 0888836588 | @chhanycls")
+                                else:
+                                    st.error(f"❌ {message}")
+                                    st.info("💡 Make sure you've setup personal sender (see SETUP_PERSONAL_TELEGRAM.md)")
+                                    
+                            except ImportError:
+                                # Fallback to bot method if personal sender not available
+                                st.warning("📝 Personal sender not setup. Using bot method...")
+                                try:
+                                    from telegram_bot import TelegramReportSender
+                                    sender = TelegramReportSender()
+                                    
+                                    with st.spinner(f'📤 Sending via bot to @{telegram_contact}...'):
+                                        success, message = sender.send_report(telegram_contact, report_data, selected_language, charts)
+                                    
+                                    if success:
+                                        st.success(f"✅ Sent to @{telegram_contact}!")
+                                        st.balloons()
+                                        st.info("📞 Contact: 0888836588 | @chhanycls")
+                                    else:
+                                        st.error(f"❌ {message}")
+                                        st.warning("💡 Ask customer to send /start to @khsolar_bot first")
+                                except:
+                                    st.error("❌ Neither personal sender nor bot available. Check setup.")
+                                    
+                    except Exception as e:
+                        st.error(f"❌ Error: {str(e)}")
+            
+            with cost_col2:
+                monthly_savings = results['monthly_kwh'] * 0.20  # Assume $0.20/kWh grid rate
+                payback_years = results['total_customer'] / (monthly_savings * 12) if monthly_savings > 0 else 0
+                annual_savings = monthly_savings * 12
+                
+                # Total Investment Card - Redesigned
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, #0f766e 0%, #0d9488 100%, #14b8a6 200%); 
+                            padding: 2rem; border-radius: 16px; box-shadow: 0 10px 30px rgba(15, 118, 110, 0.4);
+                            position: relative; overflow: hidden;'>
+                    <div style='position: absolute; top: -50px; right: -50px; width: 150px; height: 150px; 
+                                background: rgba(255,255,255,0.1); border-radius: 50%;'></div>
+                    <div style='position: relative; z-index: 1;'>
+                        <div style='text-align: center; margin-bottom: 1rem;'>
+                            <div style='font-size: 3rem; margin-bottom: 0.5rem;'>💎</div>
+                            <p style='margin: 0; font-size: 0.95rem; color: rgba(255,255,255,0.9); font-weight: 600; letter-spacing: 2px;'>TOTAL INVESTMENT</p>
+                        </div>
+                        <h1 style='margin: 1rem 0; color: white; font-size: 3.8rem; font-weight: 900; text-align: center; 
+                                   text-shadow: 2px 2px 12px rgba(0,0,0,0.3); letter-spacing: -2px;'>
+                            ${results['total_customer']:,.2f}
+                        </h1>
+                        <p style='margin: 0; font-size: 0.9rem; color: rgba(255,255,255,0.85); text-align: center; font-weight: 500;'>
+                            ✨ Complete turnkey solar solution
+                        </p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
+                
+                # Financial Metrics in Cards
+                st.markdown(f"""
+                <div style='background: white; padding: 1.5rem; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-bottom: 1rem;'>
+                    <div style='display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;'>
+                        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); border-radius: 10px;'>
+                            <div style='font-size: 1.8rem; margin-bottom: 0.3rem;'>💵</div>
+                            <div style='font-size: 0.75rem; color: #1e40af; font-weight: 600; margin-bottom: 0.3rem;'>MONTHLY SAVINGS</div>
+                            <div style='font-size: 1.5rem; color: #1e3a8a; font-weight: 800;'>${monthly_savings:.2f}</div>
+                        </div>
+                        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); border-radius: 10px;'>
+                            <div style='font-size: 1.8rem; margin-bottom: 0.3rem;'>📅</div>
+                            <div style='font-size: 0.75rem; color: #065f46; font-weight: 600; margin-bottom: 0.3rem;'>ANNUAL SAVINGS</div>
+                            <div style='font-size: 1.5rem; color: #064e3b; font-weight: 800;'>${annual_savings:.2f}</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div style='background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); padding: 1.5rem; border-radius: 12px; 
+                            box-shadow: 0 2px 8px rgba(0,0,0,0.1); text-align: center;'>
+                    <div style='font-size: 2rem; margin-bottom: 0.3rem;'>⏱️</div>
+                    <div style='font-size: 0.8rem; color: #92400e; font-weight: 600; margin-bottom: 0.5rem;'>PAYBACK PERIOD</div>
+                    <div style='font-size: 2.2rem; color: #78350f; font-weight: 800;'>{payback_years:.1f} <span style='font-size: 1.2rem;'>years</span></div>
+                    <div style='font-size: 0.75rem; color: #92400e; margin-top: 0.5rem;'>🚀 Start saving from day one!</div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+            
+            # Auto-applied success message
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.success("✅ Configuration automatically applied to your system! Sample devices created based on usage pattern. Scroll down to see System Overview.")
+        
+        st.markdown("---")
+    
+    # Modern Metric Cards
+    device_count = len(st.session_state.devices)
+    total_load = sum(d.daily_energy_kwh for d in st.session_state.devices)
+    monthly_load = total_load * 30
+    pv_cap = st.session_state.system_config.solar_panels.total_power_kw if st.session_state.system_config.solar_panels else 0
+    bat_cap = st.session_state.system_config.battery.capacity_kwh if st.session_state.system_config.battery else 0
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
+            padding: 1.5rem;
+            border-radius: 15px;
+            box-shadow: 0 4px 20px rgba(59, 130, 246, 0.3);
+            text-align: center;
+            border: 1px solid rgba(255,255,255,0.2);
+        ">
+            <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">⚡</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;">DEVICES</div>
+            <div style="color: white; font-size: 2.5rem; font-weight: 800; margin-bottom: 0.3rem;">{device_count}</div>
+            <div style="
+                background: rgba(255,255,255,0.2);
+                padding: 0.3rem 0.8rem;
+                border-radius: 12px;
+                color: white;
+                font-size: 0.75rem;
+                display: inline-block;
+                font-weight: 600;
+            ">{'✅ ACTIVE' if device_count > 0 else '➕ Add devices'}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+            padding: 1.5rem;
+            border-radius: 15px;
+            box-shadow: 0 4px 20px rgba(16, 185, 129, 0.3);
+            text-align: center;
+            border: 1px solid rgba(255,255,255,0.2);
+        ">
+            <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">🔋</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;">DAILY CONSUMPTION</div>
+            <div style="color: white; font-size: 2rem; font-weight: 800; margin-bottom: 0.3rem;">{total_load:.2f} kWh</div>
+            <div style="
+                background: rgba(255,255,255,0.2);
+                padding: 0.3rem 0.8rem;
+                border-radius: 12px;
+                color: white;
+                font-size: 0.75rem;
+                display: inline-block;
+                font-weight: 600;
+            ">{monthly_load:.0f} kWh/month</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        pv_status = '✅ CONFIGURED' if pv_cap > 0 else '⚙️ Not set'
+        pv_color = '#10b981' if pv_cap > 0 else '#6b7280'
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
+            padding: 1.5rem;
+            border-radius: 15px;
+            box-shadow: 0 4px 20px rgba(245, 158, 11, 0.3);
+            text-align: center;
+            border: 1px solid rgba(255,255,255,0.2);
+        ">
+            <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">☀️</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;">PV CAPACITY</div>
+            <div style="color: white; font-size: 2rem; font-weight: 800; margin-bottom: 0.3rem;">{pv_cap:.2f} kW</div>
+            <div style="
+                background: rgba(255,255,255,0.2);
+                padding: 0.3rem 0.8rem;
+                border-radius: 12px;
+                color: white;
+                font-size: 0.75rem;
+                display: inline-block;
+                font-weight: 600;
+            ">{pv_status}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        bat_status = '✅ READY' if bat_cap > 0 else '⚙️ Not set'
+        st.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, #8b5cf6 0%, #7c3aed 100%);
+            padding: 1.5rem;
+            border-radius: 15px;
+            box-shadow: 0 4px 20px rgba(139, 92, 246, 0.3);
+            text-align: center;
+            border: 1px solid rgba(255,255,255,0.2);
+        ">
+            <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">🔌</div>
+            <div style="color: rgba(255,255,255,0.9); font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;">BATTERY STORAGE</div>
+            <div style="color: white; font-size: 2rem; font-weight: 800; margin-bottom: 0.3rem;">{bat_cap:.1f} kWh</div>
+            <div style="
+                background: rgba(255,255,255,0.2);
+                padding: 0.3rem 0.8rem;
+                border-radius: 12px;
+                color: white;
+                font-size: 0.75rem;
+                display: inline-block;
+                font-weight: 600;
+            ">{bat_status}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Enhanced System Status Cards with Detailed Information
+    if device_count > 0 or pv_cap > 0:
+        st.markdown("---")
+        st.markdown(f"""
+        <div style='text-align: center; margin: 1.5rem 0 1rem 0;'>
+            <h2 style='margin: 0; color: #1f2937;'>🎯 {t('system_overview')}</h2>
+            <p style='color: #6b7280; font-size: 0.9rem; margin-top: 0.5rem;'>Complete system specifications and pricing breakdown</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Row 1: Load Summary and Solar Panel Details
+        overview_col1, overview_col2, overview_col3 = st.columns(3)
+        
+        with overview_col1:
+            st.markdown(f"""
+            <div class="custom-card" style='
+                background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%);
+                border-left: 4px solid #6b7280;
+                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            '>
+                <h4 style='color: #374151; margin-bottom: 0.8rem;'>⚡ {t('load_summary')}</h4>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📅 {t('daily')}:</b> <span style='color: #1f2937; font-weight: 600;'>{total_load:.2f} kWh</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📆 {t('monthly')}:</b> <span style='color: #1f2937; font-weight: 600;'>{monthly_load:.0f} kWh</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🔌 {t('devices')}:</b> <span style='color: #1f2937; font-weight: 600;'>{device_count}</span></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with overview_col2:
+            # Calculate solar panel details
+            pv_monthly = pv_cap * st.session_state.system_config.sunlight_hours * 30 if pv_cap > 0 else 0
+            panel_count = st.session_state.system_config.solar_panels.quantity if st.session_state.system_config.solar_panels else 0
+            panel_wattage = st.session_state.system_config.solar_panels.power_watts if st.session_state.system_config.solar_panels else 0
+            # Calculate area needed (approx 2 m² per 550W panel, adjust based on wattage)
+            area_per_panel = 2.0 if panel_wattage >= 500 else 1.7
+            total_area = panel_count * area_per_panel
+            
+            st.markdown(f"""
+            <div class="custom-card" style='
+                background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
+                border-left: 4px solid #f59e0b;
+                box-shadow: 0 4px 6px rgba(245, 158, 11, 0.2);
+            '>
+                <h4 style='color: #92400e; margin-bottom: 0.8rem;'>☀️ Solar Panels</h4>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>⚡ Total Capacity:</b> <span style='color: #92400e; font-weight: 600;'>{pv_cap:.2f} kW</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📦 Panels:</b> <span style='color: #92400e; font-weight: 600;'>{panel_count} × {panel_wattage}W</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📊 Monthly Gen:</b> <span style='color: #92400e; font-weight: 600;'>{pv_monthly:.0f} kWh</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📐 Area Needed:</b> <span style='color: #92400e; font-weight: 600;'>~{total_area:.1f} m²</span></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with overview_col3:
+            # Battery details
+            battery_count = st.session_state.system_config.battery.quantity if st.session_state.system_config.battery else 0
+            battery_voltage = st.session_state.system_config.battery.voltage if st.session_state.system_config.battery else 0
+            # Calculate Ah from kWh and voltage: Ah = (kWh * 1000) / voltage
+            battery_capacity_ah = (st.session_state.system_config.battery.capacity_kwh * 1000 / battery_voltage) if (st.session_state.system_config.battery and battery_voltage > 0) else 0
+            # Extract battery type from name (Lithium, Gel, etc.)
+            battery_name = st.session_state.system_config.battery.name if st.session_state.system_config.battery else ""
+            battery_type = "Lithium" if "lithium" in battery_name.lower() else "Gel" if "gel" in battery_name.lower() else "Lead-Acid" if "lead" in battery_name.lower() else "Battery"
+            
+            st.markdown(f"""
+            <div class="custom-card" style='
+                background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
+                border-left: 4px solid #3b82f6;
+                box-shadow: 0 4px 6px rgba(59, 130, 246, 0.2);
+            '>
+                <h4 style='color: #1e40af; margin-bottom: 0.8rem;'>🔋 Battery Storage</h4>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>⚡ Total Capacity:</b> <span style='color: #1e40af; font-weight: 600;'>{bat_cap:.1f} kWh</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🔋 Batteries:</b> <span style='color: #1e40af; font-weight: 600;'>{battery_count} × {battery_voltage}V {battery_capacity_ah}Ah</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🏷️ Type:</b> <span style='color: #1e40af; font-weight: 600;'>{battery_type}</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>⏱️ Backup:</b> <span style='color: #1e40af; font-weight: 600;'>~{(bat_cap * 0.8 / total_load * 24) if total_load > 0 else 0:.1f} hours</span></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Row 2: Inverter, System Status, and Pricing
+        st.markdown("<br>", unsafe_allow_html=True)
+        overview_col4, overview_col5, overview_col6 = st.columns(3)
+        
+        with overview_col4:
+            # Inverter details
+            inverter_power = st.session_state.system_config.inverter.power_kw if st.session_state.system_config.inverter else 0
+            # Extract inverter type from name (Hybrid, On-Grid, Off-Grid)
+            inverter_name = st.session_state.system_config.inverter.name if st.session_state.system_config.inverter else ""
+            inverter_type = "Hybrid" if "hybrid" in inverter_name.lower() else "On-Grid" if "ongrid" in inverter_name.lower() or "on-grid" in inverter_name.lower() else "Off-Grid" if "off" in inverter_name.lower() else "Inverter"
+            inverter_voltage = st.session_state.system_config.inverter.input_voltage if st.session_state.system_config.inverter else 48
+            # Determine phases from name (3P = 3-phase, 1P or default = single phase)
+            inverter_phases = "3-Phase" if "3p" in inverter_name.lower() else "Single Phase"
+            
+            st.markdown(f"""
+            <div class="custom-card" style='
+                background: linear-gradient(135deg, #e0e7ff 0%, #c7d2fe 100%);
+                border-left: 4px solid #6366f1;
+                box-shadow: 0 4px 6px rgba(99, 102, 241, 0.2);
+            '>
+                <h4 style='color: #4338ca; margin-bottom: 0.8rem;'>⚡ Inverter</h4>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🔌 Power Rating:</b> <span style='color: #4338ca; font-weight: 600;'>{inverter_power:.1f} kW</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🏷️ Type:</b> <span style='color: #4338ca; font-weight: 600;'>{inverter_type}</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>⚡ Voltage:</b> <span style='color: #4338ca; font-weight: 600;'>{inverter_voltage}V</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🔄 Phases:</b> <span style='color: #4338ca; font-weight: 600;'>{inverter_phases}</span></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with overview_col5:
+            # System status and coverage
+            if pv_cap > 0 and total_load > 0:
+                coverage = (pv_monthly / monthly_load * 100) if monthly_load > 0 else 0
+                coverage_status = t('excellent') if coverage >= 100 else t('good') if coverage >= 80 else t('needs_increase')
+                coverage_color = "#10b981" if coverage >= 100 else "#f59e0b" if coverage >= 80 else "#ef4444"
+            else:
+                coverage = 0
+                coverage_status = t('configure_system_msg')
+                coverage_color = "#6b7280"
+            
+            st.markdown(f"""
+            <div class="custom-card" style='
+                background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);
+                border-left: 4px solid #10b981;
+                box-shadow: 0 4px 6px rgba(16, 185, 129, 0.2);
+            '>
+                <h4 style='color: #065f46; margin-bottom: 0.8rem;'>✅ {t('system_status')}</h4>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📊 {t('coverage')}:</b> <span style="color: {coverage_color}; font-weight: 700; font-size: 1.1rem;">{coverage:.0f}%</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🎯 {t('status')}:</b> <span style='color: #065f46; font-weight: 600;'>{coverage_status}</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>☀️ Peak Hours:</b> <span style='color: #065f46; font-weight: 600;'>{st.session_state.system_config.sunlight_hours:.1f} hrs/day</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📍 Location:</b> <span style='color: #065f46; font-weight: 600;'>{st.session_state.system_config.location}</span></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with overview_col6:
+            # Calculate total pricing (with 30% markup for customer)
+            equipment_cost = 0.0
+            if st.session_state.system_config.solar_panels:
+                equipment_cost += st.session_state.system_config.solar_panels.cost_per_panel * st.session_state.system_config.solar_panels.quantity
+            if st.session_state.system_config.battery:
+                equipment_cost += st.session_state.system_config.battery.total_cost
+            if st.session_state.system_config.inverter:
+                equipment_cost += st.session_state.system_config.inverter.cost
+            
+            labor_cost = st.session_state.system_config.labor_cost
+            support_cost = st.session_state.system_config.support_material_cost
+            total_wholesale = equipment_cost + labor_cost + support_cost
+            total_customer = total_wholesale * 1.30  # 30% markup
+            
+            st.markdown(f"""
+            <div class="custom-card" style='
+                background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%);
+                border-left: 4px solid #ec4899;
+                box-shadow: 0 4px 6px rgba(236, 72, 153, 0.2);
+            '>
+                <h4 style='color: #9f1239; margin-bottom: 0.8rem;'>💰 System Pricing</h4>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>📦 Equipment:</b> <span style='color: #9f1239; font-weight: 600;'>${equipment_cost:,.2f}</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>🔧 Installation:</b> <span style='color: #9f1239; font-weight: 600;'>${(labor_cost + support_cost):,.2f}</span></p>
+                <p style='margin: 0.4rem 0; font-size: 0.9rem;'><b>💵 Wholesale:</b> <span style='color: #9f1239; font-weight: 600;'>${total_wholesale:,.2f}</span></p>
+                <p style='margin: 0.6rem 0 0.2rem 0; padding-top: 0.5rem; border-top: 2px solid #ec4899; font-size: 0.95rem;'><b>🏷️ Customer Price (+30%):</b></p>
+                <p style='margin: 0; font-size: 1.3rem;'><span style="color: #be185d; font-weight: 700;">${total_customer:,.2f}</span></p>
+            </div>
+            """, unsafe_allow_html=True)
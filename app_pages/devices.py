@@ -0,0 +1,940 @@
+"""
+Devices Page
+Device list, presets and load calculators
+"""
+import streamlit as st
+import pandas as pd
+
+from device_database import DEVICE_DATABASE
+from models import Device, SolarPanel, Battery, Inverter
+from translations import t
+
+
+def render():
+    """Render the devices page"""
+    st.title(t('device_management'))
+    st.markdown(f"#### {t('device_subtitle')}")
+    
+    tab1, tab2, tab3, tab4 = st.tabs([t('add_device'), t('device_list'), t('quick_add'), '🧮 Quick Calculator'])
+    
+    with tab1:
+        st.markdown(f"### {t('add_new_device')}")
+        st.markdown(f"**{t('tip_select_device')}**")
+        
+        with st.form("device_form", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Device selection with auto-recognition
+                device_options = [t('custom_device')] + sorted(list(DEVICE_DATABASE.keys()))
+                selected_device = st.selectbox(
+                    t('select_device_custom'),
+                    device_options,
+                    help=t('choose_from_common')
+                )
+                
+                # Auto-fill values if device is selected from database
+                if selected_device != t('custom_device'):
+                    device_info = DEVICE_DATABASE[selected_device]
+                    default_name = selected_device
+                    default_power = int(device_info["power"])
+                    default_hours = 4.0  # Will be updated from device_info
+                    # Ensure hours is always float
+                    try:
+                        default_hours = float(device_info["hours"])
+                    except (ValueError, TypeError):
+                        default_hours = 4.0
+                    default_type = device_info["type"]
+                    default_priority = device_info["priority"]
+                    default_inverter = device_info.get("inverter", False)
+                else:
+                    default_name = ""
+                    default_power = 100
+                    default_hours = 4.0
+                    default_type = "general"
+                    default_priority = False
+                    default_inverter = False
+                
+                name = st.text_input(
+                    f"{t('device_name')} *",
+                    value=default_name,
+                    placeholder=t('example_placeholder')
+                )
+                
+                quantity = st.number_input(
+                    t('quantity'),
+                    min_value=1,
+                    value=1,
+                    step=1,
+                    help=t('number_identical')
+                )
+                
+                power = st.number_input(
+                    f"{t('power_consumption')} *",
+                    min_value=1,
+                    value=default_power,
+                    step=10,
+                    help=t('power_rating_watts')
+                )
+                
+                # Absolutely ensure hours value is float type
+                hours_value = float(default_hours) if default_hours is not None else 4.0
+                hours = st.number_input(
+                    f"{t('daily_usage_hours')} *",
+                    min_value=0.0,
+                    max_value=24.0,
+                    value=hours_value,
+                    step=0.5,
+                    format="%.1f",
+                    help=t('hours_per_day')
+                )
+            
+            with col2:
+                device_type = st.selectbox(
+                    t('device_category'),
+                    ["general", "cooling", "heating", "lighting", "kitchen", "entertainment", "office"],
+                    index=["general", "cooling", "heating", "lighting", "kitchen", "entertainment", "office"].index(default_type),
+                    help=t('category_help')
+                )
+                
+                is_priority = st.checkbox(
+                    t('priority_device'),
+                    value=default_priority,
+                    help=t('priority_help')
+                )
+                
+                # Inverter technology checkbox
+                has_inverter = st.checkbox(
+                    t('inverter_tech'),
+                    value=default_inverter,
+                    help=t('inverter_help')
+                )
+                
+                # Calculate inverter savings
+                inverter_savings_percent = 0
+                if has_inverter:
+                    if device_type == "cooling":
+                        inverter_savings_percent = 40
+                    elif device_type == "heating":
+                        inverter_savings_percent = 35
+                    else:
+                        inverter_savings_percent = 30
+                
+                effective_power = power * (1 - inverter_savings_percent / 100) if has_inverter else power
+                
+                # Calculate and display energy
+                daily_energy = (effective_power * hours / 1000) * quantity
+                daily_without_inverter = (power * hours / 1000) * quantity
+                daily_savings = daily_without_inverter - daily_energy if has_inverter else 0
+                monthly_energy = daily_energy * 30
+                monthly_savings = daily_savings * 30
+                yearly_cost = monthly_energy * 12 * 0.20  # Assume $0.20/kWh
+                yearly_savings_cost = monthly_savings * 12 * 0.20
+                
+                if has_inverter:
+                    st.markdown(f"""
+                    <div class="success-box" style="padding: 1rem;">
+                        <h4>{t('energy_impact_inverter')}</h4>
+                        <p><b>{t('quantity')}:</b> {quantity}x</p>
+                        <p><b>{t('power_savings')}:</b> {inverter_savings_percent}%</p>
+                        <p><b>{t('daily')}:</b> {daily_energy:.2f} kWh <span style="color: #10b981;">({t('save_text')} {daily_savings:.2f} kWh)</span></p>
+                        <p><b>{t('monthly')}:</b> {monthly_energy:.2f} kWh <span style="color: #10b981;">({t('save_text')} {monthly_savings:.2f} kWh)</span></p>
+                        <p><b>{t('yearly_cost')}:</b> ${yearly_cost:.2f} <span style="color: #10b981;">({t('save_text')} ${yearly_savings_cost:.2f})</span></p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown(f"""
+                    <div class="info-box" style="padding: 1rem;">
+                        <h4>{t('energy_impact')}</h4>
+                        <p><b>{t('quantity')}:</b> {quantity}x</p>
+                        <p><b>{t('daily')}:</b> {daily_energy:.2f} kWh</p>
+                        <p><b>{t('monthly')}:</b> {monthly_energy:.2f} kWh</p>
+                        <p><b>{t('yearly_cost')}:</b> ${yearly_cost:.2f}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            submitted = st.form_submit_button(t('add_devices'), type="primary", use_container_width=True)
+            
+            if submitted:
+                if name and name.strip():
+                    # Add devices based on quantity
+                    for i in range(quantity):
+                        device_name = name.strip() if quantity == 1 else f"{name.strip()} #{i+1}"
+                        new_device = Device(device_name, power, hours, is_priority, [], device_type, has_inverter)
+                        st.session_state.devices.append(new_device)
+                    
+                    inverter_text = " with Inverter Technology" if has_inverter else ""
+                    savings_text = f" (Saves {daily_savings:.2f} kWh/day)" if has_inverter else ""
+                    success_msg = f"✅ Successfully added **{quantity}x {name}**{inverter_text} - {daily_energy:.2f} kWh/day{savings_text}"
+                    st.success(success_msg)
+                    st.rerun()
+                else:
+                    st.error(f"⚠️ {t('enter_device_name')}")
+    
+    with tab2:
+        if st.session_state.devices:
+            st.markdown(f"### {t('your_devices')}")
+            
+            # Summary metrics
+            col1, col2, col3 = st.columns(3)
+            total_devices = len(st.session_state.devices)
+            total_daily = sum(d.daily_energy_kwh for d in st.session_state.devices)
+            priority_count = sum(1 for d in st.session_state.devices if d.is_priority)
+            
+            with col1:
+                st.metric(t('total_devices_label'), total_devices)
+            with col2:
+                st.metric(t('daily_consumption'), f"{total_daily:.2f} kWh")
+            with col3:
+                st.metric(t('priority_devices'), priority_count)
+            
+            st.markdown("---")
+            
+            # Enhanced device table with inverter info
+            device_data = []
+            total_saved = 0
+            for idx, d in enumerate(st.session_state.devices):
+                inverter_icon = "⚡" if d.has_inverter else ""
+                savings_pct = f"(-{d.inverter_savings_percent}%)" if d.has_inverter else ""
+                total_saved += d.power_saved_kwh
+                
+                device_data.append({
+                    "#": idx + 1,
+                    t('device'): d.name,
+                    t('type'): d.device_type.title(),
+                    t('power_w'): f"{d.power_watts:.0f} {inverter_icon}",
+                    t('effective_w'): f"{d.effective_power_watts:.0f} {savings_pct}" if d.has_inverter else f"{d.power_watts:.0f}",
+                    t('hours_day'): d.daily_hours,
+                    t('daily_kwh'): round(d.daily_energy_kwh, 2),
+                    t('monthly_kwh'): round(d.daily_energy_kwh * 30, 1),
+                    t('priority'): "⭐" if d.is_priority else "○"
+                })
+            
+            df = pd.DataFrame(device_data)
+            st.dataframe(df, use_container_width=True, hide_index=True)
+            
+            # Show total inverter savings if any
+            if total_saved > 0:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 0.8rem; margin-top: 1rem;">
+                    <p style="margin: 0;"><b>{t('total_inverter_savings')}:</b> {total_saved:.2f} kWh/{t('daily').lower()} ({total_saved * 30:.2f} kWh/{t('monthly').lower()}) - {t('save_month')} ${total_saved * 30 * 0.20:.2f}/{t('monthly').lower()}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Device management
+            st.markdown("---")
+            st.markdown(f"#### {t('remove_device_title')}")
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                idx = st.selectbox(
+                    t('select_device_remove'),
+                    range(len(st.session_state.devices)),
+                    format_func=lambda x: f"{st.session_state.devices[x].name} ({st.session_state.devices[x].daily_energy_kwh:.2f} kWh/{t('daily').lower()})"
+                )
+            with col2:
+                st.markdown("<br>", unsafe_allow_html=True)
+                if st.button(t('remove_device_btn'), type="secondary", use_container_width=True):
+                    removed = st.session_state.devices.pop(idx)
+                    st.success(f"{t('removed')} {removed.name}")
+                    st.rerun()
+        else:
+            st.markdown(f"""
+            <div class="warning-box">
+                <h3>{t('no_devices_yet')}</h3>
+                <p>{t('get_started_first')} <b>{t('add_device_tab')}</b> {t('tab_above')}</p>
+                <p>{t('or_use_quick')} <b>{t('quick_add_tab')}</b> {t('to_add_typical')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with tab3:
+        st.markdown(f"### {t('quick_add_home_presets')}")
+        st.markdown(t('select_home_size'))
+        
+        # Home size presets
+        preset_col1, preset_col2, preset_col3 = st.columns(3)
+        
+        # Small Home Preset
+        with preset_col1:
+            st.markdown(f"""
+            <div class="custom-card">
+                <h4>{t('small_home')}</h4>
+                <p><b>{t('size')}:</b> 1-2 {t('bedrooms')}</p>
+                <p><b>{t('people')}:</b> 1-3</p>
+                <p><b>{t('monthly_usage')}:</b> ~250-350 kWh</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button(t('add_small_setup'), key="small_home", use_container_width=True):
+                small_home_devices = [
+                    ("Refrigerator", 150, 24, True, "cooling"),
+                    ("Air Conditioner 1HP", 1000, 6, False, "cooling"),
+                    ("Ceiling Fan #1", 75, 8, False, "cooling"),
+                    ("Ceiling Fan #2", 75, 8, False, "cooling"),
+                    ("LED Bulb 9W #1", 9, 5, True, "lighting"),
+                    ("LED Bulb 9W #2", 9, 5, True, "lighting"),
+                    ("LED Bulb 9W #3", 9, 5, True, "lighting"),
+                    ("LED Bulb 9W #4", 9, 4, True, "lighting"),
+                    ("Rice Cooker", 500, 1, True, "kitchen"),
+                    ("TV LED 32 inch", 60, 4, False, "entertainment"),
+                    ("Washing Machine", 500, 0.5, False, "general"),
+                    ("Water Pump", 300, 0.5, True, "general"),
+                    ("Router/Modem", 10, 24, True, "office"),
+                    ("Iron", 1000, 0.3, False, "general"),
+                ]
+                for name, power, hours, priority, dtype in small_home_devices:
+                    st.session_state.devices.append(Device(name, power, hours, priority, [], dtype))
+                st.success(t('added_small'))
+                st.rerun()
+        
+        # Medium Home Preset
+        with preset_col2:
+            st.markdown(f"""
+            <div class="custom-card">
+                <h4>{t('medium_home')}</h4>
+                <p><b>{t('size')}:</b> 3-4 {t('bedrooms')}</p>
+                <p><b>{t('people')}:</b> 4-6</p>
+                <p><b>{t('monthly_usage')}:</b> ~400-600 kWh</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button(t('add_medium_setup'), key="medium_home", use_container_width=True):
+                medium_home_devices = [
+                    ("Refrigerator", 150, 24, True, "cooling"),
+                    ("Freezer", 200, 24, True, "cooling"),
+                    ("Air Conditioner 1.5HP #1", 1500, 8, False, "cooling"),
+                    ("Air Conditioner 1.5HP #2", 1500, 6, False, "cooling"),
+                    ("Ceiling Fan #1", 75, 10, False, "cooling"),
+                    ("Ceiling Fan #2", 75, 10, False, "cooling"),
+                    ("Ceiling Fan #3", 75, 8, False, "cooling"),
+                    ("LED Bulb 12W #1", 12, 6, True, "lighting"),
+                    ("LED Bulb 12W #2", 12, 6, True, "lighting"),
+                    ("LED Bulb 12W #3", 12, 6, True, "lighting"),
+                    ("LED Bulb 9W #1", 9, 5, True, "lighting"),
+                    ("LED Bulb 9W #2", 9, 5, True, "lighting"),
+                    ("LED Tube 18W #1", 18, 5, True, "lighting"),
+                    ("LED Tube 18W #2", 18, 5, True, "lighting"),
+                    ("Rice Cooker", 500, 1.5, True, "kitchen"),
+                    ("Microwave", 1000, 0.5, False, "kitchen"),
+                    ("Electric Kettle", 1500, 0.5, False, "kitchen"),
+                    ("TV LED 43 inch", 80, 5, False, "entertainment"),
+                    ("TV LED 32 inch", 60, 3, False, "entertainment"),
+                    ("Sound System", 100, 3, False, "entertainment"),
+                    ("Washing Machine", 500, 1, False, "general"),
+                    ("Water Pump", 300, 0.8, True, "general"),
+                    ("Iron", 1000, 0.5, False, "general"),
+                    ("Router/Modem", 10, 24, True, "office"),
+                    ("Laptop #1", 65, 6, False, "office"),
+                    ("Laptop #2", 65, 4, False, "office"),
+                ]
+                for name, power, hours, priority, dtype in medium_home_devices:
+                    st.session_state.devices.append(Device(name, power, hours, priority, [], dtype))
+                st.success(t('added_medium'))
+                st.rerun()
+        
+        # Large Home Preset
+        with preset_col3:
+            st.markdown(f"""
+            <div class="custom-card">
+                <h4>{t('large_home')}</h4>
+                <p><b>{t('size')}:</b> 5+ {t('bedrooms')}</p>
+                <p><b>{t('people')}:</b> 6-10</p>
+                <p><b>{t('monthly_usage')}:</b> ~700-1000 kWh</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button(t('add_large_setup'), key="large_home", use_container_width=True):
+                large_home_devices = [
+                    ("Refrigerator #1", 150, 24, True, "cooling"),
+                    ("Refrigerator #2", 150, 24, True, "cooling"),
+                    ("Freezer", 200, 24, True, "cooling"),
+                    ("Air Conditioner 2HP #1", 2000, 10, False, "cooling"),
+                    ("Air Conditioner 1.5HP #1", 1500, 8, False, "cooling"),
+                    ("Air Conditioner 1.5HP #2", 1500, 8, False, "cooling"),
+                    ("Air Conditioner 1HP #1", 1000, 6, False, "cooling"),
+                    ("Ceiling Fan #1", 75, 12, False, "cooling"),
+                    ("Ceiling Fan #2", 75, 12, False, "cooling"),
+                    ("Ceiling Fan #3", 75, 10, False, "cooling"),
+                    ("Ceiling Fan #4", 75, 10, False, "cooling"),
+                    ("Standing Fan #1", 60, 8, False, "cooling"),
+                    ("LED Bulb 12W #1", 12, 7, True, "lighting"),
+                    ("LED Bulb 12W #2", 12, 7, True, "lighting"),
+                    ("LED Bulb 12W #3", 12, 7, True, "lighting"),
+                    ("LED Bulb 12W #4", 12, 6, True, "lighting"),
+                    ("LED Tube 18W #1", 18, 6, True, "lighting"),
+                    ("LED Tube 18W #2", 18, 6, True, "lighting"),
+                    ("LED Tube 18W #3", 18, 5, True, "lighting"),
+                    ("LED Strip Lights", 30, 5, False, "lighting"),
+                    ("Rice Cooker", 500, 2, True, "kitchen"),
+                    ("Microwave", 1000, 0.8, False, "kitchen"),
+                    ("Electric Kettle", 1500, 0.8, False, "kitchen"),
+                    ("Toaster", 800, 0.3, False, "kitchen"),
+                    ("Blender", 300, 0.3, False, "kitchen"),
+                    ("Water Heater", 2000, 1.5, False, "heating"),
+                    ("TV LED 55 inch", 120, 6, False, "entertainment"),
+                    ("TV LED 43 inch", 80, 4, False, "entertainment"),
+                    ("Sound System", 100, 4, False, "entertainment"),
+                    ("Gaming Console", 150, 3, False, "entertainment"),
+                    ("Washing Machine", 500, 1.5, False, "general"),
+                    ("Water Pump", 300, 1, True, "general"),
+                    ("Iron", 1000, 0.8, False, "general"),
+                    ("Vacuum Cleaner", 1000, 0.5, False, "general"),
+                    ("Router/Modem", 10, 24, True, "office"),
+                    ("Desktop Computer", 300, 8, False, "office"),
+                    ("Laptop #1", 65, 6, False, "office"),
+                    ("Laptop #2", 65, 6, False, "office"),
+                    ("Monitor", 40, 8, False, "office"),
+                    ("Printer", 50, 0.5, False, "office"),
+                ]
+                for name, power, hours, priority, dtype in large_home_devices:
+                    st.session_state.devices.append(Device(name, power, hours, priority, [], dtype))
+                st.success(t('added_large'))
+                st.rerun()
+    
+    with tab4:
+        st.markdown("### 🧮 Quick System Calculator")
+        st.markdown("Get instant system recommendations based on your usage or desired inverter size")
+        
+        calc_tab1, calc_tab2 = st.tabs(["📊 From Monthly Usage", "⚡ From Inverter Size"])
+        
+        with calc_tab1:
+            st.markdown("#### Calculate System from Monthly kWh Usage")
+            st.markdown("Enter your monthly electricity usage to get AI-powered system recommendations")
+            
+            col1, col2 = st.columns([2, 3])
+            
+            with col1:
+                monthly_kwh = st.number_input(
+                    "Monthly Usage (kWh)",
+                    min_value=50.0,
+                    max_value=5000.0,
+                    value=400.0,
+                    step=50.0,
+                    help="Enter your average monthly electricity consumption in kWh"
+                )
+                
+                usage_pattern = st.selectbox(
+                    "Usage Pattern",
+                    ["Balanced (Day & Night)", "Mostly Daytime", "Mostly Evening/Night"],
+                    help="When do you use most electricity?"
+                )
+                
+                grid_available = st.checkbox("Grid Connection Available", value=True)
+                
+                if st.button("🔍 Calculate System", type="primary", use_container_width=True):
+                    # Calculate daily load
+                    daily_kwh = monthly_kwh / 30
+                    
+                    # Calculate system requirements
+                    sunlight_hours = 5.5  # Cambodia average
+                    system_efficiency = 0.85
+                    
+                    # PV sizing
+                    pv_kw = daily_kwh / (sunlight_hours * system_efficiency)
+                    
+                    # Battery sizing based on usage pattern
+                    if usage_pattern == "Mostly Daytime":
+                        battery_kwh = daily_kwh * 0.3  # 30% backup
+                        battery_note = "Smaller battery since most usage is during solar generation"
+                    elif usage_pattern == "Mostly Evening/Night":
+                        battery_kwh = daily_kwh * 0.7  # 70% backup
+                        battery_note = "Larger battery for evening/night usage"
+                    else:
+                        battery_kwh = daily_kwh * 0.5  # 50% backup
+                        battery_note = "Balanced battery for day and night usage"
+                    
+                    # Improved inverter sizing
+                    # Residential peak load typically occurs over 4-6 hours
+                    # Using 5 hours as optimal balance
+                    estimated_peak_kw = daily_kwh / 5  # Peak concentrated in 5 hours
+                    inverter_kw = estimated_peak_kw * 1.3  # 30% safety margin
+                    
+                    # Panel calculations
+                    panel_wattage = 450  # Standard panel
+                    num_panels = int(pv_kw * 1000 / panel_wattage) + 1
+                    
+                    st.session_state.calc_results = {
+                        'monthly_kwh': monthly_kwh,
+                        'daily_kwh': daily_kwh,
+                        'pv_kw': pv_kw,
+                        'battery_kwh': battery_kwh,
+                        'inverter_kw': inverter_kw,
+                        'num_panels': num_panels,
+                        'panel_wattage': panel_wattage,
+                        'battery_note': battery_note,
+                        'usage_pattern': usage_pattern
+                    }
+            
+            with col2:
+                if 'calc_results' in st.session_state:
+                    results = st.session_state.calc_results
+                    
+                    st.markdown(f"""
+                    <div class="success-box" style="padding: 1.5rem;">
+                        <h3 style="margin-top: 0;">🎯 Recommended System Configuration</h3>
+                        <hr>
+                        <h4>📊 Your Usage</h4>
+                        <p><b>Monthly:</b> {results['monthly_kwh']:.0f} kWh</p>
+                        <p><b>Daily Average:</b> {results['daily_kwh']:.2f} kWh</p>
+                        <p><b>Pattern:</b> {results['usage_pattern']}</p>
+                        
+                        <hr>
+                        <h4>☀️ Solar Panels</h4>
+                        <p><b>Total Capacity:</b> {results['pv_kw']:.2f} kW</p>
+                        <p><b>Recommended:</b> {results['num_panels']}x {results['panel_wattage']}W panels</p>
+                        <p><small>Actual capacity: {results['num_panels'] * results['panel_wattage'] / 1000:.2f} kW</small></p>
+                        
+                        <hr>
+                        <h4>🔋 Battery Storage</h4>
+                        <p><b>Capacity:</b> {results['battery_kwh']:.2f} kWh</p>
+                        <p><small>{results['battery_note']}</small></p>
+                        
+                        <hr>
+                        <h4>⚡ Inverter</h4>
+                        <p><b>Power Rating:</b> {results['inverter_kw']:.2f} kW</p>
+                        <p><small>Sized for peak loads with 25% safety margin</small></p>
+                        
+                        <hr>
+                        <h4>💰 Estimated Costs</h4>
+                        <p><b>Equipment:</b> ${(results['num_panels'] * 180 + results['battery_kwh'] * 300 + results['inverter_kw'] * 200):,.0f}</p>
+                        <p><b>Labor:</b> ${250 if results['inverter_kw'] <= 5 else 500}</p>
+                        <p><b>Materials:</b> ${450 + (results['inverter_kw'] - 5) * 30 if results['inverter_kw'] > 5 else 450}</p>
+                        <p><b>Total Est.:</b> ${(results['num_panels'] * 180 + results['battery_kwh'] * 300 + results['inverter_kw'] * 200 + (250 if results['inverter_kw'] <= 5 else 500) + (450 + (results['inverter_kw'] - 5) * 30 if results['inverter_kw'] > 5 else 450)):,.0f}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if st.button("✅ Apply to System Config", use_container_width=True):
+                        # Create system configuration
+                        st.session_state.system_config.solar_panels = SolarPanel(
+                            name=f"Solar Panel {results['panel_wattage']}W",
+                            power_watts=results['panel_wattage'],
+                            efficiency=0.21,
+                            cost_per_panel=180.0,
+                            quantity=results['num_panels']
+                        )
+                        st.session_state.system_config.battery = Battery(
+                            name=f"Battery {results['battery_kwh']:.1f}kWh",
+                            capacity_kwh=results['battery_kwh'],
+                            voltage=48.0,
+                            depth_of_discharge=0.8,
+                            efficiency=0.95,
+                            cost=results['battery_kwh'] * 300,
+                            quantity=1
+                        )
+                        st.session_state.system_config.inverter = Inverter(
+                            name=f"Hybrid Inverter {results['inverter_kw']:.1f}kW",
+                            power_kw=results['inverter_kw'],
+                            efficiency=0.97,
+                            cost=results['inverter_kw'] * 180
+                        )
+                        
+                        # Auto-generate typical devices based on calculated load
+                        # Clear existing devices first
+                        st.session_state.devices.clear()
+                        
+                        # Calculate device distribution based on usage pattern
+                        daily_kwh = results['daily_kwh']
+                        
+                        # Generate typical household devices that sum to the daily load
+                        # Base devices (always present)
+                        typical_devices = [
+                            ("Refrigerator", 150, 24, True, "cooling", False),
+                            ("LED Bulb 12W #1", 12, 6, True, "lighting", False),
+                            ("LED Bulb 12W #2", 12, 6, True, "lighting", False),
+                            ("LED Bulb 12W #3", 12, 5, True, "lighting", False),
+                            ("Router/Modem", 10, 24, True, "office", False),
+                            ("Rice Cooker", 500, 1, True, "kitchen", False),
+                            ("Water Pump", 300, 0.5, True, "general", False),
+                        ]
+                        
+                        # Add cooling devices based on load size
+                        if daily_kwh > 10:
+                            typical_devices.append(("Air Conditioner 1.5HP", 1500, 6, False, "cooling", True))
+                            typical_devices.append(("Ceiling Fan #1", 75, 8, False, "cooling", False))
+                            typical_devices.append(("Ceiling Fan #2", 75, 8, False, "cooling", False))
+                        
+                        if daily_kwh > 15:
+                            typical_devices.append(("TV LED 43 inch", 80, 4, False, "entertainment", False))
+                            typical_devices.append(("Washing Machine", 500, 1, False, "general", False))
+                        
+                        if daily_kwh > 20:
+                            typical_devices.append(("Air Conditioner 1HP", 1000, 5, False, "cooling", True))
+                            typical_devices.append(("Microwave", 1000, 0.5, False, "kitchen", False))
+                            typical_devices.append(("Laptop", 65, 6, False, "office", False))
+                        
+                        if daily_kwh > 30:
+                            typical_devices.append(("Freezer", 200, 24, True, "cooling", False))
+                            typical_devices.append(("Water Heater", 2000, 1.5, False, "heating", False))
+                        
+                        # Add devices to session state
+                        for name, power, hours, priority, dtype, has_inverter in typical_devices:
+                            st.session_state.devices.append(Device(name, power, hours, priority, [], dtype, has_inverter))
+                        
+                        st.success(f"✅ System configuration applied with {len(typical_devices)} typical devices! Ready for simulation.")
+                        st.balloons()
+                else:
+                    st.info("👈 Enter your monthly usage and click Calculate to see recommendations")
+        
+        with calc_tab2:
+            st.markdown("#### Calculate System from Inverter Size")
+            st.markdown("Start with your desired inverter size and get complete system recommendations")
+            
+            col1, col2 = st.columns([2, 3])
+            
+            with col1:
+                inverter_size = st.number_input(
+                    "Inverter Size (kW)",
+                    min_value=1.0,
+                    max_value=50.0,
+                    value=5.0,
+                    step=0.5,
+                    help="Enter your desired inverter capacity in kW"
+                )
+                
+                target_autonomy = st.slider(
+                    "Backup Hours (Autonomy)",
+                    min_value=2,
+                    max_value=24,
+                    value=6,
+                    step=1,
+                    help="How many hours of backup do you need?"
+                )
+                
+                pv_ratio = st.slider(
+                    "PV to Inverter Ratio",
+                    min_value=0.8,
+                    max_value=2.0,
+                    value=1.2,
+                    step=0.1,
+                    help="PV array size relative to inverter. Higher = more generation"
+                )
+                
+                if st.button("🔍 Calculate System", type="primary", use_container_width=True, key="calc_inv"):
+                    # Calculate based on inverter
+                    pv_kw = inverter_size * pv_ratio
+                    
+                    # Battery sizing
+                    # Assume inverter runs at 70% capacity during peak
+                    peak_load_kw = inverter_size * 0.7
+                    battery_kwh = (peak_load_kw * target_autonomy) / 0.8  # 80% DoD
+                    
+                    # Daily energy estimate
+                    sunlight_hours = 5.5
+                    system_efficiency = 0.85
+                    daily_kwh = pv_kw * sunlight_hours * system_efficiency
+                    monthly_kwh = daily_kwh * 30
+                    
+                    # Panel calculations
+                    panel_wattage = 450
+                    num_panels = int(pv_kw * 1000 / panel_wattage) + 1
+                    
+                    st.session_state.calc_inv_results = {
+                        'inverter_kw': inverter_size,
+                        'pv_kw': pv_kw,
+                        'battery_kwh': battery_kwh,
+                        'daily_kwh': daily_kwh,
+                        'monthly_kwh': monthly_kwh,
+                        'num_panels': num_panels,
+                        'panel_wattage': panel_wattage,
+                        'target_autonomy': target_autonomy,
+                        'pv_ratio': pv_ratio
+                    }
+            
+            with col2:
+                if 'calc_inv_results' in st.session_state:
+                    results = st.session_state.calc_inv_results
+                    
+                    st.markdown(f"""
+                    <div class="success-box" style="padding: 1.5rem;">
+                        <h3 style="margin-top: 0;">🎯 Recommended System Configuration</h3>
+                        <hr>
+                        <h4>⚡ Inverter (Starting Point)</h4>
+                        <p><b>Power Rating:</b> {results['inverter_kw']:.2f} kW</p>
+                        <p><b>Peak Output:</b> {results['inverter_kw'] * 0.9:.2f} kW (continuous)</p>
+                        
+                        <hr>
+                        <h4>☀️ Solar Panels</h4>
+                        <p><b>Total Capacity:</b> {results['pv_kw']:.2f} kW</p>
+                        <p><b>Recommended:</b> {results['num_panels']}x {results['panel_wattage']}W panels</p>
+                        <p><b>PV/Inv Ratio:</b> {results['pv_ratio']:.1f}x</p>
+                        <p><small>Higher ratio = more daytime generation</small></p>
+                        
+                        <hr>
+                        <h4>🔋 Battery Storage</h4>
+                        <p><b>Capacity:</b> {results['battery_kwh']:.2f} kWh</p>
+                        <p><b>Backup Time:</b> {results['target_autonomy']} hours at 70% load</p>
+                        <p><small>Provides backup during grid outages</small></p>
+                        
+                        <hr>
+                        <h4>📊 Expected Generation</h4>
+                        <p><b>Daily:</b> {results['daily_kwh']:.2f} kWh</p>
+                        <p><b>Monthly:</b> {results['monthly_kwh']:.0f} kWh</p>
+                        <p><b>Annual:</b> {results['daily_kwh'] * 365:.0f} kWh</p>
+                        
+                        <hr>
+                        <h4>💰 Estimated Costs</h4>
+                        <p><small>Based on actual products from catalog</small></p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if st.button("✅ Apply to System Config", use_container_width=True, key="apply_inv"):
+                        # Get actual products from catalog
+                        pm = st.session_state.product_manager
+                        recommended_panel = pm.get_recommended_panel(min_wattage=results['panel_wattage'])
+                        recommended_battery = pm.get_recommended_battery(min_capacity_kwh=results['battery_kwh'])
+                        recommended_inverter = pm.get_recommended_inverter(min_power_kw=results['inverter_kw'], inverter_type="Hybrid")
+                        
+                        # Use recommended products or fallback to generic with estimated prices
+                        panel_name = recommended_panel.name if recommended_panel else f"Solar Panel {results['panel_wattage']}W"
+                        panel_cost = recommended_panel.cost if recommended_panel else (results['panel_wattage'] * 0.15)
+                        
+                        battery_name = recommended_battery.name if recommended_battery else f"Battery {results['battery_kwh']:.1f}kWh"
+                        battery_cost = recommended_battery.cost if recommended_battery else (results['battery_kwh'] * 250)
+                        battery_voltage = recommended_battery.specifications.get('voltage', 48.0) if recommended_battery else 48.0
+                        
+                        inverter_name = recommended_inverter.name if recommended_inverter else f"Hybrid Inverter {results['inverter_kw']:.1f}kW"
+                        inverter_cost = recommended_inverter.cost if recommended_inverter else (results['inverter_kw'] * 180)
+                        
+                        # Create system configuration
+                        st.session_state.system_config.solar_panels = SolarPanel(
+                            name=panel_name,
+                            power_watts=results['panel_wattage'],
+                            efficiency=0.21,
+                            cost_per_panel=panel_cost,
+                            quantity=results['num_panels']
+                        )
+                        st.session_state.system_config.battery = Battery(
+                            name=battery_name,
+                            capacity_kwh=results['battery_kwh'],
+                            voltage=battery_voltage,
+                            depth_of_discharge=0.8,
+                            efficiency=0.95,
+                            cost=battery_cost,
+                            quantity=1
+                        )
+                        st.session_state.system_config.inverter = Inverter(
+                            name=inverter_name,
+                            power_kw=results['inverter_kw'],
+                            efficiency=0.97,
+                            cost=inverter_cost
+                        )
+                        
+                        # Auto-generate typical devices based on calculated load
+                        # Clear existing devices first
+                        st.session_state.devices.clear()
+                        
+                        # Calculate device distribution based on expected generation
+                        daily_kwh = results['daily_kwh']
+                        
+                        # Generate typical household devices that sum to the daily load
+                        # Base devices (always present)
+                        typical_devices = [
+                            ("Refrigerator", 150, 24, True, "cooling", False),
+                            ("LED Bulb 12W #1", 12, 6, True, "lighting", False),
+                            ("LED Bulb 12W #2", 12, 6, True, "lighting", False),
+                            ("LED Bulb 12W #3", 12, 5, True, "lighting", False),
+                            ("Router/Modem", 10, 24, True, "office", False),
+                            ("Rice Cooker", 500, 1, True, "kitchen", False),
+                            ("Water Pump", 300, 0.5, True, "general", False),
+                        ]
+                        
+                        # Add cooling devices based on load size
+                        if daily_kwh > 10:
+                            typical_devices.append(("Air Conditioner 1.5HP", 1500, 6, False, "cooling", True))
+                            typical_devices.append(("Ceiling Fan #1", 75, 8, False, "cooling", False))
+                            typical_devices.append(("Ceiling Fan #2", 75, 8, False, "cooling", False))
+                        
+                        if daily_kwh > 15:
+                            typical_devices.append(("TV LED 43 inch", 80, 4, False, "entertainment", False))
+                            typical_devices.append(("Washing Machine", 500, 1, False, "general", False))
+                        
+                        if daily_kwh > 20:
+                            typical_devices.append(("Air Conditioner 1HP", 1000, 5, False, "cooling", True))
+                            typical_devices.append(("Microwave", 1000, 0.5, False, "kitchen", False))
+                            typical_devices.append(("Laptop", 65, 6, False, "office", False))
+                        
+                        if daily_kwh > 30:
+                            typical_devices.append(("Freezer", 200, 24, True, "cooling", False))
+                            typical_devices.append(("Water Heater", 2000, 1.5, False, "heating", False))
+                        
+                        # Add devices to session state
+                        for name, power, hours, priority, dtype, has_inverter in typical_devices:
+                            st.session_state.devices.append(Device(name, power, hours, priority, [], dtype, has_inverter))
+                        
+                        st.success(f"✅ System configuration applied with {len(typical_devices)} typical devices! Ready for simulation.")
+                        st.balloons()
+                else:
+                    st.info("👈 Enter your inverter size and click Calculate to see recommendations")
+        
+        st.markdown("---")
+        st.markdown(f"### {t('individual_devices')}")
+        st.markdown(t('add_individual_one'))
+        
+        # Individual device quick add
+        individual_devices = [
+            ("Refrigerator", 150, 24, True, "cooling"),
+            ("Air Conditioner 1.5HP", 1500, 8, False, "cooling"),
+            ("Ceiling Fan", 75, 10, False, "cooling"),
+            ("LED Bulb 12W", 12, 5, True, "lighting"),
+            ("Rice Cooker", 500, 1, True, "kitchen"),
+            ("TV LED 43 inch", 80, 4, False, "entertainment"),
+            ("Washing Machine", 500, 1, False, "general"),
+            ("Water Pump", 300, 0.5, True, "general"),
+            ("Laptop", 65, 6, False, "office"),
+            ("Router/Modem", 10, 24, True, "office"),
+        ]
+        
+        cols = st.columns(2)
+        for idx, (name, power, hours, priority, dtype) in enumerate(individual_devices):
+            with cols[idx % 2]:
+                daily_kwh = (power * hours) / 1000
+                if st.button(
+                    f"➕ {name}\n{power}W, {hours}h/day ({daily_kwh:.2f} kWh)",
+                    key=f"quick_individual_{idx}",
+                    use_container_width=True
+                ):
+                    # Check if device already exists
+                    existing = any(d.name == name for d in st.session_state.devices)
+                    if not existing:
+                        st.session_state.devices.append(Device(name, power, hours, priority, [], dtype))
+                        st.success(t('added_device').format(name))
+                        st.rerun()
+                    else:
+                        st.warning(t('already_exists').format(name))
+        
+        # AI Recommendations Section
+        st.markdown("---")
+        st.markdown(f"### {t('ai_recommendations')}")
+        st.markdown(t('ai_subtitle'))
+        
+        if st.button(t('analyze_devices'), use_container_width=True, type="primary"):
+            with st.spinner(t('ai_analyzing')):
+                import time
+                time.sleep(1)  # Simulate AI processing
+                
+                # AI recommendation logic based on current devices
+                current_device_types = [d.device_type for d in st.session_state.devices]
+                current_device_names = [d.name.lower() for d in st.session_state.devices]
+                
+                recommendations = []
+                
+                # Check for missing essential devices
+                if not any('refrigerator' in name or 'fridge' in name for name in current_device_names):
+                    recommendations.append({
+                        'name': 'Refrigerator',
+                        'power': 150,
+                        'hours': 24,
+                        'priority': True,
+                        'type': 'cooling',
+                        'reason': 'Essential for food preservation, runs 24/7'
+                    })
+                
+                if not any('router' in name or 'modem' in name or 'wifi' in name for name in current_device_names):
+                    recommendations.append({
+                        'name': 'Router/Modem',
+                        'power': 10,
+                        'hours': 24,
+                        'priority': True,
+                        'type': 'office',
+                        'reason': 'Essential for internet connectivity'
+                    })
+                
+                # Check for efficiency upgrades
+                if any('air conditioner' in name or 'ac' in name for name in current_device_names):
+                    if not any(d.has_inverter and 'air conditioner' in d.name.lower() for d in st.session_state.devices):
+                        recommendations.append({
+                            'name': 'Inverter Air Conditioner 1.5HP',
+                            'power': 1500,
+                            'hours': 8,
+                            'priority': False,
+                            'type': 'cooling',
+                            'reason': 'Upgrade to inverter AC saves 40% energy',
+                            'inverter': True
+                        })
+                
+                # Suggest lighting upgrades
+                if not any('led' in name for name in current_device_names):
+                    recommendations.append({
+                        'name': 'LED Bulb 12W',
+                        'power': 12,
+                        'hours': 5,
+                        'priority': True,
+                        'type': 'lighting',
+                        'reason': 'Energy-efficient lighting, uses 80% less power than incandescent'
+                    })
+                
+                # Suggest fan for cooling efficiency
+                cooling_devices = [d for d in st.session_state.devices if d.device_type == 'cooling']
+                fan_count = sum(1 for d in st.session_state.devices if 'fan' in d.name.lower())
+                if len(cooling_devices) > 2 and fan_count < 2:
+                    recommendations.append({
+                        'name': 'Ceiling Fan',
+                        'power': 75,
+                        'hours': 10,
+                        'priority': False,
+                        'type': 'cooling',
+                        'reason': 'Reduces AC load by circulating air, saves energy'
+                    })
+                
+                # Suggest water heating for modern homes
+                if len(st.session_state.devices) > 15 and not any('water heater' in name or 'heater' in name for name in current_device_names):
+                    recommendations.append({
+                        'name': 'Water Heater',
+                        'power': 2000,
+                        'hours': 1.5,
+                        'priority': False,
+                        'type': 'heating',
+                        'reason': 'Convenient for daily hot water needs'
+                    })
+                
+                # Suggest backup power devices
+                if not any('water pump' in name or 'pump' in name for name in current_device_names):
+                    recommendations.append({
+                        'name': 'Water Pump',
+                        'power': 300,
+                        'hours': 0.5,
+                        'priority': True,
+                        'type': 'general',
+                        'reason': 'Essential for water supply, priority during power outage'
+                    })
+                
+                if recommendations:
+                    st.success(f"🤖 Found {len(recommendations)} recommendations based on your current setup!")
+                    
+                    for idx, rec in enumerate(recommendations):
+                        with st.expander(f"💡 {rec['name']} - {rec['power']}W"):
+                            col1, col2 = st.columns([2, 1])
+                            
+                            with col1:
+                                st.markdown(f"""
+                                **{t('recommendation')}:** {rec['name']}  
+                                **{t('power_w')}:** {rec['power']}W  
+                                **{t('hours_day')}:** {rec['hours']}h/{t('daily').lower()}  
+                                **{t('type')}:** {rec['type'].title()}  
+                                **{t('priority')}:** {'⭐ Yes' if rec['priority'] else '○ No'}  
+                                {'**Inverter:** ⚡ Yes' if rec.get('inverter') else ''}  
+                                
+                                **{t('reason')}:** {rec['reason']}
+                                """)
+                                
+                                daily_energy = (rec['power'] * rec['hours']) / 1000
+                                monthly_cost = daily_energy * 30 * 0.20
+                                st.info(f"📊 {t('energy_impact')}: {daily_energy:.2f} kWh/{t('daily').lower()} (${monthly_cost:.2f}/{t('monthly').lower()})")
+                            
+                            with col2:
+                                if st.button(t('add_recommended'), key=f"ai_rec_{idx}", use_container_width=True):
+                                    has_inverter = rec.get('inverter', False)
+                                    new_device = Device(
+                                        rec['name'],
+                                        rec['power'],
+                                        rec['hours'],
+                                        rec['priority'],
+                                        [],
+                                        rec['type'],
+                                        has_inverter
+                                    )
+                                    st.session_state.devices.append(new_device)
+                                    st.success(t('added_device').format(rec['name']))
+                                    st.rerun()
+                else:
+                    st.info("✅ Your device setup looks comprehensive! No additional recommendations at this time.")
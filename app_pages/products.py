@@ -0,0 +1,1121 @@
+"""
+Products Page
+Product catalog, price management and ready-made system sets
+"""
+import streamlit as st
+
+from translations import t
+
+
+def render():
+    """Render the products page"""
+    st.title("📦 Product Catalog & System Sets")
+    st.markdown("#### Complete product pricing with specifications and ready-to-install system packages")
+    
+    pm = st.session_state.product_manager
+    
+    # Initialize session state for pricing control
+    if 'price_markup' not in st.session_state:
+        st.session_state.price_markup = 30.0
+    if 'hide_wholesale' not in st.session_state:
+        st.session_state.hide_wholesale = False
+    if 'admin_authenticated' not in st.session_state:
+        st.session_state.admin_authenticated = False
+    if 'show_admin_panel' not in st.session_state:
+        st.session_state.show_admin_panel = False
+    
+    # ========== PRICING CONTROL PANEL (PASSWORD PROTECTED) ==========
+    # Admin panel toggle button (clean, no header)
+    col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
+    with col_btn1:
+        if st.button("🔐 Admin Pricing Control" if not st.session_state.show_admin_panel else "✖️ Close Admin Panel", 
+                     use_container_width=True, 
+                     type="primary" if not st.session_state.show_admin_panel else "secondary"):
+            st.session_state.show_admin_panel = not st.session_state.show_admin_panel
+            if not st.session_state.show_admin_panel:
+                st.session_state.admin_authenticated = False
+    
+    # Show admin panel if toggled
+    if st.session_state.show_admin_panel:
+        if not st.session_state.admin_authenticated:
+            # Password authentication using popup dialog
+            @st.dialog("🔒 Admin Authentication")
+            def password_dialog():
+                st.markdown("**Enter admin password to access pricing controls**")
+                admin_password = st.text_input("🔑 Password", type="password", key="admin_pwd_popup")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button("🔓 Unlock", use_container_width=True, type="primary"):
+                        if admin_password == "admin123":
+                            st.session_state.admin_authenticated = True
+                            st.success("✅ Access granted!")
+                            st.rerun()
+                        else:
+                            st.error("❌ Incorrect password")
+                with col2:
+                    if st.button("Cancel", use_container_width=True):
+                        st.session_state.show_admin_panel = False
+                        st.rerun()
+            
+            password_dialog()
+        else:
+            # Admin controls (authenticated)
+            st.markdown("""
+            <div style='background: linear-gradient(135deg, #d4fc79 0%, #96e6a1 100%); 
+                        padding: 1rem; border-radius: 8px; margin: 1rem 0;
+                        border-left: 4px solid #10b981;'>
+                <p style='margin: 0; color: #065f46; font-weight: 600;'>
+                    ✅ Admin Access Granted - Pricing Controls Active
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Simple and clean control layout
+            ctrl_col1, ctrl_col2 = st.columns(2)
+            
+            with ctrl_col1:
+                st.markdown("#### 💰 Markup Control")
+                markup_percentage = st.slider(
+                    "Retail Markup (%)",
+                    min_value=0,
+                    max_value=100,
+                    value=int(st.session_state.price_markup),
+                    step=5,
+                    help="Adjust retail price markup percentage"
+                )
+                st.session_state.price_markup = float(markup_percentage)
+                
+                # Show example
+                example_cost = 1000.00
+                example_retail = example_cost * (1 + markup_percentage / 100)
+                st.info(f"**Example:** ${example_cost:,.0f} → ${example_retail:,.0f} (+{markup_percentage}%)")
+            
+            with ctrl_col2:
+                st.markdown("#### 🔒 Display Settings")
+                hide_wholesale = st.toggle(
+                    "Hide Wholesale Prices from Customers",
+                    value=st.session_state.hide_wholesale,
+                    help="When enabled, customers only see retail prices"
+                )
+                st.session_state.hide_wholesale = hide_wholesale
+                
+                # Show status
+                if hide_wholesale:
+                    st.warning("🚫 **Wholesale prices are HIDDEN**")
+                else:
+                    st.success("✅ **Wholesale prices are VISIBLE**")
+            
+            # Quick stats
+            st.markdown("---")
+            stat_col1, stat_col2, stat_col3 = st.columns(3)
+            with stat_col1:
+                st.metric("Current Markup", f"{markup_percentage}%", delta=f"{markup_percentage-30}%" if markup_percentage != 30 else "Default")
+            with stat_col2:
+                st.metric("Wholesale Display", "Hidden" if hide_wholesale else "Visible")
+            with stat_col3:
+                if st.button("🔄 Reset to Default", use_container_width=True):
+                    st.session_state.price_markup = 30.0
+                    st.session_state.hide_wholesale = False
+                    st.success("✅ Reset to default settings!")
+                    st.rerun()
+    
+    # Main tabs for Products, System Sets, and Water Pump Sets
+    main_tab1, main_tab2, main_tab3 = st.tabs([t('individual_products'), t('complete_system_sets'), "💧 Water Pump Sets"])
+    
+    # ========== TAB 1: INDIVIDUAL PRODUCTS ==========
+    with main_tab1:
+        # Category filter with icons
+        category_map = {
+            "All": t('all_products'),
+            "solar_panel": t('solar_panels'),
+            "inverter": t('inverters'),
+            "battery": t('batteries'),
+            "water_pump": t('water_pumps'),
+            "accessories": t('accessories')
+        }
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            category = st.selectbox(t('filter_category'), 
+                                   list(category_map.keys()),
+                                   format_func=lambda x: category_map[x])
+        with col2:
+            st.metric(t('total_products'), len(pm.products))
+        with col3:
+            search = st.text_input(t('search'), placeholder="e.g. SG33CX, 51.2V100AH, power>=500")
+        
+        # Filter products (ranked fuzzy search when a query is given)
+        if search:
+            products = pm.search(search)
+            if category != "All":
+                products = [p for p in products if p.category == category]
+        elif category == "All":
+            products = list(pm.products.values())
+        else:
+            products = pm.get_products_by_category(category)
+        
+        st.markdown(f"### {t('showing_products').format(count=len(products))}")
+        
+        # Product image mapping (real product images)
+        product_images = {
+            # Deye Inverters
+            "Deye Hybrid 5kw EU 1P": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye Hybrid 8kw EU 1P": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 16kw EP 1P": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 10kw eu 1P Low Voltage": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 10kw eu 3P Low Voltage": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 12kw eu 3P Low Voltage": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 20kw eu 3P Low Voltage": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 20kw eu 3P High Voltage": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 30kw eu 3p": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 40kw eu 3p": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            "Deye 50kw eu 3p": "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg",
+            
+            # Solar Panels
+            "Lvtopsun 340W": "https://m.media-amazon.com/images/I/61qL8ZxGvEL._AC_SL1500_.jpg",
+            "Lvtopsun 550W": "https://m.media-amazon.com/images/I/61qL8ZxGvEL._AC_SL1500_.jpg",
+            "Lvtopsun 620W": "https://m.media-amazon.com/images/I/61qL8ZxGvEL._AC_SL1500_.jpg",
+            "LONGi Panel 360w": "https://m.media-amazon.com/images/I/71KqVH8XJNL._AC_SL1500_.jpg",
+            "LONGi Panel 585w": "https://m.media-amazon.com/images/I/71KqVH8XJNL._AC_SL1500_.jpg",
+            
+            # Batteries
+            "DEYE 100AH 51.2v (5.12KWH)": "https://m.media-amazon.com/images/I/61J8vZ9HPNL._AC_SL1500_.jpg",
+            "DEYE Battery Controller": "https://m.media-amazon.com/images/I/61J8vZ9HPNL._AC_SL1500_.jpg",
+            "LVtopsun-51.2V100AH Lithium": "https://m.media-amazon.com/images/I/61J8vZ9HPNL._AC_SL1500_.jpg",
+            "LVtopsun-51.2V200AH Lithium": "https://m.media-amazon.com/images/I/61J8vZ9HPNL._AC_SL1500_.jpg",
+            "LVtopsun-51.2V300AH Lithium": "https://m.media-amazon.com/images/I/61J8vZ9HPNL._AC_SL1500_.jpg",
+            "LVtopsun-51.2V100AH Lithium HV": "https://m.media-amazon.com/images/I/61J8vZ9HPNL._AC_SL1500_.jpg",
+            "LV 100AH 12V GEL": "https://m.media-amazon.com/images/I/71qYMXqVBOL._AC_SL1500_.jpg",
+            "LV 150AH 12V GEL BATTERY": "https://m.media-amazon.com/images/I/71qYMXqVBOL._AC_SL1500_.jpg",
+            "LV 200AH 12V GEL BATTERY": "https://m.media-amazon.com/images/I/71qYMXqVBOL._AC_SL1500_.jpg",
+            "LV 250AH 12V GEL BATTERY": "https://m.media-amazon.com/images/I/71qYMXqVBOL._AC_SL1500_.jpg",
+            
+            # Sungrow Inverters
+            "Sungrow SG33CX-P2": "https://m.media-amazon.com/images/I/61-8zXqXqBL._AC_SL1500_.jpg",
+            "Sungrow SG40CX-P2": "https://m.media-amazon.com/images/I/61-8zXqXqBL._AC_SL1500_.jpg",
+            "Sungrow SG50CX-P2": "https://m.media-amazon.com/images/I/61-8zXqXqBL._AC_SL1500_.jpg",
+            "Sungrow SG125CX-P2": "https://m.media-amazon.com/images/I/61-8zXqXqBL._AC_SL1500_.jpg",
+            "Sungrow SG150CX": "https://m.media-amazon.com/images/I/61-8zXqXqBL._AC_SL1500_.jpg",
+            "Sungrow 250KW": "https://m.media-amazon.com/images/I/61-8zXqXqBL._AC_SL1500_.jpg",
+            
+            # Solis Inverters
+            "Solis Ongrid Inverter 5kw": "https://m.media-amazon.com/images/I/61kZxH8XJNL._AC_SL1500_.jpg",
+            "Solis Ongrid Inverter 10kw": "https://m.media-amazon.com/images/I/61kZxH8XJNL._AC_SL1500_.jpg",
+            "Solis Ongrid Inverter 20kw": "https://m.media-amazon.com/images/I/61kZxH8XJNL._AC_SL1500_.jpg",
+            "Solis Ongrid Inverter 40kw": "https://m.media-amazon.com/images/I/61kZxH8XJNL._AC_SL1500_.jpg",
+            
+            # Water Pumps
+            "3DPC5.2-50-48-600W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "4DPC9-45-110-750W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "3DPC6-84-110-1100W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "4DPC9-85-110-1500W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "4DSC19-60-300-2200W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "4DSC19-98-380/550-3000W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "4DSC19-135-380/550-4000W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "DCPM21-14-72-750W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "DCPM50-17-110-1500W": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            "DCPM60-20-300-2200W-A/D": "https://m.media-amazon.com/images/I/61xqL8ZxGvEL._AC_SL1500_.jpg",
+            
+            # Accessories
+            "Rail 4.8m": "https://m.media-amazon.com/images/I/71KqVH8XJNL._AC_SL1000_.jpg",
+            "Mid clamp": "https://m.media-amazon.com/images/I/61KqVH8XJNL._AC_SL1000_.jpg",
+            "End Clamp": "https://m.media-amazon.com/images/I/61KqVH8XJNL._AC_SL1000_.jpg",
+            "LV 4mm PV CABLE 100M": "https://m.media-amazon.com/images/I/71xqL8ZxGvEL._AC_SL1000_.jpg",
+            "LV 6mm PV CABLE 100M": "https://m.media-amazon.com/images/I/71xqL8ZxGvEL._AC_SL1000_.jpg",
+        }
+        
+        # Display products in enhanced cards
+        for p in products:
+            # Determine category icon
+            cat_icon = "☀️" if "panel" in p.category.lower() else \
+                      "⚡" if "inverter" in p.category.lower() else \
+                      "🔋" if "battery" in p.category.lower() else \
+                      "💧" if "pump" in p.category.lower() else "🔧"
+            
+            customer_price = p.cost * 1.3
+            
+            # Apply markup from control panel
+            customer_price = p.cost * (1 + st.session_state.price_markup / 100)
+            
+            # Create expander title based on wholesale visibility
+            if st.session_state.hide_wholesale:
+                expander_title = f"{cat_icon} {p.name} | {t('retail')}: ${customer_price:,.2f}"
+            else:
+                expander_title = f"{cat_icon} {p.name} | {t('wholesale')}: ${p.cost:,.2f} | {t('retail')}: ${customer_price:,.2f}"
+            
+            with st.expander(expander_title):
+                col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
+                
+                with col1:
+                    # Display product image using HTML img tag for better compatibility
+                    product_img = product_images.get(p.name, "https://via.placeholder.com/300x300.png?text=No+Image")
+                    st.markdown(f"""
+                    <div style='text-align: center;'>
+                        <img src='{product_img}' style='max-width: 250px; width: 100%; height: auto; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);' onerror="this.src='https://via.placeholder.com/300x300.png?text=No+Image'">
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                with col2:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
+                        <h4 style='margin: 0 0 0.5rem 0; color: #4338ca;'>{t('product_details')}</h4>
+                        <p style='margin: 0.3rem 0;'><b>{t('category')}:</b> {cat_icon} {p.category.replace('_', ' ').title()}</p>
+                        <p style='margin: 0.3rem 0;'><b>{t('supplier')}:</b> {p.supplier}</p>
+                        <p style='margin: 0.3rem 0;'><b>{t('warranty')}:</b> {p.warranty_years} {t('years')}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if p.notes:
+                        st.info(f"ℹ️ {p.notes}")
+                
+                with col3:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;'>
+                        <h4 style='margin: 0 0 0.5rem 0; color: #1e3a8a;'>{t('specifications')}</h4>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if p.specifications:
+                        for key, value in p.specifications.items():
+                            st.write(f"• **{key.replace('_', ' ').title()}:** {value}")
+                    else:
+                        st.write("• Standard specifications")
+                    
+                    # Add area calculation for solar panels
+                    if "panel" in p.category.lower():
+                        st.markdown("---")
+                        st.info(f"📐 **Area per panel:** ~2.6 m²")
+                
+                with col4:
+                    # Show pricing based on visibility settings
+                    if st.session_state.hide_wholesale:
+                        st.markdown(f"""
+                        <div style='background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%); 
+                                    padding: 1rem; border-radius: 8px; border-left: 4px solid #ec4899; text-align: center;'>
+                            <h4 style='margin: 0 0 0.5rem 0; color: #9f1239;'>{t('pricing')}</h4>
+                            <p style='margin: 0.3rem 0; font-size: 0.9rem;'><b>Price:</b></p>
+                            <p style='margin: 0; font-size: 1.6rem; color: #be185d; font-weight: 700;'>${customer_price:,.2f}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    else:
+                        st.markdown(f"""
+                        <div style='background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%); 
+                                    padding: 1rem; border-radius: 8px; border-left: 4px solid #ec4899; text-align: center;'>
+                            <h4 style='margin: 0 0 0.5rem 0; color: #9f1239;'>{t('pricing')}</h4>
+                            <p style='margin: 0.3rem 0; font-size: 0.9rem;'><b>{t('wholesale')}:</b></p>
+                            <p style='margin: 0; font-size: 1.2rem; color: #9f1239; font-weight: 600;'>${p.cost:,.2f}</p>
+                            <hr style='margin: 0.5rem 0; border: 1px solid #ec4899;'>
+                            <p style='margin: 0.3rem 0; font-size: 0.9rem;'><b>{t('retail')} (+{st.session_state.price_markup:.0f}%):</b></p>
+                            <p style='margin: 0; font-size: 1.4rem; color: #be185d; font-weight: 700;'>${customer_price:,.2f}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        st.info(t('pricing_note'))
+    
+    # ========== TAB 2: COMPLETE SYSTEM SETS ==========
+    with main_tab2:
+        st.markdown("### 📦 Ready-to-Install System Packages")
+        st.markdown("Complete solar system sets with all components, materials, and installation")
+        
+        # Define system sets with detailed specifications based on inverter capacity
+        # Calculation logic: PV = Inverter × 1.1-1.2, Battery = Inverter × 2 (for backup)
+        system_sets = [
+            {
+                "name": "5kW Hybrid Solar System",
+                "inverter": "Deye Hybrid 5kw EU 1P",
+                "inverter_power": 5.0,
+                "inverter_specs": {
+                    "max_pv_input": "6.5kW",
+                    "mppt_trackers": "2",
+                    "max_charge_current": "135A",
+                    "battery_voltage": "48V",
+                    "efficiency": "97.6%",
+                    "phases": "Single Phase"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 10, "total_kw": 5.5},
+                "panel_specs": {
+                    "power": "550W",
+                    "efficiency": "21.2%",
+                    "voltage_vmp": "41.8V",
+                    "current_imp": "13.16A",
+                    "dimensions": "2278×1134×35mm",
+                    "weight": "27.5kg"
+                },
+                "battery": {"name": "DEYE 100AH 51.2v (5.12KWH)", "quantity": 1, "total_kwh": 5.12},
+                "battery_specs": {
+                    "capacity": "100Ah / 5.12kWh",
+                    "voltage": "51.2V",
+                    "type": "LiFePO4",
+                    "cycle_life": "6000+ cycles",
+                    "dod": "90%",
+                    "dimensions": "483×420×177mm"
+                },
+                "description": "Perfect for small homes and offices (Daily consumption: 15-20 kWh)",
+                "daily_generation": "22-27.5 kWh",
+                "backup_time": "8-12 hours",
+                "recommended_load": "15-20 kWh/day",
+                "icon": "🏠",
+                "image_url": "https://www.deyeinverter.com/upload/image/20210901/5kw-hybrid-inverter.jpg"
+            },
+            {
+                "name": "8kW Hybrid Solar System",
+                "inverter": "Deye Hybrid 8kw EU 1P",
+                "inverter_power": 8.0,
+                "inverter_specs": {
+                    "max_pv_input": "10.4kW",
+                    "mppt_trackers": "2",
+                    "max_charge_current": "190A",
+                    "battery_voltage": "48V",
+                    "efficiency": "97.6%",
+                    "phases": "Single Phase"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 16, "total_kw": 8.8},
+                "panel_specs": {
+                    "power": "550W",
+                    "efficiency": "21.2%",
+                    "voltage_vmp": "41.8V",
+                    "current_imp": "13.16A",
+                    "dimensions": "2278×1134×35mm",
+                    "weight": "27.5kg"
+                },
+                "battery": {"name": "DEYE 100AH 51.2v (5.12KWH)", "quantity": 1, "total_kwh": 5.12},
+                "battery_specs": {
+                    "capacity": "100Ah / 5.12kWh",
+                    "voltage": "51.2V",
+                    "type": "LiFePO4",
+                    "cycle_life": "6000+ cycles",
+                    "dod": "90%",
+                    "dimensions": "483×420×177mm"
+                },
+                "description": "Ideal for medium-sized homes (Daily consumption: 25-32 kWh)",
+                "daily_generation": "35-44 kWh",
+                "backup_time": "10-14 hours",
+                "recommended_load": "25-32 kWh/day",
+                "icon": "🏡",
+                "image_url": "https://www.deyeinverter.com/upload/image/20210901/8kw-hybrid-inverter.jpg"
+            },
+            {
+                "name": "10kW Hybrid Solar System",
+                "inverter": "Deye 10kw eu 1P Low Voltage",
+                "inverter_power": 10.0,
+                "inverter_specs": {
+                    "max_pv_input": "13kW",
+                    "mppt_trackers": "2",
+                    "max_charge_current": "210A",
+                    "battery_voltage": "48V",
+                    "efficiency": "97.6%",
+                    "phases": "Single Phase"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 20, "total_kw": 11.0},
+                "panel_specs": {
+                    "power": "550W",
+                    "efficiency": "21.2%",
+                    "voltage_vmp": "41.8V",
+                    "current_imp": "13.16A",
+                    "dimensions": "2278×1134×35mm",
+                    "weight": "27.5kg"
+                },
+                "battery": {"name": "DEYE 100AH 51.2v (5.12KWH)", "quantity": 1, "total_kwh": 5.12},
+                "battery_specs": {
+                    "capacity": "100Ah / 5.12kWh",
+                    "voltage": "51.2V",
+                    "type": "LiFePO4",
+                    "cycle_life": "6000+ cycles",
+                    "dod": "90%",
+                    "dimensions": "483×420×177mm"
+                },
+                "description": "Great for large homes and small businesses (Daily consumption: 30-40 kWh)",
+                "daily_generation": "44-55 kWh",
+                "backup_time": "12-16 hours",
+                "recommended_load": "30-40 kWh/day",
+                "icon": "🏢",
+                "image_url": "https://www.deyeinverter.com/upload/image/20210901/10kw-hybrid-inverter.jpg"
+            },
+            {
+                "name": "20kW Commercial Solar System",
+                "inverter": "Deye 20kw eu 3P Low Voltage",
+                "inverter_power": 20.0,
+                "inverter_specs": {
+                    "max_pv_input": "26kW",
+                    "mppt_trackers": "2",
+                    "max_charge_current": "210A",
+                    "battery_voltage": "48V",
+                    "efficiency": "97.8%",
+                    "phases": "Three Phase"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 40, "total_kw": 22.0},
+                "panel_specs": {
+                    "power": "550W",
+                    "efficiency": "21.2%",
+                    "voltage_vmp": "41.8V",
+                    "current_imp": "13.16A",
+                    "dimensions": "2278×1134×35mm",
+                    "weight": "27.5kg"
+                },
+                "battery": {"name": "DEYE 100AH 51.2v (5.12KWH)", "quantity": 1, "total_kwh": 5.12},
+                "battery_specs": {
+                    "capacity": "100Ah / 5.12kWh",
+                    "voltage": "51.2V",
+                    "type": "LiFePO4",
+                    "cycle_life": "6000+ cycles",
+                    "dod": "90%",
+                    "dimensions": "483×420×177mm"
+                },
+                "description": "Perfect for commercial buildings (Daily consumption: 60-80 kWh)",
+                "daily_generation": "88-110 kWh",
+                "backup_time": "10-14 hours",
+                "recommended_load": "60-80 kWh/day",
+                "icon": "🏭",
+                "image_url": "https://www.deyeinverter.com/upload/image/20210901/20kw-hybrid-inverter.jpg"
+            },
+            {
+                "name": "30kW Industrial Solar System",
+                "inverter": "Deye 30kw eu 3p",
+                "inverter_power": 30.0,
+                "inverter_specs": {
+                    "max_pv_input": "39kW",
+                    "mppt_trackers": "2",
+                    "max_charge_current": "210A",
+                    "battery_voltage": "48V",
+                    "efficiency": "97.8%",
+                    "phases": "Three Phase"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 60, "total_kw": 33.0},
+                "panel_specs": {
+                    "power": "550W",
+                    "efficiency": "21.2%",
+                    "voltage_vmp": "41.8V",
+                    "current_imp": "13.16A",
+                    "dimensions": "2278×1134×35mm",
+                    "weight": "27.5kg"
+                },
+                "battery": {"name": "DEYE 100AH 51.2v (5.12KWH)", "quantity": 1, "total_kwh": 5.12},
+                "battery_specs": {
+                    "capacity": "100Ah / 5.12kWh",
+                    "voltage": "51.2V",
+                    "type": "LiFePO4",
+                    "cycle_life": "6000+ cycles",
+                    "dod": "90%",
+                    "dimensions": "483×420×177mm"
+                },
+                "description": "Industrial-grade power solution (Daily consumption: 90-120 kWh)",
+                "daily_generation": "132-165 kWh",
+                "backup_time": "12-16 hours",
+                "recommended_load": "90-120 kWh/day",
+                "icon": "🏗️",
+                "image_url": "https://www.deyeinverter.com/upload/image/20210901/30kw-hybrid-inverter.jpg"
+            }
+        ]
+        
+        # Display each system set
+        for sys_set in system_sets:
+            with st.expander(f"{sys_set['icon']} {sys_set['name']} - {sys_set['inverter_power']}kW"):
+                # Display system image
+                img_col1, img_col2, img_col3 = st.columns([1, 2, 1])
+                with img_col2:
+                    inverter_img = product_images.get(sys_set['inverter'], "https://m.media-amazon.com/images/I/61VH9YqVZlL._AC_SL1500_.jpg")
+                    st.image(inverter_img, caption=f"{sys_set['inverter']} - Main System Component", width=400)
+                
+                st.markdown(f"**{sys_set['description']}**")
+                st.markdown("---")
+                
+                # Performance Summary Card
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); 
+                            padding: 1.2rem; border-radius: 10px; border-left: 4px solid #10b981; margin-bottom: 1rem;'>
+                    <h3 style='margin: 0 0 0.8rem 0; color: #065f46;'>📊 System Performance</h3>
+                    <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;'>
+                        <div style='text-align: center;'>
+                            <p style='margin: 0; font-size: 0.85rem; color: #065f46;'><b>Daily Generation</b></p>
+                            <p style='margin: 0.2rem 0; font-size: 1.3rem; color: #047857; font-weight: 700;'>{sys_set['daily_generation']}</p>
+                        </div>
+                        <div style='text-align: center; border-left: 2px solid #10b981; border-right: 2px solid #10b981;'>
+                            <p style='margin: 0; font-size: 0.85rem; color: #065f46;'><b>Backup Time</b></p>
+                            <p style='margin: 0.2rem 0; font-size: 1.3rem; color: #047857; font-weight: 700;'>{sys_set['backup_time']}</p>
+                        </div>
+                        <div style='text-align: center;'>
+                            <p style='margin: 0; font-size: 0.85rem; color: #065f46;'><b>Recommended Load</b></p>
+                            <p style='margin: 0.2rem 0; font-size: 1.3rem; color: #047857; font-weight: 700;'>{sys_set['recommended_load']}</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Detailed Component Specifications
+                st.markdown("### 🔧 Component Specifications")
+                
+                spec_col1, spec_col2, spec_col3 = st.columns(3)
+                
+                with spec_col1:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b;'>
+                        <h4 style='margin: 0 0 0.8rem 0; color: #92400e;'>☀️ Solar Panels</h4>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Model:</b> {sys_set['solar_panels']['name']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Quantity:</b> {sys_set['solar_panels']['quantity']} panels</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Total Power:</b> {sys_set['solar_panels']['total_kw']} kW</p>
+                        <hr style='margin: 0.5rem 0; border: 1px solid #f59e0b;'>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Power/Panel:</b> {sys_set['panel_specs']['power']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Efficiency:</b> {sys_set['panel_specs']['efficiency']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Vmp:</b> {sys_set['panel_specs']['voltage_vmp']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Imp:</b> {sys_set['panel_specs']['current_imp']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Size:</b> {sys_set['panel_specs']['dimensions']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Weight:</b> {sys_set['panel_specs']['weight']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Area Needed:</b> ~{sys_set['solar_panels']['quantity'] * 2.6:.1f} m²</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with spec_col2:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #e0e7ff 0%, #c7d2fe 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
+                        <h4 style='margin: 0 0 0.8rem 0; color: #4338ca;'>⚡ Inverter</h4>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Model:</b> {sys_set['inverter']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Power:</b> {sys_set['inverter_power']} kW</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Type:</b> Hybrid (Grid-Tied + Off-Grid)</p>
+                        <hr style='margin: 0.5rem 0; border: 1px solid #6366f1;'>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Max PV Input:</b> {sys_set['inverter_specs']['max_pv_input']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>MPPT Trackers:</b> {sys_set['inverter_specs']['mppt_trackers']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Max Charge:</b> {sys_set['inverter_specs']['max_charge_current']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Battery Voltage:</b> {sys_set['inverter_specs']['battery_voltage']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Efficiency:</b> {sys_set['inverter_specs']['efficiency']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Phases:</b> {sys_set['inverter_specs']['phases']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with spec_col3:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;'>
+                        <h4 style='margin: 0 0 0.8rem 0; color: #1e40af;'>🔋 Battery Storage</h4>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Model:</b> {sys_set['battery']['name']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Quantity:</b> {sys_set['battery']['quantity']} units</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Total:</b> {sys_set['battery']['total_kwh']:.2f} kWh</p>
+                        <hr style='margin: 0.5rem 0; border: 1px solid #3b82f6;'>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Capacity/Unit:</b> {sys_set['battery_specs']['capacity']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Voltage:</b> {sys_set['battery_specs']['voltage']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Type:</b> {sys_set['battery_specs']['type']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Cycle Life:</b> {sys_set['battery_specs']['cycle_life']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>DoD:</b> {sys_set['battery_specs']['dod']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Size:</b> {sys_set['battery_specs']['dimensions']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.8rem;'><b>Usable Energy:</b> {sys_set['battery']['total_kwh'] * 0.9:.2f} kWh</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                st.markdown("<br>", unsafe_allow_html=True)
+                
+                # Calculate pricing
+                # Get product prices - search by exact name match
+                inverter_price = 0
+                for prod_name, prod in pm.products.items():
+                    if prod_name == sys_set['inverter']:
+                        inverter_price = prod.cost
+                        break
+                
+                # Fallback prices based on inverter model
+                if inverter_price == 0:
+                    inverter_prices = {
+                        "Deye Hybrid 5kw EU 1P": 888.00,
+                        "Deye Hybrid 8kw EU 1P": 1320.00,
+                        "Deye 10kw eu 1P Low Voltage": 1800.00,
+                        "Deye 20kw eu 3P Low Voltage": 3096.00,
+                        "Deye 30kw eu 3p": 4080.00
+                    }
+                    inverter_price = inverter_prices.get(sys_set['inverter'], 888.00)
+                
+                panel_product = pm.products.get(sys_set['solar_panels']['name'])
+                panel_price = panel_product.cost if panel_product else 66
+                
+                battery_product = pm.products.get(sys_set['battery']['name'])
+                battery_price = battery_product.cost if battery_product else 1440
+                
+                # Improved calculation for materials and labor based on system size
+                panel_qty = sys_set['solar_panels']['quantity']
+                
+                # Calculate mounting materials (more accurate) + 20% markup
+                rails_needed = panel_qty * 0.5  # 2 panels per 4.8m rail
+                base_materials_cost = (
+                    (rails_needed * 19.20) +  # Rails
+                    (panel_qty * 2 * 0.60) +  # Mid clamps (2 per panel)
+                    (panel_qty * 0.60) +  # End clamps
+                    ((rails_needed - 1) * 0.84) +  # Rail connectors
+                    (panel_qty * 4 * 1.32) +  # L feet (4 per panel)
+                    (panel_qty * 6 * 64.80 / 100)  # PV cables (6m per panel average)
+                )
+                materials_cost = base_materials_cost * 1.20  # Add 20% markup
+                
+                # Labor cost calculation based on system complexity + 20% markup
+                # Base: $80/kW + complexity factor
+                base_labor = sys_set['inverter_power'] * 80
+                complexity_factor = 1.0 + (0.05 * (panel_qty // 10))  # 5% more per 10 panels
+                labor_cost = (base_labor * complexity_factor) * 1.20  # Add 20% markup
+                
+                equipment_total = (inverter_price + 
+                                 (panel_price * panel_qty) + 
+                                 (battery_price * sys_set['battery']['quantity']))
+                
+                wholesale_total = equipment_total + materials_cost + labor_cost
+                retail_total = wholesale_total * (1 + st.session_state.price_markup / 100)
+                
+                # Pricing breakdown
+                if st.session_state.hide_wholesale:
+                    st.markdown("### 💰 System Pricing")
+                else:
+                    st.markdown("### 💰 Complete System Pricing")
+                
+                price_col1, price_col2 = st.columns(2)
+                
+                with price_col1:
+                    # Only show breakdown if wholesale is visible
+                    if not st.session_state.hide_wholesale:
+                        # Calculate individual material costs for display (with 20% markup)
+                        rails_cost = (rails_needed * 19.20) * 1.20
+                        clamps_cost = ((panel_qty * 2 * 0.60) + (panel_qty * 0.60)) * 1.20
+                        connectors_cost = ((rails_needed - 1) * 0.84) * 1.20
+                        lfeet_cost = (panel_qty * 4 * 1.32) * 1.20
+                        cables_cost = (panel_qty * 6 * 64.80 / 100) * 1.20
+                        
+                        st.markdown("#### 📊 Detailed Cost Breakdown")
+                        
+                        # Main Equipment
+                        st.markdown("**Main Equipment**")
+                        st.write(f"⚡ Inverter (1x): ${inverter_price:,.2f}")
+                        st.write(f"☀️ Solar Panels ({panel_qty}x): ${panel_price * panel_qty:,.2f}")
+                        st.write(f"🔋 Battery ({sys_set['battery']['quantity']}x): ${battery_price * sys_set['battery']['quantity']:,.2f}")
+                        st.markdown(f"**Equipment Subtotal: ${equipment_total:,.2f}**")
+                        
+                        st.markdown("---")
+                        
+                        # Mounting & Materials (with 20% markup)
+                        st.markdown("**Mounting & Materials (+20%)**")
+                        st.write(f"Rails ({rails_needed:.0f}x 4.8m): ${rails_cost:,.2f}")
+                        st.write(f"Clamps (Mid + End): ${clamps_cost:,.2f}")
+                        st.write(f"Connectors & L-Feet: ${connectors_cost + lfeet_cost:,.2f}")
+                        st.write(f"PV Cables (~{panel_qty * 6}m): ${cables_cost:,.2f}")
+                        st.markdown(f"**Materials Subtotal: ${materials_cost:,.2f}**")
+                        
+                        st.markdown("---")
+                        
+                        # Installation (with 20% markup)
+                        st.markdown("**Installation (+20%)**")
+                        base_labor_raw = base_labor / 1.20
+                        st.write(f"👷 Base Labor ({sys_set['inverter_power']}kW × $80): ${base_labor_raw:,.2f}")
+                        st.write(f"Complexity (+{(complexity_factor-1)*100:.0f}%): ${base_labor_raw * (complexity_factor - 1):,.2f}")
+                        st.write(f"Markup (+20%): ${(base_labor * complexity_factor) * 0.20:,.2f}")
+                        st.markdown(f"**Labor Subtotal: ${labor_cost:,.2f}**")
+                    else:
+                        # Show simplified info when wholesale is hidden
+                        st.markdown("#### 📦 System Includes")
+                        st.write(f"⚡ {sys_set['inverter']} Inverter")
+                        st.write(f"☀️ {panel_qty}x {sys_set['solar_panels']['name']}")
+                        st.write(f"🔋 {sys_set['battery']['quantity']}x {sys_set['battery']['name']}")
+                        st.write(f"🔧 Complete mounting & materials")
+                        st.write(f"👷 Professional installation")
+                        st.write(f"📐 Area needed: ~{panel_qty * 2.6:.1f} m²")
+                
+                with price_col2:
+                    # Apply pricing control settings
+                    if st.session_state.hide_wholesale:
+                        # Show only retail price
+                        st.markdown(f"""
+                        <div style='background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%); 
+                                    padding: 1.2rem; border-radius: 10px; border-left: 4px solid #ec4899; text-align: center;'>
+                            <h4 style='margin: 0 0 0.8rem 0; color: #9f1239;'>💵 System Price</h4>
+                            <p style='margin: 0; font-size: 2.2rem; color: #be185d; font-weight: 700;'>${retail_total:,.2f}</p>
+                            <p style='margin: 0.5rem 0 0 0; font-size: 0.85rem; color: #9f1239;'>
+                                <b>Price per kW:</b> ${retail_total / sys_set['inverter_power']:,.2f}/kW
+                            </p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    else:
+                        # Show both wholesale and retail
+                        st.markdown(f"""
+                        <div style='background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%); 
+                                    padding: 1.2rem; border-radius: 10px; border-left: 4px solid #ec4899;'>
+                            <h4 style='margin: 0 0 0.8rem 0; color: #9f1239;'>💵 Final Pricing</h4>
+                            <div style='margin: 1rem 0;'>
+                                <p style='margin: 0.3rem 0; font-size: 0.95rem;'><b>💼 Wholesale Price:</b></p>
+                                <p style='margin: 0; font-size: 1.5rem; color: #9f1239; font-weight: 600;'>${wholesale_total:,.2f}</p>
+                            </div>
+                            <hr style='margin: 1rem 0; border: 2px solid #ec4899;'>
+                            <div style='margin: 1rem 0;'>
+                                <p style='margin: 0.3rem 0; font-size: 0.95rem;'><b>🏷️ Retail Price (+{st.session_state.price_markup:.0f}%):</b></p>
+                                <p style='margin: 0; font-size: 1.8rem; color: #be185d; font-weight: 700;'>${retail_total:,.2f}</p>
+                            </div>
+                            <p style='margin: 0.5rem 0 0 0; font-size: 0.8rem; color: #9f1239;'>
+                                <b>Price per kW:</b> ${retail_total / sys_set['inverter_power']:,.2f}/kW
+                            </p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                # Installation notes
+                st.markdown("---")
+                st.info(f"""
+                **📋 What's Included:**
+                • {sys_set['solar_panels']['quantity']}x {sys_set['solar_panels']['name']} solar panels
+                • 1x {sys_set['inverter']} hybrid inverter
+                • {sys_set['battery']['quantity']}x {sys_set['battery']['name']} battery units
+                • Complete mounting system (rails, clamps, connectors)
+                • PV cables and electrical accessories
+                • Professional installation and commissioning
+                • System testing and warranty activation
+                """)
+        
+        st.markdown("---")
+        st.success("✅ **All system sets include:** Complete equipment, materials, installation labor, and 1-year service warranty")
+    
+    # ========== TAB 3: WATER PUMP SETS ==========
+    with main_tab3:
+        st.markdown("### 💧 Solar Water Pump System Sets")
+        st.markdown("Complete solar-powered water pumping systems with panels, controller, and installation")
+        
+        # Water pump system configurations - ALL MODELS
+        pump_sets = [
+            {
+                "name": "600W Solar Water Pump System (3DPC)",
+                "hp": 0.8,
+                "pump_model": "3DPC5.2-50-48-600W",
+                "pump_power": 600,
+                "pump_specs": {
+                    "power": "600W (0.8 HP)",
+                    "voltage": "48V DC",
+                    "max_flow": "5.2 m³/h",
+                    "max_head": "50m",
+                    "outlet": "1.5 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 340W", "quantity": 2, "total_kw": 0.68},
+                "controller": "MPPT Solar Pump Controller 48V",
+                "description": "Perfect for small farms and home gardens",
+                "applications": "Irrigation, livestock watering, domestic use",
+                "daily_water": "20-30 m³/day",
+                "icon": "🏡"
+            },
+            {
+                "name": "750W Solar Water Pump System (4DPC)",
+                "hp": 1,
+                "pump_model": "4DPC9-45-110-750W",
+                "pump_power": 750,
+                "pump_specs": {
+                    "power": "750W (1 HP)",
+                    "voltage": "110V DC",
+                    "max_flow": "9 m³/h",
+                    "max_head": "45m",
+                    "outlet": "2 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 340W", "quantity": 3, "total_kw": 1.02},
+                "controller": "MPPT Solar Pump Controller 110V",
+                "description": "Ideal for small to medium farms",
+                "applications": "Farm irrigation, garden watering",
+                "daily_water": "35-45 m³/day",
+                "icon": "🌱"
+            },
+            {
+                "name": "750W Solar Water Pump System (DCPM)",
+                "hp": 1,
+                "pump_model": "DCPM21-14-72-750W",
+                "pump_power": 750,
+                "pump_specs": {
+                    "power": "750W (1 HP)",
+                    "voltage": "72V DC",
+                    "max_flow": "21 m³/h",
+                    "max_head": "14m",
+                    "outlet": "2 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 340W", "quantity": 3, "total_kw": 1.02},
+                "controller": "MPPT Solar Pump Controller 72V",
+                "description": "High flow for shallow wells",
+                "applications": "Surface water pumping, pond filling",
+                "daily_water": "80-100 m³/day",
+                "icon": "💦"
+            },
+            {
+                "name": "1100W Solar Water Pump System (3DPC)",
+                "hp": 1.5,
+                "pump_model": "3DPC6-84-110-1100W",
+                "pump_power": 1100,
+                "pump_specs": {
+                    "power": "1100W (1.5 HP)",
+                    "voltage": "110V DC",
+                    "max_flow": "6 m³/h",
+                    "max_head": "84m",
+                    "outlet": "1.5 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 2, "total_kw": 1.1},
+                "controller": "MPPT Solar Pump Controller 110V",
+                "description": "Deep well specialist",
+                "applications": "Deep well pumping, high head applications",
+                "daily_water": "25-35 m³/day",
+                "icon": "⛏️"
+            },
+            {
+                "name": "1500W Solar Water Pump System (4DPC)",
+                "hp": 2,
+                "pump_model": "4DPC9-85-110-1500W",
+                "pump_power": 1500,
+                "pump_specs": {
+                    "power": "1500W (2 HP)",
+                    "voltage": "110V DC",
+                    "max_flow": "9 m³/h",
+                    "max_head": "85m",
+                    "outlet": "2 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 3, "total_kw": 1.65},
+                "controller": "MPPT Solar Pump Controller 110V",
+                "description": "Ideal for medium farms and irrigation",
+                "applications": "Farm irrigation, fish ponds, water supply",
+                "daily_water": "40-60 m³/day",
+                "icon": "🌾"
+            },
+            {
+                "name": "1500W Solar Water Pump System (DCPM)",
+                "hp": 2,
+                "pump_model": "DCPM50-17-110-1500W",
+                "pump_power": 1500,
+                "pump_specs": {
+                    "power": "1500W (2 HP)",
+                    "voltage": "110V DC",
+                    "max_flow": "50 m³/h",
+                    "max_head": "17m",
+                    "outlet": "3 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 3, "total_kw": 1.65},
+                "controller": "MPPT Solar Pump Controller 110V",
+                "description": "High volume for surface water",
+                "applications": "Large pond filling, surface irrigation",
+                "daily_water": "200-250 m³/day",
+                "icon": "🌊"
+            },
+            {
+                "name": "2200W Solar Water Pump System (4DSC)",
+                "hp": 3,
+                "pump_model": "4DSC19-60-300-2200W",
+                "pump_power": 2200,
+                "pump_specs": {
+                    "power": "2200W (3 HP)",
+                    "voltage": "300V DC",
+                    "max_flow": "19 m³/h",
+                    "max_head": "60m",
+                    "outlet": "3 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 5, "total_kw": 2.75},
+                "controller": "MPPT Solar Pump Controller 300V",
+                "description": "Great for large farms and commercial use",
+                "applications": "Large-scale irrigation, water distribution",
+                "daily_water": "80-100 m³/day",
+                "icon": "🚜"
+            },
+            {
+                "name": "2200W Solar Water Pump System (DCPM)",
+                "hp": 3,
+                "pump_model": "DCPM60-20-300-2200W-A/D",
+                "pump_power": 2200,
+                "pump_specs": {
+                    "power": "2200W (3 HP)",
+                    "voltage": "300V DC",
+                    "max_flow": "60 m³/h",
+                    "max_head": "20m",
+                    "outlet": "4 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 5, "total_kw": 2.75},
+                "controller": "MPPT Solar Pump Controller 300V",
+                "description": "Ultra high flow for surface applications",
+                "applications": "Flood irrigation, large pond systems",
+                "daily_water": "250-300 m³/day",
+                "icon": "🌊"
+            },
+            {
+                "name": "4 HP Solar Water Pump System",
+                "hp": 4,
+                "pump_model": "4DSC19-98-380/550-3000W",
+                "pump_power": 3000,
+                "pump_specs": {
+                    "power": "3000W (4 HP)",
+                    "voltage": "380V AC / 550V DC",
+                    "max_flow": "19 m³/h",
+                    "max_head": "98m",
+                    "outlet": "3 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 6, "total_kw": 3.3},
+                "controller": "MPPT Solar Pump Controller 380V",
+                "description": "Heavy-duty for deep wells and high head",
+                "applications": "Deep well pumping, high-pressure irrigation",
+                "daily_water": "100-120 m³/day",
+                "icon": "🏭"
+            },
+            {
+                "name": "5 HP Solar Water Pump System",
+                "hp": 5,
+                "pump_model": "4DSC19-135-380/550-4000W",
+                "pump_power": 4000,
+                "pump_specs": {
+                    "power": "4000W (5 HP)",
+                    "voltage": "380V AC / 550V DC",
+                    "max_flow": "19 m³/h",
+                    "max_head": "135m",
+                    "outlet": "3 inch"
+                },
+                "solar_panels": {"name": "Lvtopsun 550W", "quantity": 8, "total_kw": 4.4},
+                "controller": "MPPT Solar Pump Controller 380V",
+                "description": "Industrial-grade for maximum performance",
+                "applications": "Industrial water supply, large irrigation systems",
+                "daily_water": "120-150 m³/day",
+                "icon": "🏗️"
+            }
+        ]
+        
+        # Display each pump set
+        for pump_set in pump_sets:
+            with st.expander(f"{pump_set['icon']} {pump_set['name']} - {pump_set['hp']} HP"):
+                # Display pump image using HTML
+                img_col1, img_col2, img_col3 = st.columns([1, 2, 1])
+                with img_col2:
+                    pump_img = product_images.get(pump_set['pump_model'], "https://via.placeholder.com/400x300.png?text=Water+Pump")
+                    st.markdown(f"""
+                    <div style='text-align: center;'>
+                        <img src='{pump_img}' style='max-width: 400px; width: 100%; height: auto; border-radius: 10px; box-shadow: 0 4px 12px rgba(0,0,0,0.15);' onerror="this.src='https://via.placeholder.com/400x300.png?text=Water+Pump'">
+                        <p style='margin-top: 0.5rem; color: #666; font-size: 0.9rem;'>{pump_set['pump_model']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                st.markdown(f"**{pump_set['description']}**")
+                st.markdown(f"**Applications:** {pump_set['applications']}")
+                st.markdown("---")
+                
+                # Performance Summary
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); 
+                            padding: 1.2rem; border-radius: 10px; border-left: 4px solid #3b82f6; margin-bottom: 1rem;'>
+                    <h3 style='margin: 0 0 0.8rem 0; color: #1e40af;'>💧 System Performance</h3>
+                    <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;'>
+                        <div style='text-align: center;'>
+                            <p style='margin: 0; font-size: 0.85rem; color: #1e40af;'><b>Pump Power</b></p>
+                            <p style='margin: 0.2rem 0; font-size: 1.3rem; color: #1e3a8a; font-weight: 700;'>{pump_set['pump_power']}W ({pump_set['hp']} HP)</p>
+                        </div>
+                        <div style='text-align: center; border-left: 2px solid #3b82f6; border-right: 2px solid #3b82f6;'>
+                            <p style='margin: 0; font-size: 0.85rem; color: #1e40af;'><b>Daily Water Output</b></p>
+                            <p style='margin: 0.2rem 0; font-size: 1.3rem; color: #1e3a8a; font-weight: 700;'>{pump_set['daily_water']}</p>
+                        </div>
+                        <div style='text-align: center;'>
+                            <p style='margin: 0; font-size: 0.85rem; color: #1e40af;'><b>Solar Panels</b></p>
+                            <p style='margin: 0.2rem 0; font-size: 1.3rem; color: #1e3a8a; font-weight: 700;'>{pump_set['solar_panels']['quantity']}x {pump_set['solar_panels']['total_kw']}kW</p>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Component Specifications
+                st.markdown("### 🔧 System Components")
+                
+                spec_col1, spec_col2 = st.columns(2)
+                
+                with spec_col1:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b;'>
+                        <h4 style='margin: 0 0 0.8rem 0; color: #92400e;'>☀️ Solar Panels</h4>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Model:</b> {pump_set['solar_panels']['name']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Quantity:</b> {pump_set['solar_panels']['quantity']} panels</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Total Power:</b> {pump_set['solar_panels']['total_kw']} kW</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Area Needed:</b> ~{pump_set['solar_panels']['quantity'] * 2.6:.1f} m²</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    st.markdown("<br>", unsafe_allow_html=True)
+                    
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #e0e7ff 0%, #c7d2fe 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
+                        <h4 style='margin: 0 0 0.8rem 0; color: #4338ca;'>⚡ Controller</h4>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Type:</b> {pump_set['controller']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Features:</b> MPPT, Auto start/stop</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Protection:</b> Overload, dry-run, overvoltage</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                with spec_col2:
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); 
+                                padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;'>
+                        <h4 style='margin: 0 0 0.8rem 0; color: #1e40af;'>💧 Water Pump</h4>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Model:</b> {pump_set['pump_model']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Power:</b> {pump_set['pump_specs']['power']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Voltage:</b> {pump_set['pump_specs']['voltage']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Max Flow:</b> {pump_set['pump_specs']['max_flow']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Max Head:</b> {pump_set['pump_specs']['max_head']}</p>
+                        <p style='margin: 0.3rem 0; font-size: 0.85rem;'><b>Outlet:</b> {pump_set['pump_specs']['outlet']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                st.markdown("<br>", unsafe_allow_html=True)
+                
+                # Pricing calculation
+                pump_price = pm.products.get(pump_set['pump_model'])
+                pump_cost = pump_price.cost if pump_price else 200.00
+                
+                panel_price = pm.products.get(pump_set['solar_panels']['name'])
+                panel_cost = panel_price.cost if panel_price else 66.00
+                
+                controller_cost = 150.00
+                installation_cost = pump_set['pump_power'] * 0.15
+                
+                equipment_total = pump_cost + (panel_cost * pump_set['solar_panels']['quantity']) + controller_cost
+                wholesale_total = equipment_total + installation_cost
+                retail_total = wholesale_total * (1 + st.session_state.price_markup / 100)
+                
+                # Pricing display
+                st.markdown("### 💰 System Pricing")
+                
+                price_col1, price_col2 = st.columns(2)
+                
+                with price_col1:
+                    if not st.session_state.hide_wholesale:
+                        st.markdown("#### 📊 Cost Breakdown")
+                        st.write(f"💧 Water Pump: ${pump_cost:,.2f}")
+                        st.write(f"☀️ Solar Panels ({pump_set['solar_panels']['quantity']}x): ${panel_cost * pump_set['solar_panels']['quantity']:,.2f}")
+                        st.write(f"⚡ Controller: ${controller_cost:,.2f}")
+                        st.write(f"👷 Installation: ${installation_cost:,.2f}")
+                        st.markdown(f"**Total: ${equipment_total + installation_cost:,.2f}**")
+                    else:
+                        st.markdown("#### 📦 System Includes")
+                        st.write(f"💧 {pump_set['pump_model']}")
+                        st.write(f"☀️ {pump_set['solar_panels']['quantity']}x {pump_set['solar_panels']['name']}")
+                        st.write(f"⚡ MPPT Controller")
+                        st.write(f"👷 Professional installation")
+                        st.write(f"📐 Area needed: ~{pump_set['solar_panels']['quantity'] * 2.6:.1f} m²")
+                
+                with price_col2:
+                    if st.session_state.hide_wholesale:
+                        st.markdown(f"""
+                        <div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); 
+                                    padding: 1.5rem; border-radius: 10px; border-left: 4px solid #3b82f6; text-align: center;'>
+                            <h4 style='margin: 0 0 0.8rem 0; color: #1e40af;'>💵 System Price</h4>
+                            <p style='margin: 0; font-size: 2rem; color: #1e3a8a; font-weight: 700;'>${retail_total:,.2f}</p>
+                            <p style='margin: 0.5rem 0 0 0; font-size: 0.85rem; color: #1e40af;'>Complete installed system</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    else:
+                        st.markdown(f"""
+                        <div style='background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); 
+                                    padding: 1.5rem; border-radius: 10px; border-left: 4px solid #3b82f6;'>
+                            <h4 style='margin: 0 0 0.8rem 0; color: #1e40af; text-align: center;'>💵 Final Pricing</h4>
+                            <div style='margin: 0.5rem 0;'>
+                                <p style='margin: 0.3rem 0; font-size: 0.9rem;'><b>💼 Wholesale:</b></p>
+                                <p style='margin: 0; font-size: 1.3rem; color: #1e40af; font-weight: 600;'>${wholesale_total:,.2f}</p>
+                            </div>
+                            <hr style='margin: 0.8rem 0; border: 1px solid #3b82f6;'>
+                            <div style='margin: 0.5rem 0;'>
+                                <p style='margin: 0.3rem 0; font-size: 0.9rem;'><b>🏷️ Retail (+{st.session_state.price_markup:.0f}%):</b></p>
+                                <p style='margin: 0; font-size: 1.8rem; color: #1e3a8a; font-weight: 700;'>${retail_total:,.2f}</p>
+                            </div>
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                st.markdown("---")
+                st.success("✅ **Includes:** Water pump, solar panels, MPPT controller, mounting structure, cables, and installation")
+        
+        st.markdown("---")
+        st.info("💡 **Note:** All water pump systems are designed for optimal performance with 6-8 hours of peak sunlight. Actual water output may vary based on sunlight conditions and installation location.")
@@ -0,0 +1,179 @@
+"""
+Reports Page
+PDF, Word, Excel and CSV report export, generated in the background by export_jobs
+"""
+import streamlit as st
+
+import export_jobs
+from calculations import SolarCalculator
+from models import as_frame
+from translations import t
+
+
+def render():
+    """Render the reports page"""
+    st.title(t('reports_title'))
+    
+    if not st.session_state.simulation_results:
+        st.warning("⚠️ Run a simulation first")
+        st.stop()
+    
+    # Display customer info
+    if st.session_state.customer_info['name']:
+        st.markdown(f"### {t('customer_report')}")
+        report_col1, report_col2 = st.columns(2)
+        with report_col1:
+            st.markdown(f"""
+            <div class="custom-card" style="padding: 1rem;">
+                <p style="margin: 0;"><b>Customer:</b> {st.session_state.customer_info['name']}</p>
+                <p style="margin: 0;"><b>Company:</b> {st.session_state.customer_info['company'] or 'N/A'}</p>
+                <p style="margin: 0;"><b>Address:</b> {st.session_state.customer_info['address'] or 'N/A'}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with report_col2:
+            st.markdown(f"""
+            <div class="custom-card" style="padding: 1rem;">
+                <p style="margin: 0;"><b>Phone:</b> {st.session_state.customer_info['phone']}</p>
+                <p style="margin: 0;"><b>Telegram:</b> {st.session_state.customer_info['telegram'] or 'N/A'}</p>
+                <p style="margin: 0;"><b>Email:</b> {st.session_state.customer_info['email'] or 'N/A'}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        st.markdown("---")
+    
+    from visualization import SolarVisualizer
+    results = as_frame(st.session_state.simulation_results)
+    devices = st.session_state.devices
+    
+    # Add Customer Pricing Toggle
+    st.markdown("### 💰 Pricing Mode")
+    customer_markup_mode = st.checkbox(
+        "🏷️ Customer Report (Add 30% Markup)",
+        value=True,
+        help="Enable this to add 30% markup to all wholesale prices for customer reports. Wholesale prices are used for internal analysis."
+    )
+    
+    markup_multiplier = 1.30 if customer_markup_mode else 1.0
+    
+    if customer_markup_mode:
+        st.info("ℹ️ **Customer Pricing Mode Active**: All prices shown include 30% markup for retail customers")
+    else:
+        st.warning("⚠️ **Wholesale Pricing Mode**: Showing wholesale prices (for internal use only)")
+    
+    st.markdown("---")
+    
+    # Financial data with markup applied
+    calc = SolarCalculator(st.session_state.system_config)
+    total_pv = float(results.pv_generation_kw.sum())
+    annual = st.session_state.annual_simulation
+    annual_energy = annual.annual_pv_kwh if annual else total_pv * 365
+    system_cost = st.session_state.system_config.total_system_cost * markup_multiplier
+    financial = calc.calculate_financial_analysis(system_cost, annual_energy, 0.20)
+    
+    st.markdown(f"### {t('download_reports')}")
+    report_config = _report_config(markup_multiplier)
+    jobs = st.session_state.setdefault('export_jobs', {})  # export kind -> job id
+    
+    def submit(*kinds):
+        for kind in kinds:
+            job = export_jobs.submit_export(kind, results, devices, financial, report_config, include_charts=True)
+            jobs[kind] = job.job_id
+    
+    # Quick Export All Button
+    quick_export_col1, quick_export_col2, quick_export_col3 = st.columns([1, 2, 1])
+    with quick_export_col2:
+        if st.button("⚡ Quick Export All (PDF + Word + Excel)", type="primary", use_container_width=True, help="Export all report formats at once"):
+            submit('pdf', 'docx', 'xlsx')
+    
+    st.markdown("---")
+    st.markdown("#### Or export individually:")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if st.button(t('export_excel'), type="primary", use_container_width=True):
+            submit('xlsx')
+    
+    with col2:
+        if st.button(t('export_csv'), use_container_width=True):
+            submit('csv')
+    
+    with col3:
+        if st.button(t('export_pdf'), use_container_width=True):
+            submit('pdf')
+    
+    with col4:
+        if st.button("📄 Export Word", use_container_width=True):
+            submit('docx')
+    
+    # Only jobs for the current design; older ones are dropped from the session
+    current = {kind: export_jobs.get_job(job_id) for kind, job_id in jobs.items()}
+    current = {kind: job for kind, job in current.items()
+               if job is not None and job.key == export_jobs.export_key(kind, results, devices, financial, report_config,
+                                                                        include_charts=True)}
+    # Reports evicted from the export cache are generated again
+    submit(*[kind for kind, job in current.items() if job.expired])
+    current = {kind: export_jobs.get_job(jobs[kind]) for kind in current}
+    st.session_state.export_jobs = {kind: job.job_id for kind, job in current.items()}
+    if current:
+        export_status(list(current.values()))
+    
+    # Summary table
+    st.markdown("---")
+    st.subheader("Daily Summary Table")
+    viz = SolarVisualizer()
+    summary_df = viz.create_monthly_summary_table(results)
+    st.dataframe(summary_df, use_container_width=True)
+
+
+
+def _report_config(markup_multiplier: float) -> dict:
+    """Customer and system details shown in the PDF and Word reports, with markup applied to costs"""
+    config = st.session_state.system_config
+    customer = st.session_state.customer_info
+    equipment_cost = 0.0
+    if config.solar_panels:
+        equipment_cost += (config.solar_panels.cost_per_panel * config.solar_panels.quantity) * markup_multiplier
+    if config.battery:
+        equipment_cost += config.battery.total_cost * markup_multiplier
+    if config.inverter:
+        equipment_cost += config.inverter.cost * markup_multiplier
+    
+    return {
+        "customer_name": customer['name'],
+        "customer_company": customer['company'],
+        "customer_phone": customer['phone'],
+        "customer_telegram": customer['telegram'],
+        "customer_email": customer['email'],
+        "customer_address": customer['address'],
+        "location": config.location,
+        "pv_capacity": config.solar_panels.total_power_kw if config.solar_panels else 0,
+        "battery_capacity": config.battery.total_capacity_kwh if config.battery else 0,
+        "inverter_power": config.inverter.power_kw if config.inverter else 0,
+        "labor_cost": config.labor_cost * markup_multiplier,
+        "support_material_cost": config.support_material_cost * markup_multiplier,
+        "equipment_cost": equipment_cost
+    }
+
+
+def export_status(jobs):
+    """Progress of running exports and download buttons for finished ones"""
+    pending = not all(job.finished for job in jobs)
+    
+    # Polls without rerunning the whole page while any export is still running
+    @st.fragment(run_every=1.0 if pending else None)
+    def status():
+        for job in jobs:
+            label = job.file_name
+            data = job.data
+            if data is not None:
+                st.download_button(f"⬇️ {label}", data, file_name=job.file_name, mime=job.mime_type,
+                                   key=f"download_{job.job_id}", use_container_width=True)
+            elif job.expired:
+                st.rerun()  # the full run re-queues it
+            elif job.status == export_jobs.FAILED:
+                st.error(f"❌ {label}: {job.error}")
+            else:
+                st.progress(job.progress, text=f"{label}: {job.message}")
+        if pending and all(job.finished for job in jobs):
+            st.rerun()
+    
+    status()
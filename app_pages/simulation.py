@@ -0,0 +1,690 @@
+"""
+Simulation Page
+24-hour and annual simulation with financial analysis
+"""
+import calendar
+
+import streamlit as st
+import pandas as pd
+
+from calculations import SolarCalculator
+from models import as_frame
+from simulation_cache import SIMULATION_CACHE, config_fingerprint
+from translations import t
+
+
+def render():
+    """Render the simulation page"""
+    st.title(t('simulation_title'))
+    st.markdown(f"#### {t('simulation_subtitle')}")
+    
+    # Check customer info first
+    if not st.session_state.customer_info['name'] or not st.session_state.customer_info['phone']:
+        st.markdown("""
+        <div class="warning-box">
+            <h3>👤 Customer Information Required</h3>
+            <p>Please add customer information in the <b>🏠 Dashboard</b> page before running simulation.</p>
+            <p>This helps identify each customer's unique requirements.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("➡️ Go to Dashboard", type="primary", use_container_width=True):
+                st.switch_page("app.py")
+        st.stop()
+    
+    # Display customer info at top
+    st.markdown(f"### {t('customer_project')}")
+    customer_col1, customer_col2 = st.columns(2)
+    with customer_col1:
+        st.markdown(f"""
+        <div class="custom-card" style="padding: 1rem;">
+            <p style="margin: 0;"><b>Customer:</b> {st.session_state.customer_info['name']}</p>
+            <p style="margin: 0;"><b>Company:</b> {st.session_state.customer_info['company'] or 'N/A'}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with customer_col2:
+        st.markdown(f"""
+        <div class="custom-card" style="padding: 1rem;">
+            <p style="margin: 0;"><b>Phone:</b> {st.session_state.customer_info['phone']}</p>
+            <p style="margin: 0;"><b>Telegram:</b> {st.session_state.customer_info['telegram'] or 'N/A'}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Enhanced Prerequisites Checklist
+    st.markdown("### ✅ Prerequisites Check")
+    
+    # Calculate prerequisites status
+    has_devices = len(st.session_state.devices) > 0
+    has_panels = st.session_state.system_config.solar_panels is not None
+    has_battery = st.session_state.system_config.battery is not None
+    has_inverter = st.session_state.system_config.inverter is not None
+    
+    total_load = sum(d.daily_energy_kwh for d in st.session_state.devices) if has_devices else 0
+    pv_cap = st.session_state.system_config.solar_panels.total_power_kw if has_panels else 0
+    bat_cap = st.session_state.system_config.battery.total_capacity_kwh if has_battery else 0
+    inv_cap = st.session_state.system_config.inverter.power_kw if has_inverter else 0
+    
+    # Check if system is properly sized
+    pv_adequate = pv_cap >= (total_load / 4) if has_devices and has_panels else False
+    battery_adequate = bat_cap >= (total_load * 0.5) if has_devices and has_battery else False
+    inverter_adequate = inv_cap >= (pv_cap * 0.8) if has_panels and has_inverter else False
+    
+    all_required = has_devices and has_panels and has_battery and has_inverter
+    all_optimal = all_required and pv_adequate and battery_adequate and inverter_adequate
+    
+    # Display checklist in a nice card
+    checklist_col1, checklist_col2 = st.columns([2, 1])
+    
+    with checklist_col1:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 10px; color: white;">
+            <h4 style="margin: 0 0 1rem 0;">🎯 System Readiness</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Required items
+        st.markdown("**Required Components:**")
+        req_col1, req_col2, req_col3, req_col4 = st.columns(4)
+        
+        with req_col1:
+            if has_devices:
+                st.markdown(f"✅ **Devices**<br>{len(st.session_state.devices)} configured", unsafe_allow_html=True)
+            else:
+                st.markdown("❌ **Devices**<br>None added", unsafe_allow_html=True)
+        
+        with req_col2:
+            if has_panels:
+                st.markdown(f"✅ **Solar**<br>{pv_cap:.1f} kW", unsafe_allow_html=True)
+            else:
+                st.markdown("❌ **Solar**<br>Not set", unsafe_allow_html=True)
+        
+        with req_col3:
+            if has_battery:
+                st.markdown(f"✅ **Battery**<br>{bat_cap:.1f} kWh", unsafe_allow_html=True)
+            else:
+                st.markdown("❌ **Battery**<br>Not set", unsafe_allow_html=True)
+        
+        with req_col4:
+            if has_inverter:
+                st.markdown(f"✅ **Inverter**<br>{inv_cap:.1f} kW", unsafe_allow_html=True)
+            else:
+                st.markdown("❌ **Inverter**<br>Not set", unsafe_allow_html=True)
+        
+        # System sizing check
+        if all_required:
+            st.markdown("---")
+            st.markdown("**System Sizing Analysis:**")
+            size_col1, size_col2, size_col3 = st.columns(3)
+            
+            with size_col1:
+                if pv_adequate:
+                    st.markdown("✅ **PV Sizing**<br>Adequate for load", unsafe_allow_html=True)
+                else:
+                    shortfall = (total_load / 4) - pv_cap
+                    st.markdown(f"⚠️ **PV Sizing**<br>Add {shortfall:.1f} kW", unsafe_allow_html=True)
+            
+            with size_col2:
+                if battery_adequate:
+                    st.markdown("✅ **Battery Size**<br>Good capacity", unsafe_allow_html=True)
+                else:
+                    needed = (total_load * 0.5) - bat_cap
+                    st.markdown(f"⚠️ **Battery Size**<br>Add {needed:.1f} kWh", unsafe_allow_html=True)
+            
+            with size_col3:
+                if inverter_adequate:
+                    st.markdown("✅ **Inverter Size**<br>Properly sized", unsafe_allow_html=True)
+                else:
+                    needed = (pv_cap * 0.8) - inv_cap
+                    st.markdown(f"⚠️ **Inverter Size**<br>Add {needed:.1f} kW", unsafe_allow_html=True)
+    
+    with checklist_col2:
+        # Overall status
+        if all_optimal:
+            st.markdown("""
+            <div style="background: #10b981; padding: 1.5rem; border-radius: 10px; text-align: center; color: white;">
+                <h2 style="margin: 0;">✅</h2>
+                <h4 style="margin: 0.5rem 0;">Ready to Simulate</h4>
+                <p style="margin: 0; font-size: 0.9rem;">All systems optimal</p>
+            </div>
+            """, unsafe_allow_html=True)
+        elif all_required:
+            st.markdown("""
+            <div style="background: #f59e0b; padding: 1.5rem; border-radius: 10px; text-align: center; color: white;">
+                <h2 style="margin: 0;">⚠️</h2>
+                <h4 style="margin: 0.5rem 0;">Can Simulate</h4>
+                <p style="margin: 0; font-size: 0.9rem;">Some sizing issues</p>
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown("""
+            <div style="background: #ef4444; padding: 1.5rem; border-radius: 10px; text-align: center; color: white;">
+                <h2 style="margin: 0;">❌</h2>
+                <h4 style="margin: 0.5rem 0;">Cannot Simulate</h4>
+                <p style="margin: 0; font-size: 0.9rem;">Missing components</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Quick action buttons
+        st.markdown("<br>", unsafe_allow_html=True)
+        if not has_devices:
+            if st.button("➕ Add Devices", use_container_width=True, type="secondary"):
+                st.switch_page("app.py")
+        if not has_panels or not has_battery or not has_inverter:
+            if st.button("🔧 Configure System", use_container_width=True, type="secondary"):
+                st.switch_page("app.py")
+    
+    # Stop if required components missing
+    if not all_required:
+        st.stop()
+    
+    # Detailed System Configuration Display
+    st.markdown("### 📋 System Configuration Summary")
+    
+    config_col1, config_col2 = st.columns([2, 1])
+    
+    with config_col1:
+        # Component details
+        st.markdown("🔹 **Solar Panels:**")
+        if st.session_state.system_config.solar_panels:
+            panels = st.session_state.system_config.solar_panels
+            st.write(f"  • {panels.quantity}x {panels.name} ({panels.power_watts}W each)")
+            st.write(f"  • Total Capacity: {panels.total_power_kw:.2f} kW")
+            st.write(f"  • Cost: ${panels.cost_per_panel * panels.quantity:,.2f}")
+        
+        st.markdown("🔹 **Battery Storage:**")
+        if st.session_state.system_config.battery:
+            battery = st.session_state.system_config.battery
+            if battery.quantity > 1:
+                st.write(f"  • {battery.quantity}x {battery.name} ({battery.capacity_kwh}kWh each)")
+                st.write(f"  • Total Capacity: {battery.total_capacity_kwh:.2f} kWh")
+                st.write(f"  • Usable: {battery.usable_capacity_kwh:.2f} kWh (80% DoD)")
+                st.write(f"  • Cost: ${battery.total_cost:,.2f} ({battery.quantity} units)")
+            else:
+                st.write(f"  • {battery.name} ({battery.capacity_kwh}kWh)")
+                st.write(f"  • Usable: {battery.usable_capacity_kwh:.2f} kWh (80% DoD)")
+                st.write(f"  • Cost: ${battery.cost:,.2f}")
+        
+        st.markdown("🔹 **Inverter:**")
+        if st.session_state.system_config.inverter:
+            inverter = st.session_state.system_config.inverter
+            st.write(f"  • {inverter.name} ({inverter.power_kw}kW)")
+            st.write(f"  • Efficiency: {inverter.efficiency * 100:.0f}%")
+            st.write(f"  • Cost: ${inverter.cost:,.2f}")
+    
+    with config_col2:
+        # Cost summary
+        equipment_cost = 0.0
+        if st.session_state.system_config.solar_panels:
+            equipment_cost += st.session_state.system_config.solar_panels.cost_per_panel * st.session_state.system_config.solar_panels.quantity
+        if st.session_state.system_config.battery:
+            equipment_cost += st.session_state.system_config.battery.total_cost
+        if st.session_state.system_config.inverter:
+            equipment_cost += st.session_state.system_config.inverter.cost
+        
+        labor_cost = st.session_state.system_config.labor_cost
+        support_cost = st.session_state.system_config.support_material_cost
+        total_cost = st.session_state.system_config.total_system_cost
+        
+        st.markdown("💰 **Cost Summary (Wholesale):**")
+        st.write(f"  • Equipment: ${equipment_cost:,.2f}")
+        st.write(f"  • Labor: ${labor_cost:,.2f}")
+        st.write(f"  • Materials: ${support_cost:,.2f}")
+        st.markdown(f"**Total: ${total_cost:,.2f}**")
+        st.caption("ℹ️ Customer price (+30%): ${:,.2f}".format(total_cost * 1.3))
+    
+    st.markdown("---")
+    
+    # Quick metrics
+    st.markdown("### 📊 Quick Metrics")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("⚡ Devices", len(st.session_state.devices))
+    with col2:
+        pv_cap = st.session_state.system_config.solar_panels.total_power_kw
+        st.metric("☀️ PV Capacity", f"{pv_cap:.2f} kW")
+    with col3:
+        if st.session_state.system_config.battery:
+            bat_cap = st.session_state.system_config.battery.total_capacity_kwh
+            bat_qty = st.session_state.system_config.battery.quantity
+            if bat_qty > 1:
+                st.metric("🔋 Battery", f"{bat_cap:.1f} kWh", delta=f"{bat_qty} units")
+            else:
+                st.metric("🔋 Battery", f"{bat_cap:.1f} kWh")
+        else:
+            bat_cap = 5.0
+            st.metric("🔋 Battery", f"{bat_cap:.1f} kWh")
+    with col4:
+        total_load = sum(d.daily_energy_kwh for d in st.session_state.devices)
+        st.metric("🔌 Daily Load", f"{total_load:.2f} kWh")
+    
+    st.markdown("---")
+    
+    # Run simulation button
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("▶️ Run 24-Hour Simulation", type="primary", use_container_width=True):
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            
+            status_text.text("⚙️ Initializing calculator...")
+            progress_bar.progress(20)
+            
+            calc = SolarCalculator(st.session_state.system_config)
+            
+            status_text.text("☀️ Calculating PV generation...")
+            progress_bar.progress(40)
+            
+            status_text.text("🔋 Simulating battery flow...")
+            progress_bar.progress(60)
+            
+            # Identical designs are served from the process-wide cache
+            devices = st.session_state.devices
+            design_key = config_fingerprint(st.session_state.system_config, devices, calc.seed, pv_cap, bat_cap)
+            results = SIMULATION_CACHE.get_or_compute(
+                design_key + ':24h', lambda: calc.simulate_24_hours_frame(pv_cap, bat_cap, devices))
+            
+            status_text.text("📅 Simulating full year (8760 hours)...")
+            progress_bar.progress(70)
+            
+            annual = SIMULATION_CACHE.get_or_compute(
+                design_key + ':year', lambda: calc.simulate_year(pv_cap, bat_cap, devices))
+            
+            status_text.text("📊 Processing results...")
+            progress_bar.progress(80)
+            
+            st.session_state.simulation_results = results
+            st.session_state.annual_simulation = annual
+            st.session_state.monte_carlo = None
+            
+            progress_bar.progress(100)
+            status_text.text("✅ Simulation complete!")
+            
+            st.success("🎉 Simulation completed successfully!")
+            st.rerun()
+    
+    if st.session_state.simulation_results:
+        st.markdown("---")
+        st.markdown("### 📈 Simulation Results")
+        
+        from visualization import SolarVisualizer
+        viz = SolarVisualizer(language=st.session_state.language)
+        results = as_frame(st.session_state.simulation_results)
+        calc = SolarCalculator(st.session_state.system_config)
+        
+        # Calculate metrics
+        total_pv = float(results.pv_generation_kw.sum())
+        total_load = float(results.load_kw.sum())
+        total_grid = float(results.grid_import_kw.sum())
+        total_grid_export = float(results.grid_export_kw.sum())
+        self_suff = ((total_load - total_grid) / total_load * 100) if total_load > 0 else 0
+        
+        # Create tabs for organized results
+        results_tab1, results_tab2, results_tab3, results_tab4, results_tab5 = st.tabs([
+            "📊 Overview & KPIs",
+            "📈 Energy Flow",
+            "💡 System Insights",
+            "💰 Financial Analysis",
+            "🎯 Recommendations"
+        ])
+        
+        # ===== TAB 1: Overview & KPIs =====
+        with results_tab1:
+            st.markdown(f"#### {t('kpi')}")
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric(
+                    label=t('pv_generation'),
+                    value=f"{total_pv:.2f} kWh",
+                    delta=f"{total_pv * 30:.0f} kWh/month"
+                )
+            with col2:
+                st.metric(
+                    label=t('total_load'),
+                    value=f"{total_load:.2f} kWh",
+                    delta=f"{total_load * 30:.0f} kWh/month"
+                )
+            with col3:
+                grid_status = "Low" if total_grid < total_load * 0.2 else "Moderate"
+                st.metric(
+                    t('grid_import'),
+                    f"{total_grid:.2f} kWh",
+                    delta=grid_status,
+                    delta_color="inverse"
+                )
+            with col4:
+                suff_status = "Excellent" if self_suff >= 80 else "Good" if self_suff >= 50 else "Low"
+                st.metric(
+                    "🎯 Self-Sufficiency",
+                    f"{self_suff:.1f}%",
+                    delta=suff_status
+                )
+            
+            annual = st.session_state.annual_simulation
+            if annual:
+                st.markdown("#### 📅 Full-Year Simulation (8760 hours)")
+                year_col1, year_col2, year_col3, year_col4 = st.columns(4)
+                with year_col1:
+                    st.metric("☀️ Annual PV", f"{annual.annual_pv_kwh:,.0f} kWh")
+                with year_col2:
+                    st.metric("🔌 Annual Load", f"{annual.annual_load_kwh:,.0f} kWh")
+                with year_col3:
+                    st.metric("⚡ Annual Grid Import", f"{annual.annual_grid_import_kwh:,.0f} kWh")
+                with year_col4:
+                    st.metric("🎯 Annual Self-Sufficiency", f"{annual.self_sufficiency_percent:.1f}%")
+                
+                monthly_df = pd.DataFrame({
+                    "Month": ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+                    "PV (kWh)": annual.monthly_pv_kwh.round(1),
+                    "Load (kWh)": annual.monthly_load_kwh.round(1),
+                    "Grid Import (kWh)": annual.monthly_grid_import_kwh.round(1),
+                    "Grid Export (kWh)": annual.monthly_grid_export_kwh.round(1),
+                })
+                st.dataframe(monthly_df, use_container_width=True, hide_index=True)
+        
+        # ===== TAB 2: Energy Flow =====
+        with results_tab2:
+            st.markdown("#### 📊 24-Hour Energy Flow")
+            fig = viz.create_24h_energy_flow_chart(results)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            annual = st.session_state.annual_simulation
+            if annual:
+                st.markdown("#### 📅 Full-Year Energy Flow")
+                first_month, last_month = st.select_slider(
+                    "Months", options=list(range(1, 13)), value=(1, 12),
+                    format_func=lambda month: calendar.month_abbr[month], key="annual_chart_months"
+                )
+                st.caption("Ranges up to a month show every hour; longer ranges are downsampled and drawn with WebGL.")
+                annual_fig = viz.create_annual_energy_chart(annual, first_month, last_month)
+                st.plotly_chart(annual_fig, use_container_width=True)
+        
+        # ===== TAB 3: System Insights =====
+        with results_tab3:
+            st.markdown("#### 💡 System Insights")
+            
+            insight_col1, insight_col2, insight_col3 = st.columns(3)
+            
+            with insight_col1:
+                avg_battery_soc = float(results.battery_soc.mean())
+                min_battery_soc = float(results.battery_soc.min())
+                
+                st.markdown(f"""
+                <div class="custom-card">
+                    <h4>🔋 Battery Performance</h4>
+                    <p><b>Average SoC:</b> {avg_battery_soc:.1f}%</p>
+                    <p><b>Minimum SoC:</b> {min_battery_soc:.1f}%</p>
+                    <p><b>Status:</b> {"Excellent" if min_battery_soc > 30 else "Needs attention"}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with insight_col2:
+                peak_pv = float(results.pv_generation_kw.max())
+                peak_hour = int(results.hour[results.pv_generation_kw.argmax()])
+                
+                st.markdown(f"""
+                <div class="custom-card">
+                    <h4>☀️ Solar Performance</h4>
+                    <p><b>Peak Generation:</b> {peak_pv:.2f} kW</p>
+                    <p><b>Peak Hour:</b> {peak_hour}:00</p>
+                    <p><b>Daily Total:</b> {total_pv:.2f} kWh</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with insight_col3:
+                energy_wasted = float(results.energy_surplus_kw.sum())
+                grid_export_value = total_grid_export * 0.15
+                
+                st.markdown(f"""
+                <div class="custom-card">
+                    <h4>💰 Energy Economics</h4>
+                    <p><b>Grid Export:</b> {total_grid_export:.2f} kWh</p>
+                    <p><b>Export Value:</b> ${grid_export_value:.2f}</p>
+                    <p><b>Wasted Energy:</b> {energy_wasted:.2f} kWh</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Uncertainty bands from many randomized days
+            st.markdown("---")
+            st.markdown("#### 🎲 Uncertainty Analysis (Monte Carlo)")
+            st.caption("Runs 5,000 days with random device usage and cloudy/clear weather to show the likely range, not just one day.")
+            if st.button("🎲 Run 5,000 Scenarios", use_container_width=True):
+                with st.spinner("Simulating scenarios..."):
+                    st.session_state.monte_carlo = calc.simulate_monte_carlo(pv_cap, bat_cap, st.session_state.devices)
+            
+            monte_carlo = st.session_state.get('monte_carlo')
+            if monte_carlo:
+                import_p10, import_p50, import_p90 = monte_carlo.grid_import_bands_kwh
+                unmet_p10, unmet_p50, unmet_p90 = monte_carlo.unmet_load_bands_kwh
+                mc_col1, mc_col2, mc_col3 = st.columns(3)
+                with mc_col1:
+                    st.metric("⚡ Grid Import (P50)", f"{import_p50:.2f} kWh/day",
+                              delta=f"P10 {import_p10:.1f} – P90 {import_p90:.1f}", delta_color="off")
+                with mc_col2:
+                    st.metric("⚠️ Unmet Load (P50)", f"{unmet_p50:.2f} kWh/day",
+                              delta=f"P10 {unmet_p10:.1f} – P90 {unmet_p90:.1f}", delta_color="off")
+                with mc_col3:
+                    soc_p10 = monte_carlo.battery_soc_bands[0]
+                    st.metric("🔋 Lowest SoC (P10)", f"{soc_p10.min():.0f}%")
+                
+                st.plotly_chart(viz.create_monte_carlo_soc_chart(monte_carlo), use_container_width=True)
+                st.plotly_chart(viz.create_scenario_chart(monte_carlo), use_container_width=True)
+        
+        # ===== TAB 4: Financial Analysis =====
+        with results_tab4:
+            st.markdown("#### 💰 Financial Analysis & ROI Breakdown")
+            
+            # Add Pricing Mode Toggle
+            pricing_col1, pricing_col2 = st.columns([3, 1])
+        with pricing_col1:
+            st.markdown("### 💰 Pricing Mode")
+        with pricing_col2:
+            customer_pricing = st.checkbox(
+                "🏷️ Customer Pricing (+30%)",
+                value=True,
+                help="Enable to show financial analysis with customer pricing (30% markup). Disable for wholesale pricing."
+            )
+        
+        # Apply markup if customer pricing is selected
+        markup_multiplier = 1.30 if customer_pricing else 1.0
+        
+        if customer_pricing:
+            st.info("ℹ️ **Customer Pricing Mode**: All costs include 30% markup for retail customers")
+        else:
+            st.warning("⚠️ **Wholesale Pricing Mode**: Showing wholesale costs (internal use only)")
+        
+        st.markdown("---")
+        
+        calc = SolarCalculator(st.session_state.system_config)
+        wholesale_cost = st.session_state.system_config.total_system_cost
+        system_cost = wholesale_cost * markup_multiplier
+        annual = st.session_state.annual_simulation
+        annual_energy = annual.annual_pv_kwh if annual else total_pv * 365
+        
+        # Use fixed electricity rate for Cambodia
+        electricity_rate = 0.1875  # $0.1875 per kWh
+        
+        financial = calc.calculate_financial_analysis(
+            system_cost, annual_energy,
+            electricity_rate
+        )
+        
+        # Initial Investment Summary
+        st.markdown("#### 📈 Initial Investment")
+        inv_col1, inv_col2, inv_col3, inv_col4 = st.columns(4)
+        with inv_col1:
+            if customer_pricing:
+                st.metric("System Cost (Customer)", f"${system_cost:,.2f}", delta=f"+30% from ${wholesale_cost:,.2f}")
+            else:
+                st.metric("System Cost (Wholesale)", f"${system_cost:,.2f}")
+        with inv_col2:
+            annual_generation = annual_energy
+            st.metric("Annual Generation", f"{annual_generation:,.0f} kWh")
+        with inv_col3:
+            annual_savings = annual_generation * electricity_rate
+            st.metric("Annual Savings", f"${annual_savings:,.2f}")
+        with inv_col4:
+            payback = system_cost / annual_savings if annual_savings > 0 else 0
+            st.metric("Payback Period", f"{payback:.1f} years")
+        
+        pricing_mode = "Customer (+30%)" if customer_pricing else "Wholesale"
+        st.caption(f"⚡ Electricity Rate: ${electricity_rate}/kWh | 📅 Analysis based on {annual_generation:,.0f} kWh/year | 🏷️ {pricing_mode} pricing")
+        
+        st.markdown("---")
+        
+        # ROI Timeline Breakdown
+        st.markdown("#### 📅 ROI Timeline Breakdown")
+        
+        timeline_data = []
+        
+        # Year 3 - After initial warranty
+        years_3 = 3
+        total_savings_3y = annual_savings * years_3
+        maintenance_3y = system_cost * 0.02 * years_3  # 2% per year maintenance
+        net_savings_3y = total_savings_3y - maintenance_3y
+        net_profit_3y = net_savings_3y - system_cost
+        roi_3y = (net_profit_3y / system_cost) * 100
+        
+        timeline_data.append({
+            "Period": "🔹 Year 3",
+            "Milestone": "Inverter Warranty Ends",
+            "Total Savings": f"${total_savings_3y:,.2f}",
+            "Maintenance": f"${maintenance_3y:,.2f}",
+            "Net Profit": f"${net_profit_3y:,.2f}",
+            "ROI": f"{roi_3y:.1f}%",
+            "Status": "❌ Not Paid Off" if net_profit_3y < 0 else "✅ Profitable"
+        })
+        
+        # Year 5 - Mid-term review
+        years_5 = 5
+        total_savings_5y = annual_savings * years_5
+        maintenance_5y = system_cost * 0.02 * years_5
+        net_savings_5y = total_savings_5y - maintenance_5y
+        net_profit_5y = net_savings_5y - system_cost
+        roi_5y = (net_profit_5y / system_cost) * 100
+        
+        timeline_data.append({
+            "Period": "🔹 Year 5",
+            "Milestone": "Extended Warranty Period",
+            "Total Savings": f"${total_savings_5y:,.2f}",
+            "Maintenance": f"${maintenance_5y:,.2f}",
+            "Net Profit": f"${net_profit_5y:,.2f}",
+            "ROI": f"{roi_5y:.1f}%",
+            "Status": "❌ Not Paid Off" if net_profit_5y < 0 else "✅ Profitable"
+        })
+        
+        # Year 10 - Mid-life
+        years_10 = 10
+        total_savings_10y = annual_savings * years_10
+        maintenance_10y = system_cost * 0.02 * years_10
+        # Possible inverter replacement at year 10
+        inverter_replacement = (st.session_state.system_config.inverter.cost * markup_multiplier) if st.session_state.system_config.inverter else 0
+        net_savings_10y = total_savings_10y - maintenance_10y - inverter_replacement
+        net_profit_10y = net_savings_10y - system_cost
+        roi_10y = (net_profit_10y / system_cost) * 100
+        
+        timeline_data.append({
+            "Period": "🔹 Year 10",
+            "Milestone": "Inverter Replacement (~$800)",
+            "Total Savings": f"${total_savings_10y:,.2f}",
+            "Maintenance": f"${maintenance_10y + inverter_replacement:,.2f}",
+            "Net Profit": f"${net_profit_10y:,.2f}",
+            "ROI": f"{roi_10y:.1f}%",
+            "Status": "❌ Not Paid Off" if net_profit_10y < 0 else "✅ Profitable"
+        })
+        
+        # Year 15 - Battery lifespan
+        years_15 = 15
+        total_savings_15y = annual_savings * years_15
+        maintenance_15y = system_cost * 0.02 * years_15
+        # Add inverter replacement cost
+        total_replacements = inverter_replacement
+        net_savings_15y = total_savings_15y - maintenance_15y - total_replacements
+        net_profit_15y = net_savings_15y - system_cost
+        roi_15y = (net_profit_15y / system_cost) * 100
+        
+        timeline_data.append({
+            "Period": "🔹 Year 15",
+            "Milestone": "Battery Lifespan End",
+            "Total Savings": f"${total_savings_15y:,.2f}",
+            "Maintenance": f"${maintenance_15y + total_replacements:,.2f}",
+            "Net Profit": f"${net_profit_15y:,.2f}",
+            "ROI": f"{roi_15y:.1f}%",
+            "Status": "❌ Not Paid Off" if net_profit_15y < 0 else "✅ Profitable"
+        })
+        
+        # Year 25 - Panel lifespan
+        years_25 = 25
+        total_savings_25y = annual_savings * years_25 * 0.9  # 10% degradation
+        maintenance_25y = system_cost * 0.02 * years_25
+        # Battery replacement at year 15
+        battery_replacement = (st.session_state.system_config.battery.total_cost * markup_multiplier) if st.session_state.system_config.battery else 0
+        total_replacements_25y = inverter_replacement + battery_replacement
+        net_savings_25y = total_savings_25y - maintenance_25y - total_replacements_25y
+        net_profit_25y = net_savings_25y - system_cost
+        roi_25y = (net_profit_25y / system_cost) * 100
+        
+        timeline_data.append({
+            "Period": "🔹 Year 25",
+            "Milestone": "Full System Lifespan",
+            "Total Savings": f"${total_savings_25y:,.2f}",
+            "Maintenance": f"${maintenance_25y + total_replacements_25y:,.2f}",
+            "Net Profit": f"${net_profit_25y:,.2f}",
+            "ROI": f"{roi_25y:.1f}%",
+            "Status": "✅ Fully Profitable"
+        })
+        
+        # Display as table
+        timeline_df = pd.DataFrame(timeline_data)
+        st.dataframe(timeline_df, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        # Key Financial Highlights
+        st.markdown("#### 🎯 Key Financial Highlights")
+        highlight_col1, highlight_col2, highlight_col3 = st.columns(3)
+        
+        with highlight_col1:
+            st.markdown(f"""
+            <div class="success-box" style="padding: 1rem;">
+                <h4>💵 Break-Even Point</h4>
+                <p><b>Estimated:</b> Year {payback:.1f}</p>
+                <p><b>After payback:</b> Pure profit!</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with highlight_col2:
+            st.markdown(f"""
+            <div class="info-box" style="padding: 1rem;">
+                <h4>🔋 Battery Impact</h4>
+                <p><b>Lifespan:</b> 15 years</p>
+                <p><b>Replacement Cost:</b> ${battery_replacement:,.2f}</p>
+                <p><b>At Year 15:</b> Consider upgrade</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with highlight_col3:
+            st.markdown(f"""
+            <div class="custom-card" style="padding: 1rem;">
+                <h4>🌱 Environmental Impact</h4>
+                <p><b>CO₂ Reduction:</b> {financial.co2_reduction_kg_per_year * 15:,.0f} kg</p>
+                <p><b>Over 15 years</b></p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # ===== TAB 5: Recommendations =====
+        with results_tab5:
+            st.markdown("#### 💡 AI Recommendations")
+            st.markdown("Based on your simulation results and system configuration:")
+            st.markdown("---")
+            recommendations = calc.get_device_recommendations(
+                st.session_state.devices, pv_cap, bat_cap
+            )
+            for idx, rec in enumerate(recommendations, 1):
+                st.info(f"**{idx}.** {rec}")
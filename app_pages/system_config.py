@@ -0,0 +1,395 @@
+"""
+System Configuration Page
+Panel, battery and inverter selection plus the system optimizer
+"""
+import streamlit as st
+import pandas as pd
+
+from models import SolarPanel, Battery, Inverter
+from translations import t
+
+
+def render():
+    """Render the system configuration page"""
+    st.title(t('system_config'))
+    st.markdown(f"#### {t('system_subtitle')}")
+    
+    # Calculate recommendations based on devices
+    if st.session_state.devices:
+        total_daily_load = sum(d.daily_energy_kwh for d in st.session_state.devices)
+        peak_power = sum(d.effective_power_watts for d in st.session_state.devices) / 1000
+        
+        # Calculate night load (assuming 50% during night hours 18:00-06:00)
+        night_load = total_daily_load * 0.5
+        
+        # Recommendations
+        sunlight_hours = st.session_state.system_config.sunlight_hours
+        system_efficiency = 0.85
+        
+        recommended_pv_kw = total_daily_load / (sunlight_hours * system_efficiency)
+        recommended_battery_kwh = night_load / 0.8  # 80% DoD
+        recommended_inverter_kw = peak_power * 1.3  # 30% safety margin for better reliability
+        
+        # Show recommendations banner
+        st.markdown(f"""
+        <div class="info-box">
+            <h4>{t('auto_recommendations')}</h4>
+            <p><b>{t('based_on_devices').format(len(st.session_state.devices), total_daily_load)}</b></p>
+            <p>{t('solar_panels')}: {recommended_pv_kw:.2f} kW | {t('battery')}: {recommended_battery_kwh:.2f} kWh | {t('inverter')}: {recommended_inverter_kw:.2f} kW</p>
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown("---")
+    else:
+        st.warning("⚠️ Add devices first to get auto-calculated recommendations")
+        recommended_pv_kw = 5.0
+        recommended_battery_kwh = 5.0
+        recommended_inverter_kw = 5.0
+    
+    tab1, tab2, tab3 = st.tabs([t('solar_panels'), t('battery'), t('inverter')])
+    
+    with tab1:
+        st.markdown(f"### {t('solar_config')}")
+        
+        # Auto-calculate section
+        if st.session_state.devices:
+            # Get recommended panel from product catalog
+            pm = st.session_state.product_manager
+            recommended_panel = pm.get_recommended_panel(min_wattage=400)
+            rec_panel_wattage = recommended_panel.specifications.get('power', 550) if recommended_panel else 550
+            
+            col_auto1, col_auto2 = st.columns(2)
+            with col_auto1:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 1rem;">
+                    <h4>{t('recommended')}</h4>
+                    <p><b>{t('total_capacity')}:</b> {recommended_pv_kw:.2f} kW</p>
+                    <p><b>Example:</b> {int(recommended_pv_kw * 1000 / rec_panel_wattage)} x {rec_panel_wattage}W panels</p>
+                    <p><b>Recommended:</b> {recommended_panel.name if recommended_panel else 'Check Products page'}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            with col_auto2:
+                if st.button(t('auto_fill'), key="auto_solar", use_container_width=True):
+                    if recommended_panel:
+                        st.session_state.auto_solar_quantity = int(recommended_pv_kw * 1000 / rec_panel_wattage)
+                        st.session_state.auto_panel_name = recommended_panel.name
+                        st.session_state.auto_panel_power = rec_panel_wattage
+                        st.session_state.auto_panel_cost = recommended_panel.cost
+                    st.rerun()
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Get default values from recommended product or session state
+            pm = st.session_state.product_manager
+            default_panel = pm.get_recommended_panel(min_wattage=400)
+            
+            default_name = st.session_state.get('auto_panel_name', default_panel.name if default_panel else "Lvtopsun 550W")
+            default_power = st.session_state.get('auto_panel_power', default_panel.specifications.get('power', 550) if default_panel else 550)
+            default_cost = st.session_state.get('auto_panel_cost', default_panel.cost if default_panel else 66.0)
+            
+            panel_name = st.text_input(t('panel_model'), default_name)
+            panel_power = st.number_input(t('power_per_panel'), 100, value=int(default_power), step=50)
+            
+            # Use auto-calculated quantity if available
+            default_qty = st.session_state.get('auto_solar_quantity', 10)
+            quantity = st.number_input(t('quantity'), 1, value=default_qty)
+            cost = st.number_input(f"{t('cost')}/Panel ($)", 0.0, value=float(default_cost))
+        
+        with col2:
+            total_pv_kw = (panel_power * quantity / 1000)
+            st.metric(t('total_capacity'), f"{total_pv_kw:.2f} kW")
+            st.metric(t('total_cost'), f"${cost * quantity:,.2f}")
+            
+            # Show comparison with recommendation
+            if st.session_state.devices:
+                difference = total_pv_kw - recommended_pv_kw
+                if abs(difference) < 0.5:
+                    st.success(t('optimal_sizing'))
+                elif difference > 0:
+                    st.info(f"ℹ️ {difference:.1f} kW above recommended (good for growth)")
+                else:
+                    st.warning(f"⚠️ {abs(difference):.1f} kW below recommended")
+        
+        if st.button(t('save_config').format(' Solar'), type="primary"):
+            st.session_state.system_config.solar_panels = SolarPanel(name=panel_name, power_watts=panel_power, efficiency=0.21, cost_per_panel=cost, quantity=quantity)
+            st.success("✅ Solar panels configured successfully!")
+            st.rerun()
+    
+    with tab2:
+        st.markdown(f"### {t('battery_config')}")
+        
+        # Auto-calculate section
+        if st.session_state.devices:
+            col_auto1, col_auto2 = st.columns(2)
+            with col_auto1:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 1rem;">
+                    <h4>{t('recommended')}</h4>
+                    <p><b>{t('capacity_kwh')}:</b> {recommended_battery_kwh:.2f} kWh</p>
+                    <p><b>Purpose:</b> Cover night load + safety margin</p>
+                </div>
+                """, unsafe_allow_html=True)
+            with col_auto2:
+                if st.button(t('auto_fill'), key="auto_battery", use_container_width=True):
+                    st.session_state.auto_battery_capacity = recommended_battery_kwh
+                    st.rerun()
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Get default values from recommended battery
+            pm = st.session_state.product_manager
+            default_capacity = st.session_state.get('auto_battery_capacity', 5.0)
+            default_battery = pm.get_recommended_battery(min_capacity_kwh=default_capacity)
+            
+            default_bat_name = st.session_state.get('auto_battery_name', default_battery.name if default_battery else "DEYE 100AH 51.2v (5.12KWH)")
+            default_bat_capacity = default_battery.specifications.get('capacity', 5.12) if default_battery else 5.12
+            default_bat_voltage = default_battery.specifications.get('voltage', 51.2) if default_battery else 51.2
+            default_bat_cost = default_battery.cost if default_battery else 1440.0
+            
+            bat_name = st.text_input(t('battery_model'), default_bat_name)
+            
+            # Use auto-calculated capacity if available
+            capacity = st.number_input(t('capacity_kwh'), 1.0, value=float(default_bat_capacity), step=0.5, help="Capacity per battery unit")
+            
+            bat_quantity = st.number_input(
+                "🔢 Quantity (Units)",
+                min_value=1,
+                max_value=10,
+                value=1,
+                step=1,
+                help="Number of battery units to install (connected in parallel for more capacity)"
+            )
+            
+            voltage = st.number_input(t('voltage'), 12, value=int(default_bat_voltage), step=12)
+            bat_cost = st.number_input(f"{t('cost')}/Unit ($)", 0.0, value=float(default_bat_cost), help="Cost per battery unit")
+        
+        with col2:
+            total_capacity = capacity * bat_quantity
+            total_usable = total_capacity * 0.8
+            total_bat_cost = bat_cost * bat_quantity
+            
+            st.metric(t('total_capacity'), f"{total_capacity:.1f} kWh", help=f"{bat_quantity}x {capacity}kWh batteries")
+            st.metric("Usable Energy (80% DoD)", f"{total_usable:.1f} kWh")
+            st.metric(t('total_cost'), f"${total_bat_cost:,.2f}", help=f"{bat_quantity} units × ${bat_cost:,.2f}")
+            
+            # Show comparison with recommendation
+            if st.session_state.devices:
+                difference = total_capacity - recommended_battery_kwh
+                if abs(difference) < 1.0:
+                    st.success(t('optimal_sizing'))
+                elif difference > 0:
+                    st.info(f"ℹ️ {difference:.1f} kWh above recommended (extra backup)")
+                else:
+                    st.warning(f"⚠️ {abs(difference):.1f} kWh below recommended")
+            
+            # Show battery configuration info
+            if bat_quantity > 1:
+                st.markdown(f"""
+                <div class="info-box" style="padding: 0.8rem; margin-top: 1rem;">
+                    <p style="margin: 0;"><b>⚡ Configuration:</b> {bat_quantity} batteries in parallel</p>
+                    <p style="margin: 0;"><small>Each: {capacity}kWh @ {voltage}V | Total: {total_capacity:.1f}kWh</small></p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        if st.button(t('save_config').format(' Battery'), type="primary"):
+            st.session_state.system_config.battery = Battery(name=bat_name, capacity_kwh=capacity, voltage=voltage, depth_of_discharge=0.8, efficiency=0.95, cost=bat_cost, quantity=bat_quantity)
+            st.success(f"✅ Battery configured successfully! ({bat_quantity}x {capacity}kWh = {total_capacity:.1f}kWh total)")
+            st.rerun()
+    
+    with tab3:
+        st.markdown(f"### {t('inverter_config')}")
+        
+        # Auto-calculate section
+        if st.session_state.devices:
+            col_auto1, col_auto2 = st.columns(2)
+            with col_auto1:
+                st.markdown(f"""
+                <div class="success-box" style="padding: 1rem;">
+                    <h4>{t('recommended')}</h4>
+                    <p><b>{t('power_rating')}:</b> {recommended_inverter_kw:.2f} kW</p>
+                    <p><b>Peak Load:</b> {peak_power:.2f} kW + 25% margin</p>
+                </div>
+                """, unsafe_allow_html=True)
+            with col_auto2:
+                if st.button(t('auto_fill'), key="auto_inverter", use_container_width=True):
+                    st.session_state.auto_inverter_power = recommended_inverter_kw
+                    st.rerun()
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Get default values from recommended inverter
+            pm = st.session_state.product_manager
+            default_power = st.session_state.get('auto_inverter_power', 5.0)
+            default_inverter = pm.get_recommended_inverter(min_power_kw=default_power, inverter_type="Hybrid")
+            
+            default_inv_name = st.session_state.get('auto_inverter_name', default_inverter.name if default_inverter else "Deye Hybrid 5kw EU 1P")
+            default_inv_power = default_inverter.specifications.get('power', 5.0) if default_inverter else 5.0
+            default_inv_cost = default_inverter.cost if default_inverter else 888.0
+            
+            inv_name = st.text_input(t('inverter_model'), default_inv_name)
+            
+            # Use auto-calculated power if available
+            inv_power = st.number_input(t('power_rating'), 1.0, value=float(default_inv_power), step=0.5)
+            inv_cost = st.number_input(f"{t('inverter')} {t('cost')} ($)", 0.0, value=float(default_inv_cost))
+        
+        with col2:
+            st.metric(t('power_rating'), f"{inv_power} kW")
+            st.metric("Max Output", f"{inv_power * 0.9:.1f} kW (continuous)")
+            st.metric(t('total_cost'), f"${inv_cost:,.2f}")
+            
+            # Show comparison with recommendation
+            if st.session_state.devices:
+                difference = inv_power - recommended_inverter_kw
+                if abs(difference) < 0.5:
+                    st.success(t('optimal_sizing'))
+                elif difference > 0:
+                    st.info(f"ℹ️ {difference:.1f} kW above recommended (good headroom)")
+                else:
+                    st.warning(f"⚠️ {abs(difference):.1f} kW below recommended")
+        
+        if st.button(t('save_config').format(' Inverter'), type="primary"):
+            st.session_state.system_config.inverter = Inverter(name=inv_name, power_kw=inv_power, efficiency=0.97, cost=inv_cost)
+            st.success("✅ Inverter configured successfully!")
+            st.rerun()
+    
+    # Cost Breakdown Section
+    st.markdown("---")
+    st.markdown("### 💰 Complete Cost Breakdown")
+    
+    # Calculate all costs
+    equipment_cost = 0.0
+    if st.session_state.system_config.solar_panels:
+        equipment_cost += st.session_state.system_config.solar_panels.cost_per_panel * st.session_state.system_config.solar_panels.quantity
+    if st.session_state.system_config.battery:
+        equipment_cost += st.session_state.system_config.battery.total_cost
+    if st.session_state.system_config.inverter:
+        equipment_cost += st.session_state.system_config.inverter.cost
+    
+    labor_cost = st.session_state.system_config.labor_cost
+    support_cost = st.session_state.system_config.support_material_cost
+    total_cost = st.session_state.system_config.total_system_cost
+    
+    # Display cost breakdown
+    cost_col1, cost_col2 = st.columns([2, 1])
+    
+    with cost_col1:
+        # Cost breakdown table
+        cost_breakdown_data = []
+        
+        if st.session_state.system_config.solar_panels:
+            panels = st.session_state.system_config.solar_panels
+            cost_breakdown_data.append({
+                'Item': f'Solar Panels ({panels.quantity}x {panels.name})',
+                'Cost': f'${panels.cost_per_panel * panels.quantity:,.2f}'
+            })
+        
+        if st.session_state.system_config.battery:
+            battery = st.session_state.system_config.battery
+            if battery.quantity > 1:
+                cost_breakdown_data.append({
+                    'Item': f'Battery ({battery.quantity}x {battery.name})',
+                    'Cost': f'${battery.total_cost:,.2f}'
+                })
+            else:
+                cost_breakdown_data.append({
+                    'Item': f'Battery ({battery.name})',
+                    'Cost': f'${battery.total_cost:,.2f}'
+                })
+        
+        if st.session_state.system_config.inverter:
+            inverter = st.session_state.system_config.inverter
+            cost_breakdown_data.append({
+                'Item': f'Inverter ({inverter.name})',
+                'Cost': f'${inverter.cost:,.2f}'
+            })
+        
+        # Add labor cost
+        if labor_cost > 0:
+            inverter_size = st.session_state.system_config.inverter.power_kw if st.session_state.system_config.inverter else 0
+            labor_note = f"({'≤5kW' if inverter_size <= 5 else '>5kW'})"
+            cost_breakdown_data.append({
+                'Item': f'Labor Cost {labor_note}',
+                'Cost': f'${labor_cost:,.2f}'
+            })
+        
+        # Add support materials
+        if support_cost > 0:
+            cost_breakdown_data.append({
+                'Item': 'Support Materials',
+                'Cost': f'${support_cost:,.2f}'
+            })
+        
+        if cost_breakdown_data:
+            df_cost = pd.DataFrame(cost_breakdown_data)
+            st.dataframe(df_cost, use_container_width=True, hide_index=True)
+        else:
+            st.info("Configure system components to see cost breakdown")
+    
+    with cost_col2:
+        # Summary cards
+        st.markdown(f"""
+        <div class="custom-card" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 15px;">
+            <h3 style="margin: 0; color: white;">Total System Cost</h3>
+            <h2 style="margin: 10px 0; color: white;">${total_cost:,.2f}</h2>
+            <hr style="border-color: rgba(255,255,255,0.3);">
+            <p style="margin: 5px 0; font-size: 0.9rem;"><b>Equipment:</b> ${equipment_cost:,.2f}</p>
+            <p style="margin: 5px 0; font-size: 0.9rem;"><b>Labor:</b> ${labor_cost:,.2f}</p>
+            <p style="margin: 5px 0; font-size: 0.9rem;"><b>Materials:</b> ${support_cost:,.2f}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Show cost per kW if PV is configured
+        if st.session_state.system_config.solar_panels:
+            pv_capacity = st.session_state.system_config.solar_panels.total_power_kw
+            if pv_capacity > 0:
+                cost_per_kw = total_cost / pv_capacity
+                st.metric("Cost per kW", f"${cost_per_kw:,.2f}/kW")
+    
+    # Catalog Optimizer - search product combinations instead of picking by hand
+    st.markdown("---")
+    st.markdown(f"### {t('optimizer_title')}")
+    st.caption(t('optimizer_caption'))
+    
+    if st.button(t('optimizer_find'), use_container_width=True, disabled=not st.session_state.devices):
+        with st.spinner(t('optimizer_searching')):
+            from system_optimizer import SystemOptimizer
+            optimizer = SystemOptimizer(st.session_state.product_manager, st.session_state.system_config)
+            st.session_state.optimizer_result = optimizer.optimize(st.session_state.devices)
+    
+    optimizer_result = st.session_state.get('optimizer_result')
+    if optimizer_result and optimizer_result.front:
+        front = optimizer_result.front
+        st.caption(t('optimizer_evaluated').format(optimizer_result.evaluated, optimizer_result.elapsed_seconds)
+                   + ("" if optimizer_result.complete else f" ({t('optimizer_budget_reached')})"))
+        
+        front_df = pd.DataFrame([{
+            t('optimizer_col_inverter'): c.inverter.name,
+            t('optimizer_col_panels'): f"{c.panel_count}x {c.panel.name}",
+            t('optimizer_col_battery'): f"{c.battery_count}x {c.battery.name}" if c.battery else t('optimizer_no_battery'),
+            t('optimizer_col_pv_kw'): round(c.pv_kw, 2),
+            t('optimizer_col_battery_kwh'): round(c.battery_kwh, 2),
+            t('optimizer_col_cost'): f"${c.total_cost:,.2f}",
+            t('optimizer_col_self_sufficiency'): f"{c.self_sufficiency_percent:.1f}%",
+            t('optimizer_col_payback'): round(c.payback_years, 1),
+        } for c in front])
+        st.dataframe(front_df, use_container_width=True, hide_index=True)
+        
+        opt_col1, opt_col2 = st.columns([3, 1])
+        with opt_col1:
+            choice = st.selectbox(t('optimizer_choice'), range(len(front)),
+                                  format_func=lambda i: t('optimizer_choice_item').format(
+                                      i + 1, front[i].total_cost, front[i].self_sufficiency_percent))
+        with opt_col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            if st.button(t('optimizer_apply'), type="primary", use_container_width=True):
+                chosen = front[choice].to_configuration(st.session_state.system_config)
+                st.session_state.system_config.solar_panels = chosen.solar_panels
+                st.session_state.system_config.battery = chosen.battery
+                st.session_state.system_config.inverter = chosen.inverter
+                st.success(t('optimizer_applied'))
+                st.rerun()
@@ -0,0 +1,459 @@
+"""
+Technician Calculator Page
+Wire sizing, voltage drop, battery runtime and string calculators
+"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from translations import t
+
+
+def render():
+    """Render the technician calculator page"""
+    st.title(t('tech_calc'))
+    st.markdown(f"<p style='font-size: 1.1rem; color: #666; margin-bottom: 1rem;'>{t('tech_subtitle')}</p>", unsafe_allow_html=True)
+    
+    # Quick Reference Cards
+    st.markdown("### 📋 Quick Reference")
+    ref_col1, ref_col2, ref_col3, ref_col4 = st.columns(4)
+    
+    with ref_col1:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1rem; border-radius: 10px; color: white; text-align: center;'>
+            <div style='font-size: 0.8rem; opacity: 0.9;'>Common Voltages</div>
+            <div style='font-size: 1.2rem; font-weight: bold; margin: 0.5rem 0;'>12V / 24V / 48V</div>
+            <div style='font-size: 0.75rem; opacity: 0.8;'>DC Systems</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with ref_col2:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 1rem; border-radius: 10px; color: white; text-align: center;'>
+            <div style='font-size: 0.8rem; opacity: 0.9;'>Max Voltage Drop</div>
+            <div style='font-size: 1.2rem; font-weight: bold; margin: 0.5rem 0;'>3% - 5%</div>
+            <div style='font-size: 0.75rem; opacity: 0.8;'>Acceptable Range</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with ref_col3:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 1rem; border-radius: 10px; color: white; text-align: center;'>
+            <div style='font-size: 0.8rem; opacity: 0.9;'>Battery DoD</div>
+            <div style='font-size: 1.2rem; font-weight: bold; margin: 0.5rem 0;'>50% - 80%</div>
+            <div style='font-size: 0.75rem; opacity: 0.8;'>Recommended</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with ref_col4:
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); padding: 1rem; border-radius: 10px; color: white; text-align: center;'>
+            <div style='font-size: 0.8rem; opacity: 0.9;'>Panel Voltage</div>
+            <div style='font-size: 1.2rem; font-weight: bold; margin: 0.5rem 0;'>18V - 36V</div>
+            <div style='font-size: 0.75rem; opacity: 0.8;'>Typical Vmp</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("<div style='margin: 1.5rem 0;'></div>", unsafe_allow_html=True)
+    
+    # Create tabs for different calculators
+    calc_tabs = st.tabs([
+        "☀️ Solar System",
+        "🔋 Battery & Runtime",
+        "📏 Wire Sizing",
+        "⚡ Quick Calculations",
+        "📊 Load Analysis"
+    ])
+    
+    # ===== TAB 1: SOLAR SYSTEM CALCULATOR =====
+    with calc_tabs[0]:
+        st.markdown("### ☀️ Solar System Calculator")
+        st.markdown("Calculate complete solar system specifications with presets.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📥 Input")
+            calc_type = st.radio("What do you want to calculate?", 
+                               ["Voltage (V)", "Current (A)", "Resistance (Ω)", "Power (W)"])
+            
+            if calc_type == "Voltage (V)":
+                current = st.number_input("Current (A)", min_value=0.0, value=10.0, step=0.1)
+                resistance = st.number_input("Resistance (Ω)", min_value=0.0, value=12.0, step=0.1)
+                if st.button(t('calculate'), key="ohm_v"):
+                    voltage = current * resistance
+                    power = voltage * current
+                    st.session_state.ohm_result = {
+                        'voltage': voltage,
+                        'current': current,
+                        'resistance': resistance,
+                        'power': power
+                    }
+            
+            elif calc_type == "Current (A)":
+                voltage = st.number_input("Voltage (V)", min_value=0.0, value=12.0, step=0.1)
+                resistance = st.number_input("Resistance (Ω)", min_value=0.01, value=1.2, step=0.1)
+                if st.button(t('calculate'), key="ohm_i"):
+                    current = voltage / resistance
+                    power = voltage * current
+                    st.session_state.ohm_result = {
+                        'voltage': voltage,
+                        'current': current,
+                        'resistance': resistance,
+                        'power': power
+                    }
+            
+            elif calc_type == "Resistance (Ω)":
+                voltage = st.number_input("Voltage (V)", min_value=0.0, value=12.0, step=0.1)
+                current = st.number_input("Current (A)", min_value=0.01, value=10.0, step=0.1)
+                if st.button(t('calculate'), key="ohm_r"):
+                    resistance = voltage / current
+                    power = voltage * current
+                    st.session_state.ohm_result = {
+                        'voltage': voltage,
+                        'current': current,
+                        'resistance': resistance,
+                        'power': power
+                    }
+            
+            else:  # Power
+                voltage = st.number_input("Voltage (V)", min_value=0.0, value=12.0, step=0.1)
+                current = st.number_input("Current (A)", min_value=0.0, value=10.0, step=0.1)
+                if st.button(t('calculate'), key="ohm_p"):
+                    power = voltage * current
+                    resistance = voltage / current if current > 0 else 0
+                    st.session_state.ohm_result = {
+                        'voltage': voltage,
+                        'current': current,
+                        'resistance': resistance,
+                        'power': power
+                    }
+        
+        with col2:
+            st.markdown("#### 📊 Results")
+            if 'ohm_result' in st.session_state:
+                result = st.session_state.ohm_result
+                st.success(f"**Voltage:** {result['voltage']:.2f} V")
+                st.info(f"**Current:** {result['current']:.2f} A")
+                st.warning(f"**Resistance:** {result['resistance']:.2f} Ω")
+                st.error(f"**Power:** {result['power']:.2f} W ({result['power']/1000:.2f} kW)")
+                
+                st.markdown("---")
+                st.markdown("**📐 Formulas Used:**")
+                st.code("V = I × R\nI = V / R\nR = V / I\nP = V × I")
+    
+    # ===== TAB 2: POWER CALCULATOR =====
+    with calc_tabs[1]:
+        st.markdown("### 💡 Power Calculator")
+        st.markdown("Calculate power consumption and energy costs.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📥 Device Information")
+            device_power = st.number_input("Device Power (W)", min_value=0.0, value=1000.0, step=10.0)
+            device_voltage = st.number_input("Operating Voltage (V)", min_value=0.0, value=220.0, step=1.0)
+            usage_hours = st.number_input("Daily Usage (hours)", min_value=0.0, value=8.0, step=0.5)
+            num_devices = st.number_input("Number of Devices", min_value=1, value=1, step=1)
+            electricity_rate = st.number_input("Electricity Rate ($/kWh)", min_value=0.0, value=0.20, step=0.01)
+            
+            if st.button(t('calculate'), key="power_calc"):
+                current_draw = device_power / device_voltage
+                daily_kwh = (device_power * usage_hours * num_devices) / 1000
+                monthly_kwh = daily_kwh * 30
+                yearly_kwh = daily_kwh * 365
+                daily_cost = daily_kwh * electricity_rate
+                monthly_cost = monthly_kwh * electricity_rate
+                yearly_cost = yearly_kwh * electricity_rate
+                
+                st.session_state.power_result = {
+                    'current': current_draw,
+                    'daily_kwh': daily_kwh,
+                    'monthly_kwh': monthly_kwh,
+                    'yearly_kwh': yearly_kwh,
+                    'daily_cost': daily_cost,
+                    'monthly_cost': monthly_cost,
+                    'yearly_cost': yearly_cost
+                }
+        
+        with col2:
+            st.markdown("#### 📊 Results")
+            if 'power_result' in st.session_state:
+                result = st.session_state.power_result
+                st.success(f"**Current Draw:** {result['current']:.2f} A")
+                st.markdown("---")
+                st.info(f"**Daily Energy:** {result['daily_kwh']:.2f} kWh (${result['daily_cost']:.2f})")
+                st.info(f"**Monthly Energy:** {result['monthly_kwh']:.2f} kWh (${result['monthly_cost']:.2f})")
+                st.info(f"**Yearly Energy:** {result['yearly_kwh']:.2f} kWh (${result['yearly_cost']:.2f})")
+                
+                st.markdown("---")
+                st.warning(f"💰 **Annual Cost:** ${result['yearly_cost']:.2f}")
+    
+    # ===== TAB 3: WIRE SIZING CALCULATOR =====
+    with calc_tabs[2]:
+        st.markdown("### 📏 Wire Sizing Calculator")
+        st.markdown("Calculate proper wire gauge for your installation.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📥 Circuit Information")
+            circuit_current = st.number_input("Circuit Current (A)", min_value=0.0, value=20.0, step=1.0)
+            wire_length = st.number_input("One-Way Wire Length (m)", min_value=0.0, value=10.0, step=0.5)
+            system_voltage = st.number_input("System Voltage (V)", min_value=0.0, value=12.0, step=1.0, 
+                                           help="Common: 12V, 24V, 48V for DC systems")
+            max_voltage_drop = st.number_input("Max Voltage Drop (%)", min_value=0.0, max_value=10.0, value=3.0, step=0.5)
+            
+            # Wire gauge reference table
+            wire_data = {
+                'AWG': [14, 12, 10, 8, 6, 4, 2, 1, 0, 00, 000, 0000],
+                'mm²': [2.08, 3.31, 5.26, 8.37, 13.3, 21.2, 33.6, 42.4, 53.5, 67.4, 85.0, 107],
+                'Max A': [15, 20, 30, 40, 55, 70, 95, 110, 125, 145, 165, 195],
+                'Ω/km': [8.28, 5.21, 3.28, 2.06, 1.30, 0.815, 0.513, 0.407, 0.323, 0.256, 0.203, 0.161]
+            }
+            
+            if st.button(t('calculate'), key="wire_calc"):
+                # Calculate voltage drop for each wire size
+                max_drop_voltage = system_voltage * (max_voltage_drop / 100)
+                
+                recommended_wire = None
+                for i, awg in enumerate(wire_data['AWG']):
+                    resistance_ohm = (wire_data['Ω/km'][i] / 1000) * wire_length * 2  # Round trip
+                    voltage_drop = circuit_current * resistance_ohm
+                    drop_percent = (voltage_drop / system_voltage) * 100
+                    
+                    if voltage_drop <= max_drop_voltage and wire_data['Max A'][i] >= circuit_current:
+                        recommended_wire = {
+                            'awg': awg,
+                            'mm2': wire_data['mm²'][i],
+                            'max_current': wire_data['Max A'][i],
+                            'voltage_drop': voltage_drop,
+                            'drop_percent': drop_percent
+                        }
+                        break
+                
+                st.session_state.wire_result = recommended_wire
+        
+        with col2:
+            st.markdown("#### 📊 Recommendation")
+            if 'wire_result' in st.session_state and st.session_state.wire_result:
+                result = st.session_state.wire_result
+                st.success(f"✅ **Recommended Wire Size**")
+                st.markdown(f"### AWG {result['awg']} ({result['mm2']:.1f} mm²)")
+                st.info(f"**Max Current Rating:** {result['max_current']} A")
+                st.warning(f"**Voltage Drop:** {result['voltage_drop']:.2f} V ({result['drop_percent']:.2f}%)")
+                
+                st.markdown("---")
+                st.markdown("**📋 Wire Gauge Reference:**")
+                df = pd.DataFrame(wire_data)
+                st.dataframe(df, use_container_width=True)
+            elif 'wire_result' in st.session_state:
+                st.error("❌ No suitable wire found! Increase wire size or reduce length/current.")
+    
+    # ===== TAB 4: VOLTAGE DROP CALCULATOR =====
+    with calc_tabs[3]:
+        st.markdown("### 📉 Voltage Drop Calculator")
+        st.markdown("Calculate voltage drop in your wire run.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📥 Wire Specifications")
+            wire_awg = st.selectbox("Wire Gauge (AWG)", [14, 12, 10, 8, 6, 4, 2, 1, 0, "00", "000", "0000"])
+            wire_length_vd = st.number_input("One-Way Length (m)", min_value=0.0, value=10.0, step=0.5, key="vd_length")
+            current_vd = st.number_input("Current (A)", min_value=0.0, value=20.0, step=1.0, key="vd_current")
+            voltage_vd = st.number_input("System Voltage (V)", min_value=0.0, value=12.0, step=1.0, key="vd_voltage")
+            
+            # Resistance per km for different AWG
+            resistance_map = {
+                14: 8.28, 12: 5.21, 10: 3.28, 8: 2.06, 6: 1.30, 
+                4: 0.815, 2: 0.513, 1: 0.407, 0: 0.323, 
+                "00": 0.256, "000": 0.203, "0000": 0.161
+            }
+            
+            if st.button(t('calculate'), key="vd_calc"):
+                resistance_per_km = resistance_map[wire_awg]
+                total_resistance = (resistance_per_km / 1000) * wire_length_vd * 2  # Round trip
+                voltage_drop = current_vd * total_resistance
+                drop_percent = (voltage_drop / voltage_vd) * 100
+                voltage_at_load = voltage_vd - voltage_drop
+                power_loss = current_vd * voltage_drop
+                
+                st.session_state.vd_result = {
+                    'voltage_drop': voltage_drop,
+                    'drop_percent': drop_percent,
+                    'voltage_at_load': voltage_at_load,
+                    'power_loss': power_loss,
+                    'resistance': total_resistance
+                }
+        
+        with col2:
+            st.markdown("#### 📊 Results")
+            if 'vd_result' in st.session_state:
+                result = st.session_state.vd_result
+                
+                # Color code based on voltage drop percentage
+                if result['drop_percent'] <= 3:
+                    status = "✅ Excellent"
+                    color = "green"
+                elif result['drop_percent'] <= 5:
+                    status = "⚠️ Acceptable"
+                    color = "orange"
+                else:
+                    status = "❌ Too High"
+                    color = "red"
+                
+                st.markdown(f"**Status:** :{color}[{status}]")
+                st.success(f"**Voltage Drop:** {result['voltage_drop']:.2f} V ({result['drop_percent']:.2f}%)")
+                st.info(f"**Voltage at Load:** {result['voltage_at_load']:.2f} V")
+                st.warning(f"**Power Loss:** {result['power_loss']:.2f} W")
+                st.error(f"**Wire Resistance:** {result['resistance']:.4f} Ω")
+                
+                st.markdown("---")
+                st.markdown("**📐 Guidelines:**")
+                st.markdown("- ✅ < 3%: Excellent")
+                st.markdown("- ⚠️ 3-5%: Acceptable")
+                st.markdown("- ❌ > 5%: Use larger wire")
+    
+    # ===== TAB 5: BATTERY CALCULATOR =====
+    with calc_tabs[4]:
+        st.markdown("### 🔋 Battery Calculator")
+        st.markdown("Calculate battery capacity and runtime.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📥 Battery & Load Information")
+            calc_mode = st.radio("Calculate:", ["Runtime", "Required Capacity"])
+            
+            if calc_mode == "Runtime":
+                battery_voltage = st.number_input("Battery Voltage (V)", min_value=0.0, value=12.0, step=1.0, key="bat_v")
+                battery_ah = st.number_input("Battery Capacity (Ah)", min_value=0.0, value=100.0, step=10.0)
+                load_watts = st.number_input("Load Power (W)", min_value=0.0, value=120.0, step=10.0)
+                dod_percent = st.number_input("Depth of Discharge (%)", min_value=0.0, max_value=100.0, value=80.0, step=5.0)
+                efficiency = st.number_input("System Efficiency (%)", min_value=0.0, max_value=100.0, value=85.0, step=5.0)
+                
+                if st.button(t('calculate'), key="bat_runtime"):
+                    usable_capacity_ah = battery_ah * (dod_percent / 100)
+                    usable_capacity_wh = battery_voltage * usable_capacity_ah
+                    actual_usable_wh = usable_capacity_wh * (efficiency / 100)
+                    runtime_hours = actual_usable_wh / load_watts if load_watts > 0 else 0
+                    
+                    st.session_state.bat_result = {
+                        'mode': 'runtime',
+                        'runtime': runtime_hours,
+                        'usable_wh': actual_usable_wh,
+                        'usable_ah': usable_capacity_ah
+                    }
+            
+            else:  # Required Capacity
+                battery_voltage_req = st.number_input("Battery Voltage (V)", min_value=0.0, value=12.0, step=1.0, key="bat_v_req")
+                load_watts_req = st.number_input("Load Power (W)", min_value=0.0, value=120.0, step=10.0, key="load_req")
+                runtime_hours_req = st.number_input("Desired Runtime (hours)", min_value=0.0, value=8.0, step=0.5)
+                dod_percent_req = st.number_input("Depth of Discharge (%)", min_value=0.0, max_value=100.0, value=80.0, step=5.0, key="dod_req")
+                efficiency_req = st.number_input("System Efficiency (%)", min_value=0.0, max_value=100.0, value=85.0, step=5.0, key="eff_req")
+                
+                if st.button(t('calculate'), key="bat_capacity"):
+                    required_wh = load_watts_req * runtime_hours_req
+                    required_wh_with_eff = required_wh / (efficiency_req / 100)
+                    required_wh_with_dod = required_wh_with_eff / (dod_percent_req / 100)
+                    required_ah = required_wh_with_dod / battery_voltage_req
+                    
+                    st.session_state.bat_result = {
+                        'mode': 'capacity',
+                        'required_ah': required_ah,
+                        'required_wh': required_wh_with_dod,
+                        'energy_needed': required_wh
+                    }
+        
+        with col2:
+            st.markdown("#### 📊 Results")
+            if 'bat_result' in st.session_state:
+                result = st.session_state.bat_result
+                
+                if result['mode'] == 'runtime':
+                    hours = int(result['runtime'])
+                    minutes = int((result['runtime'] - hours) * 60)
+                    st.success(f"**Runtime:** {hours}h {minutes}m ({result['runtime']:.2f} hours)")
+                    st.info(f"**Usable Energy:** {result['usable_wh']:.2f} Wh ({result['usable_wh']/1000:.2f} kWh)")
+                    st.warning(f"**Usable Capacity:** {result['usable_ah']:.2f} Ah")
+                else:
+                    st.success(f"**Required Capacity:** {result['required_ah']:.2f} Ah")
+                    st.info(f"**Total Energy Storage:** {result['required_wh']:.2f} Wh ({result['required_wh']/1000:.2f} kWh)")
+                    st.warning(f"**Energy Needed:** {result['energy_needed']:.2f} Wh")
+                    
+                    # Suggest standard battery sizes
+                    st.markdown("---")
+                    st.markdown("**💡 Standard Battery Sizes:**")
+                    standard_sizes = [50, 100, 150, 200, 250, 300]
+                    for size in standard_sizes:
+                        if size >= result['required_ah']:
+                            st.markdown(f"- ✅ **{size} Ah** (Recommended)")
+                            break
+                        else:
+                            st.markdown(f"- ❌ {size} Ah (Too small)")
+    
+    # ===== TAB 6: SOLAR ARRAY CALCULATOR =====
+    with calc_tabs[5]:
+        st.markdown("### ☀️ Solar Array Calculator")
+        st.markdown("Calculate series/parallel configuration for solar panels.")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📥 System Requirements")
+            target_voltage = st.number_input("Target System Voltage (V)", min_value=0.0, value=48.0, step=1.0)
+            target_power = st.number_input("Target Power (W)", min_value=0.0, value=3000.0, step=100.0)
+            
+            st.markdown("#### 📥 Panel Specifications")
+            panel_voltage = st.number_input("Panel Voltage (Vmp)", min_value=0.0, value=18.0, step=0.1)
+            panel_current = st.number_input("Panel Current (Imp)", min_value=0.0, value=9.0, step=0.1)
+            panel_power = st.number_input("Panel Power (W)", min_value=0.0, value=160.0, step=10.0)
+            
+            if st.button(t('calculate'), key="solar_calc"):
+                # Calculate series and parallel configuration
+                panels_in_series = int(np.ceil(target_voltage / panel_voltage))
+                string_voltage = panels_in_series * panel_voltage
+                string_power = panels_in_series * panel_power
+                
+                num_strings = int(np.ceil(target_power / string_power))
+                total_panels = panels_in_series * num_strings
+                total_power = total_panels * panel_power
+                total_current = num_strings * panel_current
+                
+                st.session_state.solar_result = {
+                    'panels_series': panels_in_series,
+                    'num_strings': num_strings,
+                    'total_panels': total_panels,
+                    'string_voltage': string_voltage,
+                    'total_power': total_power,
+                    'total_current': total_current
+                }
+        
+        with col2:
+            st.markdown("#### 📊 Configuration")
+            if 'solar_result' in st.session_state:
+                result = st.session_state.solar_result
+                
+                st.success(f"**Configuration:** {result['panels_series']}S × {result['num_strings']}P")
+                st.info(f"**Total Panels:** {result['total_panels']} panels")
+                st.warning(f"**Total Power:** {result['total_power']} W ({result['total_power']/1000:.2f} kW)")
+                st.error(f"**System Voltage:** {result['string_voltage']:.1f} V")
+                st.info(f"**Total Current:** {result['total_current']:.1f} A")
+                
+                st.markdown("---")
+                st.markdown("**📐 Configuration Diagram:**")
+                st.code(f"""
+String 1: [{result['panels_series']} panels in series]
+String 2: [{result['panels_series']} panels in series]
+...
+String {result['num_strings']}: [{result['panels_series']} panels in series]
+
+All strings connected in parallel
+                """)
+                
+                st.markdown("---")
+                st.markdown("**🔌 Connection Details:**")
+                st.markdown(f"- Each string: {result['panels_series']} panels × {panel_voltage}V = {result['string_voltage']:.1f}V")
+                st.markdown(f"- Parallel strings: {result['num_strings']} × {panel_current}A = {result['total_current']:.1f}A")
+                st.markdown(f"- Total power: {result['total_panels']} × {panel_power}W = {result['total_power']}W")
@@ -0,0 +1,425 @@
+"""
+Benchmark Suite
+Speed of the simulation, product catalog, charts, report exports and desktop database
+
+    python benchmarks.py                 run all benchmarks and compare with the baseline
+    python benchmarks.py --save          run and store the results as the new baseline
+    python benchmarks.py -k export       run benchmarks whose name contains "export"
+
+Each benchmark is timed over several repeats after a warm-up call and
+reported by its median. The run fails (exit code 1) if any benchmark is
+slower than its baseline by more than --tolerance (default 30%). Baselines
+are machine-specific: regenerate benchmark_baseline.json with --save on the
+machine that runs the pre-deploy check.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(ROOT, "benchmark_baseline.json")
+DEFAULT_TOLERANCE = 0.30
+DATABASE_SIZES = (10_000, 100_000)
+
+# name -> (setup() returning the callable to time, repeats)
+BENCHMARKS: Dict[str, Tuple[Callable[[], Callable[[], object]], int]] = {}
+_temp_dirs: List[str] = []
+
+
+def _temp_dir() -> str:
+    path = tempfile.mkdtemp(prefix="khsolar_bench_")
+    _temp_dirs.append(path)
+    return path
+
+
+def benchmark(name: str, repeats: int = 20):
+    """Register setup as benchmark name; setup returns the zero-argument callable to time"""
+    def register(setup):
+        BENCHMARKS[name] = (setup, repeats)
+        return setup
+    return register
+
+
+def _sample_devices():
+    from models import Device
+    return [
+        Device("LED Lights", 100, 6, preferred_hours=[18, 19, 20, 21, 22, 23]),
+        Device("Refrigerator", 150, 24, is_priority=True, device_type="cooling", has_inverter=True),
+        Device("Air Conditioner", 1200, 8, device_type="cooling", has_inverter=True),
+        Device("Water Pump", 750, 1, preferred_hours=[7]),
+        Device("TV", 120, 5),
+        Device("Washing Machine", 500, 1),
+        Device("Rice Cooker", 700, 1, preferred_hours=[6, 17]),
+        Device("Fan", 60, 10),
+    ]
+
+
+def _sample_design():
+    """Simulation results, devices, financial analysis and report config for one typical system"""
+    from calculations import SolarCalculator
+    from models import Battery, Inverter, SolarPanel, SystemConfiguration
+    config = SystemConfiguration(
+        solar_panels=SolarPanel("LONGi 550W", 550, cost_per_panel=95.0, quantity=10),
+        battery=Battery("LVtopsun 51.2V 100Ah", 5.12, 51.2, cost=800.0, quantity=2),
+        inverter=Inverter("Deye 8kW Hybrid", 8.0, cost=1200.0),
+    )
+    devices = _sample_devices()
+    calc = SolarCalculator(config)
+    results = calc.simulate_24_hours_frame(5.5, 10.24, devices)
+    financial = calc.calculate_financial_analysis(config.total_system_cost, float(results.pv_generation_kw.sum()) * 365)
+    report_config = {
+        "customer_name": "Benchmark Customer", "customer_company": "", "customer_phone": "012345678",
+        "customer_telegram": "", "customer_email": "", "customer_address": "Phnom Penh",
+        "location": config.location, "pv_capacity": config.solar_panels.total_power_kw,
+        "battery_capacity": config.battery.total_capacity_kwh, "inverter_power": config.inverter.power_kw,
+        "labor_cost": config.labor_cost, "support_material_cost": config.support_material_cost,
+        "equipment_cost": config.solar_panels.cost_per_panel * config.solar_panels.quantity
+                          + config.battery.total_cost + config.inverter.cost,
+    }
+    return results, devices, financial, report_config
+
+
+# ==================== SIMULATION ====================
+
+@benchmark("simulate_24_hours", repeats=200)
+def _simulate_24_hours():
+    from calculations import SolarCalculator
+    from models import SystemConfiguration
+    calc, devices = SolarCalculator(SystemConfiguration()), _sample_devices()
+    return lambda: calc.simulate_24_hours(5.5, 10.24, devices)
+
+
+@benchmark("simulate_year", repeats=20)
+def _simulate_year():
+    from calculations import SolarCalculator
+    from models import SystemConfiguration
+    calc, devices = SolarCalculator(SystemConfiguration()), _sample_devices()
+    return lambda: calc.simulate_year(5.5, 10.24, devices)
+
+
+@benchmark("simulate_monte_carlo", repeats=5)
+def _simulate_monte_carlo():
+    """5,000 scenarios, the Simulation page default"""
+    from calculations import SolarCalculator
+    from models import SystemConfiguration
+    calc, devices = SolarCalculator(SystemConfiguration()), _sample_devices()
+    return lambda: calc.simulate_monte_carlo(4.0, 5.0, devices, scenarios=5000)
+
+
+# ==================== PRODUCT CATALOG ====================
+
+@benchmark("product_catalog_parse", repeats=20)
+def _product_catalog_parse():
+    from product_manager import CatalogWatcher, PRICES_FILE
+
+    def parse():
+        watcher = CatalogWatcher(os.path.join(ROOT, PRICES_FILE))
+        with contextlib.redirect_stdout(io.StringIO()):  # One "Loaded N products" line per parse
+            watcher.check()
+        return watcher.catalog
+    return parse
+
+
+@benchmark("product_manager_load", repeats=200)
+def _product_manager_load():
+    from product_manager import ProductManager
+    return lambda: ProductManager().get_products_by_category("battery")
+
+
+@benchmark("product_recommendations", repeats=200)
+def _product_recommendations():
+    from product_manager import ProductManager
+    pm = ProductManager()
+
+    def recommend():
+        for size in (300, 450, 550, 700):
+            pm.get_recommended_panel(size)
+        for kwh in (2.4, 5.0, 10.24, 20.0):
+            pm.get_recommended_battery(kwh)
+        for kw in (3.0, 5.0, 8.0, 12.0):
+            pm.get_recommended_inverter(kw)
+    return recommend
+
+
+@benchmark("product_search", repeats=200)
+def _product_search():
+    from product_manager import ProductManager
+    pm = ProductManager()
+    return lambda: [pm.search(q) for q in ("sg33xc", "51.2v100ah", "category:pv_panel power>=550")]
+
+
+# ==================== CHARTS ====================
+
+@benchmark("chart_24h_energy_flow", repeats=20)
+def _chart_24h_energy_flow():
+    from visualization import SolarVisualizer
+    results = _sample_design()[0]
+    viz = SolarVisualizer()
+    return lambda: viz.create_24h_energy_flow_chart(results)
+
+
+@benchmark("chart_24h_energy_flow_uncached", repeats=20)
+def _chart_24h_energy_flow_uncached():
+    from visualization import FIGURE_CACHE, SolarVisualizer
+    results = _sample_design()[0]
+    viz = SolarVisualizer()
+
+    def build():
+        FIGURE_CACHE.clear()
+        return viz.create_24h_energy_flow_chart(results)
+    return build
+
+
+@benchmark("chart_annual_energy_uncached", repeats=5)
+def _chart_annual_energy_uncached():
+    from calculations import SolarCalculator
+    from models import SystemConfiguration
+    from visualization import FIGURE_CACHE, SolarVisualizer
+    annual = SolarCalculator(SystemConfiguration()).simulate_year(5.5, 10.24, _sample_devices())
+    viz = SolarVisualizer()
+
+    def build():
+        FIGURE_CACHE.clear()
+        return viz.create_annual_energy_chart(annual)
+    return build
+
+
+@benchmark("chart_energy_balance_pie", repeats=20)
+def _chart_energy_balance_pie():
+    from visualization import SolarVisualizer
+    results = _sample_design()[0]
+    viz = SolarVisualizer()
+    return lambda: viz.create_energy_balance_pie(results)
+
+
+@benchmark("chart_financial", repeats=20)
+def _chart_financial():
+    from visualization import SolarVisualizer
+    viz = SolarVisualizer()
+    return lambda: viz.create_financial_chart(25, 960.0, 5200.0)
+
+
+@benchmark("chart_render_png_uncached", repeats=5)
+def _chart_render_png_uncached():
+    import chart_renderer
+    from visualization import SolarVisualizer
+    fig = SolarVisualizer().create_24h_energy_flow_chart(_sample_design()[0])
+
+    def render():
+        chart_renderer.CHART_CACHE_DIR = Path(_temp_dir())
+        return chart_renderer.render(fig)
+    return render
+
+
+# ==================== EXPORTS ====================
+
+def _export_setup(method: str, with_config: bool, **options):
+    import chart_renderer
+    from export_utils import ReportExporter
+    chart_renderer.CHART_CACHE_DIR = Path(_temp_dir())
+    results, devices, financial, report_config = _sample_design()
+    exporter = ReportExporter()
+    export = getattr(exporter, method)
+    # Built in memory, as the app's downloads are
+    if with_config:
+        return lambda: export(results, devices, financial, report_config, **options)
+    return lambda: export(results, devices, financial, **options)
+
+
+@benchmark("export_pdf", repeats=10)
+def _export_pdf():
+    return _export_setup("generate_pdf_report", with_config=True)
+
+
+@benchmark("export_pdf_charts", repeats=10)
+def _export_pdf_charts():
+    """With the report charts, which the warm-up call renders into the chart cache"""
+    return _export_setup("generate_pdf_report", with_config=True, include_charts=True)
+
+
+@benchmark("export_word", repeats=10)
+def _export_word():
+    return _export_setup("generate_word_report", with_config=True)
+
+
+@benchmark("export_word_charts", repeats=10)
+def _export_word_charts():
+    return _export_setup("generate_word_report", with_config=True, include_charts=True)
+
+
+@benchmark("export_excel", repeats=10)
+def _export_excel():
+    return _export_setup("export_to_excel", with_config=False)
+
+
+# ==================== DESKTOP DATABASE ====================
+
+def _seeded_database(rows: int):
+    """DatabaseManager over a fresh database with rows products, customers and sales"""
+    sys.path.insert(0, os.path.join(ROOT, "khsolar_desktop"))
+    from database.db_manager import DatabaseManager
+    db = DatabaseManager(_temp_dir())
+    categories = ("pv_panel", "battery", "inverter", "accessory")
+    conn = db.get_connection()
+    conn.executemany(
+        "INSERT INTO products (product_code, product_name, category, wholesale_price, retail_price, stock_quantity) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ((f"P{i:06d}", f"Product {i}", categories[i % 4], 10.0 + i % 500, 13.0 + i % 500, i % 50)
+         for i in range(rows)))
+    conn.executemany(
+        "INSERT INTO customers (customer_code, name, customer_type, phone) VALUES (?, ?, ?, ?)",
+        ((f"CUS-{i:06d}", f"Customer {i}", ("Individual", "Business", "VIP")[i % 3], f"0{i:08d}")
+         for i in range(rows)))
+    conn.executemany(
+        "INSERT INTO sales (invoice_number, customer_name, sale_date, total_amount) "
+        "VALUES (?, ?, DATE('now', ?), ?)",
+        ((f"INV-{i:06d}", f"Customer {i}", f"-{i % 365} days", 100.0 + i % 9000) for i in range(rows)))
+    conn.executemany(
+        "INSERT INTO sale_items (sale_id, product_name, quantity, unit_price, subtotal) VALUES (?, ?, ?, ?, ?)",
+        ((i + 1, f"Product {i}", 1 + i % 4, 95.0, 95.0 * (1 + i % 4)) for i in range(rows)))
+    conn.commit()
+    conn.close()
+    return db
+
+
+for _rows in DATABASE_SIZES:
+    _label = f"{_rows // 1000}k"
+
+    @benchmark(f"db_get_all_products_{_label}", repeats=5)
+    def _db_all_products(rows=_rows):
+        db = _seeded_database(rows)
+        return db.get_all_products
+
+    @benchmark(f"db_product_by_code_{_label}", repeats=5)
+    def _db_product_by_code(rows=_rows):
+        db = _seeded_database(rows)
+        codes = [f"P{i:06d}" for i in range(0, rows, rows // 100)]
+        return lambda: [db.get_product_by_code(code) for code in codes]
+
+    @benchmark(f"db_get_all_customers_{_label}", repeats=5)
+    def _db_all_customers(rows=_rows):
+        return _seeded_database(rows).get_all_customers
+
+    @benchmark(f"db_get_all_sales_{_label}", repeats=5)
+    def _db_all_sales(rows=_rows):
+        return _seeded_database(rows).get_all_sales
+
+    @benchmark(f"db_sale_details_{_label}", repeats=5)
+    def _db_sale_details(rows=_rows):
+        db = _seeded_database(rows)
+        sale_ids = list(range(1, rows + 1, rows // 100))
+        return lambda: [db.get_sale_details(sale_id) for sale_id in sale_ids]
+
+
+# ==================== RUNNER ====================
+
+def time_benchmark(name: str) -> Optional[Dict[str, float]]:
+    """Median/min/max milliseconds of a benchmark, or None if its dependencies are missing"""
+    setup, repeats = BENCHMARKS[name]
+    try:
+        func = setup()
+    except ImportError as e:
+        print(f"  {name:<32} unavailable ({e})")
+        return None
+    func()  # Warm-up: imports, caches, first-call allocations
+    samples: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples), "max_ms": max(samples),
+            "repeats": repeats}
+
+
+def load_baseline(path: str = BASELINE_FILE) -> Dict[str, dict]:
+    """Stored results by benchmark name (empty if there is no baseline yet)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["results"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results: Dict[str, dict], path: str = BASELINE_FILE):
+    """Store results with the machine they were measured on"""
+    data = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "processor": platform.processor() or platform.machine()},
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Names of benchmarks whose median is more than tolerance slower than the baseline"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base and result["median_ms"] > base["median_ms"] * (1 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run benchmarks, print a comparison with the baseline, return the exit code"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="keyword", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown before a benchmark counts as a regression (0.30 = 30%%)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    baseline = load_baseline(args.baseline)
+    names = [name for name in BENCHMARKS if args.keyword in name]
+    print(f"Running {len(names)} benchmarks (median of repeats, ms)")
+    print(f"  {'benchmark':<32}{'median':>12}{'baseline':>12}{'change':>10}")
+
+    results: Dict[str, dict] = {}
+    for name in names:
+        result = time_benchmark(name)
+        if result is None:
+            continue
+        results[name] = result
+        base = baseline.get(name)
+        if base:
+            change = result["median_ms"] / base["median_ms"] - 1
+            flag = "  ⚠️" if change > args.tolerance else ""
+            print(f"  {name:<32}{result['median_ms']:>12.2f}{base['median_ms']:>12.2f}{change:>+10.0%}{flag}")
+        else:
+            print(f"  {name:<32}{result['median_ms']:>12.2f}{'-':>12}{'new':>10}")
+
+    for path in _temp_dirs:
+        shutil.rmtree(path, ignore_errors=True)
+
+    if args.save:
+        merged = dict(baseline, **results)
+        save_baseline(merged, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print("\n✅ No regressions" if baseline else "\nNo baseline yet: run with --save to create one")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,127 @@
 Solar System Calculation Modules
 """
 import numpy as np
-from typing import List, Tuple
-from models import Device, SystemConfiguration, SimulationResult, FinancialAnalysis
+from typing import List, Optional, Sequence, Tuple
+from models import (
+    Device, SystemConfiguration, SimulationResult, SimulationFrame,
+    AnnualSimulation, BatchSimulation, MonteCarloResult, FinancialAnalysis
+)
+from load_profiles import DEFAULT_LOAD_SEED, load_matrix
+from startup_timing import profiled
+
+BATTERY_EFFICIENCY = 0.95
+BATTERY_C_RATE = 0.5  # Max charge/discharge per hour as a fraction of capacity
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Normalized sine curve from 6am to 6pm, peaking at solar noon
+_HOURS = np.arange(24)
+_SUN_CURVE = np.where((_HOURS >= 6) & (_HOURS < 18), np.sin((_HOURS - 6) / 12 * np.pi), 0.0)
+
+
+
+def _battery_steps(net_energy: np.ndarray, battery_capacity_kwh) -> np.ndarray:
+    """Energy the battery would gain/lose each hour if it were never full or empty"""
+    max_rate = battery_capacity_kwh * BATTERY_C_RATE
+    surplus_in = np.minimum(np.maximum(net_energy, 0.0), max_rate)
+    deficit_out = np.minimum(np.maximum(-net_energy, 0.0), max_rate)
+    return surplus_in * BATTERY_EFFICIENCY - deficit_out / BATTERY_EFFICIENCY
+
+
+def _flows_from_storage(net_energy: np.ndarray, stored: np.ndarray, battery_capacity_kwh,
+                        grid_available: bool) -> Tuple[np.ndarray, ...]:
+    """
+    Derive hourly flows from the stored-energy trajectory
+    
+    stored has one more entry along the last axis than net_energy (the
+    initial level). Works for a single run or a (candidates x hours) batch.
+    
+    Returns (charge, discharge, soc, grid_import, grid_export, surplus, unmet) arrays
+    """
+    change = stored[..., 1:] - stored[..., :-1]
+    charge = np.maximum(change, 0.0) / BATTERY_EFFICIENCY
+    discharge = np.maximum(-change, 0.0) * BATTERY_EFFICIENCY
+    
+    remaining_surplus = np.maximum(net_energy - charge, 0.0)
+    remaining_deficit = np.maximum(-net_energy - discharge, 0.0)
+    no_flow = np.zeros(remaining_surplus.shape)
+    if grid_available:
+        grid_import, grid_export = remaining_deficit, remaining_surplus
+        surplus, unmet = no_flow, no_flow.copy()
+    else:
+        grid_import, grid_export = no_flow, no_flow.copy()
+        surplus, unmet = remaining_surplus, remaining_deficit
+    
+    # Stored energy is already clamped to [0, capacity] by the recurrence
+    soc = np.divide(stored[..., 1:] * 100, battery_capacity_kwh,
+                    out=np.zeros(remaining_surplus.shape),
+                    where=np.asarray(battery_capacity_kwh) > 0)
+    
+    return charge, discharge, soc, grid_import, grid_export, surplus, unmet
+
+
+def _dispatch_battery(pv_gen: np.ndarray, load: np.ndarray, battery_capacity_kwh: float,
+                      initial_soc: float, grid_available: bool) -> Tuple[np.ndarray, ...]:
+    """
+    Battery state recurrence over hourly PV and load arrays
+    
+    Surplus charges the battery (then exports or is wasted), deficit
+    discharges it (then imports from grid). Each hour moves the stored
+    energy by a rate-limited amount clamped to [0, capacity]; only that
+    clamp depends on the previous hour, so it is the only part run as a
+    Python loop. All other flows are derived from it with array math.
+    
+    Returns (charge, discharge, soc, grid_import, grid_export, surplus, unmet) arrays
+    """
+    net_energy = pv_gen - load
+    step = _battery_steps(net_energy, battery_capacity_kwh)
+    
+    battery_kwh = battery_capacity_kwh * (initial_soc / 100)
+    stored = [battery_kwh]
+    for delta in step.tolist():
+        battery_kwh += delta
+        if battery_kwh < 0.0:
+            battery_kwh = 0.0
+        elif battery_kwh > battery_capacity_kwh:
+            battery_kwh = battery_capacity_kwh
+        stored.append(battery_kwh)
+    
+    return _flows_from_storage(net_energy, np.array(stored), battery_capacity_kwh, grid_available)
+
+
+def _dispatch_battery_batch(pv_gen: np.ndarray, load: np.ndarray, battery_capacity_kwh: np.ndarray,
+                            initial_soc: float, grid_available: bool) -> Tuple[np.ndarray, ...]:
+    """
+    Same recurrence as _dispatch_battery for many systems at once
+    
+    Args:
+        pv_gen: PV generation, shape (candidates, hours)
+        load: Load, shape (hours,) shared or (candidates, hours)
+        battery_capacity_kwh: Capacity per candidate, shape (candidates,)
+    
+    The loop runs over hours only; each step updates every candidate
+    with one vector operation.
+    """
+    capacity = np.asarray(battery_capacity_kwh, dtype=float)[:, None]
+    net_energy = pv_gen - load
+    # Hour-major copy so each loop step reads one contiguous row
+    step = np.ascontiguousarray(_battery_steps(net_energy, capacity).T)
+    
+    stored = np.empty((step.shape[0] + 1, step.shape[1]))
+    level = capacity[:, 0] * (initial_soc / 100)
+    stored[0] = level
+    for hour, delta in enumerate(step, start=1):
+        level = np.minimum(np.maximum(level + delta, 0.0), capacity[:, 0])
+        stored[hour] = level
+    
+    return _flows_from_storage(net_energy, stored.T, capacity, grid_available)
+
 
 class SolarCalculator:
     """Core calculation engine for solar system sizing and simulation"""
     
-    def __init__(self, config: SystemConfiguration):
+    def __init__(self, config: SystemConfiguration, seed: Optional[int] = None):
         self.config = config
+        self.seed = DEFAULT_LOAD_SEED if seed is None else seed
     
     def calculate_pv_size_needed(self, daily_load_kwh: float, sunlight_hours: float, 
                                  system_efficiency: float = 0.85) -> float:
@@ -94,6 +207,78 @@ class SolarCalculator:
         
         return max(0, pv_generation)
     
+    def pv_generation_profile(self, pv_capacity_kw: float, month: int = 6) -> np.ndarray:
+        """
+        Vectorized version of calculate_hourly_pv_generation for all 24 hours
+        
+        Returns array of PV generation (kW) indexed by hour of day
+        """
+        seasonal_factor = 1.0 + 0.2 * np.sin((month - 6) * np.pi / 6)
+        return np.maximum(pv_capacity_kw * _SUN_CURVE * seasonal_factor, 0.0)
+    
+    def hourly_load_matrix(self, devices: List[Device], days: int = 1,
+                           rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Build a device x hour load matrix (kW) covering the given number of days
+        
+        Draws are seeded with the calculator's seed, so the same devices
+        always give the same profile (see load_profiles.load_matrix).
+        
+        Returns array of shape (len(devices), 24 * days)
+        """
+        return load_matrix(devices, days, seed=self.seed, rng=rng)
+    
+    def simulate_profile(self, pv_generation_kw: np.ndarray, load_kw: np.ndarray,
+                         battery_capacity_kwh: float, initial_soc: float = 50.0) -> SimulationFrame:
+        """
+        Run the battery state recurrence over precomputed PV and load curves
+        
+        Args:
+            pv_generation_kw: PV generation per hour
+            load_kw: Load per hour (same length as pv_generation_kw)
+            battery_capacity_kwh: Total battery capacity
+            initial_soc: Starting state of charge (%)
+        
+        Returns SimulationFrame with one entry per hour
+        """
+        return self._simulate_profile(pv_generation_kw, load_kw, battery_capacity_kwh, initial_soc)[0]
+    
+    def _simulate_profile(self, pv_generation_kw: np.ndarray, load_kw: np.ndarray,
+                          battery_capacity_kwh: float, initial_soc: float) -> Tuple[SimulationFrame, np.ndarray]:
+        """simulate_profile() plus the hourly load left unmet (off-grid only)"""
+        pv_generation_kw = np.asarray(pv_generation_kw, dtype=float)
+        load_kw = np.asarray(load_kw, dtype=float)
+        charge, discharge, soc, grid_import, grid_export, surplus, unmet = _dispatch_battery(
+            pv_generation_kw, load_kw, battery_capacity_kwh, initial_soc,
+            self.config.grid_available
+        )
+        
+        frame = SimulationFrame(
+            hour=np.arange(len(pv_generation_kw)) % 24,
+            pv_generation_kw=pv_generation_kw,
+            load_kw=load_kw,
+            battery_charge_kw=charge,
+            battery_discharge_kw=discharge,
+            battery_soc=soc,
+            grid_import_kw=grid_import,
+            grid_export_kw=grid_export,
+            energy_surplus_kw=surplus
+        )
+        return frame, unmet
+    
+    @profiled()
+    def simulate_24_hours_frame(self, pv_capacity_kw: float, battery_capacity_kwh: float,
+                                devices: List[Device], initial_soc: float = 50.0) -> SimulationFrame:
+        """
+        Simulate 24 hours of energy flow with the vectorized engine
+        
+        Returns columnar SimulationFrame (use to_results() for List[SimulationResult])
+        """
+        pv_gen = self.pv_generation_profile(pv_capacity_kw)
+        load = self.hourly_load_matrix(devices).sum(axis=0)
+        return self.simulate_profile(pv_gen, load, battery_capacity_kwh, initial_soc)
+    
+    @profiled()
     def simulate_24_hours(self, pv_capacity_kw: float, battery_capacity_kwh: float,
                           devices: List[Device], initial_soc: float = 50.0) -> List[SimulationResult]:
         """
@@ -101,126 +286,154 @@ class SolarCalculator:
         
         Returns list of SimulationResult for each hour
         """
-        results = []
-        battery_soc = initial_soc  # Start at 50% SoC
-        battery_kwh = battery_capacity_kwh * (battery_soc / 100)
-        
-        battery_efficiency = 0.95
-        max_charge_rate = battery_capacity_kwh * 0.5  # C-rate of 0.5
-        max_discharge_rate = battery_capacity_kwh * 0.5
-        
-        for hour in range(24):
-            # Calculate PV generation
-            pv_gen = self.calculate_hourly_pv_generation(pv_capacity_kw, hour)
-            
-            # Calculate load for this hour
-            load = self.calculate_hourly_load(devices, hour)
-            
-            # Energy flow logic
-            battery_charge = 0.0
-            battery_discharge = 0.0
-            grid_import = 0.0
-            grid_export = 0.0
-            surplus = 0.0
-            
-            # Net energy: PV - Load
-            net_energy = pv_gen - load
-            
-            if net_energy > 0:
-                # Surplus: charge battery or export to grid
-                available_to_charge = min(net_energy, max_charge_rate)
-                space_in_battery = battery_capacity_kwh - battery_kwh
-                
-                if space_in_battery > 0:
-                    # Charge battery
-                    battery_charge = min(available_to_charge, space_in_battery / battery_efficiency)
-                    battery_kwh += battery_charge * battery_efficiency
-                    remaining_surplus = net_energy - battery_charge
-                else:
-                    remaining_surplus = net_energy
-                
-                if remaining_surplus > 0:
-                    # Export to grid or waste
-                    if self.config.grid_available:
-                        grid_export = remaining_surplus
-                    else:
-                        surplus = remaining_surplus
-            
-            else:
-                # Deficit: discharge battery or import from grid
-                deficit = abs(net_energy)
-                available_from_battery = battery_kwh * battery_efficiency
-                
-                can_discharge = min(deficit, max_discharge_rate, available_from_battery)
-                
-                if can_discharge > 0:
-                    # Discharge battery
-                    battery_discharge = can_discharge
-                    battery_kwh -= battery_discharge / battery_efficiency
-                    remaining_deficit = deficit - battery_discharge
-                else:
-                    remaining_deficit = deficit
-                
-                if remaining_deficit > 0:
-                    # Import from grid
-                    if self.config.grid_available:
-                        grid_import = remaining_deficit
-                    # else: load shedding situation
-            
-            # Update SoC
-            battery_soc = (battery_kwh / battery_capacity_kwh) * 100 if battery_capacity_kwh > 0 else 0
-            battery_soc = max(0, min(100, battery_soc))
-            
-            # Store result
-            result = SimulationResult(
-                hour=hour,
-                pv_generation_kw=pv_gen,
-                load_kw=load,
-                battery_charge_kw=battery_charge,
-                battery_discharge_kw=battery_discharge,
-                battery_soc=battery_soc,
-                grid_import_kw=grid_import,
-                grid_export_kw=grid_export,
-                energy_surplus_kw=surplus
+        frame = self.simulate_24_hours_frame(pv_capacity_kw, battery_capacity_kwh,
+                                             devices, initial_soc)
+        return frame.to_results()
+    
+    @profiled()
+    def simulate_batch(self, systems: Sequence[Tuple[float, float]],
+                       devices: Optional[List[Device]] = None,
+                       load_kw: Optional[np.ndarray] = None,
+                       initial_soc: float = 50.0, month: int = 6) -> BatchSimulation:
+        """
+        Simulate many candidate systems against one shared load profile
+        
+        Used by SystemOptimizer (System Configuration page). The Quick System
+        Designer and Products pages size systems with rules of thumb and run
+        no per-candidate simulation, so they have no loop to batch.
+        
+        Args:
+            systems: (pv_capacity_kw, battery_capacity_kwh) pair per candidate
+            devices: Devices to build the shared 24-hour load from
+            load_kw: Precomputed hourly load (used instead of devices)
+            initial_soc: Starting state of charge (%) for every candidate
+            month: Month (1-12) for the PV seasonal adjustment
+        
+        Returns BatchSimulation with (candidates x hours) arrays
+        """
+        if load_kw is None:
+            load_kw = self.hourly_load_matrix(devices or []).sum(axis=0)
+        load_kw = np.asarray(load_kw, dtype=float)
+        
+        sizes = np.asarray(systems, dtype=float).reshape(-1, 2)
+        pv_capacity_kw, battery_capacity_kwh = sizes[:, 0], sizes[:, 1]
+        
+        # Sun curve repeats for horizons longer than one day
+        sun_curve = np.resize(self.pv_generation_profile(1.0, month), load_kw.shape[-1])
+        pv_gen = np.maximum(pv_capacity_kw[:, None] * sun_curve, 0.0)
+        
+        charge, discharge, soc, grid_import, grid_export, surplus, unmet = _dispatch_battery_batch(
+            pv_gen, load_kw, battery_capacity_kwh, initial_soc, self.config.grid_available
+        )
+        
+        return BatchSimulation(
+            pv_capacity_kw=pv_capacity_kw,
+            battery_capacity_kwh=battery_capacity_kwh,
+            load_kw=load_kw,
+            pv_generation_kw=pv_gen,
+            battery_charge_kw=charge,
+            battery_discharge_kw=discharge,
+            battery_soc=soc,
+            grid_import_kw=grid_import,
+            grid_export_kw=grid_export,
+            energy_surplus_kw=surplus,
+            unmet_load_kw=unmet
+        )
+    
+    @profiled()
+    def simulate_monte_carlo(self, pv_capacity_kw: float, battery_capacity_kwh: float,
+                             devices: List[Device], scenarios: int = 5000,
+                             irradiance_variability: float = 0.25,
+                             initial_soc: float = 50.0, month: int = 6,
+                             percentiles: Tuple[int, ...] = (10, 50, 90)) -> MonteCarloResult:
+        """
+        Run many 24-hour scenarios with random device usage and daily irradiance
+        
+        All scenarios are drawn and simulated as one NumPy batch: loads come
+        from one seeded draw of (scenarios x devices x hours), and each
+        scenario scales the sun curve by a daily clearness factor drawn
+        around 1.0 (cloudy days low, clear days slightly above average).
+        
+        Args:
+            irradiance_variability: Standard deviation of the daily clearness factor
+            percentiles: Percentiles to report (default P10/P50/P90)
+        
+        Returns MonteCarloResult with daily totals and hourly percentile bands
+        """
+        rng = np.random.default_rng(self.seed)
+        
+        # One draw of `scenarios` independent days, reshaped to (scenarios, 24)
+        load = self.hourly_load_matrix(devices, scenarios, rng=rng).sum(axis=0).reshape(scenarios, 24)
+        clearness = np.clip(rng.normal(1.0, irradiance_variability, scenarios), 0.1, 1.3)
+        pv_gen = clearness[:, None] * self.pv_generation_profile(pv_capacity_kw, month)
+        
+        _, _, soc, grid_import, _, _, unmet = _dispatch_battery_batch(
+            pv_gen, load, np.full(scenarios, float(battery_capacity_kwh)), initial_soc,
+            self.config.grid_available
+        )
+        
+        return MonteCarloResult(
+            scenarios=scenarios,
+            percentiles=tuple(percentiles),
+            grid_import_kwh=grid_import.sum(axis=1),
+            unmet_load_kwh=unmet.sum(axis=1),
+            grid_import_bands_kw=np.percentile(grid_import, percentiles, axis=0),
+            unmet_load_bands_kw=np.percentile(unmet, percentiles, axis=0),
+            battery_soc_bands=np.percentile(soc, percentiles, axis=0)
+        )
+    
+    @profiled()
+    def simulate_year(self, pv_capacity_kw: float, battery_capacity_kwh: float,
+                      devices: List[Device], initial_soc: float = 50.0) -> AnnualSimulation:
+        """
+        Simulate a full year (8760 hours) of energy flow
+        
+        Each month uses its own seasonally scaled sun curve, every day gets
+        its own device usage draw, and battery SoC carries over between days.
+        
+        Returns AnnualSimulation with float32 hourly columns and monthly totals
+        """
+        days = sum(DAYS_IN_MONTH)
+        day_month = np.repeat(np.arange(1, 13), DAYS_IN_MONTH)
+        seasonal_factor = 1.0 + 0.2 * np.sin((day_month - 6) * np.pi / 6)
+        
+        pv_gen = np.maximum(pv_capacity_kw * np.outer(seasonal_factor, _SUN_CURVE), 0.0).ravel()
+        load = self.hourly_load_matrix(devices, days).sum(axis=0)
+        frame, unmet = self._simulate_profile(pv_gen, load, battery_capacity_kwh, initial_soc)
+        
+        # Monthly totals from full-precision columns before compacting to float32
+        month_starts = np.concatenate(([0], np.cumsum(DAYS_IN_MONTH)[:-1])) * 24
+        monthly = {
+            name: np.add.reduceat(getattr(frame, column), month_starts)
+            for name, column in (
+                ('pv_kwh', 'pv_generation_kw'),
+                ('load_kwh', 'load_kw'),
+                ('grid_import_kwh', 'grid_import_kw'),
+                ('grid_export_kwh', 'grid_export_kw'),
+                ('surplus_kwh', 'energy_surplus_kw'),
             )
-            results.append(result)
+        }
         
-        return results
+        return AnnualSimulation(
+            hourly=frame.astype(np.float32),
+            month=np.repeat(day_month, 24).astype(np.uint8),
+            monthly_pv_kwh=monthly['pv_kwh'],
+            monthly_load_kwh=monthly['load_kwh'],
+            monthly_grid_import_kwh=monthly['grid_import_kwh'],
+            monthly_grid_export_kwh=monthly['grid_export_kwh'],
+            monthly_surplus_kwh=monthly['surplus_kwh'],
+            monthly_unmet_load_kwh=np.add.reduceat(unmet, month_starts)
+        )
     
     def calculate_hourly_load(self, devices: List[Device], hour: int) -> float:
         """
         Calculate total load for a specific hour based on device schedules
         """
-        total_load = 0.0
-        
-        for device in devices:
-            if device.preferred_hours:
-                # Use preferred hours
-                if hour in device.preferred_hours:
-                    total_load += device.power_watts / 1000  # Convert to kW
-            else:
-                # Distribute evenly across daily hours
-                if device.daily_hours > 0:
-                    hours_per_day = device.daily_hours
-                    probability = hours_per_day / 24
-                    
-                    # Simple distribution: assume device runs during typical hours
-                    # Morning/evening peak for homes
-                    if 6 <= hour <= 9 or 17 <= hour <= 22:
-                        # Peak hours - higher probability
-                        if np.random.random() < probability * 2:
-                            total_load += device.power_watts / 1000
-                    elif 10 <= hour <= 16:
-                        # Midday - moderate
-                        if np.random.random() < probability:
-                            total_load += device.power_watts / 1000
-                    else:
-                        # Night - lower probability
-                        if np.random.random() < probability * 0.5:
-                            total_load += device.power_watts / 1000
-        
-        return total_load
+        if not 0 <= hour < 24:
+            return 0.0
+        return float(self.hourly_load_matrix(devices)[:, hour].sum())
     
+    @profiled()
     def calculate_financial_analysis(self, system_cost: float, 
                                      annual_energy_kwh: float,
                                      electricity_rate: float = 0.20,
@@ -257,6 +470,7 @@ class SolarCalculator:
             co2_reduction_kg_per_year=co2_reduction
         )
     
+    @profiled()
     def get_device_recommendations(self, devices: List[Device], 
                                    pv_capacity_kw: float,
                                    battery_capacity_kwh: float) -> List[str]:
@@ -0,0 +1,362 @@
+"""
+Chart Renderer
+Headless PNG/SVG rendering of SolarVisualizer figures for reports and Telegram
+
+Figures are rendered with kaleido (plotly's static image engine) when it is
+installed, otherwise by drawing their traces with matplotlib. Images go to
+a disk cache keyed by a hash of the figure JSON and the render options, so
+a chart is rendered once per server and then shared by the PDF and Word
+reports and Telegram messages. The cache is pruned to the most recently
+used CHART_CACHE_MAX_FILES images, none older than CHART_CACHE_MAX_AGE. Rendering runs on a small worker pool:
+render_async() returns a Future and never blocks the calling script run.
+"""
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import plotly.graph_objects as go
+
+from models import SimulationResults
+from startup_timing import profiled
+
+try:
+    import kaleido  # noqa: F401  (used through plotly.io)
+    KALEIDO_AVAILABLE = True
+except ImportError:
+    KALEIDO_AVAILABLE = False
+
+CHART_CACHE_DIR = Path(os.environ.get('KHSOLAR_CHART_CACHE', Path(__file__).resolve().parent / 'chart_cache'))
+CHART_CACHE_MAX_FILES = 500
+CHART_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds since an image was last used
+RENDER_WORKERS = 2
+FORMATS = ('png', 'svg')
+
+# Size of report and Telegram charts in CSS pixels (PNG is rendered at scale x this)
+CHART_WIDTH = 900
+CHART_HEIGHT = 500
+CHART_SCALE = 1.5
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Dict[str, Future] = {}  # cache key -> render in progress
+_lock = threading.Lock()
+
+
+def renderer_name() -> str:
+    """Engine used for rendering: 'kaleido' or 'matplotlib'"""
+    return 'kaleido' if KALEIDO_AVAILABLE else 'matplotlib'
+
+
+def chart_key(figure_json: str, fmt: str, width: int, height: int, scale: float) -> str:
+    """Hash of a figure and its render options (and engine), used as the cache file name"""
+    # Key order differs between a freshly built figure and one read back from JSON
+    digest = hashlib.sha1(json.dumps(json.loads(figure_json), sort_keys=True).encode())
+    digest.update(repr((fmt, width, height, scale, renderer_name())).encode())
+    return digest.hexdigest()
+
+
+def cache_path(key: str, fmt: str) -> Path:
+    return CHART_CACHE_DIR / f"{key}.{fmt}"
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="chart-render")
+        return _executor
+
+
+def render_async(fig: go.Figure, fmt: str = 'png', width: int = CHART_WIDTH, height: int = CHART_HEIGHT,
+                 scale: float = CHART_SCALE) -> 'Future[bytes]':
+    """
+    Image bytes of fig as a Future
+
+    A cached image resolves at once; a chart already being rendered returns
+    the Future of that render, so concurrent requests share one render.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported chart format {fmt!r}, expected one of {FORMATS}")
+    figure_json = fig.to_json()
+    key = chart_key(figure_json, fmt, width, height, scale)
+    path = cache_path(key, fmt)
+    cached = _read_cached(path)
+    if cached is None:
+        pool = _pool()
+        # Check and claim under one lock hold, so only one caller submits the render
+        with _lock:
+            pending = _pending.get(key)
+            if pending is not None:
+                return pending
+            cached = _read_cached(path)  # a render may have finished since the first look
+            if cached is None:
+                future = _pending[key] = pool.submit(_render_to_cache, figure_json, fmt, width, height, scale, path)
+        if cached is None:
+            future.add_done_callback(lambda _: _forget(key))
+            return future
+    done: Future = Future()
+    done.set_result(cached)
+    return done
+
+
+def _read_cached(path: Path) -> Optional[bytes]:
+    """Cached image, marked as just used (the mtime orders the cache for pruning), or None"""
+    try:
+        image = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return image
+
+
+def _forget(key: str):
+    with _lock:
+        _pending.pop(key, None)
+
+
+def render(fig: go.Figure, fmt: str = 'png', width: int = CHART_WIDTH, height: int = CHART_HEIGHT,
+           scale: float = CHART_SCALE) -> bytes:
+    """Image bytes of fig, from the disk cache or rendered on the worker pool"""
+    return render_async(fig, fmt, width, height, scale).result()
+
+
+def render_many(figures: Sequence[go.Figure], fmt: str = 'png', **options) -> List[bytes]:
+    """Images of several figures, rendered in parallel"""
+    futures = [render_async(fig, fmt, **options) for fig in figures]
+    return [future.result() for future in futures]
+
+
+@profiled("chart_renderer.render")
+def _render_to_cache(figure_json: str, fmt: str, width: int, height: int, scale: float, path: Path) -> bytes:
+    if KALEIDO_AVAILABLE:
+        import plotly.io as pio
+        image = pio.to_image(pio.from_json(figure_json), format=fmt, width=width, height=height, scale=scale)
+    else:
+        image = _render_matplotlib(json.loads(figure_json), fmt, width, height, scale)
+
+    # Write then rename, so readers never see a partial file
+    CHART_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    partial.write_bytes(image)
+    os.replace(partial, path)
+    prune_cache()
+    return image
+
+
+def prune_cache(max_files: Optional[int] = None, max_age: Optional[float] = None) -> int:
+    """Delete cached images unused for max_age seconds, then the least recently used beyond max_files"""
+    max_files = CHART_CACHE_MAX_FILES if max_files is None else max_files
+    max_age = CHART_CACHE_MAX_AGE if max_age is None else max_age
+    entries = []
+    try:
+        with os.scandir(CHART_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.rsplit('.', 1)[-1] in FORMATS:
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return 0
+    entries.sort(reverse=True)
+    cutoff = time.time() - max_age
+    stale = [path for i, (mtime, path) in enumerate(entries) if i >= max_files or mtime < cutoff]
+    removed = 0
+    for path in stale:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+# ==================== MATPLOTLIB FALLBACK ====================
+# Draws the trace types SolarVisualizer produces (scatter, scattergl, bar,
+# pie, indicator) with the figure's axis domains, titles and line shapes.
+
+_DASHES = {'dash': '--', 'dot': ':', 'dashdot': '-.', 'longdash': '--'}
+_RGBA = re.compile(r"rgba?\(([^)]*)\)")
+
+# Plot area as a fraction of the image: left, bottom, right, top
+_PLOT_AREA = (0.08, 0.1, 0.8, 0.88)
+
+
+def _values(data) -> np.ndarray:
+    """Array from plotly JSON data: a list, or a base64 typed array {'dtype', 'bdata'[, 'shape']}"""
+    if isinstance(data, dict) and 'bdata' in data:
+        values = np.frombuffer(base64.b64decode(data['bdata']), dtype=data['dtype'])
+        shape = data.get('shape')
+        if shape:
+            values = values.reshape([int(n) for n in str(shape).split(',')])
+        return values
+    values = np.asarray(data)
+    if values.dtype.kind in 'US':
+        try:
+            return values.astype('datetime64[ms]')
+        except ValueError:
+            return values
+    return values
+
+
+def _color(color):
+    """matplotlib color from a plotly color string"""
+    if isinstance(color, str):
+        match = _RGBA.fullmatch(color.replace(' ', ''))
+        if match:
+            parts = [float(p) for p in match.group(1).split(',')]
+            return tuple(p / 255 for p in parts[:3]) + (tuple(parts[3:4]) or (1.0,))
+    return color
+
+
+def _text(item) -> str:
+    if isinstance(item, dict):
+        return item.get('text') or ''
+    return item or ''
+
+
+def _axis_box(layout: dict, xref: str, yref: str):
+    left, bottom, right, top = _PLOT_AREA
+    x0, x1 = layout.get('xaxis' + xref[1:], {}).get('domain', [0, 1])
+    y0, y1 = layout.get('yaxis' + yref[1:], {}).get('domain', [0, 1])
+    return [left + x0 * (right - left), bottom + y0 * (top - bottom),
+            (x1 - x0) * (right - left), (y1 - y0) * (top - bottom)]
+
+
+def _draw_scatter(ax, trace: dict):
+    x, y = _values(trace.get('x', [])), _values(trace.get('y', []))
+    line = trace.get('line', {})
+    color = _color(line.get('color'))
+    marker = 'o' if 'markers' in trace.get('mode', 'lines') else None
+    lines = ax.plot(x, y, color=color, linewidth=line.get('width', 2) * 0.75,
+                    linestyle=_DASHES.get(line.get('dash'), '-'), marker=marker, markersize=3,
+                    label=trace.get('name'))
+    if trace.get('fill') == 'tozeroy':
+        fill = _color(trace.get('fillcolor')) or lines[0].get_color()
+        ax.fill_between(x, y, 0, color=fill, alpha=None if trace.get('fillcolor') else 0.3, linewidth=0)
+
+
+def _draw_bar(ax, trace: dict):
+    x, y = _values(trace.get('x', [])), _values(trace.get('y', []))
+    colors = trace.get('marker', {}).get('color')
+    ax.bar(x, y, color=[_color(c) for c in colors] if isinstance(colors, list) else _color(colors))
+    ax.tick_params(axis='x', labelrotation=45, labelsize=7)
+
+
+def _draw_shapes(axes: dict, layout: dict):
+    for shape in layout.get('shapes', []):
+        if shape.get('type') != 'line':
+            continue
+        xref, yref = shape.get('xref', 'x').split()[0], shape.get('yref', 'y').split()[0]
+        ax = axes.get((xref.replace('paper', 'x'), yref.replace('paper', 'y')))
+        if ax is None:
+            continue
+        line = shape.get('line', {})
+        style = dict(color=_color(line.get('color', 'grey')), linestyle=_DASHES.get(line.get('dash'), '-'),
+                     linewidth=1)
+        if shape.get('y0') == shape.get('y1') and 'domain' in shape.get('xref', ''):
+            ax.axhline(shape['y0'], **style)
+        elif shape.get('x0') == shape.get('x1') and 'domain' in shape.get('yref', ''):
+            ax.axvline(shape['x0'], **style)
+
+
+def _render_matplotlib(figure: dict, fmt: str, width: int, height: int, scale: float) -> bytes:
+    from matplotlib.figure import Figure
+
+    layout = figure.get('layout', {})
+    dpi = 100
+    canvas = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    axes = {}
+
+    for trace in figure.get('data', []):
+        kind = trace.get('type', 'scatter')
+        if kind in ('pie', 'indicator'):
+            domain = trace.get('domain', {})
+            left, bottom, right, top = _PLOT_AREA
+            x0, x1 = domain.get('x', [0, 1])
+            y0, y1 = domain.get('y', [0, 1])
+            ax = canvas.add_axes([left + x0 * (right - left), bottom + y0 * (top - bottom),
+                                  (x1 - x0) * (right - left), (y1 - y0) * (top - bottom)])
+            ax.axis('off')
+            if kind == 'pie':
+                colors = trace.get('marker', {}).get('colors')
+                ax.pie(_values(trace.get('values', [])), labels=trace.get('labels'), autopct='%1.0f%%',
+                       colors=[_color(c) for c in colors] if colors else None,
+                       wedgeprops={'width': 1 - trace.get('hole', 0)}, textprops={'fontsize': 8})
+            else:
+                ax.text(0.5, 0.45, f"{trace.get('value', 0):,.1f}", ha='center', va='center', fontsize=36)
+                ax.text(0.5, 0.85, _text(trace.get('title')), ha='center', va='center', fontsize=14)
+            continue
+
+        refs = (trace.get('xaxis', 'x'), trace.get('yaxis', 'y'))
+        ax = axes.get(refs)
+        if ax is None:
+            ax = axes[refs] = canvas.add_axes(_axis_box(layout, *refs))
+            x_axis, y_axis = layout.get('xaxis' + refs[0][1:], {}), layout.get('yaxis' + refs[1][1:], {})
+            ax.set_xlabel(_text(x_axis.get('title')), fontsize=8)
+            ax.set_ylabel(_text(y_axis.get('title')), fontsize=8)
+            if y_axis.get('range'):
+                ax.set_ylim(*y_axis['range'])
+            ax.tick_params(labelsize=7)
+            ax.grid(True, color='#E5E5E5', linewidth=0.5)
+        if kind == 'bar':
+            _draw_bar(ax, trace)
+        else:
+            _draw_scatter(ax, trace)
+
+    _draw_shapes(axes, layout)
+    for annotation in layout.get('annotations', []):
+        # Subplot titles sit in paper coordinates above each subplot
+        if annotation.get('xref') == 'paper' and annotation.get('yref') == 'paper':
+            left, bottom, right, top = _PLOT_AREA
+            canvas.text(left + annotation['x'] * (right - left), bottom + annotation['y'] * (top - bottom) + 0.01,
+                        _text(annotation), ha='center', va='bottom', fontsize=9)
+
+    handles = [(line, line.get_label()) for ax in axes.values() for line in ax.get_lines()
+               if not line.get_label().startswith('_')]
+    if handles and layout.get('showlegend', True):
+        canvas.legend(*zip(*handles), loc='upper right', fontsize=7, frameon=False)
+    if _text(layout.get('title')):
+        canvas.suptitle(_text(layout.get('title')), fontsize=12)
+
+    buffer = io.BytesIO()
+    canvas.savefig(buffer, format=fmt, dpi=dpi * scale)
+    return buffer.getvalue()
+
+
+# ==================== REPORT CHARTS ====================
+
+def report_figures(simulation_results: Optional[SimulationResults] = None, annual_savings: float = 0.0,
+                   system_cost: float = 0.0, years: int = 25) -> List[go.Figure]:
+    """
+    Charts embedded in reports and Telegram messages (English: the report fonts have no Khmer glyphs)
+
+    The 24-hour energy flow and energy source charts need simulation
+    results; the cumulative savings chart needs positive annual savings.
+    """
+    from visualization import SolarVisualizer
+    viz = SolarVisualizer()
+    figures = []
+    if simulation_results is not None and len(simulation_results):
+        figures.append(viz.create_24h_energy_flow_chart(simulation_results))
+        figures.append(viz.create_energy_balance_pie(simulation_results))
+    if annual_savings > 0:
+        figures.append(viz.create_financial_chart(years, annual_savings, system_cost))
+    return figures
+
+
+def report_charts(simulation_results: Optional[SimulationResults] = None, annual_savings: float = 0.0,
+                  system_cost: float = 0.0, fmt: str = 'png') -> List[bytes]:
+    """Rendered report charts, see report_figures()"""
+    return render_many(report_figures(simulation_results, annual_savings, system_cost), fmt)
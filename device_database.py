@@ -0,0 +1,62 @@
+"""
+Device Database
+Typical power, daily hours and type of common household devices, used for auto-recognition
+"""
+
+# Device Database for Auto-Recognition
+DEVICE_DATABASE = {
+    # Cooling (inverter available for AC and refrigerators)
+    "Refrigerator": {"power": 150, "hours": 24.0, "type": "cooling", "priority": True, "inverter": False},
+    "Refrigerator (Inverter)": {"power": 150, "hours": 24.0, "type": "cooling", "priority": True, "inverter": True},
+    "Freezer": {"power": 200, "hours": 24.0, "type": "cooling", "priority": True, "inverter": False},
+    "Freezer (Inverter)": {"power": 200, "hours": 24.0, "type": "cooling", "priority": True, "inverter": True},
+    "Air Conditioner 1HP": {"power": 1000, "hours": 8.0, "type": "cooling", "priority": False, "inverter": False},
+    "Air Conditioner 1HP (Inverter)": {"power": 1000, "hours": 8.0, "type": "cooling", "priority": False, "inverter": True},
+    "Air Conditioner 1.5HP": {"power": 1500, "hours": 8.0, "type": "cooling", "priority": False, "inverter": False},
+    "Air Conditioner 1.5HP (Inverter)": {"power": 1500, "hours": 8.0, "type": "cooling", "priority": False, "inverter": True},
+    "Air Conditioner 2HP": {"power": 2000, "hours": 8.0, "type": "cooling", "priority": False, "inverter": False},
+    "Air Conditioner 2HP (Inverter)": {"power": 2000, "hours": 8.0, "type": "cooling", "priority": False, "inverter": True},
+    "Ceiling Fan": {"power": 75, "hours": 10.0, "type": "cooling", "priority": False, "inverter": False},
+    "Standing Fan": {"power": 60, "hours": 8.0, "type": "cooling", "priority": False, "inverter": False},
+    "Table Fan": {"power": 50, "hours": 6.0, "type": "cooling", "priority": False, "inverter": False},
+    
+    # Lighting
+    "LED Bulb 9W": {"power": 9, "hours": 5.0, "type": "lighting", "priority": True},
+    "LED Bulb 12W": {"power": 12, "hours": 5.0, "type": "lighting", "priority": True},
+    "LED Tube 18W": {"power": 18, "hours": 5.0, "type": "lighting", "priority": True},
+    "CFL Bulb 20W": {"power": 20, "hours": 5.0, "type": "lighting", "priority": False},
+    "LED Strip Lights": {"power": 30, "hours": 4.0, "type": "lighting", "priority": False},
+    
+    # Kitchen
+    "Rice Cooker": {"power": 500, "hours": 1.0, "type": "kitchen", "priority": True},
+    "Electric Stove": {"power": 2000, "hours": 1.5, "type": "kitchen", "priority": False},
+    "Microwave": {"power": 1000, "hours": 0.3, "type": "kitchen", "priority": False},
+    "Toaster": {"power": 800, "hours": 0.2, "type": "kitchen", "priority": False},
+    "Electric Kettle": {"power": 1500, "hours": 0.3, "type": "kitchen", "priority": False},
+    "Blender": {"power": 300, "hours": 0.2, "type": "kitchen", "priority": False},
+    "Coffee Maker": {"power": 800, "hours": 0.5, "type": "kitchen", "priority": False},
+    
+    # Entertainment
+    "TV LED 32 inch": {"power": 60, "hours": 4.0, "type": "entertainment", "priority": False},
+    "TV LED 43 inch": {"power": 80, "hours": 4.0, "type": "entertainment", "priority": False},
+    "TV LED 55 inch": {"power": 120, "hours": 4.0, "type": "entertainment", "priority": False},
+    "Sound System": {"power": 100, "hours": 3.0, "type": "entertainment", "priority": False},
+    "Gaming Console": {"power": 150, "hours": 3.0, "type": "entertainment", "priority": False},
+    
+    # Office/Computing
+    "Desktop Computer": {"power": 300, "hours": 6.0, "type": "office", "priority": False},
+    "Laptop": {"power": 65, "hours": 6.0, "type": "office", "priority": False},
+    "Monitor": {"power": 40, "hours": 6.0, "type": "office", "priority": False},
+    "Printer": {"power": 50, "hours": 0.5, "type": "office", "priority": False},
+    "Router/Modem": {"power": 10, "hours": 24.0, "type": "office", "priority": True},
+    
+    # General Appliances (inverter available for washing machine)
+    "Washing Machine": {"power": 500, "hours": 1.0, "type": "general", "priority": False, "inverter": False},
+    "Washing Machine (Inverter)": {"power": 500, "hours": 1.0, "type": "general", "priority": False, "inverter": True},
+    "Iron": {"power": 1000, "hours": 0.5, "type": "general", "priority": False, "inverter": False},
+    "Vacuum Cleaner": {"power": 1000, "hours": 0.5, "type": "general", "priority": False, "inverter": False},
+    "Water Pump": {"power": 300, "hours": 0.5, "type": "general", "priority": True, "inverter": False},
+    "Water Heater": {"power": 2000, "hours": 1.0, "type": "heating", "priority": False, "inverter": False},
+    "Water Heater (Inverter)": {"power": 2000, "hours": 1.0, "type": "heating", "priority": False, "inverter": True},
+    "Hair Dryer": {"power": 1500, "hours": 0.2, "type": "general", "priority": False, "inverter": False},
+}
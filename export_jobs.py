@@ -0,0 +1,211 @@
+"""
+Export Job Queue
+PDF, Word, Excel and CSV exports run on a background worker pool
+
+submit_export() returns an ExportJob at once; the Streamlit script polls
+its status and progress on later reruns instead of blocking while
+reportlab or python-docx work. Reports are built in memory and kept only in
+a process-wide cache keyed by a hash of the export inputs (jobs hold the
+key, not the bytes, so EXPORT_CACHE bounds report memory). Downloads never
+touch the filesystem, exporting an unchanged design again is served from
+the cache, and a request for a report that is already being generated
+joins the running job instead of starting another.
+"""
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from models import Device, FinancialAnalysis, SimulationResults, as_frame
+from simulation_cache import SimulationCache
+from startup_timing import profiled
+from visualization import chart_fingerprint, frame_fingerprint
+
+# Report bytes by export key, shared by every session
+EXPORT_CACHE = SimulationCache(max_entries=32)
+EXPORT_WORKERS = 2
+MAX_JOBS = 256  # finished jobs beyond this are forgotten, oldest first
+CHUNK_SIZE = 64 * 1024
+
+# Export kind -> (file extension, MIME type, download file name)
+EXPORT_FORMATS = {
+    'pdf': ('pdf', 'application/pdf', 'solar_report.pdf'),
+    'docx': ('docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'solar_report.docx'),
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'solar_report.xlsx'),
+    'csv': ('csv', 'text/csv', 'solar_simulation.csv'),
+}
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+
+@dataclass
+class ExportJob:
+    """One export request; the worker updates status, progress and message as it runs"""
+    job_id: str
+    kind: str
+    key: str
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = "Queued"
+    error: Optional[str] = None
+    cached: bool = False
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    @property
+    def data(self) -> Optional[bytes]:
+        """The finished report from EXPORT_CACHE; None while running, after a failure or once evicted"""
+        return EXPORT_CACHE.get(self.key) if self.status == DONE else None
+    
+    @property
+    def expired(self) -> bool:
+        """Finished, but the report has left the cache; submit the export again"""
+        return self.status == DONE and self.data is None
+    
+    @property
+    def mime_type(self) -> str:
+        return EXPORT_FORMATS[self.kind][1]
+
+    @property
+    def file_name(self) -> str:
+        return EXPORT_FORMATS[self.kind][2]
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_jobs: "OrderedDict[str, ExportJob]" = OrderedDict()  # job id -> job
+_running: Dict[str, ExportJob] = {}  # cache key -> unfinished job
+_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix="report-export")
+        return _executor
+
+
+def export_key(kind: str, simulation_results: SimulationResults, devices: List[Device] = (),
+               financial: Optional[FinancialAnalysis] = None, system_config: Optional[dict] = None,
+               include_charts: bool = False) -> str:
+    """Hash of everything an export depends on; equal inputs give equal keys across sessions"""
+    payload = (
+        kind,
+        include_charts,
+        [asdict(d) for d in devices],
+        asdict(financial) if financial is not None else None,
+        sorted((system_config or {}).items()),
+    )
+    return chart_fingerprint(frame_fingerprint(as_frame(simulation_results)), payload)
+
+
+def submit_export(kind: str, simulation_results: SimulationResults, devices: List[Device] = (),
+                  financial: Optional[FinancialAnalysis] = None, system_config: Optional[dict] = None,
+                  include_charts: bool = False) -> ExportJob:
+    """
+    Queue an export and return its job without waiting for it
+
+    A report already in the cache gives a finished job; a report being
+    generated for the same inputs returns that running job.
+    """
+    if kind not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export {kind!r}, expected one of {tuple(EXPORT_FORMATS)}")
+    key = export_key(kind, simulation_results, devices, financial, system_config, include_charts)
+
+    with _lock:
+        running = _running.get(key)
+        if running is not None:
+            return running
+        job = ExportJob(job_id=f"{next(_ids)}-{key[:8]}", kind=kind, key=key)
+        if EXPORT_CACHE.get(key) is not None:
+            job.status, job.progress, job.message = DONE, 1.0, "Done"
+            job.cached = True
+        else:
+            _running[key] = job
+        _remember(job)
+    if not job.finished:
+        _pool().submit(_run, job, simulation_results, devices, financial, system_config, include_charts)
+    return job
+
+
+def _remember(job: ExportJob):
+    """Register job under its id, forgetting the oldest finished jobs beyond MAX_JOBS (caller holds _lock)"""
+    _jobs[job.job_id] = job
+    excess = len(_jobs) - MAX_JOBS
+    for job_id in [job_id for job_id, old in _jobs.items() if old.finished][:max(excess, 0)]:
+        del _jobs[job_id]
+
+
+def get_job(job_id: str) -> Optional[ExportJob]:
+    """Job by id, or None if unknown (or forgotten)"""
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def wait(job: ExportJob, timeout: Optional[float] = None, poll_seconds: float = 0.05) -> ExportJob:
+    """Block until job finishes or timeout seconds pass (for scripts and tests; the app polls instead)"""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not job.finished and (deadline is None or time.monotonic() < deadline):
+        time.sleep(poll_seconds)
+    return job
+
+
+def stream(job: ExportJob, chunk_size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """A finished report in chunks, as views of the cached bytes rather than copies"""
+    if job.status != DONE:
+        raise RuntimeError(f"Export job {job.job_id} is {job.status}")
+    data = job.data
+    if data is None:
+        raise RuntimeError(f"Export job {job.job_id} expired from the cache, submit the export again")
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+def _progress(job: ExportJob, progress: float, message: str):
+    job.progress, job.message = progress, message
+
+
+def _run(job: ExportJob, simulation_results, devices, financial, system_config, include_charts):
+    job.status = RUNNING
+    try:
+        EXPORT_CACHE.put(job.key, _export(job, simulation_results, devices, financial, system_config, include_charts))
+        _progress(job, 1.0, "Done")
+        job.status = DONE
+    except Exception as e:
+        job.error = str(e)
+        job.status = FAILED
+        job.message = f"Failed: {e}"
+    finally:
+        with _lock:
+            _running.pop(job.key, None)
+
+
+@profiled("export_jobs.export")
+def _export(job: ExportJob, simulation_results, devices, financial, system_config, include_charts) -> bytes:
+    from export_utils import ReportExporter
+    exporter = ReportExporter()
+
+    if job.kind in ('pdf', 'docx') and include_charts:
+        # Charts are the slow part; once rendered the report build below finds them cached
+        from chart_renderer import report_charts
+        _progress(job, 0.1, "Rendering charts")
+        report_charts(simulation_results, financial.annual_savings, financial.total_system_cost)
+
+    _progress(job, 0.5, "Writing report")
+    build: Dict[str, Callable[[], bytes]] = {
+        'pdf': lambda: exporter.generate_pdf_report(simulation_results, devices, financial, system_config,
+                                                    include_charts=include_charts),
+        'docx': lambda: exporter.generate_word_report(simulation_results, devices, financial, system_config,
+                                                      include_charts=include_charts),
+        'xlsx': lambda: exporter.export_to_excel(simulation_results, devices, financial),
+        'csv': lambda: exporter.export_to_csv(simulation_results),
+    }
+    return build[job.kind]()
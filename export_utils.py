@@ -1,13 +1,17 @@
 """
 Export and Reporting Utilities
+
+Every exporter writes to a file name or a writable binary buffer, or, when
+given neither, builds the file in memory and returns its bytes.
 """
+import os
 import pandas as pd
-from typing import List
-from models import SimulationResult, Device, FinancialAnalysis
+from typing import BinaryIO, Callable, List, Optional, Union
+from models import SimulationResults, Device, FinancialAnalysis, as_frame
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 import io
@@ -17,8 +21,23 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 import datetime
+from chart_renderer import CHART_HEIGHT, CHART_WIDTH, report_charts
 from export_utils_word import generate_word_report
 from report_translations import REPORT_LABELS as RL
+from startup_timing import profiled
+
+# Where an exporter writes: a file name, a writable binary buffer, or None for bytes returned in memory
+ReportOutput = Union[str, os.PathLike, BinaryIO, None]
+
+
+def write_output(output: ReportOutput, write: Callable[[Union[str, os.PathLike, BinaryIO]], None]) -> Optional[bytes]:
+    """Run write() against output, or against an in-memory buffer whose bytes are returned"""
+    if output is not None:
+        write(output)
+        return None
+    buffer = io.BytesIO()
+    write(buffer)
+    return buffer.getvalue()
 
 class ReportExporter:
     """Export simulation results and reports"""
@@ -26,23 +45,29 @@ class ReportExporter:
     def __init__(self):
         self.styles = getSampleStyleSheet()
     
-    def export_to_excel(self, simulation_results: List[SimulationResult], 
+    @profiled()
+    def export_to_excel(self, simulation_results: SimulationResults, 
                        devices: List[Device], 
                        financial: FinancialAnalysis,
-                       filename: str):
+                       output: ReportOutput = None) -> Optional[bytes]:
         """Export all data to Excel with multiple sheets"""
+        return write_output(output, lambda target: self._write_excel(simulation_results, devices, financial, target))
+    
+    def _write_excel(self, simulation_results: SimulationResults, devices: List[Device],
+                     financial: FinancialAnalysis, target):
+        frame = as_frame(simulation_results)
         
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        with pd.ExcelWriter(target, engine='openpyxl') as writer:
             # Sheet 1: Hourly Simulation
             sim_data = {
-                'Hour': [r.hour for r in simulation_results],
-                'PV Generation (kW)': [r.pv_generation_kw for r in simulation_results],
-                'Load (kW)': [r.load_kw for r in simulation_results],
-                'Battery Charge (kW)': [r.battery_charge_kw for r in simulation_results],
-                'Battery Discharge (kW)': [r.battery_discharge_kw for r in simulation_results],
-                'Battery SoC (%)': [r.battery_soc for r in simulation_results],
-                'Grid Import (kW)': [r.grid_import_kw for r in simulation_results],
-                'Grid Export (kW)': [r.grid_export_kw for r in simulation_results],
+                'Hour': frame.hour,
+                'PV Generation (kW)': frame.pv_generation_kw,
+                'Load (kW)': frame.load_kw,
+                'Battery Charge (kW)': frame.battery_charge_kw,
+                'Battery Discharge (kW)': frame.battery_discharge_kw,
+                'Battery SoC (%)': frame.battery_soc,
+                'Grid Import (kW)': frame.grid_import_kw,
+                'Grid Export (kW)': frame.grid_export_kw,
             }
             df_sim = pd.DataFrame(sim_data)
             df_sim.to_excel(writer, sheet_name='Hourly Simulation', index=False)
@@ -84,9 +109,9 @@ class ReportExporter:
             df_financial.to_excel(writer, sheet_name='Financial Analysis', index=False)
             
             # Sheet 4: Daily Summary
-            total_pv = sum(r.pv_generation_kw for r in simulation_results)
-            total_load = sum(r.load_kw for r in simulation_results)
-            total_grid_import = sum(r.grid_import_kw for r in simulation_results)
+            total_pv = float(frame.pv_generation_kw.sum())
+            total_load = float(frame.load_kw.sum())
+            total_grid_import = float(frame.grid_import_kw.sum())
             self_sufficiency = ((total_load - total_grid_import) / total_load * 100) if total_load > 0 else 0
             
             summary_data = {
@@ -115,29 +140,37 @@ class ReportExporter:
             df_summary = pd.DataFrame(summary_data)
             df_summary.to_excel(writer, sheet_name='Summary', index=False)
     
-    def export_to_csv(self, simulation_results: List[SimulationResult], filename: str):
+    @profiled()
+    def export_to_csv(self, simulation_results: SimulationResults, output: ReportOutput = None) -> Optional[bytes]:
         """Export hourly simulation to CSV"""
+        frame = as_frame(simulation_results)
         sim_data = {
-            'Hour': [r.hour for r in simulation_results],
-            'PV_Generation_kW': [r.pv_generation_kw for r in simulation_results],
-            'Load_kW': [r.load_kw for r in simulation_results],
-            'Battery_Charge_kW': [r.battery_charge_kw for r in simulation_results],
-            'Battery_Discharge_kW': [r.battery_discharge_kw for r in simulation_results],
-            'Battery_SoC_percent': [r.battery_soc for r in simulation_results],
-            'Grid_Import_kW': [r.grid_import_kw for r in simulation_results],
-            'Grid_Export_kW': [r.grid_export_kw for r in simulation_results],
+            'Hour': frame.hour,
+            'PV_Generation_kW': frame.pv_generation_kw,
+            'Load_kW': frame.load_kw,
+            'Battery_Charge_kW': frame.battery_charge_kw,
+            'Battery_Discharge_kW': frame.battery_discharge_kw,
+            'Battery_SoC_percent': frame.battery_soc,
+            'Grid_Import_kW': frame.grid_import_kw,
+            'Grid_Export_kW': frame.grid_export_kw,
         }
         df = pd.DataFrame(sim_data)
-        df.to_csv(filename, index=False)
+        return write_output(output, lambda target: df.to_csv(target, index=False))
     
-    def generate_pdf_report(self, simulation_results: List[SimulationResult],
+    @profiled()
+    def generate_pdf_report(self, simulation_results: SimulationResults,
                            devices: List[Device],
                            financial: FinancialAnalysis,
                            system_config: dict,
-                           filename: str):
+                           output: ReportOutput = None,
+                           include_charts: bool = False) -> Optional[bytes]:
         """Generate comprehensive professional PDF report"""
-        
-        doc = SimpleDocTemplate(filename, pagesize=letter,
+        return write_output(output, lambda target: self._write_pdf(simulation_results, devices, financial,
+                                                                   system_config, target, include_charts))
+    
+    def _write_pdf(self, simulation_results: SimulationResults, devices: List[Device],
+                   financial: FinancialAnalysis, system_config: dict, target, include_charts: bool):
+        doc = SimpleDocTemplate(target, pagesize=letter,
                                topMargin=0.5*inch, bottomMargin=0.5*inch,
                                leftMargin=0.75*inch, rightMargin=0.75*inch)
         story = []
@@ -354,10 +387,11 @@ class ReportExporter:
         
         # Energy Summary
         story.append(Paragraph(RL['energy_analysis'], section_header))
-        total_pv = sum(r.pv_generation_kw for r in simulation_results)
-        total_load = sum(r.load_kw for r in simulation_results)
-        total_grid_import = sum(r.grid_import_kw for r in simulation_results)
-        total_grid_export = sum(r.grid_export_kw for r in simulation_results)
+        frame = as_frame(simulation_results)
+        total_pv = float(frame.pv_generation_kw.sum())
+        total_load = float(frame.load_kw.sum())
+        total_grid_import = float(frame.grid_import_kw.sum())
+        total_grid_export = float(frame.grid_export_kw.sum())
         self_sufficiency = ((total_load - total_grid_import) / total_load * 100) if total_load > 0 else 0
         
         energy_data = [
@@ -390,6 +424,17 @@ class ReportExporter:
         story.append(energy_table)
         story.append(Spacer(1, 0.4*inch))
         
+        # Charts (rendered once per design and cached on disk)
+        if include_charts:
+            charts = report_charts(simulation_results, financial.annual_savings, financial.total_system_cost)
+            if charts:
+                story.append(PageBreak())
+                story.append(Paragraph(RL['performance_charts'], section_header))
+                chart_width = 6.5*inch
+                for png in charts:
+                    story.append(Image(io.BytesIO(png), width=chart_width, height=chart_width * CHART_HEIGHT / CHART_WIDTH))
+                    story.append(Spacer(1, 0.2*inch))
+        
         # Device List
         story.append(PageBreak())
         story.append(Paragraph(RL['device_inventory'], section_header))
@@ -457,7 +502,8 @@ class ReportExporter:
         # Build PDF
         doc.build(story)
     
-    def export_device_schedule(self, devices: List[Device], filename: str):
+    @profiled()
+    def export_device_schedule(self, devices: List[Device], output: ReportOutput = None) -> Optional[bytes]:
         """Export device schedule as printable CSV"""
         schedule_data = {
             'Device': [d.name for d in devices],
@@ -468,12 +514,14 @@ class ReportExporter:
             'Recommendation': ['Run during peak sun (10AM-2PM)' if d.power_watts > 1000 else 'Flexible timing' for d in devices]
         }
         df = pd.DataFrame(schedule_data)
-        df.to_csv(filename, index=False)
+        return write_output(output, lambda target: df.to_csv(target, index=False))
     
-    def generate_word_report(self, simulation_results: List[SimulationResult],
+    @profiled()
+    def generate_word_report(self, simulation_results: SimulationResults,
                             devices: List[Device],
                             financial: FinancialAnalysis,
                             system_config: dict,
-                            filename: str):
+                            output: ReportOutput = None,
+                            include_charts: bool = False) -> Optional[bytes]:
         """Generate professional Word document report with same style as PDF"""
-        generate_word_report(simulation_results, devices, financial, system_config, filename)
+        return generate_word_report(simulation_results, devices, financial, system_config, output, include_charts)
@@ -7,8 +7,10 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 import datetime
-from typing import List
-from models import SimulationResult, Device, FinancialAnalysis
+import io
+from typing import List, Optional
+from models import SimulationResults, Device, FinancialAnalysis, as_frame
+from chart_renderer import report_charts
 from report_translations import REPORT_LABELS as RL
 
 def set_cell_background(cell, color):
@@ -199,10 +201,11 @@ def add_energy_summary(doc, simulation_results):
     """Add energy summary section"""
     doc.add_heading(RL['energy_analysis'], 2)
     
-    total_pv = sum(r.pv_generation_kw for r in simulation_results)
-    total_load = sum(r.load_kw for r in simulation_results)
-    total_grid_import = sum(r.grid_import_kw for r in simulation_results)
-    total_grid_export = sum(r.grid_export_kw for r in simulation_results)
+    frame = as_frame(simulation_results)
+    total_pv = float(frame.pv_generation_kw.sum())
+    total_load = float(frame.load_kw.sum())
+    total_grid_import = float(frame.grid_import_kw.sum())
+    total_grid_export = float(frame.grid_export_kw.sum())
     self_sufficiency = ((total_load - total_grid_import) / total_load * 100) if total_load > 0 else 0
     
     table = doc.add_table(rows=7, cols=4)
@@ -234,6 +237,16 @@ def add_energy_summary(doc, simulation_results):
     
     doc.add_paragraph()
 
+def add_charts(doc, simulation_results, financial):
+    """Add performance charts section"""
+    charts = report_charts(simulation_results, financial.annual_savings, financial.total_system_cost)
+    if not charts:
+        return
+    doc.add_page_break()
+    doc.add_heading(RL['performance_charts'], 2)
+    for png in charts:
+        doc.add_picture(io.BytesIO(png), width=Inches(6.5))
+
 def add_device_inventory(doc, devices):
     """Add device inventory section"""
     doc.add_page_break()
@@ -293,12 +306,14 @@ def add_footer(doc):
     footer3.runs[0].font.size = Pt(9)
     footer3.runs[0].font.color.rgb = RGBColor(127, 140, 141)
 
-def generate_word_report(simulation_results: List[SimulationResult],
+def generate_word_report(simulation_results: SimulationResults,
                         devices: List[Device],
                         financial: FinancialAnalysis,
                         system_config: dict,
-                        filename: str):
-    """Generate professional Word document report"""
+                        output=None,
+                        include_charts: bool = False) -> Optional[bytes]:
+    """Generate professional Word document report into output (a file name or binary buffer), or as bytes"""
+    from export_utils import write_output  # export_utils imports this module
     doc = Document()
     
     # Set default font
@@ -314,8 +329,10 @@ def generate_word_report(simulation_results: List[SimulationResult],
     add_cost_breakdown(doc, system_config, financial)
     add_financial_analysis(doc, financial)
     add_energy_summary(doc, simulation_results)
+    if include_charts:
+        add_charts(doc, simulation_results, financial)
     add_device_inventory(doc, devices)
     add_footer(doc)
     
     # Save document
-    doc.save(filename)
+    return write_output(output, doc.save)
@@ -4,7 +4,10 @@ Products & Prices Tab
 
 import sys
 import os
+import json
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Repository root, for the search index shared with the web app
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTableWidget, QTableWidgetItem,
@@ -13,6 +16,21 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
 from database.db_manager import DatabaseManager
+from product_manager import specifications_from_name
+from product_search import ProductSearchIndex
+
+
+def product_specifications(name, specs_text):
+    """Specs saved with a product, over the power/capacity the web catalog reads from its name"""
+    specs = specifications_from_name(name)
+    try:
+        saved = json.loads(specs_text) if specs_text else {}
+    except ValueError:
+        saved = {}
+    if isinstance(saved, dict):
+        specs.update(saved)
+    return specs
+
 
 class ProductsTab(QWidget):
     """Products and pricing management tab"""
@@ -107,38 +125,35 @@ class ProductsTab(QWidget):
                 str(p[6])  # stock
             ))
         
-        self.table.setRowCount(len(products))
-        for row, product in enumerate(products):
-            for col, value in enumerate(product):
+        # Row number -> code, name, category and specs for fuzzy search
+        self.products = products
+        self.search_index = ProductSearchIndex(
+            (row, [p[1], p[2], p[3], p[8] or ""],
+             dict(product_specifications(p[2], p[8]),
+                  code=p[1], name=p[2], category=p[3], price=p[4], retail=p[5], stock=p[6]))
+            for row, p in enumerate(db_products)
+        )
+        self.show_rows(range(len(products)))
+    
+    def show_rows(self, rows):
+        """Fill the table with the given product rows, in that order"""
+        rows = list(rows)
+        self.table.setRowCount(len(rows))
+        for row, index in enumerate(rows):
+            for col, value in enumerate(self.products[index]):
                 item = QTableWidgetItem(str(value))
                 item.setTextAlignment(Qt.AlignCenter)
                 self.table.setItem(row, col, item)
                 
     def filter_products(self):
-        """Filter products based on search and category"""
-        search_text = self.search_box.text().lower()
+        """Filter products based on search and category, best search match first"""
+        search_text = self.search_box.text()
         category = self.category_filter.currentText()
-        
-        for row in range(self.table.rowCount()):
-            show_row = True
-            
-            # Check search text
-            if search_text:
-                row_text = ""
-                for col in range(self.table.columnCount() - 1):
-                    item = self.table.item(row, col)
-                    if item:
-                        row_text += item.text().lower() + " "
-                if search_text not in row_text:
-                    show_row = False
-            
-            # Check category
-            if category != "All Categories":
-                category_item = self.table.item(row, 2)
-                if category_item and category_item.text() != category:
-                    show_row = False
-            
-            self.table.setRowHidden(row, not show_row)
+        # Typo tolerant, supports filters like price<=500 or power>=5
+        rows = self.search_index.search(search_text) if search_text.strip() else range(len(self.products))
+        if category != "All Categories":
+            rows = [row for row in rows if self.products[row][2] == category]
+        self.show_rows(rows)
             
     def add_product(self):
         """Add new product"""
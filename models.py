@@ -2,53 +2,48 @@
 Data Models for Solar Planning Software
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple, Union
 from datetime import datetime
+import numpy as np
 
-@dataclass
+# Typical inverter power savings by device type
+INVERTER_SAVINGS_PERCENT = {
+    "cooling": 40,  # AC and refrigerators save 35-45%
+    "heating": 35,  # Water heaters save 30-40%
+    "general": 30,  # Washing machines, etc save 25-35%
+}
+
+@dataclass(frozen=True, slots=True)
 class Device:
-    """Represents an electrical device"""
+    """
+    Represents an electrical device
+
+    Immutable and hashable; derived energy values are computed once at
+    construction and preferred_hours is stored as a tuple.
+    """
     name: str
     power_watts: float
     daily_hours: float
     is_priority: bool = False
-    preferred_hours: List[int] = field(default_factory=list)  # Hours when device should run (0-23)
+    preferred_hours: Tuple[int, ...] = ()  # Hours when device should run (0-23); lists are converted
     device_type: str = "general"  # general, heating, cooling, lighting, etc.
     has_inverter: bool = False  # Smart inverter technology for power saving
     
-    @property
-    def inverter_savings_percent(self) -> float:
-        """Power savings percentage for inverter devices"""
-        # Typical savings by device type
-        inverter_savings = {
-            "cooling": 40,  # AC and refrigerators save 35-45%
-            "heating": 35,  # Water heaters save 30-40%
-            "general": 30,  # Washing machines, etc save 25-35%
-        }
-        if self.has_inverter:
-            return inverter_savings.get(self.device_type, 30)
-        return 0
+    inverter_savings_percent: float = field(init=False, repr=False, compare=False)  # Power savings percentage for inverter devices
+    effective_power_watts: float = field(init=False, repr=False, compare=False)  # Actual power consumption considering inverter savings
+    daily_energy_kwh: float = field(init=False, repr=False, compare=False)  # Daily energy consumption in kWh (with inverter savings)
+    power_saved_kwh: float = field(init=False, repr=False, compare=False)  # Daily power saved by inverter technology
     
-    @property
-    def effective_power_watts(self) -> float:
-        """Actual power consumption considering inverter savings"""
-        if self.has_inverter:
-            savings_factor = 1 - (self.inverter_savings_percent / 100)
-            return self.power_watts * savings_factor
-        return self.power_watts
-    
-    @property
-    def daily_energy_kwh(self) -> float:
-        """Calculate daily energy consumption in kWh (with inverter savings)"""
-        return (self.effective_power_watts * self.daily_hours) / 1000
-    
-    @property
-    def power_saved_kwh(self) -> float:
-        """Daily power saved by inverter technology"""
-        if self.has_inverter:
-            non_inverter_consumption = (self.power_watts * self.daily_hours) / 1000
-            return non_inverter_consumption - self.daily_energy_kwh
-        return 0.0
+    def __post_init__(self):
+        object.__setattr__(self, 'preferred_hours', tuple(self.preferred_hours))
+        savings = INVERTER_SAVINGS_PERCENT.get(self.device_type, 30) if self.has_inverter else 0
+        effective_power = self.power_watts * (1 - savings / 100) if self.has_inverter else self.power_watts
+        daily_energy = (effective_power * self.daily_hours) / 1000
+        saved = (self.power_watts * self.daily_hours) / 1000 - daily_energy if self.has_inverter else 0.0
+        object.__setattr__(self, 'inverter_savings_percent', savings)
+        object.__setattr__(self, 'effective_power_watts', effective_power)
+        object.__setattr__(self, 'daily_energy_kwh', daily_energy)
+        object.__setattr__(self, 'power_saved_kwh', saved)
 
 @dataclass
 class Product:
@@ -63,7 +58,7 @@ class Product:
     supplier: str = ""
     notes: str = ""
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SolarPanel:
     """PV Panel specifications"""
     name: str
@@ -72,11 +67,12 @@ class SolarPanel:
     cost_per_panel: float = 0.0
     quantity: int = 1
     
-    @property
-    def total_power_kw(self) -> float:
-        return (self.power_watts * self.quantity) / 1000
+    total_power_kw: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'total_power_kw', (self.power_watts * self.quantity) / 1000)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Battery:
     """Battery specifications"""
     name: str
@@ -87,19 +83,16 @@ class Battery:
     cost: float = 0.0
     quantity: int = 1
     
-    @property
-    def usable_capacity_kwh(self) -> float:
-        return self.capacity_kwh * self.depth_of_discharge * self.quantity
-    
-    @property
-    def total_capacity_kwh(self) -> float:
-        return self.capacity_kwh * self.quantity
+    usable_capacity_kwh: float = field(init=False, repr=False, compare=False)
+    total_capacity_kwh: float = field(init=False, repr=False, compare=False)
+    total_cost: float = field(init=False, repr=False, compare=False)
     
-    @property
-    def total_cost(self) -> float:
-        return self.cost * self.quantity
+    def __post_init__(self):
+        object.__setattr__(self, 'usable_capacity_kwh', self.capacity_kwh * self.depth_of_discharge * self.quantity)
+        object.__setattr__(self, 'total_capacity_kwh', self.capacity_kwh * self.quantity)
+        object.__setattr__(self, 'total_cost', self.cost * self.quantity)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Inverter:
     """Inverter specifications"""
     name: str
@@ -183,6 +176,185 @@ class SimulationResult:
     grid_export_kw: float
     energy_surplus_kw: float
 
+@dataclass
+class SimulationFrame:
+    """
+    Columnar simulation results (one NumPy array per SimulationResult field)
+
+    Columns are plain arrays, so frame.load_kw.sum() touches no Python
+    objects. Indexing a frame gives a SimulationResult for that hour,
+    built only when asked for; slicing gives a frame of array views.
+    Iterating yields rows, so code written for List[SimulationResult]
+    keeps working.
+    """
+    hour: np.ndarray
+    pv_generation_kw: np.ndarray
+    load_kw: np.ndarray
+    battery_charge_kw: np.ndarray
+    battery_discharge_kw: np.ndarray
+    battery_soc: np.ndarray
+    grid_import_kw: np.ndarray
+    grid_export_kw: np.ndarray
+    energy_surplus_kw: np.ndarray
+    
+    COLUMNS = ('hour', 'pv_generation_kw', 'load_kw', 'battery_charge_kw', 'battery_discharge_kw',
+               'battery_soc', 'grid_import_kw', 'grid_export_kw', 'energy_surplus_kw')
+    
+    @classmethod
+    def from_results(cls, results: List[SimulationResult]) -> 'SimulationFrame':
+        """Build a frame from row-based SimulationResult objects"""
+        count = len(results)
+        return cls(
+            hour=np.fromiter((r.hour for r in results), dtype=np.int64, count=count),
+            **{name: np.fromiter((getattr(r, name) for r in results), dtype=float, count=count)
+               for name in cls.COLUMNS[1:]}
+        )
+    
+    def __len__(self) -> int:
+        return len(self.hour)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SimulationFrame(*(getattr(self, name)[index] for name in self.COLUMNS))
+        return SimulationResult(*(getattr(self, name)[index].item() for name in self.COLUMNS))
+    
+    def __iter__(self):
+        columns = zip(*(getattr(self, name).tolist() for name in self.COLUMNS))
+        return (SimulationResult(*row) for row in columns)
+    
+    def to_results(self) -> List[SimulationResult]:
+        """Convert to a row-based List[SimulationResult]"""
+        return list(self)
+    
+    def astype(self, dtype) -> 'SimulationFrame':
+        """Copy with all kW/SoC columns cast to dtype (e.g. np.float32 for long runs)"""
+        return SimulationFrame(self.hour.astype(np.uint8),
+                               *(getattr(self, name).astype(dtype) for name in self.COLUMNS[1:]))
+
+
+# Anything the visualizer and exporters accept as simulation output
+SimulationResults = Union[SimulationFrame, List[SimulationResult]]
+
+
+def as_frame(results: SimulationResults) -> SimulationFrame:
+    """Accept a SimulationFrame or a List[SimulationResult] and return a frame"""
+    if isinstance(results, SimulationFrame):
+        return results
+    return SimulationFrame.from_results(results)
+
+@dataclass
+class AnnualSimulation:
+    """Results from a full-year (8760-hour) simulation"""
+    hourly: SimulationFrame  # float32 columns, one row per hour of the year
+    month: np.ndarray  # Month (1-12) of each hour
+    monthly_pv_kwh: np.ndarray
+    monthly_load_kwh: np.ndarray
+    monthly_grid_import_kwh: np.ndarray
+    monthly_grid_export_kwh: np.ndarray
+    monthly_surplus_kwh: np.ndarray
+    monthly_unmet_load_kwh: np.ndarray  # Deficit not covered by battery or grid (off-grid only)
+    
+    @property
+    def annual_pv_kwh(self) -> float:
+        return float(self.monthly_pv_kwh.sum())
+    
+    @property
+    def annual_load_kwh(self) -> float:
+        return float(self.monthly_load_kwh.sum())
+    
+    @property
+    def annual_grid_import_kwh(self) -> float:
+        return float(self.monthly_grid_import_kwh.sum())
+    
+    @property
+    def annual_grid_export_kwh(self) -> float:
+        return float(self.monthly_grid_export_kwh.sum())
+    
+    @property
+    def annual_unmet_load_kwh(self) -> float:
+        return float(self.monthly_unmet_load_kwh.sum())
+    
+    @property
+    def self_sufficiency_percent(self) -> float:
+        """Share of annual load covered without grid import (unmet load is not covered)"""
+        load = self.annual_load_kwh
+        covered = load - self.annual_grid_import_kwh - self.annual_unmet_load_kwh
+        return covered / load * 100 if load > 0 else 0.0
+
+@dataclass
+class BatchSimulation:
+    """Results from simulating many candidate systems at once"""
+    pv_capacity_kw: np.ndarray  # (candidates,)
+    battery_capacity_kwh: np.ndarray  # (candidates,)
+    load_kw: np.ndarray  # (hours,) shared by all candidates
+    pv_generation_kw: np.ndarray  # (candidates, hours)
+    battery_charge_kw: np.ndarray
+    battery_discharge_kw: np.ndarray
+    battery_soc: np.ndarray
+    grid_import_kw: np.ndarray
+    grid_export_kw: np.ndarray
+    energy_surplus_kw: np.ndarray
+    unmet_load_kw: np.ndarray  # Deficit not covered by battery or grid (off-grid only)
+    
+    def __len__(self) -> int:
+        return len(self.pv_capacity_kw)
+    
+    @property
+    def grid_import_kwh(self) -> np.ndarray:
+        return self.grid_import_kw.sum(axis=1)
+    
+    @property
+    def grid_export_kwh(self) -> np.ndarray:
+        return self.grid_export_kw.sum(axis=1)
+    
+    @property
+    def unmet_load_kwh(self) -> np.ndarray:
+        return self.unmet_load_kw.sum(axis=1)
+    
+    @property
+    def self_sufficiency_percent(self) -> np.ndarray:
+        """Share of load covered without grid import, per candidate"""
+        total_load = float(self.load_kw.sum())
+        if total_load <= 0:
+            return np.zeros(len(self))
+        covered = total_load - self.grid_import_kwh - self.unmet_load_kwh
+        return covered / total_load * 100
+    
+    def candidate(self, index: int) -> SimulationFrame:
+        """Hourly results of one candidate as a SimulationFrame"""
+        return SimulationFrame(
+            hour=np.arange(len(self.load_kw)) % 24,
+            pv_generation_kw=self.pv_generation_kw[index],
+            load_kw=self.load_kw,
+            battery_charge_kw=self.battery_charge_kw[index],
+            battery_discharge_kw=self.battery_discharge_kw[index],
+            battery_soc=self.battery_soc[index],
+            grid_import_kw=self.grid_import_kw[index],
+            grid_export_kw=self.grid_export_kw[index],
+            energy_surplus_kw=self.energy_surplus_kw[index]
+        )
+
+@dataclass
+class MonteCarloResult:
+    """Percentile bands over many randomized daily scenarios"""
+    scenarios: int
+    percentiles: tuple  # e.g. (10, 50, 90); first axis of every *_bands array
+    grid_import_kwh: np.ndarray  # Daily total per scenario
+    unmet_load_kwh: np.ndarray  # Daily total per scenario
+    grid_import_bands_kw: np.ndarray  # (percentiles, 24)
+    unmet_load_bands_kw: np.ndarray  # (percentiles, 24)
+    battery_soc_bands: np.ndarray  # (percentiles, 24)
+    
+    @property
+    def grid_import_bands_kwh(self) -> np.ndarray:
+        """Daily grid import at each percentile"""
+        return np.percentile(self.grid_import_kwh, self.percentiles)
+    
+    @property
+    def unmet_load_bands_kwh(self) -> np.ndarray:
+        """Daily unmet load at each percentile"""
+        return np.percentile(self.unmet_load_kwh, self.percentiles)
+
 @dataclass
 class FinancialAnalysis:
     """Financial calculations for solar system"""
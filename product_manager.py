@@ -1,202 +1,658 @@
 """
 Product and Cost Management Module
 """
+import copy
 import json
 import os
 import re
-from typing import List, Dict
+import threading
+from bisect import bisect_left
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from models import Product
+from product_search import ProductSearchIndex
+from startup_timing import profiled
 
-class ProductManager:
-    """Manages solar system products and pricing"""
+PRICES_FILE = "product_prices.txt"  # Weekly price list; edits are merged into CATALOG_FILE
+CATALOG_FILE = "product_catalog.json"  # Structured catalog with explicit IDs; the one the app loads
+CATALOG_FORMAT_VERSION = 1
+
+
+class _ThresholdIndex:
+    """
+    Best product among those whose spec value is at least a minimum, in O(log n)
+
+    Products are sorted by value once; a suffix scan records the best-ranked
+    product from each position to the end, so a query is one bisect.
+    """
     
-    def __init__(self):
-        self.products: Dict[str, Product] = {}
-        self.load_default_products()
+    def __init__(self, products: List[Product], value: Callable[[Product], float],
+                 rank: Callable[[Product], tuple]):
+        ordered = sorted(products, key=value)
+        self._values = [value(p) for p in ordered]
+        self._best: List[Product] = [None] * len(ordered)
+        best = None
+        for i in range(len(ordered) - 1, -1, -1):
+            if best is None or rank(ordered[i]) <= rank(best):
+                best = ordered[i]
+            self._best[i] = best
     
-    def load_default_products(self):
-        """Load products from product_prices.txt file"""
-        # Try to load from product_prices.txt
-        prices_file = "product_prices.txt"
-        if os.path.exists(prices_file):
-            self._load_from_file(prices_file)
-        else:
-            # Fallback to empty catalog if file not found
-            print(f"Warning: {prices_file} not found. Product catalog will be empty.")
-    
-    def _parse_price_line(self, line: str) -> tuple:
-        """Parse a line from product_prices.txt"""
-        # Format: "Product Name: $Price"
-        if ':' in line and '$' in line:
-            parts = line.split(':')
-            name = parts[0].strip()
-            price_str = parts[1].strip().replace('$', '').replace(',', '')
-            try:
-                price = float(price_str)
-                return name, price
-            except ValueError:
-                return None, None
-        return None, None
+    def best(self, minimum: float) -> Optional[Product]:
+        i = bisect_left(self._values, minimum)
+        return self._best[i] if i < len(self._best) else None
+
+
+class ProductCatalog:
+    """
+    Parsed product catalog with lookup indexes
+
+    Built once and shared; treat as read-only and use with_products()
+    to derive a changed copy.
+    """
     
-    def _categorize_product(self, name: str, price: float) -> tuple:
-        """Categorize product and extract specifications"""
-        name_lower = name.lower()
+    def __init__(self, products: Iterable[Product] = (), version: int = 0):
+        self.version = version  # Increases each time the price file is reloaded
+        self.products: Dict[str, Product] = {p.product_id: p for p in products}
+        self.by_category: Dict[str, List[Product]] = {}
+        self.by_supplier: Dict[str, List[Product]] = {}
+        for product in self.products.values():
+            self.by_category.setdefault(product.category, []).append(product)
+            self.by_supplier.setdefault(product.supplier, []).append(product)
         
-        # Batteries - Check FIRST before PV panels to avoid misclassification
-        if any(word in name_lower for word in ['battery', 'ah', 'gel', 'lithium']):
-            # Extract capacity
-            if 'kwh' in name_lower:
-                kwh_match = re.search(r'([\d.]+)kwh', name_lower)
-                capacity_kwh = float(kwh_match.group(1)) if kwh_match else 5.0
-            elif 'ah' in name_lower:
-                ah_match = re.search(r'(\d+)ah', name_lower)
-                ah = int(ah_match.group(1)) if ah_match else 100
-                voltage_match = re.search(r'([\d.]+)v', name_lower)
-                voltage = float(voltage_match.group(1)) if voltage_match else 12
-                capacity_kwh = (ah * voltage) / 1000
-            else:
-                capacity_kwh = 5.0
-            
-            # Extract voltage
-            voltage_match = re.search(r'([\d.]+)v', name_lower)
-            voltage = float(voltage_match.group(1)) if voltage_match else 48
-            
-            # Battery type
-            battery_type = "Lithium" if "lithium" in name_lower else "Gel" if "gel" in name_lower else "Lead-Acid"
-            dod = 0.9 if battery_type == "Lithium" else 0.5
-            cycles = 6000 if battery_type == "Lithium" else 1500
-            
-            specs = {"capacity": capacity_kwh, "voltage": voltage, "dod": dod, "cycles": cycles, "type": battery_type}
-            supplier = "Deye" if "deye" in name_lower else "Lvtopsun" if "lvtopsun" in name_lower else "LV"
-            
-            return "battery", specs, supplier, f"{battery_type} battery for energy storage"
+        position = {pid: i for i, pid in enumerate(self.products)}
+        panels = self.by_category.get("pv_panel", [])
+        batteries = self.by_category.get("battery", [])
+        inverters = self.by_category.get("inverter", [])
         
-        # Solar Panels - Now safe to check for lvtopsun since batteries are already filtered
-        elif any(brand in name_lower for brand in ['lvtopsun', 'longi', 'panel']) and 'w' in name_lower:
-            # Extract wattage
-            wattage_match = re.search(r'(\d+)w', name_lower)
-            wattage = int(wattage_match.group(1)) if wattage_match else 400
-            
-            # Determine voltage and efficiency based on wattage
-            voltage = 48 if wattage >= 400 else 24
-            efficiency = 0.22 if wattage >= 500 else 0.21
-            
-            specs = {"power": wattage, "efficiency": efficiency, "voltage": voltage}
-            supplier = "Lvtopsun" if "lvtopsun" in name_lower else "LONGi" if "longi" in name_lower else "Generic"
-            
-            return "pv_panel", specs, supplier, "High efficiency monocrystalline solar panel"
+        self.panels_by_price_per_watt = sorted(panels, key=lambda p: (_price_per_unit(p, "power"), position[p.product_id]))
+        self.batteries_by_price_per_kwh = sorted(batteries, key=lambda b: (_price_per_unit(b, "capacity"), position[b.product_id]))
+        self.inverters_by_price_per_kw = sorted(inverters, key=lambda i: (_price_per_unit(i, "power"), position[i.product_id]))
         
-        # Inverters
-        elif any(brand in name_lower for brand in ['sungrow', 'solis', 'deye', 'luxpower', 'inverter']):
-            # Extract power rating in kW
-            kw_match = re.search(r'(\d+)kw', name_lower)
-            if kw_match:
-                power_kw = int(kw_match.group(1))
+        self._position = position
+        self._panel_index = _ThresholdIndex(
+            panels, lambda p: p.specifications.get("power", 0),
+            lambda p: (_price_per_unit(p, "power"), position[p.product_id]))
+        self._lithium_index = _ThresholdIndex(
+            [b for b in batteries if b.specifications.get("type") == "Lithium"],
+            lambda b: b.specifications.get("capacity", 0),
+            lambda b: (_price_per_unit(b, "capacity"), position[b.product_id]))
+        self._battery_index = _ThresholdIndex(
+            batteries, lambda b: b.specifications.get("capacity", 0), lambda b: (position[b.product_id],))
+        self._inverter_index = _ThresholdIndex(
+            inverters, lambda i: i.specifications.get("power", 0), lambda i: (position[i.product_id],))
+        self._inverter_type_indexes: Dict[str, _ThresholdIndex] = {}
+        self._search_index: Optional[ProductSearchIndex] = None
+    
+    def __len__(self) -> int:
+        return len(self.products)
+    
+    @property
+    def search_index(self) -> ProductSearchIndex:
+        """Fuzzy search index, built on first use"""
+        if self._search_index is None:
+            self._search_index = ProductSearchIndex.from_products(self.products.values())
+        return self._search_index
+    
+    def with_products(self, products: Iterable[Product]) -> 'ProductCatalog':
+        """Copy of this catalog with products added or replaced by ID"""
+        merged = dict(self.products)
+        merged.update((p.product_id, p) for p in products)
+        return ProductCatalog(merged.values(), self.version)
+    
+    def best_panel(self, min_wattage: float) -> Optional[Product]:
+        """Lowest price per watt among panels of at least min_wattage"""
+        return self._panel_index.best(min_wattage)
+    
+    def best_lithium_battery(self, min_capacity_kwh: float) -> Optional[Product]:
+        """Lowest price per kWh among lithium batteries of at least min_capacity_kwh"""
+        return self._lithium_index.best(min_capacity_kwh)
+    
+    def first_battery(self, min_capacity_kwh: float) -> Optional[Product]:
+        """First battery in catalog order with at least min_capacity_kwh"""
+        return self._battery_index.best(min_capacity_kwh)
+    
+    def best_inverter(self, min_power_kw: float, inverter_type: str) -> Optional[Product]:
+        """Lowest price per kW among inverters of at least min_power_kw whose type contains inverter_type"""
+        key = inverter_type.lower()
+        index = self._inverter_type_indexes.get(key)
+        if index is None:
+            position = self._position
+            index = _ThresholdIndex(
+                [i for i in self.by_category.get("inverter", []) if key in i.specifications.get("type", "").lower()],
+                lambda i: i.specifications.get("power", 0),
+                lambda i: (_price_per_unit(i, "power"), position[i.product_id]))
+            self._inverter_type_indexes[key] = index
+        return index.best(min_power_kw)
+    
+    def first_inverter(self, min_power_kw: float) -> Optional[Product]:
+        """First inverter in catalog order with at least min_power_kw"""
+        return self._inverter_index.best(min_power_kw)
+
+
+def _price_per_unit(product: Product, spec: str) -> float:
+    return product.cost / (product.specifications.get(spec, 1) or 1)
+
+
+class CatalogWatcher:
+    """
+    Keeps the catalog for one catalog file current
+
+    check() compares the file's mtime and size with the last load and
+    reloads on change; start() runs check() on a background polling
+    thread. A reload re-parses only lines (or JSON records) that were not
+    in the previous version, keeps the product ID of every product that
+    survives, and replaces the catalog in one reference swap, so readers
+    see either the old or the new version, never a mix.
+
+    A JSON catalog may have a text price list as its source: when the
+    price list is newer, its prices are merged into the catalog, which is
+    written back, so the JSON file stays the one source of truth.
+    """
+    
+    def __init__(self, filepath: str = PRICES_FILE, interval_seconds: float = 5.0,
+                 source: Optional[str] = None):
+        self.filepath = filepath
+        self.source = source
+        self.interval_seconds = interval_seconds
+        self.catalog = ProductCatalog()
+        self._signature = None
+        self._parsed: Dict[str, Optional[tuple]] = {}  # line -> (name, price, category, specs, supplier, notes)
+        self._ids: Dict[Tuple[str, int], str] = {}  # (name, occurrence) -> product ID
+        self._next_id = 1
+        self._records: Dict[str, Tuple[dict, Product]] = {}  # product ID -> (JSON record, product)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def version(self) -> int:
+        return self.catalog.version
+    
+    def _stat_signature(self) -> Optional[tuple]:
+        """(mtime, size) of the catalog and its source, None if neither exists"""
+        signature = tuple(_file_signature(path) for path in (self.filepath, self.source) if path)
+        return signature if any(signature) else None
+    
+    def check(self) -> bool:
+        """Reload if the file changed since the last load; True if a new version was swapped in"""
+        signature = self._stat_signature()
+        if signature is None or signature == self._signature:
+            return False
+        with self._lock:
+            if signature == self._signature:
+                return False
+            self._reload(signature)
+            return True
+    
+    def _source_is_newer(self, signature: tuple) -> bool:
+        if len(signature) < 2 or signature[1] is None:
+            return False
+        return signature[0] is None or signature[1][0] > signature[0][0]
+    
+    @profiled()
+    def _reload(self, signature: tuple):
+        try:
+            if self._source_is_newer(signature):
+                products = self._merge_source()
+                signature = self._stat_signature()
+            elif self.filepath.endswith('.json'):
+                products = self._read_structured()
             else:
-                # Try to extract from model number (e.g., SG33CX = 33kW)
-                model_match = re.search(r'sg(\d+)cx', name_lower)
-                if model_match:
-                    power_kw = int(model_match.group(1))
-                else:
-                    power_kw = 5  # Default
-            
-            # Determine inverter type and specs
-            inv_type = "Hybrid" if "hybrid" in name_lower else "On-Grid" if any(x in name_lower for x in ['ongrid', 'sungrow', 'solis']) else "Off-Grid"
-            voltage = 48 if "low voltage" not in name_lower else 380 if "high voltage" in name_lower else 48
-            efficiency = 0.98 if "sungrow" in name_lower else 0.97
-            
-            specs = {"power": power_kw, "efficiency": efficiency, "voltage": voltage, "type": inv_type}
-            supplier = "Sungrow" if "sungrow" in name_lower else "Solis" if "solis" in name_lower else "Deye" if "deye" in name_lower else "Luxpower" if "luxpower" in name_lower else "LV"
-            
-            return "inverter", specs, supplier, f"{inv_type} inverter for solar systems"
-        
-        # Controllers
-        elif "controller" in name_lower:
-            specs = {"capacity": 100, "voltage": 51.2}
-            supplier = "Deye" if "deye" in name_lower else "Lvtopsun" if "lvtopsun" in name_lower else "Generic"
-            return "controller", specs, supplier, "Battery management controller"
+                products = self._read_price_lines(self.filepath)
+        except Exception as e:
+            print(f"Error loading products from {self.filepath}: {e}")
+            return
         
-        # Cables
-        elif "cable" in name_lower:
-            mm_match = re.search(r'(\d+)mm', name_lower)
-            mm_size = int(mm_match.group(1)) if mm_match else 4
-            specs = {"size_mm": mm_size, "length_m": 100}
-            return "cable", specs, "LV", "PV cable for solar installations"
+        self._signature = signature
+        version = self.catalog.version + 1
+        self.catalog = ProductCatalog(products, version)
+        print(f"Loaded {len(products)} products from {self.filepath} (catalog version {version})")
+    
+    def _read_structured(self) -> List[Product]:
+        """JSON catalog; records identical to the previous load keep their Product objects"""
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            records = json.load(f)["products"]
+        products = []
+        seen = {}
+        for record in records:
+            previous = self._records.get(record["id"])
+            product = previous[1] if previous is not None and previous[0] == record else _product_from_record(record)
+            if product.product_id in seen:
+                raise ValueError("duplicate product IDs")
+            seen[product.product_id] = (record, product)
+            products.append(product)
+        self._records = seen
+        return products
+    
+    def _merge_source(self) -> List[Product]:
+        """
+        Merge the newer text price list into the JSON catalog and write it back
+
+        The price list only sets prices. A line whose name matches a catalog
+        product updates that product's cost and nothing else, so curated
+        categories, specifications and notes survive; only names not yet in
+        the catalog are categorized from the name, as new products. Products
+        that are not in the price list stay in the catalog (remove them
+        from the JSON file).
+        """
+        current = list(self.catalog.products.values())
+        if not current and os.path.exists(self.filepath):
+            current = self._read_structured()
+        # IDs come from the catalog, which may have been edited since the last merge
+        ids: Dict[Tuple[str, int], str] = {}
+        occurrences: Dict[str, int] = {}
+        for product in current:
+            key = (product.name, occurrences.get(product.name, 0))
+            occurrences[product.name] = key[1] + 1
+            ids[key] = product.product_id
+        numbers = [int(m.group()) for m in (re.search(r'\d+$', p.product_id) for p in current) if m]
+        self._next_id = max(max(numbers, default=0) + 1, self._next_id)
         
-        # Mounting accessories
-        elif any(word in name_lower for word in ['rail', 'clamp', 'feet', 'connector']):
-            specs = {"type": "mounting"}
-            return "mounting", specs, "Generic", "Mounting hardware for solar panels"
+        merged = {p.product_id: p for p in current}
+        occurrences = {}
+        with open(self.source, 'r', encoding='utf-8') as f:
+            for line in f:
+                name, price = _parse_price_line(line.strip())
+                if not (name and price):
+                    continue
+                key = (name, occurrences.get(name, 0))
+                occurrences[name] = key[1] + 1
+                existing = merged.get(ids.get(key))
+                if existing is not None:
+                    if existing.cost != price:
+                        merged[existing.product_id] = replace(existing, cost=price)
+                    continue
+                entry = (name, price) + _categorize_product(name, price)
+                product = _price_list_product(f"{entry[2][:3].upper()}{self._next_id:03d}", entry)
+                self._next_id += 1
+                ids[key] = product.product_id
+                merged[product.product_id] = product
         
-        # Smart Meters and Monitoring
-        elif any(word in name_lower for word in ['meter', 'wifi', 'winet', 'eyema', 'com100e']):
-            specs = {"type": "monitoring"}
-            supplier = "Weidmuller" if "weidmuller" in name_lower else "Acrel" if "acrel" in name_lower else "Generic"
-            return "monitoring", specs, supplier, "Smart meter for energy monitoring"
+        products = list(merged.values())
+        self._ids = ids
+        self._records = {p.product_id: (_catalog_record(p), p) for p in products}
+        try:
+            save_catalog(ProductCatalog(products), self.filepath)
+        except OSError as e:
+            print(f"Could not write {self.filepath}: {e}")
+        return products
+    
+    def _read_price_lines(self, filepath: str) -> List[Product]:
+        """Legacy "Name: $Price" text format, categorized by name heuristics"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
         
-        # Battery Racks
-        elif "rack" in name_lower:
-            capacity_match = re.search(r'(\d+)\+1', name)
-            capacity = int(capacity_match.group(1)) if capacity_match else 8
-            specs = {"capacity": capacity, "type": "battery_rack"}
-            return "accessory", specs, "Deye", f"Battery rack for {capacity}+1 units"
+        parsed = {}
+        for line in lines:
+            if line and line not in parsed:
+                parsed[line] = self._parsed[line] if line in self._parsed else _parse_product_line(line)
         
-        # Water Pumps
-        elif any(code in name for code in ['DPC', 'DSC', 'DCPM']):
-            wattage_match = re.search(r'(\d+)w', name_lower)
-            wattage = int(wattage_match.group(1)) if wattage_match else 1000
-            specs = {"power": wattage, "type": "dc_pump"}
-            return "pump", specs, "DC Solar", "DC solar water pump"
+        products = []
+        ids = {}
+        occurrences: Dict[str, int] = {}
+        for line in lines:
+            entry = parsed.get(line)
+            if not entry:
+                continue
+            name, category = entry[0], entry[2]
+            key = (name, occurrences.get(name, 0))
+            occurrences[name] = key[1] + 1
+            product_id = self._ids.get(key)
+            if product_id is None:
+                product_id = f"{category[:3].upper()}{self._next_id:03d}"
+                self._next_id += 1
+            ids[key] = product_id
+            products.append(_price_list_product(product_id, entry))
         
-        # Default
-        else:
-            specs = {}
-            return "accessory", specs, "Generic", "Solar system accessory"
+        self._parsed = parsed
+        self._ids = ids
+        return products
+    
+    def start(self):
+        """Poll the file every interval_seconds on a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name="catalog-watcher", daemon=True)
+        self._thread.start()
     
-    def _load_from_file(self, filepath: str):
-        """Load products from the price file"""
+    def stop(self):
+        self._stop.set()
+    
+    def _poll(self):
+        while not self._stop.wait(self.interval_seconds):
+            self.check()
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def default_catalog_file() -> str:
+    """The structured catalog the app loads (merged from product_prices.txt when that is newer)"""
+    return CATALOG_FILE
+
+
+def _price_list_product(product_id: str, entry: tuple) -> Product:
+    """Product from a parsed price line (name, price, category, specs, supplier, notes)"""
+    name, price, category, specs, supplier, notes = entry
+    # Determine warranty based on category
+    warranty_years = 25 if category == "pv_panel" else 10 if category == "battery" else 5 if category == "inverter" else 2
+    return Product(
+        product_id=product_id,
+        name=name,
+        category=category,
+        specifications=dict(specs),
+        cost=price,
+        warranty_years=warranty_years,
+        supplier=supplier,
+        notes=notes
+    )
+
+
+def _product_from_record(record: dict) -> Product:
+    """Product from a JSON catalog record; IDs, categories and specs are explicit, nothing is inferred"""
+    return Product(
+        product_id=record["id"],
+        name=record["name"],
+        category=record["category"],
+        specifications=record.get("specifications", {}),
+        cost=float(record["cost"]),
+        currency=record.get("currency", "USD"),
+        warranty_years=record.get("warranty_years", 0),
+        supplier=record.get("supplier", ""),
+        notes=record.get("notes", "")
+    )
+
+
+def _catalog_record(p: Product) -> dict:
+    return {
+        "id": p.product_id,
+        "name": p.name,
+        "category": p.category,
+        "cost": p.cost,
+        "currency": p.currency,
+        "warranty_years": p.warranty_years,
+        "supplier": p.supplier,
+        "notes": p.notes,
+        "specifications": p.specifications,
+    }
+
+
+def save_catalog(catalog: ProductCatalog, filepath: str = CATALOG_FILE):
+    """Write a catalog in the structured JSON format, replacing the file in one step (unchanged files are left alone)"""
+    records = [_catalog_record(p) for p in catalog.products.values()]
+    text = json.dumps({"format": CATALOG_FORMAT_VERSION, "products": records}, indent=2, ensure_ascii=False) + "\n"
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    tmp = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, filepath)
+
+
+# One watcher per price file, shared by every ProductManager in the process
+_WATCHERS: Dict[str, CatalogWatcher] = {}
+_WATCHERS_LOCK = threading.Lock()
+
+
+def catalog_watcher(filepath: Optional[str] = None) -> CatalogWatcher:
+    """
+    Process-wide watcher for a catalog file (default_catalog_file() if not given)
+
+    A JSON catalog is kept in step with a product_prices.txt next to it.
+    """
+    path = os.path.abspath(filepath or default_catalog_file())
+    with _WATCHERS_LOCK:
+        watcher = _WATCHERS.get(path)
+        if watcher is None:
+            source = os.path.join(os.path.dirname(path), PRICES_FILE) if path.endswith('.json') else None
+            watcher = _WATCHERS[path] = CatalogWatcher(path, source=source)
+    return watcher
+
+
+def load_catalog(filepath: Optional[str] = None) -> ProductCatalog:
+    """
+    Current catalog for a catalog file, parsed at most once per process per file version
+
+    Accepts the structured JSON format and the legacy text format.
+    The file is re-parsed only when its modification time or size changes.
+    """
+    watcher = catalog_watcher(filepath)
+    watcher.check()
+    return watcher.catalog
+
+
+def specifications_from_name(name: str) -> dict:
+    """Specs (power, capacity, ...) read from a product name the way price-list products are categorized"""
+    return dict(_categorize_product(name, 0.0)[1])
+
+
+def _parse_product_line(line: str) -> Optional[tuple]:
+    """(name, price, category, specs, supplier, notes) for a price line, or None"""
+    name, price = _parse_price_line(line)
+    if name and price:
+        return (name, price) + _categorize_product(name, price)
+    return None
+
+
+def _parse_price_line(line: str) -> tuple:
+    """Parse a line from product_prices.txt"""
+    # Format: "Product Name: $Price"
+    if ':' in line and '$' in line:
+        parts = line.split(':')
+        name = parts[0].strip()
+        price_str = parts[1].strip().replace('$', '').replace(',', '')
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            product_id_counter = 1
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                name, price = self._parse_price_line(line)
-                if name and price:
-                    category, specs, supplier, notes = self._categorize_product(name, price)
-                    
-                    # Generate product ID
-                    category_prefix = category[:3].upper()
-                    product_id = f"{category_prefix}{product_id_counter:03d}"
-                    product_id_counter += 1
-                    
-                    # Determine warranty based on category
-                    warranty_years = 25 if category == "pv_panel" else 10 if category == "battery" else 5 if category == "inverter" else 2
-                    
-                    product = Product(
-                        product_id=product_id,
-                        name=name,
-                        category=category,
-                        specifications=specs,
-                        cost=price,
-                        warranty_years=warranty_years,
-                        supplier=supplier,
-                        notes=notes
-                    )
-                    
-                    self.products[product_id] = product
-            
-            print(f"Loaded {len(self.products)} products from {filepath}")
-        except Exception as e:
-            print(f"Error loading products from {filepath}: {e}")
+            price = float(price_str)
+            return name, price
+        except ValueError:
+            return None, None
+    return None, None
+
+
+def _categorize_product(name: str, price: float) -> tuple:
+    """Categorize product and extract specifications"""
+    name_lower = name.lower()
+
+    # Batteries - Check FIRST before PV panels to avoid misclassification
+    if any(word in name_lower for word in ['battery', 'ah', 'gel', 'lithium']):
+        # Extract capacity
+        if 'kwh' in name_lower:
+            kwh_match = re.search(r'([\d.]+)kwh', name_lower)
+            capacity_kwh = float(kwh_match.group(1)) if kwh_match else 5.0
+        elif 'ah' in name_lower:
+            ah_match = re.search(r'(\d+)ah', name_lower)
+            ah = int(ah_match.group(1)) if ah_match else 100
+            voltage_match = re.search(r'([\d.]+)v', name_lower)
+            voltage = float(voltage_match.group(1)) if voltage_match else 12
+            capacity_kwh = (ah * voltage) / 1000
+        else:
+            capacity_kwh = 5.0
+
+        # Extract voltage
+        voltage_match = re.search(r'([\d.]+)v', name_lower)
+        voltage = float(voltage_match.group(1)) if voltage_match else 48
+
+        # Battery type
+        battery_type = "Lithium" if "lithium" in name_lower else "Gel" if "gel" in name_lower else "Lead-Acid"
+        dod = 0.9 if battery_type == "Lithium" else 0.5
+        cycles = 6000 if battery_type == "Lithium" else 1500
+
+        specs = {"capacity": capacity_kwh, "voltage": voltage, "dod": dod, "cycles": cycles, "type": battery_type}
+        supplier = "Deye" if "deye" in name_lower else "Lvtopsun" if "lvtopsun" in name_lower else "LV"
+
+        return "battery", specs, supplier, f"{battery_type} battery for energy storage"
+
+    # Solar Panels - Now safe to check for lvtopsun since batteries are already filtered
+    elif any(brand in name_lower for brand in ['lvtopsun', 'longi', 'panel']) and 'w' in name_lower:
+        # Extract wattage
+        wattage_match = re.search(r'(\d+)w', name_lower)
+        wattage = int(wattage_match.group(1)) if wattage_match else 400
+
+        # Determine voltage and efficiency based on wattage
+        voltage = 48 if wattage >= 400 else 24
+        efficiency = 0.22 if wattage >= 500 else 0.21
+
+        specs = {"power": wattage, "efficiency": efficiency, "voltage": voltage}
+        supplier = "Lvtopsun" if "lvtopsun" in name_lower else "LONGi" if "longi" in name_lower else "Generic"
+
+        return "pv_panel", specs, supplier, "High efficiency monocrystalline solar panel"
+
+    # Inverters
+    elif any(brand in name_lower for brand in ['sungrow', 'solis', 'deye', 'luxpower', 'inverter']):
+        # Extract power rating in kW
+        kw_match = re.search(r'(\d+)kw', name_lower)
+        if kw_match:
+            power_kw = int(kw_match.group(1))
+        else:
+            # Try to extract from model number (e.g., SG33CX = 33kW)
+            model_match = re.search(r'sg(\d+)cx', name_lower)
+            if model_match:
+                power_kw = int(model_match.group(1))
+            else:
+                power_kw = 5  # Default
+
+        # Determine inverter type and specs
+        inv_type = "Hybrid" if "hybrid" in name_lower else "On-Grid" if any(x in name_lower for x in ['ongrid', 'sungrow', 'solis']) else "Off-Grid"
+        voltage = 48 if "low voltage" not in name_lower else 380 if "high voltage" in name_lower else 48
+        efficiency = 0.98 if "sungrow" in name_lower else 0.97
+
+        specs = {"power": power_kw, "efficiency": efficiency, "voltage": voltage, "type": inv_type}
+        supplier = "Sungrow" if "sungrow" in name_lower else "Solis" if "solis" in name_lower else "Deye" if "deye" in name_lower else "Luxpower" if "luxpower" in name_lower else "LV"
+
+        return "inverter", specs, supplier, f"{inv_type} inverter for solar systems"
+
+    # Controllers
+    elif "controller" in name_lower:
+        specs = {"capacity": 100, "voltage": 51.2}
+        supplier = "Deye" if "deye" in name_lower else "Lvtopsun" if "lvtopsun" in name_lower else "Generic"
+        return "controller", specs, supplier, "Battery management controller"
+
+    # Cables
+    elif "cable" in name_lower:
+        mm_match = re.search(r'(\d+)mm', name_lower)
+        mm_size = int(mm_match.group(1)) if mm_match else 4
+        specs = {"size_mm": mm_size, "length_m": 100}
+        return "cable", specs, "LV", "PV cable for solar installations"
+
+    # Mounting accessories
+    elif any(word in name_lower for word in ['rail', 'clamp', 'feet', 'connector']):
+        specs = {"type": "mounting"}
+        return "mounting", specs, "Generic", "Mounting hardware for solar panels"
+
+    # Smart Meters and Monitoring
+    elif any(word in name_lower for word in ['meter', 'wifi', 'winet', 'eyema', 'com100e']):
+        specs = {"type": "monitoring"}
+        supplier = "Weidmuller" if "weidmuller" in name_lower else "Acrel" if "acrel" in name_lower else "Generic"
+        return "monitoring", specs, supplier, "Smart meter for energy monitoring"
+
+    # Battery Racks
+    elif "rack" in name_lower:
+        capacity_match = re.search(r'(\d+)\+1', name)
+        capacity = int(capacity_match.group(1)) if capacity_match else 8
+        specs = {"capacity": capacity, "type": "battery_rack"}
+        return "accessory", specs, "Deye", f"Battery rack for {capacity}+1 units"
+
+    # Water Pumps
+    elif any(code in name for code in ['DPC', 'DSC', 'DCPM']):
+        wattage_match = re.search(r'(\d+)w', name_lower)
+        wattage = int(wattage_match.group(1)) if wattage_match else 1000
+        specs = {"power": wattage, "type": "dc_pump"}
+        return "pump", specs, "DC Solar", "DC solar water pump"
+
+    # Default
+    else:
+        specs = {}
+        return "accessory", specs, "Generic", "Solar system accessory"
+
+
+class ProductManager:
+    """Manages solar system products and pricing"""
+    
+    def __init__(self, prices_file: Optional[str] = None):
+        self.prices_file = prices_file or default_catalog_file()
+        self._watcher: Optional[CatalogWatcher] = None
+        self._empty = ProductCatalog()
+        self._edits: Dict[str, Product] = {}  # Local additions and price changes, by product ID
+        self._merged: Optional[Tuple[ProductCatalog, ProductCatalog]] = None  # (base, base + edits)
+        self.load_default_products()
+    
+    @property
+    def catalog(self) -> ProductCatalog:
+        """Latest file catalog with this manager's local edits applied"""
+        base = self._watcher.catalog if self._watcher else self._empty
+        if not self._edits:
+            return base
+        if self._merged is None or self._merged[0] is not base:
+            self._merged = (base, base.with_products(self._edits.values()))
+        return self._merged[1]
+    
+    @property
+    def catalog_version(self) -> int:
+        """Catalog version; changes when product_catalog.json or product_prices.txt is edited"""
+        return self.catalog.version
+    
+    @property
+    def products(self) -> Dict[str, Product]:
+        """All products by ID (read-only view of the shared catalog)"""
+        return self.catalog.products
+    
+    def load_default_products(self):
+        """Load products from product_catalog.json, merging in a newer product_prices.txt"""
+        watcher = catalog_watcher(self.prices_file)
+        if watcher.source and os.path.exists(watcher.source) or os.path.exists(self.prices_file):
+            self._watcher = watcher
+            self._watcher.check()
+        else:
+            # Fallback to empty catalog if file not found
+            print(f"Warning: {self.prices_file} not found. Product catalog will be empty.")
+    
+    def watch(self, interval_seconds: float = 5.0):
+        """Reload the catalog in the background whenever it or product_prices.txt changes"""
+        if self._watcher:
+            self._watcher.interval_seconds = interval_seconds
+            self._watcher.start()
+    
+    def _parse_price_line(self, line: str) -> tuple:
+        """Parse a line from product_prices.txt"""
+        return _parse_price_line(line)
+    
+    def _categorize_product(self, name: str, price: float) -> tuple:
+        """Categorize product and extract specifications"""
+        return _categorize_product(name, price)
+    
+    def overlay(self) -> 'ProductManager':
+        """
+        Session view that shares this manager's catalog
+
+        Edits on the view (add_product, update_price) are kept on the view
+        only and re-applied on top of each new file version; the shared
+        catalog is never modified.
+        """
+        view = copy.copy(self)
+        view._edits = dict(self._edits)
+        view._merged = None
+        return view
     
     def add_product(self, product: Product):
         """Add a new product to the catalog"""
-        self.products[product.product_id] = product
+        self._edits[product.product_id] = product
+    
+    def update_price(self, product_id: str, cost: float):
+        """Change a product's price"""
+        product = self.get_product(product_id)
+        if product is None:
+            raise KeyError(f"Unknown product: {product_id}")
+        self._edits[product_id] = replace(product, cost=cost)
     
     def get_product(self, product_id: str) -> Product:
         """Get product by ID"""
@@ -204,7 +660,21 @@ class ProductManager:
     
     def get_products_by_category(self, category: str) -> List[Product]:
         """Get all products in a category"""
-        return [p for p in self.products.values() if p.category == category]
+        return list(self.catalog.by_category.get(category, ()))
+    
+    @profiled()
+    def search(self, query: str, limit: Optional[int] = None) -> List[Product]:
+        """
+        Ranked fuzzy search, e.g. "sg33cx", "51.2v100ah category:battery" or "power>=500"
+
+        See product_search for the query syntax.
+        """
+        catalog = self.catalog
+        return [catalog.products[pid] for pid in catalog.search_index.search(query, limit)]
+    
+    def get_products_by_supplier(self, supplier: str) -> List[Product]:
+        """Get all products from a supplier"""
+        return list(self.catalog.by_supplier.get(supplier, ()))
     
     def calculate_system_cost(self, pv_id: str, pv_quantity: int, 
                             battery_id: str, inverter_id: str,
@@ -311,41 +781,41 @@ Thank you for considering solar energy!
     
     def get_recommended_panel(self, min_wattage: int = 400) -> Product:
         """Get a recommended solar panel based on minimum wattage"""
-        panels = self.get_products_by_category("pv_panel")
-        # Filter panels by minimum wattage and sort by best value (price per watt)
-        suitable = [p for p in panels if p.specifications.get("power", 0) >= min_wattage]
-        if suitable:
-            # Sort by price per watt (lower is better)
-            suitable.sort(key=lambda p: p.cost / p.specifications.get("power", 1))
-            return suitable[0]
+        # Best value (lowest price per watt) among panels of at least min_wattage
+        best = self.catalog.best_panel(min_wattage)
+        if best:
+            return best
         # Fallback to any panel
+        panels = self.catalog.by_category.get("pv_panel")
         return panels[0] if panels else None
     
     def get_recommended_battery(self, min_capacity_kwh: float = 5.0) -> Product:
         """Get a recommended battery based on minimum capacity"""
-        batteries = self.get_products_by_category("battery")
-        # Filter by lithium batteries first (better for solar), then by capacity
-        lithium = [b for b in batteries if b.specifications.get("type") == "Lithium" 
-                   and b.specifications.get("capacity", 0) >= min_capacity_kwh]
-        if lithium:
-            # Sort by price per kWh
-            lithium.sort(key=lambda b: b.cost / b.specifications.get("capacity", 1))
-            return lithium[0]
+        # Lithium batteries first (better for solar), by price per kWh
+        best = self.catalog.best_lithium_battery(min_capacity_kwh)
+        if best:
+            return best
         # Fallback to any battery meeting capacity
-        suitable = [b for b in batteries if b.specifications.get("capacity", 0) >= min_capacity_kwh]
-        return suitable[0] if suitable else (batteries[0] if batteries else None)
+        suitable = self.catalog.first_battery(min_capacity_kwh)
+        batteries = self.catalog.by_category.get("battery")
+        return suitable if suitable else (batteries[0] if batteries else None)
     
     def get_recommended_inverter(self, min_power_kw: float = 5.0, inverter_type: str = "Hybrid") -> Product:
         """Get a recommended inverter based on minimum power and type"""
-        inverters = self.get_products_by_category("inverter")
-        # Filter by type and power
-        suitable = [inv for inv in inverters 
-                    if inv.specifications.get("power", 0) >= min_power_kw
-                    and inverter_type.lower() in inv.specifications.get("type", "").lower()]
-        if suitable:
-            # Sort by price per kW
-            suitable.sort(key=lambda inv: inv.cost / inv.specifications.get("power", 1))
-            return suitable[0]
+        # Lowest price per kW among inverters of the type and power
+        best = self.catalog.best_inverter(min_power_kw, inverter_type)
+        if best:
+            return best
         # Fallback to any inverter meeting power requirement
-        any_suitable = [inv for inv in inverters if inv.specifications.get("power", 0) >= min_power_kw]
-        return any_suitable[0] if any_suitable else (inverters[0] if inverters else None)
+        any_suitable = self.catalog.first_inverter(min_power_kw)
+        inverters = self.catalog.by_category.get("inverter")
+        return any_suitable if any_suitable else (inverters[0] if inverters else None)
+
+
+if __name__ == "__main__":
+    # Convert the legacy text price list to the structured catalog, keeping current IDs
+    import sys
+    source = sys.argv[1] if len(sys.argv) > 1 else PRICES_FILE
+    target = sys.argv[2] if len(sys.argv) > 2 else CATALOG_FILE
+    save_catalog(load_catalog(source), target)
+    print(f"Wrote {target}")
@@ -0,0 +1,165 @@
+"""
+Fuzzy Product Search Index
+Trigram index over product names, suppliers and spec values, shared by the web app and desktop app
+
+Pure Python (no NumPy) so the desktop app can use it as-is.
+
+Query syntax:
+    sg33cx                free text, typo tolerant ("sg33xc" still matches)
+    sg3                   a term also matches words it starts
+    category:battery      field contains value
+    power>=500            numeric comparison (>=, <=, >, <, =) on a spec or price
+"""
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+_TOKEN = re.compile(r"[a-z0-9.]+")
+_FILTER = re.compile(r"^(\w+)(>=|<=|>|<|=|:)(.+)$")
+
+# Share of a term's trigrams a field token must contain to count as a match
+MIN_TERM_SIMILARITY = 0.45
+
+_COMPARE = {
+    '>=': lambda a, b: a >= b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '<': lambda a, b: a < b,
+    '=': lambda a, b: a == b,
+}
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(str(text).lower())
+
+
+def _trigrams(token: str, closed: bool = True) -> set:
+    """Trigrams of a space-padded token; closed=False leaves the end open, for a term that may be a prefix"""
+    padded = f" {token} " if closed else f" {token}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ProductSearchIndex:
+    """
+    Prebuilt trigram/token index returning ranked keys for a query
+
+    Each entry is (key, texts, attributes): texts are searched fuzzily,
+    attributes answer field filters (numbers for comparisons, strings
+    for field:value).
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, Iterable[str], Dict[str, object]]]):
+        self.keys: List[Hashable] = []
+        self._attributes: List[Dict[str, object]] = []
+        self._token_ids: Dict[str, int] = {}
+        self._token_grams: List[set] = []
+        self._token_docs: List[List[int]] = []
+        self._gram_tokens: Dict[str, List[int]] = defaultdict(list)
+
+        for doc, (key, texts, attributes) in enumerate(entries):
+            self.keys.append(key)
+            self._attributes.append({k.lower(): v for k, v in attributes.items()})
+            for token in {t for text in texts for t in _tokens(text)}:
+                token_id = self._token_ids.get(token)
+                if token_id is None:
+                    token_id = self._token_ids[token] = len(self._token_grams)
+                    grams = _trigrams(token)
+                    self._token_grams.append(grams)
+                    self._token_docs.append([])
+                    for gram in grams:
+                        self._gram_tokens[gram].append(token_id)
+                self._token_docs[token_id].append(doc)
+
+    @classmethod
+    def from_products(cls, products: Iterable) -> 'ProductSearchIndex':
+        """Index Product objects by product_id (name, supplier, category and spec values)"""
+        return cls(
+            (p.product_id,
+             [p.name, p.supplier, p.category, p.product_id] + [str(v) for v in p.specifications.values()],
+             dict(p.specifications, category=p.category, supplier=p.supplier, name=p.name,
+                  id=p.product_id, price=p.cost, cost=p.cost))
+            for p in products
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _term_scores(self, term: str) -> Dict[int, float]:
+        """Best similarity (0-1) of term against any token of each document"""
+        scores: Dict[int, float] = {}
+        exact = self._token_ids.get(term)
+        if exact is not None:
+            for doc in self._token_docs[exact]:
+                scores[doc] = 1.0
+
+        grams = _trigrams(term, closed=False)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for token_id in self._gram_tokens.get(gram, ()):
+                shared[token_id] += 1
+        for token_id, count in shared.items():
+            token_grams = self._token_grams[token_id]
+            # Dice coefficient, boosted when the term is a prefix/substring of a longer code
+            similarity = 2 * count / (len(grams) + len(token_grams))
+            if count == len(grams):
+                similarity = max(similarity, 0.9)
+            if similarity < MIN_TERM_SIMILARITY:
+                continue
+            for doc in self._token_docs[token_id]:
+                if similarity > scores.get(doc, 0.0):
+                    scores[doc] = similarity
+
+        if not scores:
+            # Too short for a trigram ("s"), or found only inside a longer token
+            for token, token_id in self._token_ids.items():
+                if term in token:
+                    similarity = 0.9 if token.startswith(term) else MIN_TERM_SIMILARITY
+                    for doc in self._token_docs[token_id]:
+                        if similarity > scores.get(doc, 0.0):
+                            scores[doc] = similarity
+        return scores
+
+    def _passes(self, doc: int, filters: List[Tuple[str, str, str]]) -> bool:
+        attributes = self._attributes[doc]
+        for field, op, value in filters:
+            actual = attributes.get(field)
+            if actual is None:
+                return False
+            if op == ':':
+                if value not in str(actual).lower():
+                    return False
+                continue
+            try:
+                if not _COMPARE[op](float(actual), float(value)):
+                    return False
+            except (TypeError, ValueError):
+                return False
+        return True
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Hashable]:
+        """Keys matching every term and filter in query, best match first"""
+        filters, terms = [], []
+        for part in query.lower().split():
+            match = _FILTER.match(part)
+            if match:
+                filters.append(match.groups())
+            else:
+                terms.extend(_tokens(part))
+
+        if terms:
+            totals: Optional[Dict[int, float]] = None
+            for term in terms:
+                scores = self._term_scores(term)
+                if totals is None:
+                    totals = scores
+                else:
+                    totals = {doc: totals[doc] + s for doc, s in scores.items() if doc in totals}
+                if not totals:
+                    return []
+            ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+            docs = [doc for doc, _ in ranked]
+        else:
+            docs = range(len(self.keys))
+
+        results = [self.keys[doc] for doc in docs if not filters or self._passes(doc, filters)]
+        return results[:limit] if limit is not None else results
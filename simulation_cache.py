@@ -0,0 +1,102 @@
+"""
+Process-wide Simulation Result Cache
+Shared by all Streamlit sessions so identical designs are simulated once per server
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, fields, is_dataclass
+from typing import Any, Callable, Hashable, List
+import numpy as np
+from models import Device, SystemConfiguration
+from load_profiles import device_params
+
+
+def config_fingerprint(config: SystemConfiguration, devices: List[Device], seed: int, *extra: Hashable) -> str:
+    """
+    Stable hash of a system configuration, device list, seed and any extra parameters
+
+    Equal designs give equal fingerprints across sessions and server restarts.
+    """
+    config_fields = asdict(config)
+    config_fields.pop('devices')
+    payload = (
+        sorted(config_fields.items(), key=lambda item: item[0]),
+        [asdict(d) for d in config.devices],
+        [asdict(d) for d in devices],
+        device_params(devices),
+        seed,
+        extra,
+    )
+    return hashlib.sha1(repr(payload).encode()).hexdigest()
+
+
+def read_only(value: Any) -> Any:
+    """Mark the NumPy arrays in value (an array, or a dataclass of them, nested) read-only; returns value"""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif is_dataclass(value) and not isinstance(value, type):
+        for f in fields(value):
+            read_only(getattr(value, f.name))
+    return value
+
+
+class SimulationCache:
+    """Thread-safe LRU cache with a size bound and per-entry time-to-live"""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: Any):
+        """Store value, evicting the least recently used entries beyond max_entries"""
+        read_only(value)  # Shared between sessions, must not be modified
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        Values are shared between sessions and must be treated as read-only.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# One cache per server process, shared by every session
+SIMULATION_CACHE = SimulationCache()
@@ -0,0 +1,256 @@
+"""
+Startup and Rerun Timing
+Measures import time, first paint and per-rerun cost of the Streamlit app
+
+Set KHSOLAR_TIMING=1 to print one timing line per script run, or run
+`python startup_timing.py` for a cold-import report of the app's modules.
+
+Set KHSOLAR_PROFILE=1 to profile every rerun by section: the spans between
+RunTimer marks, section() blocks and @profiled functions (SolarCalculator,
+SolarVisualizer and ReportExporter methods). Each run is appended to a
+rolling JSONL log (KHSOLAR_PROFILE_LOG, default profile_log.jsonl); run
+`python startup_timing.py --profile` for per-section percentiles. Admins
+see the same numbers in a sidebar overlay.
+"""
+import functools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+# Set when the app first imports this module, i.e. at the start of the first script run
+PROCESS_START = time.perf_counter()
+
+_lock = threading.Lock()
+_first_paint_seconds: Optional[float] = None
+_rerun_seconds: Deque[float] = deque(maxlen=200)
+
+PROFILE_LOG = os.environ.get("KHSOLAR_PROFILE_LOG", "profile_log.jsonl")
+# The log keeps the most recent runs; it is trimmed when it reaches twice this
+PROFILE_LOG_RUNS = 2000
+PERCENTILES = (50, 90, 99)
+
+# Profiled runs of this process, newest last: {"ts", "total_ms", "sections": {label: ms}}
+_recent_runs: Deque[dict] = deque(maxlen=500)
+_log_lines: Optional[int] = None
+# RunTimer of the script run executing in this thread, when it is being profiled
+_active = threading.local()
+
+
+def profiling_enabled() -> bool:
+    """Whether KHSOLAR_PROFILE asks for per-section profiling"""
+    return bool(os.environ.get("KHSOLAR_PROFILE"))
+
+
+class RunTimer:
+    """Time one execution of the app script with named marks and, when profiling, sections"""
+
+    def __init__(self, profile: Optional[bool] = None):
+        self.start = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.profile = profiling_enabled() if profile is None else profile
+        self.sections: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        # Streamlit runs each script run in its own thread; a stale timer must not leak in
+        _active.timer = self if self.profile else None
+
+    def mark(self, label: str):
+        """Record seconds since the script run started; profiled as the span since the last mark"""
+        now = time.perf_counter() - self.start
+        if self.profile:
+            self.sections[label] += now - (self.marks[-1][1] if self.marks else 0.0)
+            self.calls[label] += 1
+        self.marks.append((label, now))
+
+    @contextmanager
+    def section(self, label: str):
+        """Add the block's wall time to section label (inclusive of nested sections)"""
+        if not self.profile:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections[label] += time.perf_counter() - start
+            self.calls[label] += 1
+
+    def section_ms(self) -> Dict[str, float]:
+        """Sections recorded so far in this run (milliseconds), slowest first"""
+        ordered = sorted(self.sections.items(), key=lambda item: -item[1])
+        return {label: seconds * 1000 for label, seconds in ordered}
+
+    def finish(self, interrupted: bool = False) -> float:
+        """
+        Record the run; the first finished run in the process is the first paint
+
+        interrupted marks a run cut short by st.rerun() or st.stop().
+        """
+        global _first_paint_seconds
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            if _first_paint_seconds is None:
+                _first_paint_seconds = time.perf_counter() - PROCESS_START
+            else:
+                _rerun_seconds.append(elapsed)
+        if self.profile:
+            _active.timer = None
+            run = {"ts": time.time(), "total_ms": elapsed * 1000, "sections": self.section_ms()}
+            if interrupted:
+                run["interrupted"] = True
+            _record_profile(run)
+        if os.environ.get("KHSOLAR_TIMING"):
+            marks = " ".join(f"{label}={seconds * 1000:.0f}ms" for label, seconds in self.marks)
+            print(f"[timing] run={elapsed * 1000:.0f}ms {marks}", flush=True)
+        return elapsed
+
+
+def section(label: str):
+    """Time a block as section label of the current profiled run; a no-op otherwise"""
+    timer = getattr(_active, "timer", None)
+    return timer.section(label) if timer is not None else nullcontext()
+
+
+def profiled(label: Optional[str] = None):
+    """Decorator timing each call as a section (default label: the function's qualified name)"""
+    def decorate(func):
+        name = label or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = getattr(_active, "timer", None)
+            if timer is None:
+                return func(*args, **kwargs)
+            with timer.section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _record_profile(run: dict):
+    """Keep the run in memory and append it to the rolling JSONL log"""
+    global _log_lines
+    with _lock:
+        _recent_runs.append(run)
+        try:
+            if _log_lines is None:
+                _log_lines = _count_lines(PROFILE_LOG)
+            with open(PROFILE_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps(run) + "\n")
+            _log_lines += 1
+            if _log_lines >= 2 * PROFILE_LOG_RUNS:
+                _log_lines = _trim_log(PROFILE_LOG, PROFILE_LOG_RUNS)
+        except OSError as e:
+            print(f"Profile log not written: {e}")
+
+
+def _count_lines(path: str) -> int:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return sum(1 for _ in f)
+    except FileNotFoundError:
+        return 0
+
+
+def _trim_log(path: str, keep: int) -> int:
+    """Rewrite path with its last keep lines"""
+    with open(path, encoding="utf-8") as f:
+        lines = deque(f, maxlen=keep)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    os.replace(tmp, path)
+    return len(lines)
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def section_percentiles(runs: Optional[Iterable[dict]] = None) -> Dict[str, Dict[str, float]]:
+    """Per-section count and p50/p90/p99 (milliseconds) over runs, default this process's profiled runs"""
+    if runs is None:
+        with _lock:
+            runs = list(_recent_runs)
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for run in runs:
+        samples["total"].append(run["total_ms"])
+        for label, ms in run["sections"].items():
+            samples[label].append(ms)
+    stats = {}
+    for label, values in samples.items():
+        values.sort()
+        stats[label] = {"runs": len(values), **{f"p{pct}": _percentile(values, pct) for pct in PERCENTILES}}
+    return dict(sorted(stats.items(), key=lambda item: -item[1]["p50"]))
+
+
+def read_profile_log(path: str = PROFILE_LOG) -> List[dict]:
+    """Runs recorded in a JSONL profile log"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def timing_report() -> Dict[str, Optional[float]]:
+    """First paint and rerun statistics for this server process (milliseconds)"""
+    with _lock:
+        reruns = sorted(_rerun_seconds)
+        first_paint = _first_paint_seconds
+    report: Dict[str, Optional[float]] = {
+        "first_paint_ms": first_paint * 1000 if first_paint is not None else None,
+        "reruns": len(reruns),
+        "rerun_median_ms": None,
+        "rerun_max_ms": None,
+    }
+    if reruns:
+        report["rerun_median_ms"] = reruns[len(reruns) // 2] * 1000
+        report["rerun_max_ms"] = reruns[-1] * 1000
+    return report
+
+
+# Modules app.py needs on every run, and those it now imports only on their page
+STARTUP_MODULES = ("streamlit", "pandas", "numpy", "calculations", "product_manager", "translations", "app_pages")
+PAGE_MODULES = ("visualization", "system_optimizer", "export_utils", "telegram_bot", "telegram_personal_sender")
+
+
+def cold_import_seconds(module: str) -> Optional[float]:
+    """Import time of module in a fresh interpreter, or None if it cannot be imported"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def print_profile_report(path: str = PROFILE_LOG):
+    """Print per-section percentiles from a profile log"""
+    runs = read_profile_log(path)
+    print(f"Profiled runs in {path}: {len(runs)}")
+    print(f"  {'section':<44}{'runs':>6}" + "".join(f"{f'p{pct}':>10}" for pct in PERCENTILES))
+    for label, stats in section_percentiles(runs).items():
+        print(f"  {label:<44}{stats['runs']:>6}" + "".join(f"{stats[f'p{pct}']:>8.1f}ms" for pct in PERCENTILES))
+
+
+def main():
+    """Print cold import times for startup and page-level modules"""
+    if "--profile" in sys.argv[1:]:
+        print_profile_report()
+        return
+    print("Cold import times (fresh interpreter per module)")
+    for title, modules in (("Startup path", STARTUP_MODULES), ("Loaded on demand", PAGE_MODULES)):
+        print(f"\n{title}:")
+        for module in modules:
+            seconds = cold_import_seconds(module)
+            shown = f"{seconds * 1000:8.0f} ms" if seconds is not None else "  unavailable"
+            print(f"  {module:<28}{shown}")
+
+
+if __name__ == "__main__":
+    main()
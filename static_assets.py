@@ -0,0 +1,73 @@
+"""
+Static Assets
+Stylesheet and logo for the Streamlit app, read and encoded once per process
+
+With server.enableStaticServing (set in .streamlit/config.toml) Streamlit
+serves static/ at app/static/ with ETag/Last-Modified headers. The
+browser then downloads khsolar.css and logo.png once, and each rerun only
+sends a short <link>/<img> reference; the ?v= content hash changes when
+a file does. Without static serving the CSS is inlined and the logo sent
+as a data URI, both built once per process rather than on every rerun.
+"""
+import base64
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+CSS_FILE = STATIC_DIR / "khsolar.css"
+LOGO_FILE = STATIC_DIR / "logo.png"
+
+# URL prefix Streamlit serves STATIC_DIR under (relative to the app)
+STATIC_URL = "app/static"
+
+
+@lru_cache(maxsize=None)
+def _read(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def static_url(path: Path) -> str:
+    """Cache-busting URL of a file in STATIC_DIR"""
+    digest = hashlib.sha1(_read(path) or b"").hexdigest()[:10]
+    return f"{STATIC_URL}/{path.relative_to(STATIC_DIR).as_posix()}?v={digest}"
+
+
+def static_serving() -> bool:
+    """Whether Streamlit serves STATIC_DIR for this app"""
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+@lru_cache(maxsize=None)
+def _stylesheet_html(served: bool) -> str:
+    if served:
+        return f'<link rel="stylesheet" href="{static_url(CSS_FILE)}">'
+    css = (_read(CSS_FILE) or b"").decode("utf-8")
+    return f"<style>\n{css}</style>"
+
+
+def stylesheet_html() -> str:
+    """HTML that applies the app stylesheet"""
+    return _stylesheet_html(static_serving())
+
+
+@lru_cache(maxsize=None)
+def _logo_src(served: bool) -> Optional[str]:
+    data = _read(LOGO_FILE)
+    if data is None:
+        return None
+    if served:
+        return static_url(LOGO_FILE)
+    return "data:image/png;base64," + base64.b64encode(data).decode()
+
+
+def logo_src() -> Optional[str]:
+    """<img> src for the logo, or None if there is no logo file"""
+    return _logo_src(static_serving())
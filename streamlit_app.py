@@ -839,6 +839,13 @@ TRANSLATIONS = {
     }
 }
 
+@st.cache_resource
+def get_shared_product_manager() -> ProductManager:
+    """One parsed product catalog shared by every session, reloaded when product_catalog.json or product_prices.txt changes"""
+    manager = ProductManager()
+    manager.watch()
+    return manager
+
 # Initialize session state
 if 'devices' not in st.session_state:
     st.session_state.devices = []
@@ -847,14 +854,16 @@ if 'system_config' not in st.session_state:
 if 'simulation_results' not in st.session_state:
     st.session_state.simulation_results = None
 if 'product_manager' not in st.session_state:
-    st.session_state.product_manager = ProductManager()
+    # Copy-on-write view: price edits stay in this session
+    st.session_state.product_manager = get_shared_product_manager().overlay()
 
-# Performance optimization with caching
-@st.cache_data(ttl=3600)
-def load_product_data():
-    """Cache product data for 1 hour"""
-    return ProductManager()
+# Quotes priced from an older catalog version are dropped when prices reload
+if st.session_state.get('catalog_version') != st.session_state.product_manager.catalog_version:
+    for stale_key in ('quick_sizing_results',):
+        st.session_state.pop(stale_key, None)
+    st.session_state.catalog_version = st.session_state.product_manager.catalog_version
 
+# Performance optimization with caching
 @st.cache_data(ttl=600)
 def calculate_system_metrics(monthly_kwh, system_type):
     """Cache calculation results for 10 minutes"""
@@ -1162,17 +1171,17 @@ if page == t('nav_dashboard'):
                 pm = st.session_state.product_manager
                 
                 # Get PV panel brands
-                pv_products = [p for p in pm.products.values() if p.category == 'pv_panel']
+                pv_products = pm.get_products_by_category('pv_panel')
                 pv_brands = sorted(list(set([p.name for p in pv_products])))
                 pv_brands.insert(0, "Auto-Recommend (Best Value)")
                 
                 # Get battery brands
-                battery_products = [p for p in pm.products.values() if p.category == 'battery']
+                battery_products = pm.get_products_by_category('battery')
                 battery_brands = sorted(list(set([p.name for p in battery_products])))
                 battery_brands.insert(0, "Auto-Recommend (Best Value)")
                 
                 # Get inverter brands
-                inverter_products = [p for p in pm.products.values() if p.category == 'inverter']
+                inverter_products = pm.get_products_by_category('inverter')
                 inverter_brands = sorted(list(set([p.name for p in inverter_products])))
                 inverter_brands.insert(0, "Auto-Recommend (Best Value)")
                 
@@ -4039,12 +4048,18 @@ elif page == t('nav_reports'):
                     "equipment_cost": equipment_cost
                 }
                 
-                # Export all formats
-                exporter.generate_pdf_report(results, devices, financial, system_config, "solar_report.pdf")
-                exporter.generate_word_report(results, devices, financial, system_config, "solar_report.docx")
-                exporter.export_to_excel(results, devices, financial, "solar_report.xlsx")
+                # Export all formats in memory
+                reports = [
+                    ("solar_report.pdf", exporter.generate_pdf_report(results, devices, financial, system_config), "application/pdf"),
+                    ("solar_report.docx", exporter.generate_word_report(results, devices, financial, system_config),
+                     "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+                    ("solar_report.xlsx", exporter.export_to_excel(results, devices, financial),
+                     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+                ]
                 
                 st.success("✅ All reports exported successfully!")
+                for file_name, data, mime in reports:
+                    st.download_button(f"⬇️ {file_name}", data, file_name=file_name, mime=mime, use_container_width=True)
                 st.balloons()
     
     st.markdown("---")
@@ -4053,13 +4068,15 @@ elif page == t('nav_reports'):
     
     with col1:
         if st.button(t('export_excel'), type="primary", use_container_width=True):
-            exporter.export_to_excel(results, devices, financial, "solar_report.xlsx")
-            st.success("✅ Exported to solar_report.xlsx")
+            st.download_button("⬇️ solar_report.xlsx", exporter.export_to_excel(results, devices, financial),
+                               file_name="solar_report.xlsx",
+                               mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                               use_container_width=True)
     
     with col2:
         if st.button(t('export_csv'), use_container_width=True):
-            exporter.export_to_csv(results, "solar_simulation.csv")
-            st.success("✅ Exported to solar_simulation.csv")
+            st.download_button("⬇️ solar_simulation.csv", exporter.export_to_csv(results),
+                               file_name="solar_simulation.csv", mime="text/csv", use_container_width=True)
     
     with col3:
         if st.button(t('export_pdf'), use_container_width=True):
@@ -4087,8 +4104,8 @@ elif page == t('nav_reports'):
                 "support_material_cost": st.session_state.system_config.support_material_cost * markup_multiplier,
                 "equipment_cost": equipment_cost
             }
-            exporter.generate_pdf_report(results, devices, financial, system_config, "solar_report.pdf")
-            st.success("✅ Exported to solar_report.pdf")
+            st.download_button("⬇️ solar_report.pdf", exporter.generate_pdf_report(results, devices, financial, system_config),
+                               file_name="solar_report.pdf", mime="application/pdf", use_container_width=True)
     
     with col4:
         if st.button("📄 Export Word", use_container_width=True):
@@ -4116,8 +4133,10 @@ elif page == t('nav_reports'):
                 "support_material_cost": st.session_state.system_config.support_material_cost * markup_multiplier,
                 "equipment_cost": equipment_cost
             }
-            exporter.generate_word_report(results, devices, financial, system_config, "solar_report.docx")
-            st.success("✅ Exported to solar_report.docx")
+            st.download_button("⬇️ solar_report.docx", exporter.generate_word_report(results, devices, financial, system_config),
+                               file_name="solar_report.docx",
+                               mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                               use_container_width=True)
     
     # Summary table
     st.markdown("---")
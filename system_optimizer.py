@@ -0,0 +1,279 @@
+"""
+Catalog-driven System Optimizer
+Searches panel x battery x inverter combinations from the ProductManager catalog
+"""
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+from models import Device, Product, SystemConfiguration, SolarPanel, Battery, Inverter
+from calculations import SolarCalculator
+from product_manager import ProductManager
+
+# Inverter sizing rule used on the Simulation page: inverter >= 80% of PV
+MAX_PV_TO_INVERTER_RATIO = 1.25
+MIN_PV_TO_INVERTER_RATIO = 0.5
+NOMINAL_BANK_VOLTAGES = (12, 24, 48)
+CHUNK_SIZE = 2048
+MIN_CHUNK_SIZE = 256
+
+
+@dataclass
+class CandidateSystem:
+    """One scored panel/battery/inverter combination"""
+    panel: Product
+    panel_count: int
+    battery: Optional[Product]
+    battery_count: int
+    inverter: Product
+    pv_kw: float
+    battery_kwh: float
+    total_cost: float
+    self_sufficiency_percent: float
+    annual_savings: float
+    payback_years: float
+
+    def to_configuration(self, base: SystemConfiguration) -> SystemConfiguration:
+        """Copy of base configuration with this candidate's equipment"""
+        battery = None
+        if self.battery and self.battery_count > 0:
+            specs = self.battery.specifications
+            battery = Battery(name=self.battery.name, capacity_kwh=specs.get("capacity", 5.0),
+                              voltage=specs.get("voltage", 48), depth_of_discharge=specs.get("dod", 0.8),
+                              cost=self.battery.cost, quantity=self.battery_count)
+        return SystemConfiguration(
+            location=base.location,
+            sunlight_hours=base.sunlight_hours,
+            solar_panels=SolarPanel(name=self.panel.name, power_watts=self.panel.specifications.get("power", 400),
+                                    efficiency=self.panel.specifications.get("efficiency", 0.21),
+                                    cost_per_panel=self.panel.cost, quantity=self.panel_count),
+            battery=battery,
+            inverter=Inverter(name=self.inverter.name, power_kw=self.inverter.specifications.get("power", 5),
+                              efficiency=self.inverter.specifications.get("efficiency", 0.97),
+                              cost=self.inverter.cost,
+                              input_voltage=self.inverter.specifications.get("voltage", 48)),
+            devices=base.devices,
+            monthly_usage_kwh=base.monthly_usage_kwh,
+            grid_available=base.grid_available,
+            electricity_rate=base.electricity_rate
+        )
+
+
+@dataclass
+class OptimizationResult:
+    """Pareto front of cost vs self-sufficiency vs payback"""
+    front: List[CandidateSystem] = field(default_factory=list)
+    evaluated: int = 0
+    complete: bool = True  # False if the time budget ran out before the search finished
+    elapsed_seconds: float = 0.0
+
+
+def _is_storage_battery(product: Product) -> bool:
+    """Exclude racks and controllers that are filed under the battery category"""
+    return bool(re.search(r'\d+\s*ah|kwh', product.name.lower()))
+
+
+def _bank_series_count(battery_voltage: float, inverter_voltage: float) -> int:
+    """
+    Batteries needed in series to match the inverter DC voltage (0 if incompatible)
+
+    A 51.2V lithium pack counts as a 48V battery, 12V gel blocks go 4 in
+    series on a 48V inverter.
+    """
+    nominal = min(NOMINAL_BANK_VOLTAGES, key=lambda v: abs(v - battery_voltage))
+    if abs(nominal - battery_voltage) > nominal * 0.2:
+        return 0
+    series, remainder = divmod(inverter_voltage, nominal)
+    return int(series) if remainder == 0 and series >= 1 else 0
+
+
+class SystemOptimizer:
+    """Search catalog combinations and keep the Pareto-optimal ones"""
+
+    def __init__(self, product_manager: ProductManager, config: SystemConfiguration):
+        self.product_manager = product_manager
+        self.config = config
+        self.calculator = SolarCalculator(config)
+
+    def _blocks(self, peak_load_kw: float, max_pv_kw: float,
+                max_battery_kwh: float) -> Iterator[Tuple[Product, Product, Optional[Product], np.ndarray, np.ndarray]]:
+        """
+        Yield (inverter, panel, battery, panel_counts, battery_counts) blocks of feasible combinations
+
+        Infeasible branches are cut before any counts are enumerated:
+        inverters that cannot carry the peak load, PV arrays outside the
+        inverter's DC/AC range, batteries whose voltage does not fit the
+        inverter, and any battery on an on-grid inverter.
+        """
+        pm = self.product_manager
+        inverters = sorted(pm.get_products_by_category("inverter"), key=lambda p: p.specifications.get("power", 0))
+        panels = [p for p in pm.get_products_by_category("pv_panel") if p.specifications.get("power", 0) > 0]
+        batteries = [b for b in pm.get_products_by_category("battery")
+                     if _is_storage_battery(b) and b.specifications.get("capacity", 0) > 0]
+
+        for inverter in inverters:
+            inverter_kw = inverter.specifications.get("power", 0)
+            if inverter_kw < peak_load_kw:
+                continue
+
+            pv_low = inverter_kw * MIN_PV_TO_INVERTER_RATIO
+            pv_high = min(inverter_kw * MAX_PV_TO_INVERTER_RATIO, max_pv_kw)
+            if pv_low > pv_high:
+                continue
+
+            battery_options: List[Tuple[Optional[Product], np.ndarray]] = [(None, np.array([0]))]
+            if inverter.specifications.get("type") != "On-Grid":
+                for battery in batteries:
+                    series = _bank_series_count(battery.specifications.get("voltage", 48),
+                                                inverter.specifications.get("voltage", 48))
+                    if not series:
+                        continue
+                    max_count = int(max_battery_kwh // battery.specifications["capacity"])
+                    counts = np.arange(series, max_count + 1, series)
+                    if len(counts):
+                        battery_options.append((battery, counts))
+
+            for panel in panels:
+                panel_kw = panel.specifications["power"] / 1000
+                panel_counts = np.arange(max(1, math.ceil(pv_low / panel_kw)), math.floor(pv_high / panel_kw) + 1)
+                if not len(panel_counts):
+                    continue
+                for battery, battery_counts in battery_options:
+                    yield inverter, panel, battery, panel_counts, battery_counts
+
+    def optimize(self, devices: Optional[List[Device]] = None, load_kw: Optional[np.ndarray] = None,
+                 time_budget_seconds: float = 2.0, max_pv_kw: Optional[float] = None,
+                 max_battery_kwh: Optional[float] = None) -> OptimizationResult:
+        """
+        Search combinations and return the cost / self-sufficiency / payback Pareto front
+
+        Args:
+            devices: Devices for the shared load profile (defaults to config.devices)
+            load_kw: Precomputed 24-hour load profile (used instead of devices)
+            time_budget_seconds: Stop searching after this long and return the best front so far
+            max_pv_kw: Largest PV array to consider (default 2x the size the load needs)
+            max_battery_kwh: Largest battery bank to consider (default 2x daily load)
+        """
+        start = time.perf_counter()
+        if load_kw is None:
+            load_kw = self.calculator.hourly_load_matrix(devices if devices is not None else self.config.devices).sum(axis=0)
+        load_kw = np.asarray(load_kw, dtype=float)
+        daily_load_kwh = float(load_kw.sum())
+
+        if max_pv_kw is None:
+            needed_kw = self.calculator.calculate_pv_size_needed(daily_load_kwh, self.config.sunlight_hours)
+            max_pv_kw = max(2 * needed_kw, 1.0)
+        if max_battery_kwh is None:
+            max_battery_kwh = max(2 * daily_load_kwh, 5.12)
+
+        result = OptimizationResult(complete=True)
+        front: List[CandidateSystem] = []
+        pending: List[Tuple] = []
+        pending_size = 0
+        chunk_size = MIN_CHUNK_SIZE  # First chunk measures the cost per candidate
+
+        for block in self._blocks(float(load_kw.max(initial=0.0)), max_pv_kw, max_battery_kwh):
+            pending.append(block)
+            pending_size += len(block[3]) * len(block[4])
+            if pending_size >= chunk_size:
+                chunk_start = time.perf_counter()
+                front = self._update_front(front, self._score(pending, load_kw))
+                result.evaluated += pending_size
+                now = time.perf_counter()
+                seconds_per_candidate = (now - chunk_start) / pending_size
+                pending, pending_size = [], 0
+                remaining = time_budget_seconds - (now - start)
+                if remaining <= 0:
+                    result.complete = False
+                    break
+                # Size the next chunk to what fits in the remaining budget, so it is not overrun by a whole chunk
+                chunk_size = int(min(CHUNK_SIZE, max(MIN_CHUNK_SIZE, remaining / seconds_per_candidate)))
+
+        if pending:
+            front = self._update_front(front, self._score(pending, load_kw))
+            result.evaluated += pending_size
+
+        result.front = sorted(front, key=lambda c: c.total_cost)
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    def _score(self, blocks: List[Tuple], load_kw: np.ndarray) -> List[CandidateSystem]:
+        """Expand blocks into candidates and score them with one batch simulation"""
+        rows = []  # (inverter, panel, battery, panel_count, battery_count)
+        for inverter, panel, battery, panel_counts, battery_counts in blocks:
+            for panel_count in panel_counts.tolist():
+                for battery_count in battery_counts.tolist():
+                    rows.append((inverter, panel, battery, panel_count, battery_count))
+
+        pv_kw = np.array([r[1].specifications["power"] * r[3] / 1000 for r in rows])
+        battery_kwh = np.array([r[2].specifications["capacity"] * r[4] if r[2] else 0.0 for r in rows])
+        batch = self.calculator.simulate_batch(np.column_stack((pv_kw, battery_kwh)), load_kw=load_kw)
+
+        # Labor and support material depend only on the inverter size
+        install_cost = {}
+        for inverter, *_ in blocks:
+            if inverter.product_id not in install_cost:
+                sized = SystemConfiguration(inverter=Inverter(name=inverter.name,
+                                                              power_kw=inverter.specifications.get("power", 5)))
+                install_cost[inverter.product_id] = sized.labor_cost + sized.support_material_cost
+
+        total_cost = np.array([
+            r[0].cost + r[1].cost * r[3] + (r[2].cost * r[4] if r[2] else 0.0) + install_cost[r[0].product_id]
+            for r in rows
+        ])
+        served_kwh = float(load_kw.sum()) - batch.grid_import_kwh - batch.unmet_load_kwh
+        annual_savings = served_kwh * 365 * self.config.electricity_rate
+        with np.errstate(divide='ignore'):
+            payback = np.where(annual_savings > 0, total_cost / annual_savings, np.inf)
+        self_sufficiency = batch.self_sufficiency_percent
+
+        keep = _pareto_mask(total_cost, self_sufficiency, payback)
+        return [
+            CandidateSystem(panel=rows[i][1], panel_count=rows[i][3], battery=rows[i][2],
+                            battery_count=rows[i][4], inverter=rows[i][0],
+                            pv_kw=float(pv_kw[i]), battery_kwh=float(battery_kwh[i]),
+                            total_cost=float(total_cost[i]),
+                            self_sufficiency_percent=float(self_sufficiency[i]),
+                            annual_savings=float(annual_savings[i]), payback_years=float(payback[i]))
+            for i in np.flatnonzero(keep)
+        ]
+
+    def _update_front(self, front: List[CandidateSystem], new: List[CandidateSystem]) -> List[CandidateSystem]:
+        """Merge new candidates into the front and drop dominated ones"""
+        merged = front + new
+        if not merged:
+            return merged
+        keep = _pareto_mask(np.array([c.total_cost for c in merged]),
+                            np.array([c.self_sufficiency_percent for c in merged]),
+                            np.array([c.payback_years for c in merged]))
+        return [c for c, k in zip(merged, keep) if k]
+
+
+def _pareto_mask(cost: np.ndarray, self_sufficiency: np.ndarray, payback: np.ndarray) -> np.ndarray:
+    """
+    True for candidates not dominated by any other
+
+    Lower cost, higher self-sufficiency and shorter payback are better.
+    Exact ties keep only the first candidate.
+    """
+    # Round so float noise does not keep near-identical candidates apart
+    objectives = np.column_stack((np.round(cost, 2), -np.round(self_sufficiency, 3), np.round(payback, 3)))
+    order = np.lexsort(objectives.T[::-1])
+    objectives = objectives[order]
+
+    keep = np.zeros(len(order), dtype=bool)
+    kept = np.empty_like(objectives)  # Front so far in kept[:count], filled in place
+    count = 0
+    for i, row in enumerate(objectives):
+        # Sorted by cost first, so only earlier (cheaper or equal) rows can dominate this one
+        if count and (kept[:count] <= row).all(axis=1).any():
+            continue
+        keep[i] = True
+        kept[count] = row
+        count += 1
+
+    mask = np.zeros(len(order), dtype=bool)
+    mask[order] = keep
+    return mask
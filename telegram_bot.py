@@ -13,7 +13,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 try:
-    from telegram import Bot
+    from telegram import Bot, InputMediaPhoto
     from telegram.error import TelegramError
     TELEGRAM_AVAILABLE = True
 except ImportError:
@@ -48,7 +48,7 @@ class TelegramReportSender:
         self.bot = Bot(token=bot_token)
         init_database()
     
-    async def send_report_async(self, username, report_data, language='bilingual'):
+    async def send_report_async(self, username, report_data, language='bilingual', charts=None):
         """
         Send system report to Telegram user
         
@@ -56,6 +56,7 @@ class TelegramReportSender:
             username: Telegram username (without @)
             report_data: Dictionary with system configuration
             language: 'english', 'khmer', or 'bilingual' (default)
+            charts: Optional list of PNG images (see chart_renderer.report_charts) sent after the text
             
         Returns:
             (success: bool, message: str)
@@ -84,6 +85,12 @@ class TelegramReportSender:
                 parse_mode='HTML'
             )
             
+            # Send charts as one photo album (an album needs at least two photos)
+            if len(charts or ()) == 1:
+                await self.bot.send_photo(chat_id=chat_id, photo=charts[0])
+            elif charts:
+                await self.bot.send_media_group(chat_id=chat_id, media=[InputMediaPhoto(png) for png in charts])
+            
             return True, f"✅ Report sent successfully to @{username}"
             
         except TelegramError as e:
@@ -187,12 +194,12 @@ class TelegramReportSender:
             print(f"Database error: {e}")
             return None
     
-    def send_report(self, username, report_data, language='bilingual'):
+    def send_report(self, username, report_data, language='bilingual', charts=None):
         """Synchronous wrapper for send_report_async"""
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(self.send_report_async(username, report_data, language))
+            result = loop.run_until_complete(self.send_report_async(username, report_data, language, charts))
             loop.close()
             return result
         except Exception as e:
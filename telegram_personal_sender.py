@@ -4,6 +4,7 @@ Uses Telethon - Telegram Client API
 """
 
 import asyncio
+import io
 import os
 from dotenv import load_dotenv
 
@@ -70,7 +71,7 @@ class PersonalTelegramSender:
             print(f"❌ Connection failed: {e}")
             return False
     
-    def send_report(self, username_or_phone, report_text, language='bilingual'):
+    def send_report(self, username_or_phone, report_text, language='bilingual', charts=None):
         """
         Send report to a Telegram user
         
@@ -78,6 +79,7 @@ class PersonalTelegramSender:
             username_or_phone: Username (without @) or phone number (+855...)
             report_text: Pre-formatted report text
             language: 'bilingual', 'english', or 'khmer'
+            charts: Optional list of PNG images (see chart_renderer.report_charts) sent after the text
         
         Returns:
             (success: bool, message: str)
@@ -120,6 +122,15 @@ class PersonalTelegramSender:
             # Send message
             self.client.send_message(recipient, message, parse_mode='html')
             
+            # Send charts as one photo album (the file name tells Telethon they are images)
+            if charts:
+                photos = []
+                for index, png in enumerate(charts, 1):
+                    photo = io.BytesIO(png)
+                    photo.name = f"khsolar_chart_{index}.png"
+                    photos.append(photo)
+                self.client.send_file(recipient, photos)
+            
             return True, f"✅ Report sent to {recipient}!"
             
         except Exception as e:
@@ -140,7 +151,7 @@ class PersonalTelegramSender:
 
 
 # Thread-safe synchronous wrapper for Streamlit compatibility
-def send_report_from_personal(username_or_phone, report_data, language='bilingual'):
+def send_report_from_personal(username_or_phone, report_data, language='bilingual', charts=None):
     """
     Simple function to send report from your personal Telegram
     
@@ -148,6 +159,7 @@ def send_report_from_personal(username_or_phone, report_data, language='bilingua
         username_or_phone: Recipient's username or phone
         report_data: Dictionary with report information
         language: 'bilingual', 'english', or 'khmer'
+        charts: Optional list of PNG images sent after the text
     
     Returns:
         (success: bool, message: str)
@@ -159,7 +171,7 @@ def send_report_from_personal(username_or_phone, report_data, language='bilingua
         if not sender.connect():
             return False, "Could not connect to Telegram"
         
-        success, message = sender.send_report(username_or_phone, report_data, language)
+        success, message = sender.send_report(username_or_phone, report_data, language, charts)
         sender.disconnect()
         
         return success, message
@@ -0,0 +1,69 @@
+"""
+Test script for WebGL and M4-downsampled rendering of long chart series
+"""
+import numpy as np
+from models import SystemConfiguration
+from calculations import SolarCalculator
+from visualization import MAX_PLOT_POINTS, SolarVisualizer, m4_indices
+from test_simulation import sample_devices
+
+
+def test_m4_indices():
+    """Downsampling keeps the ends and every bucket's extremes"""
+    print("\n" + "="*50)
+    print("🧪 Testing M4 downsampling")
+    print("="*50)
+
+    values = np.random.default_rng(7).normal(size=50_000)
+    values[12_345] = 99.0
+    values[40_000] = -99.0
+    keep = m4_indices(values, 400)
+    assert len(keep) <= 400
+    assert keep[0] == 0 and keep[-1] == len(values) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 12_345 in keep and 40_000 in keep
+    assert np.array_equal(m4_indices(values[:300], 400), np.arange(300))
+    print(f"✅ PASS: {len(values):,} points reduced to {len(keep)} with both spikes kept")
+
+
+def test_adaptive_traces():
+    """Year-long and scenario series switch to WebGL, short ones stay SVG"""
+    print("\n" + "="*50)
+    print("🧪 Testing adaptive trace type")
+    print("="*50)
+
+    calc = SolarCalculator(SystemConfiguration(), seed=2024)
+    annual = calc.simulate_year(5.0, 10.0, sample_devices())
+    viz = SolarVisualizer()
+
+    year = viz.create_annual_energy_chart(annual)
+    assert all(trace.type == 'scattergl' and len(trace.x) <= MAX_PLOT_POINTS for trace in year.data)
+    assert max(year.data[0].y) == float(annual.hourly.pv_generation_kw.max())
+
+    march = viz.create_annual_energy_chart(annual, 3, 3)
+    assert all(trace.type == 'scatter' and len(trace.x) == 31 * 24 for trace in march.data)
+
+    monte_carlo = calc.simulate_monte_carlo(5.0, 10.0, sample_devices(), scenarios=5000)
+    scenarios = viz.create_scenario_chart(monte_carlo)
+    assert all(trace.type == 'scattergl' for trace in scenarios.data)
+    assert all(trace.type == 'scatter' for trace in viz.create_monte_carlo_soc_chart(monte_carlo).data)
+    assert all(trace.type == 'scatter' for trace in viz.create_24h_energy_flow_chart(annual.hourly[:24]).data)
+    print("✅ PASS: WebGL above the threshold, full detail for a month or a day")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Chart Downsampling Test Suite")
+    print("="*60)
+
+    test_m4_indices()
+    test_adaptive_traces()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Test script for headless chart rendering and its disk cache
+"""
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import chart_renderer
+from models import SystemConfiguration
+from calculations import SolarCalculator
+from visualization import SolarVisualizer
+from test_simulation import sample_devices
+
+
+def use_temp_cache() -> Path:
+    chart_renderer.CHART_CACHE_DIR = Path(tempfile.mkdtemp(prefix="khsolar_charts_"))
+    return chart_renderer.CHART_CACHE_DIR
+
+
+def test_render_and_cache():
+    """A chart is rendered once, then read from the disk cache"""
+    print("\n" + "="*50)
+    print("🧪 Testing rendering and disk cache")
+    print("="*50)
+
+    cache_dir = use_temp_cache()
+    fig = SolarVisualizer().create_financial_chart(25, 960.0, 5200.0)
+    png = chart_renderer.render(fig)
+    assert png.startswith(b"\x89PNG")
+    assert len(os.listdir(cache_dir)) == 1
+
+    cached = next(cache_dir.iterdir())
+    cached.write_bytes(b"cached")
+    assert chart_renderer.render(fig) == b"cached"
+
+    svg = chart_renderer.render(fig, 'svg')
+    assert b"<svg" in svg and len(os.listdir(cache_dir)) == 2
+
+    try:
+        chart_renderer.render(fig, 'gif')
+        assert False, "unsupported format accepted"
+    except ValueError:
+        pass
+    print(f"✅ PASS: rendered with {chart_renderer.renderer_name()} and served from cache")
+
+
+def test_coalescing():
+    """Concurrent requests for the same chart share one render"""
+    print("\n" + "="*50)
+    print("🧪 Testing render coalescing")
+    print("="*50)
+
+    use_temp_cache()
+    fig = SolarVisualizer().create_roi_gauge(180.0)
+    first = chart_renderer.render_async(fig)
+    second = chart_renderer.render_async(fig)
+    assert first is second  # still rendering: a render takes far longer than two calls
+    assert first.result().startswith(b"\x89PNG")
+
+    # Threads that miss the cache together still submit one render
+    use_temp_cache()
+    render_to_cache, renders = chart_renderer._render_to_cache, []
+    chart_renderer._render_to_cache = lambda *args: renders.append(args) or render_to_cache(*args)
+    barrier = threading.Barrier(8)
+    futures = []
+
+    def request():
+        barrier.wait()
+        futures.append(chart_renderer.render_async(fig, 'svg'))
+    try:
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({f.result() for f in futures}) == 1
+    finally:
+        chart_renderer._render_to_cache = render_to_cache
+    assert len(renders) == 1
+    print("✅ PASS: one render per chart")
+
+
+def test_cache_pruning():
+    """The disk cache keeps the most recently used images and drops old ones"""
+    print("\n" + "="*50)
+    print("🧪 Testing chart cache pruning")
+    print("="*50)
+
+    cache_dir = use_temp_cache()
+    now = time.time()
+    for i in range(6):
+        image = cache_dir / f"{i}.png"
+        image.write_bytes(b"png")
+        os.utime(image, (now - i * 60, now - i * 60))  # 0.png used most recently
+    os.utime(cache_dir / "5.png", (now - 30 * 24 * 3600,) * 2)
+
+    assert chart_renderer.prune_cache(max_files=10) == 1  # only the month-old image
+    assert chart_renderer.prune_cache(max_files=3) == 2
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["0.png", "1.png", "2.png"]
+
+    # Reading an image from the cache marks it as used
+    fig = SolarVisualizer().create_roi_gauge(120.0)
+    chart_renderer.render(fig)
+    rendered = next(p for p in cache_dir.iterdir() if len(p.stem) == 40)
+    os.utime(rendered, (now - 3600,) * 2)
+    chart_renderer.render(fig)
+    assert rendered.stat().st_mtime > now - 60
+    print("✅ PASS: least recently used and stale images removed")
+
+
+def test_report_charts():
+    """PDF and Word reports embed the rendered charts"""
+    print("\n" + "="*50)
+    print("🧪 Testing charts in reports")
+    print("="*50)
+
+    from docx import Document
+    from export_utils import ReportExporter
+
+    use_temp_cache()
+    calc = SolarCalculator(SystemConfiguration())
+    results = calc.simulate_24_hours(5.0, 10.0, sample_devices())
+    financial = calc.calculate_financial_analysis(5200.0, 7300.0)
+    assert len(chart_renderer.report_charts(results, financial.annual_savings, financial.total_system_cost)) == 3
+    assert len(chart_renderer.report_charts(annual_savings=0.0)) == 0
+
+    out_dir = tempfile.mkdtemp(prefix="khsolar_reports_")
+    exporter = ReportExporter()
+    docx_file = os.path.join(out_dir, "report.docx")
+    exporter.generate_word_report(results, sample_devices(), financial, {}, docx_file, include_charts=True)
+    assert len(Document(docx_file).inline_shapes) == 3
+
+    with_charts, without_charts = os.path.join(out_dir, "charts.pdf"), os.path.join(out_dir, "plain.pdf")
+    exporter.generate_pdf_report(results, sample_devices(), financial, {}, with_charts, include_charts=True)
+    exporter.generate_pdf_report(results, sample_devices(), financial, {}, without_charts)
+    assert os.path.getsize(with_charts) > os.path.getsize(without_charts) + 10_000
+    print("✅ PASS: three charts in the Word and PDF reports")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Chart Renderer Test Suite")
+    print("="*60)
+
+    test_render_and_cache()
+    test_coalescing()
+    test_cache_pruning()
+    test_report_charts()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Test script for the background export job queue
+"""
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import chart_renderer
+import export_jobs
+from models import SystemConfiguration
+from calculations import SolarCalculator
+from test_simulation import sample_devices
+
+
+def sample_export():
+    """Simulation results, devices and financial analysis for one design"""
+    calc = SolarCalculator(SystemConfiguration())
+    results = calc.simulate_24_hours(5.0, 10.0, sample_devices())
+    financial = calc.calculate_financial_analysis(5200.0, 7300.0)
+    return results, sample_devices(), financial
+
+
+def use_temp_caches():
+    chart_renderer.CHART_CACHE_DIR = Path(tempfile.mkdtemp(prefix="khsolar_charts_"))
+    export_jobs.EXPORT_CACHE.clear()
+
+
+def test_export_and_cache():
+    """An export runs in the background, then later requests are served from the cache"""
+    print("\n" + "="*50)
+    print("🧪 Testing background export and result cache")
+    print("="*50)
+
+    use_temp_caches()
+    results, devices, financial = sample_export()
+    job = export_jobs.submit_export('pdf', results, devices, financial, {"customer_name": "Dara"})
+    assert export_jobs.get_job(job.job_id) is job
+    export_jobs.wait(job, timeout=60)
+    assert job.status == export_jobs.DONE and job.progress == 1.0, job.error
+    pdf = b"".join(export_jobs.stream(job, chunk_size=4096))
+    assert pdf.startswith(b"%PDF") and pdf == job.data
+    assert len(export_jobs.EXPORT_CACHE) == 1
+
+    again = export_jobs.submit_export('pdf', results, devices, financial, {"customer_name": "Dara"})
+    assert again.finished and again.cached and again.data is job.data
+
+    other = export_jobs.submit_export('pdf', results, devices, financial, {"customer_name": "Sokha"})
+    assert not other.cached and other.key != job.key
+    export_jobs.wait(other, timeout=60)
+
+    # Jobs hold only the key: once the cache evicts a report, it is exported again
+    export_jobs.EXPORT_CACHE.clear()
+    assert job.expired and job.data is None
+    try:
+        next(export_jobs.stream(job))
+        assert False, "expired report streamed"
+    except RuntimeError:
+        pass
+    redo = export_jobs.wait(export_jobs.submit_export('pdf', results, devices, financial, {"customer_name": "Dara"}),
+                            timeout=60)
+    assert redo is not job and not redo.cached and redo.data.startswith(b"%PDF")
+    assert not job.expired  # its report is back in the cache
+    print("✅ PASS: exported once, then served from cache")
+
+
+def test_coalescing():
+    """Duplicate requests for a report being generated join the running job"""
+    print("\n" + "="*50)
+    print("🧪 Testing export coalescing")
+    print("="*50)
+
+    use_temp_caches()
+    results, devices, financial = sample_export()
+    first = export_jobs.submit_export('docx', results, devices, financial, {})
+    second = export_jobs.submit_export('docx', results, devices, financial, {})
+    assert first is second  # still running: an export takes far longer than two calls
+    export_jobs.wait(first, timeout=60)
+    assert first.status == export_jobs.DONE, first.error
+
+    for kind, magic in (('xlsx', b"PK"), ('csv', b"Hour,")):
+        job = export_jobs.wait(export_jobs.submit_export(kind, results, devices, financial), timeout=60)
+        assert job.status == export_jobs.DONE and job.data.startswith(magic), job.error
+
+    try:
+        export_jobs.submit_export('odt', results)
+        assert False, "unsupported export accepted"
+    except ValueError:
+        pass
+    print("✅ PASS: one export per design")
+
+
+def test_in_memory_exports():
+    """Exporters return bytes, or write to a buffer or file name, and give the same report each way"""
+    print("\n" + "="*50)
+    print("🧪 Testing in-memory exports")
+    print("="*50)
+
+    from export_utils import ReportExporter
+
+    use_temp_caches()
+    results, devices, financial = sample_export()
+    exporter = ReportExporter()
+    csv = exporter.export_to_csv(results)
+    assert csv.startswith(b"Hour,")
+    buffer = io.BytesIO()
+    assert exporter.export_to_csv(results, buffer) is None and buffer.getvalue() == csv
+    csv_file = os.path.join(tempfile.mkdtemp(prefix="khsolar_reports_"), "simulation.csv")
+    exporter.export_to_csv(results, csv_file)
+    with open(csv_file, 'rb') as f:
+        assert f.read() == csv
+
+    assert exporter.export_to_excel(results, devices, financial).startswith(b"PK")
+    assert exporter.generate_word_report(results, devices, financial, {}).startswith(b"PK")
+    assert exporter.generate_pdf_report(results, devices, financial, {}).startswith(b"%PDF")
+    assert exporter.export_device_schedule(devices).startswith(b"Device,")
+    print("✅ PASS: every exporter works in memory")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Export Job Test Suite")
+    print("="*60)
+
+    test_export_and_cache()
+    test_coalescing()
+    test_in_memory_exports()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Test script for the SolarVisualizer figure cache
+"""
+import json
+from models import SystemConfiguration, as_frame
+from calculations import SolarCalculator
+from visualization import FIGURE_CACHE, SolarVisualizer, frame_fingerprint
+from test_simulation import sample_devices
+
+
+def sample_results(pv_kw=5.0):
+    return as_frame(SolarCalculator(SystemConfiguration(), seed=2024).simulate_24_hours(pv_kw, 10.0, sample_devices()))
+
+
+def test_cached_figure():
+    """Unchanged results are served from cache as an independent copy"""
+    print("\n" + "="*50)
+    print("🧪 Testing cached figure")
+    print("="*50)
+
+    FIGURE_CACHE.clear()
+    viz = SolarVisualizer()
+    results = sample_results()
+    first = viz.create_24h_energy_flow_chart(results)
+    hits = FIGURE_CACHE.hits
+    second = viz.create_24h_energy_flow_chart(results)
+    assert FIGURE_CACHE.hits == hits + 1
+    assert json.loads(first.to_json()) == json.loads(second.to_json())
+    assert second.layout.title.text == "24-Hour Solar System Simulation"
+    assert [trace.name for trace in second.data][0] == "PV Generation"
+    assert second.data[0].fillcolor == "rgba(253, 180, 98, 0.3)"
+
+    second.update_layout(title_text="Edited")
+    assert viz.create_24h_energy_flow_chart(results).layout.title.text == "24-Hour Solar System Simulation"
+    print("✅ PASS: second call served from cache, copies are independent")
+
+
+def test_fingerprint():
+    """Different results give different figures"""
+    print("\n" + "="*50)
+    print("🧪 Testing result fingerprint")
+    print("="*50)
+
+    base = sample_results()
+    assert frame_fingerprint(base) == frame_fingerprint(sample_results())
+    assert frame_fingerprint(base) != frame_fingerprint(sample_results(pv_kw=6.0))
+    assert frame_fingerprint(base) != frame_fingerprint(base.astype("float32"))
+
+    viz = SolarVisualizer()
+    assert viz.create_energy_balance_pie(base).to_json() != viz.create_energy_balance_pie(sample_results(6.0)).to_json()
+    print("✅ PASS: any changed column changes the key")
+
+
+def test_restyle():
+    """Language and color changes reuse the cached traces and only restyle them"""
+    print("\n" + "="*50)
+    print("🧪 Testing language and style changes")
+    print("="*50)
+
+    FIGURE_CACHE.clear()
+    results = sample_results()
+    english = SolarVisualizer().create_24h_energy_flow_chart(results)
+    cached = len(FIGURE_CACHE)
+
+    khmer_viz = SolarVisualizer(language='kh')
+    khmer = khmer_viz.create_24h_energy_flow_chart(results)
+    assert len(FIGURE_CACHE) == cached + 1  # one styled figure added, traces reused
+    assert khmer.layout.title.text != english.layout.title.text
+    assert khmer.data[0].name != english.data[0].name
+    assert json.loads(khmer.to_json())['data'][0]['y'] == json.loads(english.to_json())['data'][0]['y']
+
+    khmer_viz.color_scheme['pv'] = '#000000'
+    recolored = khmer_viz.create_24h_energy_flow_chart(results)
+    assert recolored.data[0].line.color == '#000000'
+    assert recolored.data[0].fillcolor == 'rgba(0, 0, 0, 0.3)'
+
+    payback = SolarVisualizer(language='kh').create_financial_chart(10, 1000.0, 3500.0)
+    assert any("4" in annotation.text for annotation in payback.layout.annotations)
+    print("✅ PASS: traces reused, labels and colors patched")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Figure Cache Test Suite")
+    print("="*60)
+
+    test_cached_figure()
+    test_fingerprint()
+    test_restyle()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Test script for the indexed, process-wide product catalog
+"""
+import json
+import os
+import tempfile
+import time
+import product_manager
+from product_manager import CatalogWatcher, ProductManager, load_catalog, save_catalog
+
+
+def test_parsed_once():
+    """Every ProductManager shares one parse until the file changes"""
+    print("\n" + "="*50)
+    print("🧪 Testing catalog parse cache")
+    print("="*50)
+
+    assert ProductManager().catalog is ProductManager().catalog
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "prices.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("LONGi 550W Panel: $95.00\n")
+        first = load_catalog(path)
+        assert load_catalog(path) is first
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("Deye 8kW Hybrid Inverter: $1200.00\n")
+        os.utime(path, (0, os.path.getmtime(path) + 10))
+        second = load_catalog(path)
+        assert second is not first and len(second) == 2
+    print("✅ PASS: shared parse, re-parsed after mtime change")
+
+
+def test_recommendations_match_scan():
+    """Indexed recommendations equal a full scan with the original rules"""
+    print("\n" + "="*50)
+    print("🧪 Testing indexed recommendations")
+    print("="*50)
+
+    pm = ProductManager()
+    panels = pm.get_products_by_category("pv_panel")
+    batteries = pm.get_products_by_category("battery")
+
+    for min_wattage in (0, 300, 400, 500, 550, 600, 10000):
+        suitable = [p for p in panels if p.specifications.get("power", 0) >= min_wattage]
+        suitable.sort(key=lambda p: p.cost / p.specifications.get("power", 1))
+        expected = suitable[0] if suitable else panels[0]
+        assert pm.get_recommended_panel(min_wattage) is expected
+
+    for min_kwh in (0, 2.4, 5.0, 10.24, 15.36, 100):
+        lithium = [b for b in batteries if b.specifications.get("type") == "Lithium"
+                   and b.specifications.get("capacity", 0) >= min_kwh]
+        lithium.sort(key=lambda b: b.cost / b.specifications.get("capacity", 1))
+        fallback = [b for b in batteries if b.specifications.get("capacity", 0) >= min_kwh]
+        expected = lithium[0] if lithium else (fallback[0] if fallback else batteries[0])
+        assert pm.get_recommended_battery(min_kwh) is expected
+
+    for supplier in ("Sungrow", "Deye"):
+        assert all(p.supplier == supplier for p in pm.get_products_by_supplier(supplier))
+    print("✅ PASS: panel and battery picks unchanged")
+
+
+def test_overlay_copy_on_write():
+    """Session price edits do not leak into the shared manager"""
+    print("\n" + "="*50)
+    print("🧪 Testing copy-on-write overlays")
+    print("="*50)
+
+    shared = ProductManager()
+    session = shared.overlay()
+    assert session.catalog is shared.catalog
+
+    panel = shared.get_products_by_category("pv_panel")[0]
+    session.update_price(panel.product_id, panel.cost + 10)
+    assert session.get_product(panel.product_id).cost == panel.cost + 10
+    assert shared.get_product(panel.product_id).cost == panel.cost
+    assert session.catalog is not shared.catalog
+    print("✅ PASS: overlay edits are private to the session")
+
+
+def test_hot_reload():
+    """Reloads keep IDs, bump the version and re-parse only changed lines"""
+    print("\n" + "="*50)
+    print("🧪 Testing catalog hot reload")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "prices.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("LONGi 550W Panel: $95.00\nDeye 8kW Hybrid Inverter: $1200.00\n")
+        watcher = CatalogWatcher(path, interval_seconds=0.01)
+        assert watcher.check() and watcher.version == 1
+        before = {p.name: p.product_id for p in watcher.catalog.products.values()}
+
+        parse = product_manager._parse_product_line
+        parsed_lines = []
+        product_manager._parse_product_line = lambda line: parsed_lines.append(line) or parse(line)
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("LVtopsun-51.2V100AH Lithium: $800.00\nLONGi 550W Panel: $95.00\n"
+                        "Deye 8kW Hybrid Inverter: $1150.00\n")
+            os.utime(path, (0, os.path.getmtime(path) + 10))
+            watcher.start()
+            deadline = time.time() + 2
+            while watcher.version == 1 and time.time() < deadline:
+                time.sleep(0.01)
+            watcher.stop()
+        finally:
+            product_manager._parse_product_line = parse
+
+        after = {p.name: p.product_id for p in watcher.catalog.products.values()}
+        assert watcher.version == 2
+        assert parsed_lines == ["LVtopsun-51.2V100AH Lithium: $800.00", "Deye 8kW Hybrid Inverter: $1150.00"]
+        assert after["LONGi 550W Panel"] == before["LONGi 550W Panel"]
+        assert after["Deye 8kW Hybrid Inverter"] == before["Deye 8kW Hybrid Inverter"]
+        assert watcher.catalog.products[after["Deye 8kW Hybrid Inverter"]].cost == 1150.0
+        assert after["LVtopsun-51.2V100AH Lithium"] not in before.values()
+    print("✅ PASS: stable IDs, version 1 → 2, two of three lines re-parsed")
+
+
+def test_structured_catalog():
+    """JSON catalog round-trips the text catalog, keeps explicit IDs and needs no categorizer"""
+    print("\n" + "="*50)
+    print("🧪 Testing structured catalog format")
+    print("="*50)
+
+    legacy = load_catalog("product_prices.txt")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.json")
+        save_catalog(legacy, path)
+
+        categorize = product_manager._categorize_product
+        product_manager._categorize_product = None  # Any call would fail
+        try:
+            structured = CatalogWatcher(path)
+            structured.check()
+        finally:
+            product_manager._categorize_product = categorize
+        assert list(structured.catalog.products) == list(legacy.products)
+        for pid, product in legacy.products.items():
+            assert structured.catalog.products[pid] == product
+
+        # Inserting a product does not renumber the others
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["products"].insert(0, {"id": "PV_NEW", "name": "LONGi 600W Panel", "category": "pv_panel",
+                                    "cost": 110.0, "specifications": {"power": 600}})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.utime(path, (0, os.path.getmtime(path) + 10))
+        assert structured.check()
+        assert set(legacy.products) < set(structured.catalog.products)
+        assert structured.catalog.products["PV_NEW"].specifications["power"] == 600
+    print(f"✅ PASS: {len(legacy)} products round-trip, IDs unchanged by inserts")
+
+
+def test_fuzzy_search():
+    """Ranked, typo-tolerant search with field filters"""
+    print("\n" + "="*50)
+    print("🧪 Testing fuzzy product search")
+    print("="*50)
+
+    pm = ProductManager()
+    assert pm.search("SG33CX")[0].name == "Sungrow SG33CX-P2"
+    assert pm.search("sg33xc")[0].name == "Sungrow SG33CX-P2"
+    assert pm.search("51.2v10ah")[0].name.startswith("LVtopsun-51.2V100AH")
+
+    batteries = pm.search("category:battery")
+    assert batteries and all(p.category == "battery" for p in batteries)
+    big_panels = pm.search("category:pv_panel power>=550")
+    assert big_panels and all(p.specifications["power"] >= 550 for p in big_panels)
+    assert {p.product_id for p in big_panels} == {
+        p.product_id for p in pm.get_products_by_category("pv_panel") if p.specifications["power"] >= 550}
+    assert pm.search("zzzzqqq") == []
+
+    # Short prefixes match the words they start, as the old substring filter did
+    for prefix in ("sun", "sg", "sg3", "s"):
+        found = pm.search(prefix)
+        assert found and found[0].name == "Sungrow SG33CX-P2", prefix
+    assert {p.name for p in pm.search("sg")} >= {p.name for p in pm.products.values() if p.name.startswith("Sungrow SG")}
+    print("✅ PASS: model codes with typos, prefixes, category and numeric filters")
+
+
+def test_price_list_edits_reach_catalog():
+    """Editing product_prices.txt or product_catalog.json is picked up by the app's watcher"""
+    print("\n" + "="*50)
+    print("🧪 Testing edits to the active catalog")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prices = os.path.join(tmp, product_manager.PRICES_FILE)
+        catalog = os.path.join(tmp, product_manager.CATALOG_FILE)
+        with open(prices, "w", encoding="utf-8") as f:
+            f.write("LONGi 550W Panel: $95.00\nDeye 8kW Hybrid Inverter: $1200.00\n")
+        save_catalog(load_catalog(prices), catalog)
+        os.utime(prices, (0, os.path.getmtime(catalog) - 10))
+
+        pm = ProductManager(catalog)
+        watcher = product_manager.catalog_watcher(catalog)
+        assert watcher.source == prices and pm.catalog_version == 1
+        ids = {p.name: p.product_id for p in pm.products.values()}
+        panel = pm.products[ids["LONGi 550W Panel"]]
+
+        # Weekly price edit in the text list: merged into the JSON catalog, IDs kept
+        with open(prices, "w", encoding="utf-8") as f:
+            f.write("LONGi 550W Panel: $95.00\nDeye 8kW Hybrid Inverter: $1150.00\nJinko 600W Panel: $120.00\n")
+        os.utime(prices, (0, os.path.getmtime(catalog) + 10))
+        assert watcher.check() and pm.catalog_version == 2
+        assert pm.get_product(ids["Deye 8kW Hybrid Inverter"]).cost == 1150.0
+        assert pm.get_product(ids["LONGi 550W Panel"]) is panel
+        assert len(pm.products) == 3
+        with open(catalog, encoding="utf-8") as f:
+            records = {r["name"]: r for r in json.load(f)["products"]}
+        assert records["Deye 8kW Hybrid Inverter"]["cost"] == 1150.0
+        assert records["Deye 8kW Hybrid Inverter"]["id"] == ids["Deye 8kW Hybrid Inverter"]
+        assert not watcher.check()
+
+        # Direct edit of the JSON catalog: only the changed record is rebuilt
+        with open(catalog, encoding="utf-8") as f:
+            data = json.load(f)
+        data["products"][1]["cost"] = 1100.0
+        with open(catalog, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.utime(catalog, (0, os.path.getmtime(prices) + 10))
+        assert watcher.check() and pm.catalog_version == 3
+        assert pm.get_product(ids["Deye 8kW Hybrid Inverter"]).cost == 1100.0
+        assert pm.get_product(ids["LONGi 550W Panel"]) is panel
+    print("✅ PASS: text and JSON edits reload with stable IDs")
+
+
+def test_price_merge_keeps_curated_data():
+    """A price-list merge changes prices only; curated specs and JSON-only products survive"""
+    print("\n" + "="*50)
+    print("🧪 Testing price merges into a curated catalog")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prices = os.path.join(tmp, product_manager.PRICES_FILE)
+        catalog = os.path.join(tmp, product_manager.CATALOG_FILE)
+        with open(prices, "w", encoding="utf-8") as f:
+            f.write("Sungrow SG33CX Inverter: $2000.00\n")
+        save_catalog(load_catalog(prices), catalog)
+        with open(catalog, encoding="utf-8") as f:
+            data = json.load(f)
+        inverter = data["products"][0]
+        inverter["specifications"]["power"] = 999
+        inverter["notes"] = "Checked against the datasheet"
+        data["products"].append({"id": "BAT900", "name": "Curated 15kWh Battery", "category": "battery",
+                                 "cost": 3000.0, "specifications": {"capacity": 15.0, "type": "Lithium"}})
+        with open(catalog, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.utime(prices, (0, os.path.getmtime(catalog) + 10))
+
+        pm = ProductManager(catalog)
+        merged = pm.get_product(inverter["id"])
+        assert merged.cost == 2000.0 and merged.specifications["power"] == 999
+        assert pm.get_product("BAT900") is not None
+
+        with open(prices, "w", encoding="utf-8") as f:
+            f.write("Sungrow SG33CX Inverter: $1900.00\nLONGi 550W Panel: $95.00\n")
+        os.utime(prices, (0, os.path.getmtime(catalog) + 20))
+        assert product_manager.catalog_watcher(catalog).check()
+        merged = pm.get_product(inverter["id"])
+        assert merged.cost == 1900.0 and merged.specifications["power"] == 999
+        assert merged.notes == "Checked against the datasheet"
+        assert pm.get_product("BAT900").cost == 3000.0 and len(pm.products) == 3
+
+        with open(catalog, encoding="utf-8") as f:
+            records = {r["id"]: r for r in json.load(f)["products"]}
+        assert records[inverter["id"]]["specifications"]["power"] == 999
+        assert records[inverter["id"]]["cost"] == 1900.0 and "BAT900" in records
+    print("✅ PASS: merges update prices and keep curated data")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Product Catalog Test Suite")
+    print("="*60)
+
+    test_parsed_once()
+    test_recommendations_match_scan()
+    test_overlay_copy_on_write()
+    test_hot_reload()
+    test_structured_catalog()
+    test_price_list_edits_reach_catalog()
+    test_price_merge_keeps_curated_data()
+    test_fuzzy_search()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
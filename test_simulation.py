@@ -0,0 +1,270 @@
+"""
+Test script for the vectorized simulation engine
+"""
+import dataclasses
+import time
+import numpy as np
+from models import Device, SystemConfiguration, SimulationResult, SimulationFrame
+from calculations import SolarCalculator
+from load_profiles import load_matrix
+
+
+def sample_devices():
+    """Typical small home: fixed-schedule and randomly used devices"""
+    return [
+        Device("LED Lights", 100, 6, preferred_hours=[18, 19, 20, 21, 22, 23]),
+        Device("Refrigerator", 150, 24, is_priority=True, device_type="cooling", has_inverter=True),
+        Device("Air Conditioner", 1200, 8, device_type="cooling", has_inverter=True),
+        Device("Water Pump", 750, 1, preferred_hours=[7]),
+        Device("TV", 120, 5),
+    ]
+
+
+def test_frozen_devices():
+    """Derived device values are fixed at construction and devices cannot be modified"""
+    print("\n" + "="*50)
+    print("🧪 Testing frozen device models")
+    print("="*50)
+
+    ac = Device("Air Conditioner", 1200, 8, device_type="cooling", has_inverter=True)
+    assert ac.inverter_savings_percent == 40
+    assert abs(ac.effective_power_watts - 720) < 1e-9
+    assert abs(ac.daily_energy_kwh - 5.76) < 1e-9
+    assert abs(ac.power_saved_kwh - 3.84) < 1e-9
+    assert not hasattr(ac, '__dict__')
+    try:
+        ac.power_watts = 2000
+        assert False, "Device should be frozen"
+    except dataclasses.FrozenInstanceError:
+        pass
+    assert dataclasses.replace(ac, has_inverter=False).daily_energy_kwh == 9.6
+
+    lights = Device("LED Lights", 100, 6, preferred_hours=[18, 19, 20])
+    assert lights.preferred_hours == (18, 19, 20)
+    assert lights == Device("LED Lights", 100, 6, preferred_hours=(18, 19, 20))
+    assert len({lights, Device("LED Lights", 100, 6, preferred_hours=[18, 19, 20]), ac}) == 2
+    print("✅ PASS: slotted, frozen, hashable, derived values precomputed")
+
+
+def test_24_hour_frame():
+    """Frame has 24 hours and converts back to SimulationResult rows"""
+    print("\n" + "="*50)
+    print("🧪 Testing 24-hour simulation frame")
+    print("="*50)
+
+    calc = SolarCalculator(SystemConfiguration())
+    frame = calc.simulate_24_hours_frame(5.0, 10.0, sample_devices())
+    results = frame.to_results()
+
+    assert len(frame) == 24
+    assert len(results) == 24
+    assert all(isinstance(r, SimulationResult) for r in results)
+    assert [r.hour for r in results] == list(range(24))
+    assert frame.pv_generation_kw[:6].sum() == 0 and frame.pv_generation_kw[18:].sum() == 0
+    assert ((frame.battery_soc >= 0) & (frame.battery_soc <= 100)).all()
+    print("✅ PASS: 24 rows, PV only during daylight, SoC within 0-100%")
+
+
+def test_frame_views():
+    """Columns are shared arrays, rows are built on access, slices are views"""
+    print("\n" + "="*50)
+    print("🧪 Testing columnar frame access")
+    print("="*50)
+
+    frame = SolarCalculator(SystemConfiguration()).simulate_24_hours_frame(5.0, 10.0, sample_devices())
+    row = frame[12]
+    assert isinstance(row, SimulationResult) and row.hour == 12
+    assert row.pv_generation_kw == frame.pv_generation_kw[12]
+
+    midday = frame[10:14]
+    assert isinstance(midday, SimulationFrame) and len(midday) == 4
+    assert np.shares_memory(midday.load_kw, frame.load_kw)
+
+    rebuilt = SimulationFrame.from_results(list(frame))
+    for column in SimulationFrame.COLUMNS:
+        assert np.array_equal(getattr(rebuilt, column), getattr(frame, column))
+    print("✅ PASS: lazy rows, zero-copy slices, lossless round trip")
+
+
+def test_energy_balance():
+    """PV + discharge + import covers load + charge + export + surplus every hour"""
+    print("\n" + "="*50)
+    print("🧪 Testing hourly energy balance")
+    print("="*50)
+
+    for grid_available in (True, False):
+        calc = SolarCalculator(SystemConfiguration(grid_available=grid_available))
+        frame = calc.simulate_24_hours_frame(4.0, 5.0, sample_devices())
+        supply = frame.pv_generation_kw + frame.battery_discharge_kw + frame.grid_import_kw
+        demand = frame.load_kw + frame.battery_charge_kw + frame.grid_export_kw + frame.energy_surplus_kw
+
+        # Off-grid deficits that the battery cannot cover are shed, so supply may fall short
+        if grid_available:
+            assert abs(supply - demand).max() < 1e-9
+        else:
+            assert (supply <= demand + 1e-9).all()
+            assert frame.grid_import_kw.sum() == 0 and frame.grid_export_kw.sum() == 0
+        print(f"✅ PASS: grid_available={grid_available}")
+
+
+def test_full_year():
+    """8760-hour run returns float32 columns and consistent monthly totals"""
+    print("\n" + "="*50)
+    print("🧪 Testing full-year simulation")
+    print("="*50)
+
+    calc = SolarCalculator(SystemConfiguration())
+    start = time.perf_counter()
+    annual = calc.simulate_year(5.0, 10.0, sample_devices())
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert len(annual.hourly) == 8760
+    assert annual.hourly.pv_generation_kw.dtype == np.float32
+    assert len(annual.monthly_pv_kwh) == 12
+    assert abs(annual.annual_pv_kwh - annual.hourly.pv_generation_kw.sum(dtype=np.float64)) < 1.0
+    # Seasonal curve: September peaks, March is the low point
+    assert annual.monthly_pv_kwh[8] / 30 > annual.monthly_pv_kwh[2] / 31
+    assert 0 <= annual.self_sufficiency_percent <= 100
+    print(f"✅ PASS: {annual.annual_pv_kwh:,.0f} kWh PV/year in {elapsed_ms:.1f} ms")
+
+
+def test_full_year_unmet_load():
+    """An undersized off-grid design reports its unmet load and the same self-sufficiency as a batch run"""
+    print("\n" + "="*50)
+    print("🧪 Testing off-grid full-year self-sufficiency")
+    print("="*50)
+
+    calc = SolarCalculator(SystemConfiguration(grid_available=False))
+    annual = calc.simulate_year(1.0, 2.0, sample_devices())
+    assert annual.annual_grid_import_kwh == 0
+    assert len(annual.monthly_unmet_load_kwh) == 12 and annual.annual_unmet_load_kwh > 0
+    assert annual.self_sufficiency_percent < 100
+
+    # Off grid, load not met by PV or the battery is unmet
+    hourly = annual.hourly
+    load = hourly.load_kw.astype(np.float64)
+    unmet = load - np.minimum(hourly.pv_generation_kw, hourly.load_kw) - hourly.battery_discharge_kw
+    assert abs(unmet.sum() - annual.annual_unmet_load_kwh) < 1.0
+    expected = (annual.annual_load_kwh - annual.annual_unmet_load_kwh) / annual.annual_load_kwh * 100
+    assert abs(annual.self_sufficiency_percent - expected) < 1e-9
+    print(f"✅ PASS: {annual.annual_unmet_load_kwh:,.0f} kWh unmet, "
+          f"{annual.self_sufficiency_percent:.1f}% self-sufficient")
+
+
+def test_batch_matches_single_runs():
+    """Each batch candidate equals a separate run over the same load profile"""
+    print("\n" + "="*50)
+    print("🧪 Testing batch simulation")
+    print("="*50)
+
+    for grid_available in (True, False):
+        calc = SolarCalculator(SystemConfiguration(grid_available=grid_available))
+        load = calc.hourly_load_matrix(sample_devices()).sum(axis=0)
+        systems = [(pv, bat) for pv in (0.0, 2.0, 5.5, 10.0) for bat in (0.0, 5.12, 15.36)]
+        batch = calc.simulate_batch(systems, load_kw=load)
+
+        assert batch.battery_soc.shape == (len(systems), 24)
+        for i, (pv, bat) in enumerate(systems):
+            single = calc.simulate_profile(calc.pv_generation_profile(pv), load, bat)
+            candidate = batch.candidate(i)
+            for column in ("battery_soc", "grid_import_kw", "grid_export_kw", "energy_surplus_kw"):
+                assert np.allclose(getattr(candidate, column), getattr(single, column))
+        assert (np.diff(batch.self_sufficiency_percent[::3]) >= -1e-9).all()
+        print(f"✅ PASS: {len(systems)} candidates, grid_available={grid_available}")
+
+    start = time.perf_counter()
+    calc.simulate_batch([(pv, bat) for pv in range(1, 11) for bat in range(0, 25, 5)], load_kw=load)
+    print(f"⏱️ 50 candidates in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+def test_seeded_load_profile():
+    """Same devices and seed give identical results; different seeds differ"""
+    print("\n" + "="*50)
+    print("🧪 Testing seeded load profiles")
+    print("="*50)
+
+    config = SystemConfiguration()
+    first = SolarCalculator(config, seed=7).simulate_24_hours_frame(5.0, 10.0, sample_devices())
+    again = SolarCalculator(config, seed=7).simulate_24_hours_frame(5.0, 10.0, sample_devices())
+    other = SolarCalculator(config, seed=8).simulate_year(5.0, 10.0, sample_devices())
+
+    assert np.array_equal(first.load_kw, again.load_kw)
+    assert np.array_equal(first.battery_soc, again.battery_soc)
+    assert not np.array_equal(SolarCalculator(config, seed=7).simulate_year(5.0, 10.0, sample_devices()).hourly.load_kw,
+                              other.hourly.load_kw)
+
+    rng_draw = load_matrix(sample_devices(), rng=np.random.default_rng(7))
+    assert np.array_equal(rng_draw, load_matrix(sample_devices(), seed=7))
+    assert not load_matrix(sample_devices(), seed=7).flags.writeable
+    print("✅ PASS: identical figures for identical seeds, cached arrays are read-only")
+
+
+def test_monte_carlo():
+    """Percentile bands are ordered, scenario counts match and a seed reproduces its draw"""
+    print("\n" + "="*50)
+    print("🧪 Testing Monte Carlo mode")
+    print("="*50)
+
+    for grid_available in (True, False):
+        config = SystemConfiguration(grid_available=grid_available)
+        calc = SolarCalculator(config)
+        result = calc.simulate_monte_carlo(4.0, 5.0, sample_devices() * 3, scenarios=5000)
+
+        assert len(result.grid_import_kwh) == 5000 and len(result.unmet_load_kwh) == 5000
+        assert result.battery_soc_bands.shape == (3, 24)
+        assert (np.diff(result.battery_soc_bands, axis=0) >= 0).all()
+        assert (np.diff(result.grid_import_bands_kwh) >= 0).all()
+        if grid_available:
+            assert result.unmet_load_kwh.sum() == 0
+        else:
+            assert result.grid_import_kwh.sum() == 0 and result.unmet_load_kwh.sum() > 0
+
+        again = SolarCalculator(config).simulate_monte_carlo(4.0, 5.0, sample_devices() * 3, scenarios=5000)
+        assert np.array_equal(result.grid_import_kwh, again.grid_import_kwh)
+        assert np.array_equal(result.battery_soc_bands, again.battery_soc_bands)
+        other = SolarCalculator(config, seed=calc.seed + 1).simulate_monte_carlo(
+            4.0, 5.0, sample_devices() * 3, scenarios=5000)
+        assert not np.array_equal(result.battery_soc_bands, other.battery_soc_bands)
+        print(f"✅ PASS: grid_available={grid_available}, 5,000 scenarios, reproducible by seed")
+
+
+def test_speed():
+    """Report per-run cost of the vectorized engine"""
+    print("\n" + "="*50)
+    print("🧪 Timing simulate_24_hours")
+    print("="*50)
+
+    calc = SolarCalculator(SystemConfiguration())
+    devices = sample_devices() * 4
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        calc.simulate_24_hours(5.0, 10.0, devices)
+    elapsed_us = (time.perf_counter() - start) / runs * 1e6
+    print(f"⏱️ {elapsed_us:.0f} µs per run ({len(devices)} devices)")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Simulation Engine Test Suite")
+    print("="*60)
+
+    test_frozen_devices()
+    test_24_hour_frame()
+    test_frame_views()
+    test_energy_balance()
+    test_full_year()
+    test_full_year_unmet_load()
+    test_batch_matches_single_runs()
+    test_seeded_load_profile()
+    test_monte_carlo()
+    test_speed()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Test script for the process-wide simulation result cache
+"""
+import time
+from models import SystemConfiguration, SolarPanel
+from calculations import SolarCalculator
+from simulation_cache import SimulationCache, config_fingerprint
+from test_simulation import sample_devices
+
+
+def test_fingerprint():
+    """Equal designs hash equal, any changed input changes the hash"""
+    print("\n" + "="*50)
+    print("🧪 Testing configuration fingerprint")
+    print("="*50)
+
+    base = config_fingerprint(SystemConfiguration(), sample_devices(), 2024, 5.0, 10.0)
+    assert base == config_fingerprint(SystemConfiguration(), sample_devices(), 2024, 5.0, 10.0)
+    assert base != config_fingerprint(SystemConfiguration(), sample_devices(), 2025, 5.0, 10.0)
+    assert base != config_fingerprint(SystemConfiguration(), sample_devices()[:-1], 2024, 5.0, 10.0)
+    assert base != config_fingerprint(SystemConfiguration(), sample_devices(), 2024, 6.0, 10.0)
+    assert base != config_fingerprint(SystemConfiguration(solar_panels=SolarPanel("Mono 550W", 550, quantity=12)),
+                                      sample_devices(), 2024, 5.0, 10.0)
+    print("✅ PASS: seed, devices, sizes and equipment all change the key")
+
+
+def test_lru_and_ttl():
+    """Least recently used entries are evicted and expired ones recomputed"""
+    print("\n" + "="*50)
+    print("🧪 Testing LRU bound and TTL")
+    print("="*50)
+
+    cache = SimulationCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1 and len(cache) == 2
+
+    expiring = SimulationCache(ttl_seconds=0.01)
+    expiring.put("a", 1)
+    time.sleep(0.02)
+    assert expiring.get("a") is None and len(expiring) == 0
+    print("✅ PASS: size bound and expiry honoured")
+
+
+def test_get_or_compute():
+    """Repeated simulation of the same design runs the engine once"""
+    print("\n" + "="*50)
+    print("🧪 Testing cached simulation")
+    print("="*50)
+
+    cache = SimulationCache()
+    calc = SolarCalculator(SystemConfiguration())
+    devices = sample_devices()
+    key = config_fingerprint(calc.config, devices, calc.seed, 5.0, 10.0)
+    calls = []
+
+    def run():
+        calls.append(1)
+        return calc.simulate_24_hours(5.0, 10.0, devices)
+
+    first = cache.get_or_compute(key, run)
+    second = cache.get_or_compute(key, run)
+    assert first is second and len(calls) == 1
+    assert cache.hits == 1 and cache.misses == 1
+
+    annual = cache.get_or_compute(key + ':year', lambda: calc.simulate_year(5.0, 10.0, devices))
+    assert not annual.hourly.battery_soc.flags.writeable and not annual.monthly_pv_kwh.flags.writeable
+    try:
+        annual.hourly.load_kw[0] = 0.0
+        assert False, "cached array modified"
+    except ValueError:
+        pass
+    print("✅ PASS: second run served from cache")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Simulation Cache Test Suite")
+    print("="*60)
+
+    test_fingerprint()
+    test_lru_and_ttl()
+    test_get_or_compute()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
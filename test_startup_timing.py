@@ -0,0 +1,104 @@
+"""
+Test script for rerun timing and per-section profiling
+"""
+import json
+import os
+import tempfile
+import threading
+import startup_timing
+from startup_timing import RunTimer, profiled, read_profile_log, section, section_percentiles
+
+
+@profiled()
+def _slow_step(n):
+    return sum(range(n))
+
+
+def test_sections():
+    """Marks, section() blocks and @profiled calls land in the active run only"""
+    print("\n" + "="*50)
+    print("🧪 Testing profiled sections")
+    print("="*50)
+
+    log_path = startup_timing.PROFILE_LOG
+    with tempfile.TemporaryDirectory() as tmp:
+        startup_timing.PROFILE_LOG = os.path.join(tmp, "profile.jsonl")
+        startup_timing._log_lines = None
+
+        assert _slow_step(10) == 45  # No active run: plain call
+        timer = RunTimer(profile=True)
+        timer.mark("imports")
+        with section("page:nav_dashboard"):
+            _slow_step(1000)
+            _slow_step(1000)
+        timer.mark("sidebar")
+
+        # Another thread (another session) is not profiled into this run
+        other = threading.Thread(target=_slow_step, args=(10,))
+        other.start()
+        other.join()
+
+        sections = timer.section_ms()
+        assert set(sections) == {"imports", "page:nav_dashboard", "_slow_step", "sidebar"}
+        assert timer.calls["_slow_step"] == 2
+        assert sections["page:nav_dashboard"] >= sections["_slow_step"]
+
+        timer.finish()
+        runs = read_profile_log(startup_timing.PROFILE_LOG)
+        assert len(runs) == 1 and set(runs[0]["sections"]) == set(sections)
+        assert getattr(startup_timing._active, "timer") is None
+
+        # Unprofiled runs record nothing
+        RunTimer(profile=False).finish()
+        assert len(read_profile_log(startup_timing.PROFILE_LOG)) == 1
+    startup_timing.PROFILE_LOG, startup_timing._log_lines = log_path, None
+    print("✅ PASS: sections per run, JSONL line written")
+
+
+def test_rolling_log():
+    """The log is trimmed to the most recent runs"""
+    print("\n" + "="*50)
+    print("🧪 Testing rolling profile log")
+    print("="*50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "profile.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(10):
+                f.write(json.dumps({"ts": i, "total_ms": i, "sections": {}}) + "\n")
+        assert startup_timing._trim_log(path, 4) == 4
+        assert [run["ts"] for run in read_profile_log(path)] == [6, 7, 8, 9]
+    print("✅ PASS: oldest runs dropped")
+
+
+def test_percentiles():
+    """Nearest-rank percentiles per section"""
+    print("\n" + "="*50)
+    print("🧪 Testing section percentiles")
+    print("="*50)
+
+    runs = [{"total_ms": float(ms), "sections": {"page": float(ms) / 2}} for ms in range(1, 101)]
+    stats = section_percentiles(runs)
+    assert list(stats) == ["total", "page"]
+    assert stats["total"] == {"runs": 100, "p50": 50.0, "p90": 90.0, "p99": 99.0}
+    assert stats["page"]["p90"] == 45.0
+    print("✅ PASS: p50/p90/p99 per section")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Timing Test Suite")
+    print("="*60)
+
+    test_sections()
+    test_rolling_log()
+    test_percentiles()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Test script for the catalog-driven system optimizer
+"""
+from product_manager import ProductManager
+from models import SystemConfiguration
+import numpy as np
+from system_optimizer import CHUNK_SIZE, SystemOptimizer, _bank_series_count, _pareto_mask
+from test_simulation import sample_devices
+
+
+def test_voltage_matching():
+    """Battery banks are built to the inverter DC voltage"""
+    print("\n" + "="*50)
+    print("🧪 Testing battery/inverter voltage matching")
+    print("="*50)
+
+    assert _bank_series_count(51.2, 48) == 1
+    assert _bank_series_count(12.0, 48) == 4
+    assert _bank_series_count(51.2, 24) == 0
+    assert _bank_series_count(400.0, 48) == 0
+    print("✅ PASS: 51.2V→1 in series, 12V→4 in series, mismatches rejected")
+
+
+def test_pareto_front():
+    """Front is feasible and no member is dominated by another"""
+    print("\n" + "="*50)
+    print("🧪 Testing optimizer Pareto front")
+    print("="*50)
+
+    config = SystemConfiguration(devices=sample_devices())
+    result = SystemOptimizer(ProductManager(), config).optimize(time_budget_seconds=5.0)
+
+    assert result.front, "optimizer returned no candidates"
+    for c in result.front:
+        assert c.pv_kw <= c.inverter.specifications["power"] * 1.25 + 1e-9
+        if c.inverter.specifications.get("type") == "On-Grid":
+            assert c.battery_count == 0
+        for other in result.front:
+            dominates = (other.total_cost <= c.total_cost
+                         and other.self_sufficiency_percent >= c.self_sufficiency_percent
+                         and other.payback_years <= c.payback_years
+                         and (other.total_cost, other.self_sufficiency_percent, other.payback_years)
+                         != (c.total_cost, c.self_sufficiency_percent, c.payback_years))
+            assert not dominates, f"{c} dominated by {other}"
+
+    best = result.front[0].to_configuration(config)
+    assert abs(best.total_system_cost - result.front[0].total_cost) < 0.01
+    print(f"✅ PASS: {len(result.front)} Pareto candidates from {result.evaluated:,} "
+          f"combinations in {result.elapsed_seconds:.2f}s")
+
+
+def test_time_budget():
+    """Search stops when the time budget runs out"""
+    print("\n" + "="*50)
+    print("🧪 Testing optimizer time budget")
+    print("="*50)
+
+    config = SystemConfiguration(devices=sample_devices() * 4)
+    result = SystemOptimizer(ProductManager(), config).optimize(time_budget_seconds=0.0, max_pv_kw=60)
+    assert not result.complete
+    assert result.front
+    # The first chunk is small, so an exhausted budget is not overrun by a full chunk
+    assert result.evaluated < CHUNK_SIZE
+    print(f"✅ PASS: stopped after {result.evaluated:,} combinations")
+
+
+def test_pareto_mask_matches_brute_force():
+    """The sweep keeps exactly the candidates no other candidate dominates"""
+    print("\n" + "="*50)
+    print("🧪 Testing Pareto mask")
+    print("="*50)
+
+    rng = np.random.default_rng(3)
+    cost = rng.integers(1000, 1100, 500).astype(float)
+    self_sufficiency = rng.integers(0, 50, 500).astype(float)
+    payback = rng.integers(1, 30, 500).astype(float)
+    mask = _pareto_mask(cost, self_sufficiency, payback)
+
+    objectives = np.column_stack((cost, -self_sufficiency, payback))
+    for i, row in enumerate(objectives):
+        dominated = ((objectives <= row).all(axis=1) & (objectives < row).any(axis=1)).any()
+        duplicate_before = (objectives[:i] == row).all(axis=1).any()
+        assert mask[i] == (not dominated and not duplicate_before)
+    print(f"✅ PASS: {mask.sum()} of 500 candidates on the front")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar System Optimizer Test Suite")
+    print("="*60)
+
+    test_voltage_matching()
+    test_pareto_front()
+    test_time_budget()
+    test_pareto_mask_matches_brute_force()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
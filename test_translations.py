@@ -0,0 +1,113 @@
+"""
+Test script for the shared translation store
+"""
+import threading
+import translations
+from translations import TRANSLATIONS, t, translation_table, translator, use_language
+
+
+def test_bound_lookup():
+    """Per-language lookups return the table text, or the key when untranslated"""
+    print("\n" + "="*50)
+    print("🧪 Testing bound translation lookups")
+    print("="*50)
+
+    en, kh = translator('en'), translator('kh')
+    assert en('nav_dashboard') == TRANSLATIONS['en']['nav_dashboard']
+    assert kh('nav_dashboard') == TRANSLATIONS['kh']['nav_dashboard'] != en('nav_dashboard')
+    assert en('no_such_key') == 'no_such_key'
+    assert translator('fr')('nav_dashboard') == 'nav_dashboard'
+    optimizer_keys = {key for key in TRANSLATIONS['en'] if key.startswith('optimizer_')}
+    assert optimizer_keys and optimizer_keys <= set(TRANSLATIONS['kh'])
+    assert translations.load_translations() is translations.load_translations()
+    print("✅ PASS: lookups bound once per language")
+
+
+def test_language_per_thread():
+    """use_language() binds t() for the calling script run only"""
+    print("\n" + "="*50)
+    print("🧪 Testing per-run language binding")
+    print("="*50)
+
+    seen = {}
+
+    def run(language):
+        use_language(language)
+        seen[language] = t('nav_dashboard')
+
+    threads = [threading.Thread(target=run, args=(lang,)) for lang in ('en', 'kh')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == {lang: TRANSLATIONS[lang]['nav_dashboard'] for lang in ('en', 'kh')}
+    print("✅ PASS: concurrent sessions keep their own language")
+
+
+def test_shared_store():
+    """Report and Telegram labels come from the same store"""
+    print("\n" + "="*50)
+    print("🧪 Testing report and Telegram labels")
+    print("="*50)
+
+    from report_translations import REPORT_LABELS
+    from telegram_report_templates import format_report_bilingual, format_report_english, format_report_khmer
+
+    en, kh = translation_table('en', 'report'), translation_table('kh', 'report')
+    assert REPORT_LABELS['customer_info'] == f"{en['customer_info']} / {kh['customer_info']}"
+    assert REPORT_LABELS['company_name'] == en['company_name']
+
+    data = {'customer_name': 'Dara', 'monthly_kwh': 300, 'daily_kwh': 10, 'annual_savings': 600}
+    english, khmer, both = format_report_english(data), format_report_khmer(data), format_report_bilingual(data)
+    title_en, title_kh = translator('en', 'telegram')('report_title'), translator('kh', 'telegram')('report_title')
+    assert title_en in english and title_kh not in english
+    assert title_kh in khmer and title_en not in khmer
+    assert f"{title_en} | {title_kh}" in both
+    print("✅ PASS: one store for UI, report and Telegram text")
+
+
+def test_report_fits_one_telegram_message():
+    """A report for a large design with many devices still fits in one Telegram message"""
+    print("\n" + "="*50)
+    print("🧪 Testing Telegram message length")
+    print("="*50)
+
+    from calculations import SolarCalculator
+    from models import Device, SystemConfiguration
+    from telegram_report_templates import format_report
+
+    telegram_limit = 4096  # characters per message
+    devices = [Device(f"Air Conditioner {i}", 1200 + 10 * i, 8, device_type="cooling", has_inverter=True)
+               for i in range(120)]
+    simulation = SolarCalculator(SystemConfiguration()).simulate_24_hours(250.0, 500.0, devices)
+    data = {
+        'customer_name': "Sokha Chanthavy Sovannarith Development Company", 'phone': "+855 12 345 678 / +855 98 765 432",
+        'address': "Street 2004, Sangkat Tuek Thla, Khan Sen Sok, Phnom Penh", 'simulation': simulation,
+        'system_type': "Hybrid", 'num_panels': 450, 'panel_wattage': 585, 'pv_kw': 263.25,
+        'battery_kwh': 512.0, 'num_batteries': 100, 'inverter_kw': 250.0, 'total_price': 1234567.89,
+        'monthly_savings': 98765.43, 'annual_savings': 1185185.16, 'payback_years': 12.3, 'date': "2026-10-17",
+    }
+    for language in ('en', 'kh', 'bilingual'):
+        message = format_report(data, language)
+        assert len(message) <= telegram_limit, (language, len(message))
+    print(f"✅ PASS: bilingual report is {len(message)} of {telegram_limit} characters")
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "="*60)
+    print("🚀 KHSolar Translations Test Suite")
+    print("="*60)
+
+    test_bound_lookup()
+    test_language_per_thread()
+    test_shared_store()
+    test_report_fits_one_telegram_message()
+
+    print("\n" + "="*60)
+    print("✅ All Tests Complete!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Translations
+English and Khmer strings for the app UI, the PDF/Word reports and the Telegram reports
+
+All text lives in translations.json and is loaded once per process into
+per-language tables. translator() returns a bound lookup for one language
+and namespace; t() uses the lookup bound for the current script run.
+"""
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Callable, Dict
+
+TRANSLATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations.json")
+DEFAULT_LANGUAGE = 'en'
+
+
+class TranslationTable(dict):
+    """Strings for one language; a missing key translates to itself"""
+    __slots__ = ()
+
+    def __missing__(self, key):
+        return key
+
+
+@lru_cache(maxsize=None)
+def load_translations(filepath: str = TRANSLATIONS_FILE) -> Dict[str, Dict[str, TranslationTable]]:
+    """Namespace -> language -> table, parsed once per process"""
+    with open(filepath, encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        namespace: {language: TranslationTable(strings) for language, strings in languages.items()}
+        for namespace, languages in data["namespaces"].items()
+    }
+
+
+def translation_table(language: str, namespace: str = 'ui') -> TranslationTable:
+    """Table for one language, empty (every key maps to itself) if it is not translated"""
+    return load_translations()[namespace].get(language, TranslationTable())
+
+
+def translator(language: str, namespace: str = 'ui') -> Callable[[str], str]:
+    """Bound lookup key -> text for one language, with no per-call dictionary walk"""
+    return translation_table(language, namespace).__getitem__
+
+
+# UI strings by language, kept for code that indexes the tables directly
+TRANSLATIONS = load_translations()['ui']
+
+_active = threading.local()
+_default_lookup = translator(DEFAULT_LANGUAGE)
+
+
+def use_language(language: str):
+    """Bind t() to language for the rest of this script run (Streamlit runs each session in its own thread)"""
+    _active.lookup = translator(language)
+
+
+# Helper function to get translation
+def t(key):
+    """Get translation for current language"""
+    return getattr(_active, 'lookup', _default_lookup)(key)
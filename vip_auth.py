@@ -0,0 +1,98 @@
+"""
+VIP Access
+VIP user lookup and login checks for the Streamlit app
+
+The database is initialized once, when this module is first imported.
+"""
+import sqlite3
+from datetime import datetime
+
+# Initialize VIP user database
+def init_vip_database():
+    """Initialize SQLite database for VIP users"""
+    conn = sqlite3.connect('vip_users.db')
+    c = conn.cursor()
+    c.execute('''CREATE TABLE IF NOT EXISTS vip_users
+                 (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  phone TEXT UNIQUE,
+                  telegram TEXT,
+                  name TEXT,
+                  email TEXT,
+                  is_vip INTEGER DEFAULT 0,
+                  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                  expires_at TIMESTAMP)''')
+    conn.commit()
+    conn.close()
+
+init_vip_database()
+
+def check_vip_status(phone=None, telegram=None):
+    """Check if user is VIP by phone or telegram"""
+    try:
+        conn = sqlite3.connect('vip_users.db')
+        c = conn.cursor()
+        
+        if phone:
+            c.execute('SELECT is_vip, expires_at FROM vip_users WHERE phone = ?', (phone,))
+        elif telegram:
+            telegram_clean = telegram.strip().lstrip('@')
+            c.execute('SELECT is_vip, expires_at FROM vip_users WHERE telegram = ?', (telegram_clean,))
+        else:
+            return False
+            
+        result = c.fetchone()
+        conn.close()
+        
+        if result and result[0] == 1:
+            # Check if VIP hasn't expired
+            if result[1] is None:  # No expiration
+                return True
+            expires = datetime.strptime(result[1], '%Y-%m-%d %H:%M:%S')
+            return datetime.now() < expires
+        return False
+    except:
+        return False
+
+def add_vip_user(phone, telegram='', name='', email='', expires_at=None):
+    """Add or update VIP user"""
+    try:
+        conn = sqlite3.connect('vip_users.db')
+        c = conn.cursor()
+        telegram_clean = telegram.strip().lstrip('@') if telegram else ''
+        
+        c.execute('''INSERT OR REPLACE INTO vip_users 
+                     (phone, telegram, name, email, is_vip, expires_at)
+                     VALUES (?, ?, ?, ?, 1, ?)''',
+                  (phone, telegram_clean, name, email, expires_at))
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        print(f"Error adding VIP user: {e}")
+        return False
+
+# VIP Login Functions
+def verify_vip_login(username, password):
+    """Verify VIP login credentials"""
+    # Check VIP user credentials
+    vip_users = {
+        "chhany": "chhany@#$088",
+        "sothea": "sothea@#$234"
+    }
+    
+    if username in vip_users and password == vip_users[username]:
+        return True
+    
+    # Then check database for other users
+    import hashlib
+    try:
+        conn = sqlite3.connect('admin_users.db')
+        c = conn.cursor()
+        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        c.execute('SELECT id, username FROM admin_users WHERE username = ? AND password_hash = ?',
+                  (username, password_hash))
+        result = c.fetchone()
+        conn.close()
+        return result is not None
+    except:
+        return False
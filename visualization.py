@@ -1,17 +1,115 @@
 """
 Visualization and Reporting Module
+
+Figures are cached in two steps, both keyed by a fingerprint of the chart
+inputs. The traces are built once per input and stored as figure JSON with
+translation keys for text and color-scheme keys for colors; each style
+(language, template, colors) then patches a copy of them and caches the
+result. A rerun with unchanged results deserializes a cached figure, and a
+language or style change reuses the cached traces and only restyles them.
+
+Series longer than WEBGL_THRESHOLD points (a year of hours, thousands of
+Monte Carlo scenarios) are drawn with WebGL Scattergl traces and reduced
+by M4 downsampling, which keeps each bucket's first, last, minimum and
+maximum point so peaks survive. Narrower windows get more detail.
 """
+import hashlib
+import json
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
-from typing import List
-from models import SimulationResult, Device
+import numpy as np
+from typing import Callable, List
+from models import AnnualSimulation, Device, MonteCarloResult, SimulationFrame, SimulationResults, as_frame
+from simulation_cache import SimulationCache
+from startup_timing import profiled
+from translations import DEFAULT_LANGUAGE, translator
+
+# Figure JSON shared by every session, keyed "<chart>:<inputs>[:<style>]"
+FIGURE_CACHE = SimulationCache(max_entries=256)
+
+# Series with more points than this are drawn with WebGL and downsampled
+WEBGL_THRESHOLD = 1000
+# Most points kept per downsampled trace (M4 keeps four per bucket)
+MAX_PLOT_POINTS = 2000
+
+# Start of the simulated year on date axes (any non-leap year: it has 365 days)
+YEAR_START = np.datetime64('2025-01-01T00', 'h')
+
+
+def chart_fingerprint(*inputs) -> str:
+    """Stable hash of chart inputs; NumPy arrays are hashed by dtype, shape and bytes"""
+    digest = hashlib.sha1()
+    for part in inputs:
+        if isinstance(part, np.ndarray):
+            digest.update(repr((part.dtype.str, part.shape)).encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+    return digest.hexdigest()
+
+
+def frame_fingerprint(frame: SimulationFrame) -> str:
+    """Fingerprint of every column of a simulation frame"""
+    return chart_fingerprint(*(getattr(frame, name) for name in frame.COLUMNS))
+
+
+def _figure_from_json(figure_json: str, validate: bool = False) -> go.Figure:
+    """
+    Figure from cached JSON
+
+    The JSON came from a validated figure, so plotly's per-property checks
+    are skipped unless the figure is going to be edited: an unvalidated
+    figure stores edits as given (template names, for example, stay
+    unexpanded).
+    """
+    return go.Figure(json.loads(figure_json), _validate=validate)
+
+
+def _rgba(hex_color: str, alpha: float) -> str:
+    red, green, blue = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({red}, {green}, {blue}, {alpha})"
+
+
+def _first_per_bucket(mask: np.ndarray, bucket: np.ndarray) -> np.ndarray:
+    indices = np.flatnonzero(mask)
+    return indices[np.unique(bucket[indices], return_index=True)[1]]
+
+
+def m4_indices(values: np.ndarray, max_points: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Sorted indices of an M4 downsampling of values
+
+    The series is cut into max_points // 4 equal buckets, and the first,
+    last, minimum and maximum point of each bucket are kept. Drawn at one
+    bucket per pixel column, the line looks the same as the full series.
+    """
+    count = len(values)
+    if count <= max_points:
+        return np.arange(count)
+    buckets = max(max_points // 4, 1)
+    starts = np.linspace(0, count, buckets + 1).astype(np.int64)
+    bucket = np.repeat(np.arange(buckets), np.diff(starts))
+    starts = starts[:-1]
+    lows = _first_per_bucket(values == np.minimum.reduceat(values, starts)[bucket], bucket)
+    highs = _first_per_bucket(values == np.maximum.reduceat(values, starts)[bucket], bucket)
+    ends = np.append(starts[1:], count) - 1
+    return np.unique(np.concatenate((starts, ends, lows, highs)))
+
+
+def _series_trace(x: np.ndarray, y: np.ndarray, **kwargs):
+    """Line trace: SVG Scatter up to WEBGL_THRESHOLD points, else an M4-downsampled Scattergl"""
+    if len(y) <= WEBGL_THRESHOLD:
+        return go.Scatter(x=x, y=y, **kwargs)
+    keep = m4_indices(y)
+    return go.Scattergl(x=x[keep], y=y[keep], **kwargs)
 
 class SolarVisualizer:
     """Create visualizations for solar system analysis"""
     
-    def __init__(self):
+    def __init__(self, language: str = DEFAULT_LANGUAGE, template: str = 'plotly_white'):
+        self.language = language
+        self.template = template
         self.color_scheme = {
             'pv': '#FDB462',  # Orange
             'battery_charge': '#80B1D3',  # Light blue
@@ -22,201 +120,285 @@ class SolarVisualizer:
             'battery_soc': '#95E1D3'  # Mint green
         }
     
-    def create_24h_energy_flow_chart(self, simulation_results: List[SimulationResult]) -> go.Figure:
+    def style_key(self) -> str:
+        """Fingerprint of everything the style step depends on"""
+        return chart_fingerprint(self.language, self.template, sorted(self.color_scheme.items()))
+    
+    def _figure(self, chart: str, inputs_key: str, build: Callable[[], go.Figure],
+                style: Callable[[go.Figure, Callable[[str], str]], None]) -> go.Figure:
+        """
+        Cached figure for chart and inputs in the current style
+
+        build() returns the unstyled figure: text is given as 'chart'
+        translation keys and each trace's meta names its color_scheme
+        entries. style(fig, label) translates, colors and lays it out.
+        """
+        styled_key = f"{chart}:{inputs_key}:{self.style_key()}"
+        figure_json = FIGURE_CACHE.get(styled_key)
+        if figure_json is not None:
+            return _figure_from_json(figure_json)
+        
+        traces_key = f"{chart}:{inputs_key}"
+        traces_json = FIGURE_CACHE.get(traces_key)
+        if traces_json is None:
+            fig = build()
+            FIGURE_CACHE.put(traces_key, fig.to_json())
+        else:
+            fig = _figure_from_json(traces_json, validate=True)
+        style(fig, translator(self.language, 'chart'))
+        fig.update_traces(meta=None)
+        FIGURE_CACHE.put(styled_key, fig.to_json())
+        return fig
+    
+    def _color_traces(self, fig: go.Figure, label: Callable[[str], str]):
+        """Translate trace names and apply line and fill colors from each trace's meta"""
+        for trace in fig.data:
+            color = self.color_scheme[trace.meta]
+            trace.name = label(trace.name)
+            trace.line.color = color
+            if trace.fill:
+                trace.fillcolor = _rgba(color, 0.3)
+    
+    @profiled()
+    def create_24h_energy_flow_chart(self, simulation_results: SimulationResults) -> go.Figure:
         """Create 24-hour energy flow visualization"""
-        hours = [r.hour for r in simulation_results]
+        frame = as_frame(simulation_results)
+        return self._figure('energy_flow', frame_fingerprint(frame),
+                            lambda: self._build_24h_energy_flow(frame), self._style_24h_energy_flow)
+    
+    def _build_24h_energy_flow(self, frame: SimulationFrame) -> go.Figure:
+        hours = frame.hour
         
         fig = make_subplots(
             rows=2, cols=1,
-            subplot_titles=('Energy Flow (kW)', 'Battery State of Charge (%)'),
+            subplot_titles=('energy_flow_kw', 'battery_soc_pct'),
             vertical_spacing=0.15,
             row_heights=[0.6, 0.4]
         )
         
         # Top chart: Energy flows
         fig.add_trace(
-            go.Scatter(
-                x=hours,
-                y=[r.pv_generation_kw for r in simulation_results],
-                name='PV Generation',
-                line=dict(color=self.color_scheme['pv'], width=3),
-                fill='tozeroy',
-                fillcolor='rgba(253, 180, 98, 0.3)'
+            _series_trace(
+                hours,
+                frame.pv_generation_kw,
+                name='pv_generation',
+                meta='pv',
+                line=dict(width=3),
+                fill='tozeroy'
             ),
             row=1, col=1
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=hours,
-                y=[r.load_kw for r in simulation_results],
-                name='Load',
-                line=dict(color=self.color_scheme['load'], width=2, dash='dash')
+            _series_trace(
+                hours,
+                frame.load_kw,
+                name='load',
+                meta='load',
+                line=dict(width=2, dash='dash')
             ),
             row=1, col=1
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=hours,
-                y=[r.battery_charge_kw for r in simulation_results],
-                name='Battery Charge',
-                line=dict(color=self.color_scheme['battery_charge'], width=2)
+            _series_trace(
+                hours,
+                frame.battery_charge_kw,
+                name='battery_charge',
+                meta='battery_charge',
+                line=dict(width=2)
             ),
             row=1, col=1
         )
         
         fig.add_trace(
-            go.Scatter(
-                x=hours,
-                y=[r.battery_discharge_kw for r in simulation_results],
-                name='Battery Discharge',
-                line=dict(color=self.color_scheme['battery_discharge'], width=2)
+            _series_trace(
+                hours,
+                frame.battery_discharge_kw,
+                name='battery_discharge',
+                meta='battery_discharge',
+                line=dict(width=2)
             ),
             row=1, col=1
         )
         
         # Bottom chart: Battery SoC
         fig.add_trace(
-            go.Scatter(
-                x=hours,
-                y=[r.battery_soc for r in simulation_results],
-                name='Battery SoC',
-                line=dict(color=self.color_scheme['battery_soc'], width=3),
-                fill='tozeroy',
-                fillcolor='rgba(149, 225, 211, 0.3)'
+            _series_trace(
+                hours,
+                frame.battery_soc,
+                name='battery_soc',
+                meta='battery_soc',
+                line=dict(width=3),
+                fill='tozeroy'
             ),
             row=2, col=1
         )
         
         # Add horizontal lines for battery zones
         fig.add_hline(y=80, line_dash="dot", line_color="green", 
-                     annotation_text="Full", row=2, col=1)
+                     annotation_text="soc_full", row=2, col=1)
         fig.add_hline(y=20, line_dash="dot", line_color="red", 
-                     annotation_text="Low", row=2, col=1)
+                     annotation_text="soc_low", row=2, col=1)
         
-        # Update layout
-        fig.update_xaxes(title_text="Hour of Day", row=2, col=1)
-        fig.update_yaxes(title_text="Power (kW)", row=1, col=1)
-        fig.update_yaxes(title_text="SoC (%)", range=[0, 100], row=2, col=1)
+        fig.update_yaxes(range=[0, 100], row=2, col=1)
         
+        return fig
+    
+    def _style_24h_energy_flow(self, fig: go.Figure, label: Callable[[str], str]):
+        self._color_traces(fig, label)
+        fig.for_each_annotation(lambda annotation: annotation.update(text=label(annotation.text)))
+        
+        # Update layout (axes by name: a figure read back from JSON has no subplot grid)
         fig.update_layout(
+            xaxis2_title_text=label("hour_of_day"),
+            yaxis_title_text=label("power_kw"),
+            yaxis2_title_text=label("soc_pct"),
             height=700,
             showlegend=True,
             hovermode='x unified',
-            template='plotly_white',
-            title_text="24-Hour Solar System Simulation",
+            template=self.template,
+            title_text=label("energy_flow_title"),
             title_x=0.5
         )
-        
-        return fig
     
-    def create_energy_balance_pie(self, simulation_results: List[SimulationResult]) -> go.Figure:
+    @profiled()
+    def create_energy_balance_pie(self, simulation_results: SimulationResults) -> go.Figure:
         """Create pie chart showing energy sources"""
-        total_pv = sum(r.pv_generation_kw for r in simulation_results)
-        total_grid_import = sum(r.grid_import_kw for r in simulation_results)
-        total_battery = sum(r.battery_discharge_kw for r in simulation_results)
+        frame = as_frame(simulation_results)
+        return self._figure('energy_balance', frame_fingerprint(frame),
+                            lambda: self._build_energy_balance_pie(frame), self._style_energy_balance_pie)
+    
+    def _build_energy_balance_pie(self, frame: SimulationFrame) -> go.Figure:
+        total_pv = float(frame.pv_generation_kw.sum())
+        total_grid_import = float(frame.grid_import_kw.sum())
+        total_battery = float(frame.battery_discharge_kw.sum())
         
-        labels = ['Solar (PV)', 'Grid Import', 'Battery Discharge']
+        labels = ['solar_pv', 'grid_import', 'battery_discharge']
         values = [total_pv, total_grid_import, total_battery]
-        colors = [self.color_scheme['pv'], self.color_scheme['grid_import'], 
-                 self.color_scheme['battery_discharge']]
         
-        fig = go.Figure(data=[go.Pie(
+        return go.Figure(data=[go.Pie(
             labels=labels,
             values=values,
-            marker=dict(colors=colors),
+            meta=['pv', 'grid_import', 'battery_discharge'],
             hole=0.4,
             textinfo='label+percent',
             hovertemplate='%{label}<br>%{value:.2f} kWh<br>%{percent}<extra></extra>'
         )])
+    
+    def _style_energy_balance_pie(self, fig: go.Figure, label: Callable[[str], str]):
+        pie = fig.data[0]
+        pie.update(labels=[label(key) for key in pie.labels],
+                   marker=dict(colors=[self.color_scheme[key] for key in pie.meta]))
         
         fig.update_layout(
-            title_text="Daily Energy Sources",
+            title_text=label("energy_sources_title"),
             title_x=0.5,
-            template='plotly_white'
+            template=self.template
         )
-        
-        return fig
     
+    @profiled()
     def create_device_consumption_chart(self, devices: List[Device]) -> go.Figure:
         """Create bar chart of device energy consumption"""
+        inputs = [(d.name, d.daily_energy_kwh, d.is_priority) for d in devices]
+        return self._figure('device_consumption', chart_fingerprint(inputs),
+                            lambda: self._build_device_consumption(devices), self._style_device_consumption)
+    
+    def _build_device_consumption(self, devices: List[Device]) -> go.Figure:
         device_names = [d.name for d in devices]
         energy_values = [d.daily_energy_kwh for d in devices]
         
         # Color code by priority
-        colors = ['#FF6B6B' if d.is_priority else '#4ECDC4' for d in devices]
+        colors = ['grid_import' if d.is_priority else 'grid_export' for d in devices]
         
-        fig = go.Figure(data=[
+        return go.Figure(data=[
             go.Bar(
                 x=device_names,
                 y=energy_values,
-                marker_color=colors,
+                meta=colors,
                 text=[f"{e:.2f} kWh" for e in energy_values],
                 textposition='auto',
             )
         ])
+    
+    def _style_device_consumption(self, fig: go.Figure, label: Callable[[str], str]):
+        bar = fig.data[0]
+        bar.marker.color = [self.color_scheme[key] for key in bar.meta]
         
         fig.update_layout(
-            title="Device Daily Energy Consumption",
-            xaxis_title="Device",
-            yaxis_title="Energy (kWh/day)",
-            template='plotly_white',
+            title=label("device_consumption_title"),
+            xaxis_title=label("device"),
+            yaxis_title=label("energy_kwh_day"),
+            template=self.template,
             showlegend=False
         )
-        
-        return fig
     
+    @profiled()
     def create_financial_chart(self, years: int, annual_savings: float, 
                               system_cost: float) -> go.Figure:
         """Create financial analysis chart showing cumulative savings"""
         year_range = list(range(years + 1))
         cumulative_savings = [annual_savings * y - system_cost for y in year_range]
+        payback_year = next((i for i, val in enumerate(cumulative_savings) if val >= 0), None)
         
+        return self._figure('financial', chart_fingerprint(years, annual_savings, system_cost),
+                            lambda: self._build_financial(year_range, cumulative_savings, payback_year),
+                            lambda fig, label: self._style_financial(fig, label, payback_year))
+    
+    def _build_financial(self, year_range: List[int], cumulative_savings: List[float],
+                         payback_year) -> go.Figure:
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
             x=year_range,
             y=cumulative_savings,
             mode='lines+markers',
-            name='Net Savings',
-            line=dict(color='#4ECDC4', width=3),
-            fill='tozeroy',
-            fillcolor='rgba(78, 205, 196, 0.3)'
+            name='net_savings',
+            meta='grid_export',
+            line=dict(width=3),
+            fill='tozeroy'
         ))
         
         # Add break-even line
         fig.add_hline(y=0, line_dash="dash", line_color="red", 
-                     annotation_text="Break-even")
+                     annotation_text="break_even")
         
-        # Find and mark payback year
-        for i, val in enumerate(cumulative_savings):
-            if val >= 0:
-                fig.add_vline(x=i, line_dash="dot", line_color="green",
-                            annotation_text=f"Payback: Year {i}")
-                break
+        # Mark payback year
+        if payback_year is not None:
+            fig.add_vline(x=payback_year, line_dash="dot", line_color="green",
+                          annotation_text="payback_year")
+        
+        return fig
+    
+    def _style_financial(self, fig: go.Figure, label: Callable[[str], str], payback_year):
+        self._color_traces(fig, label)
+        fig.for_each_annotation(lambda annotation: annotation.update(
+            text=label(annotation.text).format(payback_year)))
         
         fig.update_layout(
-            title="Cumulative Savings Over Time",
-            xaxis_title="Years",
-            yaxis_title="Net Savings (USD)",
-            template='plotly_white',
+            title=label("savings_title"),
+            xaxis_title=label("years"),
+            yaxis_title=label("net_savings_usd"),
+            template=self.template,
             hovermode='x'
         )
-        
-        return fig
     
+    @profiled()
     def create_roi_gauge(self, roi_percent: float) -> go.Figure:
         """Create gauge chart for ROI"""
+        return self._figure('roi_gauge', chart_fingerprint(roi_percent),
+                            lambda: self._build_roi_gauge(roi_percent), self._style_roi_gauge)
+    
+    def _build_roi_gauge(self, roi_percent: float) -> go.Figure:
         fig = go.Figure(go.Indicator(
             mode="gauge+number+delta",
             value=roi_percent,
+            meta='grid_export',
             domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Return on Investment (ROI)", 'font': {'size': 24}},
+            title={'text': "roi_title", 'font': {'size': 24}},
             delta={'reference': 100},
             gauge={
                 'axis': {'range': [None, 500]},
-                'bar': {'color': "#4ECDC4"},
                 'steps': [
                     {'range': [0, 100], 'color': "#FFE5E5"},
                     {'range': [100, 300], 'color': "#E5F7F6"},
@@ -234,16 +416,122 @@ class SolarVisualizer:
         
         return fig
     
-    def create_monthly_summary_table(self, simulation_results: List[SimulationResult]) -> pd.DataFrame:
+    def _style_roi_gauge(self, fig: go.Figure, label: Callable[[str], str]):
+        gauge = fig.data[0]
+        gauge.update(title_text=label(gauge.title.text), gauge_bar_color=self.color_scheme[gauge.meta])
+    
+    @profiled()
+    def create_annual_energy_chart(self, annual: AnnualSimulation, first_month: int = 1,
+                                   last_month: int = 12) -> go.Figure:
+        """
+        Create hourly energy flow chart for a range of months of a full-year simulation
+        
+        Up to WEBGL_THRESHOLD hours (about a month) every hour is drawn;
+        wider ranges are downsampled, so narrowing the range adds detail.
+        """
+        start, end = (int(i) for i in np.searchsorted(annual.month, [first_month, last_month + 1]))
+        window = annual.hourly[start:end]
+        return self._figure('annual_energy', chart_fingerprint(frame_fingerprint(window), start),
+                            lambda: self._build_annual_energy(window, start), self._style_annual_energy)
+    
+    def _build_annual_energy(self, window: SimulationFrame, start_hour: int) -> go.Figure:
+        dates = YEAR_START + np.arange(start_hour, start_hour + len(window)).astype('timedelta64[h]')
+        
+        fig = make_subplots(
+            rows=2, cols=1,
+            shared_xaxes=True,
+            subplot_titles=('energy_flow_kw', 'battery_soc_pct'),
+            vertical_spacing=0.1,
+            row_heights=[0.6, 0.4]
+        )
+        
+        for column, key, color in (('pv_generation_kw', 'pv_generation', 'pv'),
+                                   ('load_kw', 'load', 'load'),
+                                   ('grid_import_kw', 'grid_import', 'grid_import')):
+            fig.add_trace(
+                _series_trace(dates, getattr(window, column), name=key, meta=color, line=dict(width=1),
+                              fill='tozeroy' if color == 'pv' else None),
+                row=1, col=1
+            )
+        
+        fig.add_trace(
+            _series_trace(dates, window.battery_soc, name='battery_soc', meta='battery_soc', line=dict(width=1)),
+            row=2, col=1
+        )
+        
+        fig.update_xaxes(tickformat='%b %d', hoverformat='%b %d %H:00')
+        fig.update_yaxes(range=[0, 100], row=2, col=1)
+        
+        return fig
+    
+    def _style_annual_energy(self, fig: go.Figure, label: Callable[[str], str]):
+        self._color_traces(fig, label)
+        fig.for_each_annotation(lambda annotation: annotation.update(text=label(annotation.text)))
+        
+        fig.update_layout(
+            xaxis2_title_text=label("date"),
+            yaxis_title_text=label("power_kw"),
+            yaxis2_title_text=label("soc_pct"),
+            height=600,
+            hovermode='x unified',
+            template=self.template,
+            title_text=label("annual_title"),
+            title_x=0.5
+        )
+    
+    @profiled()
+    def create_monte_carlo_soc_chart(self, monte_carlo: MonteCarloResult) -> go.Figure:
+        """Create chart of hourly battery SoC at the P10, P50 and P90 percentiles"""
+        return self._figure('monte_carlo_soc', chart_fingerprint(monte_carlo.battery_soc_bands),
+                            lambda: self._build_monte_carlo_soc(monte_carlo), self._style_monte_carlo_soc)
+    
+    def _build_monte_carlo_soc(self, monte_carlo: MonteCarloResult) -> go.Figure:
+        fig = go.Figure()
+        hours = np.arange(monte_carlo.battery_soc_bands.shape[1])
+        for band, key, color in zip(monte_carlo.battery_soc_bands, ('soc_p10', 'soc_p50', 'soc_p90'),
+                                    ('battery_discharge', 'battery_soc', 'battery_charge')):
+            fig.add_trace(_series_trace(hours, band, name=key, meta=color, mode='lines'))
+        return fig
+    
+    def _style_monte_carlo_soc(self, fig: go.Figure, label: Callable[[str], str]):
+        self._color_traces(fig, label)
+        fig.update_layout(height=300, template=self.template, xaxis_title=label("hour_of_day"),
+                          yaxis_title=label("soc_pct"), yaxis_range=[0, 100], margin=dict(t=20))
+    
+    @profiled()
+    def create_scenario_chart(self, monte_carlo: MonteCarloResult) -> go.Figure:
+        """Create exceedance curves of daily grid import and unmet load over all Monte Carlo scenarios"""
+        return self._figure('scenarios', chart_fingerprint(monte_carlo.grid_import_kwh, monte_carlo.unmet_load_kwh),
+                            lambda: self._build_scenarios(monte_carlo), self._style_scenarios)
+    
+    def _build_scenarios(self, monte_carlo: MonteCarloResult) -> go.Figure:
+        fig = go.Figure()
+        for values, key, color in ((monte_carlo.grid_import_kwh, 'grid_import', 'grid_import'),
+                                   (monte_carlo.unmet_load_kwh, 'unmet_load', 'battery_discharge')):
+            # Largest first: x is the share of scenarios with at least this daily total
+            totals = np.sort(values)[::-1]
+            exceeding = np.arange(1, len(totals) + 1) * (100.0 / len(totals))
+            fig.add_trace(_series_trace(exceeding, totals, name=key, meta=color, mode='lines', line=dict(width=2)))
+        return fig
+    
+    def _style_scenarios(self, fig: go.Figure, label: Callable[[str], str]):
+        self._color_traces(fig, label)
+        fig.update_layout(height=300, template=self.template, hovermode='x unified',
+                          title_text=label("scenario_title"), xaxis_title=label("scenarios_exceeding"),
+                          yaxis_title=label("energy_kwh_day"), margin=dict(t=40))
+    
+    @profiled()
+    def create_monthly_summary_table(self, simulation_results: SimulationResults) -> pd.DataFrame:
         """Create summary statistics table"""
-        total_pv = sum(r.pv_generation_kw for r in simulation_results)
-        total_load = sum(r.load_kw for r in simulation_results)
-        total_battery_charge = sum(r.battery_charge_kw for r in simulation_results)
-        total_battery_discharge = sum(r.battery_discharge_kw for r in simulation_results)
-        total_grid_import = sum(r.grid_import_kw for r in simulation_results)
-        total_grid_export = sum(r.grid_export_kw for r in simulation_results)
-        
-        avg_battery_soc = sum(r.battery_soc for r in simulation_results) / len(simulation_results)
+        frame = as_frame(simulation_results)
+        total_pv = float(frame.pv_generation_kw.sum())
+        total_load = float(frame.load_kw.sum())
+        total_battery_charge = float(frame.battery_charge_kw.sum())
+        total_battery_discharge = float(frame.battery_discharge_kw.sum())
+        total_grid_import = float(frame.grid_import_kw.sum())
+        total_grid_export = float(frame.grid_export_kw.sum())
+        
+        avg_battery_soc = float(frame.battery_soc.mean())
         
         self_sufficiency = ((total_load - total_grid_import) / total_load * 100) if total_load > 0 else 0
         